@@ -3,16 +3,42 @@
 ########################################################################
 ## 🚩                     mkinit flags                             🚩 ##
 ########################################################################
-__ignore__ = ["create_tcp_connector", "parse_sse_message"]
+__ignore__ = [
+    "append_timing_only_message",
+    "create_connection_trace_config",
+    "create_tcp_connector",
+    "create_unix_connector",
+    "enable_socket_read_timestamps",
+    "extract_usage",
+    "get_socket_read_log",
+    "has_content",
+    "parse_sse_message",
+    "supports_socket_read_timestamps",
+    "timing_only_text_response",
+]
 ########################################################################
 ## ⚠️        This file is auto-generated by mkinit                 ⚠️ ##
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
 from aiperf.clients.http import (
+    AioHttpClient,
     AioHttpClientMixin,
     AioHttpDefaults,
     AioHttpSSEStreamReader,
+    Http2Client,
+    Http2ConnectionTracer,
+    RawHttpClient,
+    RawHttpProtocol,
+    RawHttpResponse,
+    ReadTimestampingResponseHandler,
     SocketDefaults,
+    SocketReadLog,
+    SSEStreamSplitter,
+    StallWatchdog,
+    UnixSocketConnector,
+)
+from aiperf.clients.load_balancer import (
+    EndpointLoadBalancer,
 )
 from aiperf.clients.model_endpoint_info import (
     EndpointInfo,
@@ -30,11 +56,15 @@ from aiperf.clients.openai import (
 )
 
 __all__ = [
+    "AioHttpClient",
     "AioHttpClientMixin",
     "AioHttpDefaults",
     "AioHttpSSEStreamReader",
     "DEFAULT_ROLE",
     "EndpointInfo",
+    "EndpointLoadBalancer",
+    "Http2Client",
+    "Http2ConnectionTracer",
     "ModelEndpointInfo",
     "ModelInfo",
     "ModelListInfo",
@@ -43,5 +73,13 @@ __all__ = [
     "OpenAICompletionRequestConverter",
     "OpenAIEmbeddingsRequestConverter",
     "RankingsRequestConverter",
+    "RawHttpClient",
+    "RawHttpProtocol",
+    "RawHttpResponse",
+    "ReadTimestampingResponseHandler",
+    "SSEStreamSplitter",
     "SocketDefaults",
+    "SocketReadLog",
+    "StallWatchdog",
+    "UnixSocketConnector",
 ]
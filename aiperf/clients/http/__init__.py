@@ -9,21 +9,71 @@ __ignore__ = []
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
 from aiperf.clients.http.aiohttp_client import (
+    AioHttpClient,
     AioHttpClientMixin,
     AioHttpSSEStreamReader,
+    ReadTimestampingResponseHandler,
+    SocketReadLog,
+    UnixSocketConnector,
+    create_connection_trace_config,
     create_tcp_connector,
+    create_unix_connector,
+    enable_socket_read_timestamps,
+    get_socket_read_log,
     parse_sse_message,
+    supports_socket_read_timestamps,
 )
 from aiperf.clients.http.defaults import (
     AioHttpDefaults,
     SocketDefaults,
 )
+from aiperf.clients.http.http2_client import (
+    Http2Client,
+    Http2ConnectionTracer,
+)
+from aiperf.clients.http.raw_client import (
+    RawHttpClient,
+    RawHttpProtocol,
+    RawHttpResponse,
+)
+from aiperf.clients.http.sse_stream import (
+    SSEStreamSplitter,
+)
+from aiperf.clients.http.stall_watchdog import (
+    StallWatchdog,
+)
+from aiperf.clients.http.timing_only import (
+    append_timing_only_message,
+    extract_usage,
+    has_content,
+    timing_only_text_response,
+)
 
 __all__ = [
+    "AioHttpClient",
     "AioHttpClientMixin",
     "AioHttpDefaults",
     "AioHttpSSEStreamReader",
+    "Http2Client",
+    "Http2ConnectionTracer",
+    "RawHttpClient",
+    "RawHttpProtocol",
+    "RawHttpResponse",
+    "ReadTimestampingResponseHandler",
+    "SSEStreamSplitter",
     "SocketDefaults",
+    "SocketReadLog",
+    "StallWatchdog",
+    "UnixSocketConnector",
+    "append_timing_only_message",
+    "create_connection_trace_config",
     "create_tcp_connector",
+    "create_unix_connector",
+    "enable_socket_read_timestamps",
+    "extract_usage",
+    "get_socket_read_log",
+    "has_content",
     "parse_sse_message",
+    "supports_socket_read_timestamps",
+    "timing_only_text_response",
 ]
@@ -1,23 +1,40 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
+import bisect
 import socket
 import time
 import typing
+from functools import partial
+from types import SimpleNamespace
 from typing import Any
 
 import aiohttp
+from aiohttp.client_exceptions import UnixClientConnectorError
+from aiohttp.client_proto import ResponseHandler
+from aiohttp.streams import StreamReader
 
 from aiperf.clients.http.defaults import AioHttpDefaults, SocketDefaults
+from aiperf.clients.http.stall_watchdog import StallWatchdog
+from aiperf.clients.http.timing_only import (
+    append_timing_only_message,
+    timing_only_text_response,
+)
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
-from aiperf.common.enums import SSEFieldType
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import HttpClientType, SSEFieldType
+from aiperf.common.exceptions import ConnectTimeoutError
+from aiperf.common.factories import HttpClientFactory
 from aiperf.common.mixins import AIPerfLoggerMixin
 from aiperf.common.models import (
+    ConnectionTiming,
     ErrorDetails,
     RequestRecord,
     SSEField,
     SSEMessage,
     TextResponse,
 )
+from aiperf.common.protocols import HttpClientProtocol
 
 ################################################################################
 # AioHTTP Client
@@ -28,22 +45,38 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
     """A high-performance HTTP client for communicating with HTTP based REST APIs using aiohttp.
 
     This class is optimized for maximum performance and accurate timing measurements,
-    making it ideal for benchmarking scenarios.
+    making it ideal for benchmarking scenarios. In timing-only mode, the content of all but the
+    final message is discarded as the messages arrive.
     """
 
     def __init__(self, model_endpoint: ModelEndpointInfo, **kwargs) -> None:
         self.model_endpoint = model_endpoint
         super().__init__(model_endpoint=model_endpoint, **kwargs)
-        self.tcp_connector = create_tcp_connector()
-
-        # For now, just set all timeouts to the same value.
-        # TODO: Add support for different timeouts for different parts of the request.
+        if self.model_endpoint.endpoint.unix_socket_path:
+            self.tcp_connector = create_unix_connector(
+                self.model_endpoint.endpoint.unix_socket_path
+            )
+        else:
+            self.tcp_connector = create_tcp_connector()
+        self.trace_config = create_connection_trace_config()
+
+        endpoint = self.model_endpoint.endpoint
+        if endpoint.socket_read_timestamps and not enable_socket_read_timestamps(
+            self.tcp_connector
+        ):
+            self.warning(
+                f"Socket read timestamps are not supported by aiohttp {aiohttp.__version__}, "
+                "so the messages are timestamped when they are parsed instead"
+            )
+        self.connect_timeout = endpoint.connect_timeout or endpoint.timeout
+        self.timing_only = endpoint.timing_only
+        # The first token and inter-chunk timeouts are enforced for each request by a StallWatchdog
         self.timeout = aiohttp.ClientTimeout(
-            total=self.model_endpoint.endpoint.timeout,
-            connect=self.model_endpoint.endpoint.timeout,
-            sock_connect=self.model_endpoint.endpoint.timeout,
-            sock_read=self.model_endpoint.endpoint.timeout,
-            ceil_threshold=self.model_endpoint.endpoint.timeout,
+            total=endpoint.timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=endpoint.timeout,
+            ceil_threshold=endpoint.timeout,
         )
 
     async def close(self) -> None:
@@ -57,7 +90,7 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
         method: str,
         url: str,
         headers: dict[str, str],
-        data: str | None = None,
+        data: str | bytes | None = None,
         **kwargs: Any,
     ) -> RequestRecord:
         """Generic request method that handles common logic for all HTTP methods.
@@ -76,24 +109,38 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
 
         record: RequestRecord = RequestRecord(
             start_perf_ns=time.perf_counter_ns(),
+            connection_timing=ConnectionTiming(),
         )
 
+        watchdog = StallWatchdog(
+            self.model_endpoint.endpoint.first_token_timeout,
+            self.model_endpoint.endpoint.inter_chunk_timeout,
+        )
         try:
             # Make raw HTTP request with precise timing using aiohttp
-            async with aiohttp.ClientSession(
-                connector=self.tcp_connector,
-                timeout=self.timeout,
-                headers=headers,
-                skip_auto_headers=[
-                    *list(headers.keys()),
-                    "User-Agent",
-                    "Accept-Encoding",
-                ],
-                connector_owner=False,
-            ) as session:
+            async with (
+                watchdog,
+                aiohttp.ClientSession(
+                    connector=self.tcp_connector,
+                    timeout=self.timeout,
+                    trace_configs=[self.trace_config],
+                    headers=headers,
+                    skip_auto_headers=[
+                        *list(headers.keys()),
+                        "User-Agent",
+                        "Accept-Encoding",
+                    ],
+                    connector_owner=False,
+                ) as session,
+            ):
                 record.start_perf_ns = time.perf_counter_ns()
                 async with session.request(
-                    method, url, data=data, headers=headers, **kwargs
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    trace_request_ctx=record.connection_timing,
+                    **kwargs,
                 ) as response:
                     record.status = response.status
                     # Check for HTTP errors
@@ -113,10 +160,28 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
                         and response.content_type == "text/event-stream"
                     ):
                         # Parse SSE stream with optimal performance
-                        messages = await AioHttpSSEStreamReader(
-                            response
-                        ).read_complete_stream()
-                        record.responses.extend(messages)
+                        reader = AioHttpSSEStreamReader(
+                            response,
+                            watchdog,
+                            timing_only=self.timing_only,
+                            read_log=get_socket_read_log(response),
+                        )
+                        record.responses.extend(await reader.read_complete_stream())
+                        if reader.read_log is not None:
+                            record.coalesced_response_count = reader.coalesced_count
+                        if self.timing_only:
+                            record.response_bytes = reader.num_bytes
+                    elif self.timing_only:
+                        raw_body = await response.read()
+                        record.end_perf_ns = time.perf_counter_ns()
+                        record.response_bytes = len(raw_body)
+                        record.responses.append(
+                            timing_only_text_response(
+                                record.end_perf_ns,
+                                response.content_type,
+                                raw_body.decode(errors="replace"),
+                            )
+                        )
                     else:
                         raw_response = await response.text()
                         record.end_perf_ns = time.perf_counter_ns()
@@ -131,6 +196,10 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
 
         except Exception as e:
             record.end_perf_ns = time.perf_counter_ns()
+            if isinstance(e, aiohttp.ConnectionTimeoutError):
+                e = ConnectTimeoutError(
+                    f"No connection opened within the connect timeout of {self.connect_timeout} seconds"
+                )
             self.error(f"Error in aiohttp request: {e!r}")
             record.error = ErrorDetails(type=e.__class__.__name__, message=str(e))
 
@@ -139,7 +208,7 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
     async def post_request(
         self,
         url: str,
-        payload: str,
+        payload: str | bytes,
         headers: dict[str, str],
         **kwargs: Any,
     ) -> RequestRecord:
@@ -159,16 +228,60 @@ class AioHttpClientMixin(AIPerfLoggerMixin):
         """
         return await self._request("GET", url, headers, **kwargs)
 
+    async def open_connections(
+        self,
+        url: str,
+        headers: dict[str, str],
+        num_connections: int,
+        send_request: bool = True,
+    ) -> list[RequestRecord]:
+        """Open keep-alive connections by sending concurrent GET requests to the URL, as aiohttp
+        can only open a connection for a request.
+
+        Any response, including an HTTP error, leaves its connection open in the pool.
+        """
+        records = await asyncio.gather(
+            *[self.get_request(url, headers) for _ in range(num_connections)]
+        )
+        for record in records:
+            if record.end_perf_ns is None:
+                record.end_perf_ns = time.perf_counter_ns()
+        return list(records)
+
+
+@implements_protocol(HttpClientProtocol)
+@HttpClientFactory.register(HttpClientType.AIOHTTP)
+class AioHttpClient(AioHttpClientMixin):
+    """HTTP/1.1 client based on aiohttp, which sends each in-flight request over its own
+    pooled keep-alive connection."""
+
 
 class AioHttpSSEStreamReader:
     """A helper class for reading an SSE stream from an aiohttp.ClientResponse object.
 
     This class is optimized for maximum performance and accurate timing measurements,
-    making it ideal for benchmarking scenarios.
+    making it ideal for benchmarking scenarios. In timing-only mode, the content of all but the
+    final message is discarded as the messages arrive.
+
+    Given the log of the socket reads of the response, each message is timestamped with the earliest
+    read which contained its first byte instead, and `coalesced_count` counts the messages which
+    arrived in the same read as the message before them.
     """
 
-    def __init__(self, response: aiohttp.ClientResponse):
+    def __init__(
+        self,
+        response: aiohttp.ClientResponse,
+        watchdog: StallWatchdog | None = None,
+        timing_only: bool = False,
+        read_log: "SocketReadLog | None" = None,
+    ):
         self.response = response
+        self.watchdog = watchdog
+        self.timing_only = timing_only
+        self.read_log = read_log
+        self.num_bytes = 0
+        self.message_offset = 0
+        self.coalesced_count = 0
 
     async def read_complete_stream(self) -> list[SSEMessage]:
         """Read the complete SSE stream in a performant manner and return a list of
@@ -179,10 +292,26 @@ class AioHttpSSEStreamReader:
         """
         messages: list[SSEMessage] = []
 
+        watchdog = self.watchdog
+        read_log = self.read_log
+        last_read_index: int | None = None
         async for raw_message, first_byte_ns in self.__aiter__():
+            if (
+                read_log is not None
+                and (read_index := read_log.find(self.message_offset)) is not None
+            ):
+                first_byte_ns = read_log.perf_ns[read_index]
+                if read_index == last_read_index:
+                    self.coalesced_count += 1
+                last_read_index = read_index
             # Parse the raw SSE message into a SSEMessage object
             message = parse_sse_message(raw_message, first_byte_ns)
-            messages.append(message)
+            if self.timing_only:
+                append_timing_only_message(messages, message)
+            else:
+                messages.append(message)
+            if watchdog is not None:
+                watchdog.last_chunk_perf_ns = first_byte_ns
 
         return messages
 
@@ -209,6 +338,8 @@ class AioHttpSSEStreamReader:
             if not chunk:
                 break
             chunk = first_byte + chunk
+            self.message_offset = self.num_bytes
+            self.num_bytes += len(chunk)
 
             try:
                 # Use the fastest available decoder
@@ -253,6 +384,152 @@ def parse_sse_message(raw_message: str, perf_ns: int) -> SSEMessage:
     return message
 
 
+def create_connection_trace_config() -> aiohttp.TraceConfig:
+    """Create a trace config which captures the connection timing of each request, into the
+    ConnectionTiming passed as the `trace_request_ctx` of the request."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_headers_sent.append(_on_request_sent)
+    trace_config.on_request_chunk_sent.append(_on_request_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.freeze()
+    return trace_config
+
+
+async def _on_connection_reuseconn(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timing: ConnectionTiming = context.trace_request_ctx
+    timing.reused = True
+    timing.connection_ready_perf_ns = time.perf_counter_ns()
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.connect_start_perf_ns = time.perf_counter_ns()
+
+
+async def _on_dns_resolvehost_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.dns_start_perf_ns = time.perf_counter_ns()
+
+
+async def _on_dns_resolvehost_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timing: ConnectionTiming = context.trace_request_ctx
+    timing.dns_ns = time.perf_counter_ns() - context.dns_start_perf_ns
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    timing: ConnectionTiming = context.trace_request_ctx
+    timing.connection_ready_perf_ns = time.perf_counter_ns()
+    # aiohttp resolves the host name while creating the connection, and does not time the TLS
+    # handshake separately, so the connect time includes it.
+    timing.connect_ns = (
+        timing.connection_ready_perf_ns
+        - context.connect_start_perf_ns
+        - (timing.dns_ns or 0)
+    )
+
+
+async def _on_request_sent(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    # Called for the headers, and then for each chunk of the body, right before it is written
+    context.trace_request_ctx.request_sent_perf_ns = time.perf_counter_ns()
+
+
+async def _on_request_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    # aiohttp ends the request as soon as the response headers have been received
+    context.trace_request_ctx.headers_received_perf_ns = time.perf_counter_ns()
+
+
+class SocketReadLog:
+    """The arrival time of each socket read of a response body, along with the offset within the
+    body that each read ended at, as the bytes of a read are fed to the body right away."""
+
+    __slots__ = ("payload", "perf_ns", "end_offsets")
+
+    def __init__(self, payload: StreamReader) -> None:
+        self.payload = payload
+        self.perf_ns: list[int] = []
+        self.end_offsets: list[int] = []
+
+    def find(self, offset: int) -> int | None:
+        """Find the index of the earliest read which contained the byte at the offset of the body."""
+        index = bisect.bisect_right(self.end_offsets, offset)
+        return index if index < len(self.end_offsets) else None
+
+
+class ReadTimestampingResponseHandler(ResponseHandler):
+    """A response handler which logs the arrival time of each socket read of the response bodies,
+    before any parsing. The log of the current response is replaced when the next one starts."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__(loop)
+        self.read_log: SocketReadLog | None = None
+
+    def data_received(self, data: bytes) -> None:
+        perf_ns = time.perf_counter_ns()
+        super().data_received(data)
+        payload = self._payload
+        if payload is None:
+            return
+        read_log = self.read_log
+        if read_log is None or read_log.payload is not payload:
+            read_log = self.read_log = SocketReadLog(payload)
+        end_offset = payload.total_bytes
+        if not read_log.end_offsets or end_offset > read_log.end_offsets[-1]:
+            read_log.perf_ns.append(perf_ns)
+            read_log.end_offsets.append(end_offset)
+
+
+def supports_socket_read_timestamps(connector: aiohttp.BaseConnector) -> bool:
+    """Whether the installed aiohttp has the private attributes that the socket read timestamps rely
+    on: the protocol factory and loop of the connector, and the payload of the response handler."""
+    loop = getattr(connector, "_loop", None)
+    return (
+        loop is not None
+        and hasattr(connector, "_factory")
+        and hasattr(ResponseHandler(loop), "_payload")
+    )
+
+
+def enable_socket_read_timestamps(connector: aiohttp.BaseConnector) -> bool:
+    """Make the connector log the arrival time of each socket read of its connections. Returns False,
+    leaving the connector unchanged, if the installed aiohttp does not support it."""
+    if not supports_socket_read_timestamps(connector):
+        return False
+    connector._factory = partial(ReadTimestampingResponseHandler, loop=connector._loop)  # type: ignore[attr-defined]
+    return True
+
+
+def get_socket_read_log(response: aiohttp.ClientResponse) -> SocketReadLog | None:
+    """Get the log of the socket reads of the response, if its connection logs them."""
+    if response.connection is None:
+        return None
+    protocol = response.connection.protocol
+    if not isinstance(protocol, ReadTimestampingResponseHandler):
+        return None
+    read_log = protocol.read_log
+    return (
+        read_log
+        if read_log is not None and read_log.payload is response.content
+        else None
+    )
+
+
 def create_tcp_connector(**kwargs) -> aiohttp.TCPConnector:
     """Create a new connector with the given configuration."""
 
@@ -281,3 +558,60 @@ def create_tcp_connector(**kwargs) -> aiohttp.TCPConnector:
     return aiohttp.TCPConnector(
         **default_kwargs,
     )
+
+
+class UnixSocketConnector(aiohttp.UnixConnector):
+    """A connector for a server on the same host, listening on a Unix domain socket, which applies
+    the Unix socket options to each socket before connecting it.
+
+    This overrides a private method of :class:`aiohttp.UnixConnector`. If the aiohttp internals it
+    relies on are missing, the connections are opened by :class:`aiohttp.UnixConnector` instead,
+    without the socket options.
+    """
+
+    async def _create_connection(
+        self, req: aiohttp.ClientRequest, traces: list, timeout: aiohttp.ClientTimeout
+    ) -> ResponseHandler:
+        if not (hasattr(self, "_loop") and hasattr(self, "_factory")):
+            return await super()._create_connection(req, traces, timeout)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            SocketDefaults.apply_to_unix_socket(sock)
+            sock.setblocking(False)
+            _, proto = await asyncio.wait_for(
+                self._connect_socket(sock), timeout=timeout.sock_connect
+            )
+        except asyncio.TimeoutError as e:
+            sock.close()
+            raise aiohttp.ConnectionTimeoutError(
+                f"Connection timeout to unix socket {self.path}"
+            ) from e
+        except OSError as e:
+            sock.close()
+            raise UnixClientConnectorError(self.path, req.connection_key, e) from e
+        except BaseException:
+            sock.close()
+            raise
+        return proto
+
+    async def _connect_socket(
+        self, sock: socket.socket
+    ) -> tuple[asyncio.Transport, ResponseHandler]:
+        await self._loop.sock_connect(sock, self.path)
+        return await self._loop.create_unix_connection(self._factory, sock=sock)
+
+
+def create_unix_connector(path: str, **kwargs) -> aiohttp.UnixConnector:
+    """Create a new connector for the Unix domain socket at the given path, with the same
+    connection pool configuration as the TCP connector."""
+    default_kwargs: dict[str, Any] = {
+        "limit": AioHttpDefaults.LIMIT,
+        "limit_per_host": AioHttpDefaults.LIMIT_PER_HOST,
+        "force_close": AioHttpDefaults.FORCE_CLOSE,
+        "keepalive_timeout": AioHttpDefaults.KEEPALIVE_TIMEOUT,
+    }
+
+    default_kwargs.update(kwargs)
+
+    return UnixSocketConnector(path, **default_kwargs)
@@ -60,6 +60,13 @@ class SocketDefaults:
                 socket.SOL_TCP, socket.TCP_USER_TIMEOUT, cls.TCP_USER_TIMEOUT
             )
 
+    @classmethod
+    def apply_to_unix_socket(cls, sock: socket.socket) -> None:
+        """Apply the default socket options to the given Unix domain socket. The TCP options do not
+        apply to a Unix domain socket, so only the buffer sizes are set."""
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, cls.SO_RCVBUF)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, cls.SO_SNDBUF)
+
 
 @dataclass(frozen=True)
 class AioHttpDefaults:
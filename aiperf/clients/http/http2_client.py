@@ -0,0 +1,343 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import socket
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from aiperf.clients.http.defaults import AioHttpDefaults, SocketDefaults
+from aiperf.clients.http.sse_stream import SSEStreamSplitter
+from aiperf.clients.http.stall_watchdog import StallWatchdog
+from aiperf.clients.http.timing_only import (
+    append_timing_only_message,
+    timing_only_text_response,
+)
+from aiperf.clients.model_endpoint_info import ModelEndpointInfo
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import HttpClientType
+from aiperf.common.exceptions import ConnectTimeoutError, InferenceClientError
+from aiperf.common.factories import HttpClientFactory
+from aiperf.common.mixins import AIPerfLoggerMixin
+from aiperf.common.models import (
+    ConnectionTiming,
+    ErrorDetails,
+    RequestRecord,
+    TextResponse,
+)
+from aiperf.common.protocols import HttpClientProtocol
+
+# httpx is an optional dependency, which is only imported once the HTTP/2 client is created
+if TYPE_CHECKING:
+    import httpx
+
+################################################################################
+# HTTP/2 Client
+################################################################################
+
+
+@implements_protocol(HttpClientProtocol)
+@HttpClientFactory.register(HttpClientType.HTTP2)
+class Http2Client(AIPerfLoggerMixin):
+    """An HTTP/2 client that multiplexes many concurrent requests as streams over a small,
+    fixed number of connections, based on httpx.
+
+    Each connection carries as many concurrent streams as the server allows, so a worker with a
+    high concurrency needs only a few sockets instead of one per in-flight request. Requests are
+    sent over the connection with the fewest requests in flight. Plain `http://` URLs use HTTP/2
+    with prior knowledge (h2c), and `https://` URLs negotiate HTTP/2 using ALPN.
+
+    The timing points are the same as :class:`AioHttpClientMixin`, so the metrics are comparable.
+    """
+
+    def __init__(self, model_endpoint: ModelEndpointInfo, **kwargs) -> None:
+        self.model_endpoint = model_endpoint
+        super().__init__(model_endpoint=model_endpoint, **kwargs)
+        try:
+            import h2  # noqa: F401
+            import httpx  # noqa: F401
+        except ImportError as e:
+            raise InferenceClientError(
+                f"The {e.name} package is not installed, which is required for --http-client http2. "
+                "You can install it with `pip install aiperf[http2]`."
+            ) from e
+
+        self.connect_timeout = (
+            self.model_endpoint.endpoint.connect_timeout
+            or self.model_endpoint.endpoint.timeout
+        )
+        self.timing_only = self.model_endpoint.endpoint.timing_only
+        self.clients: list[httpx.AsyncClient] = [
+            self._create_client()
+            for _ in range(self.model_endpoint.endpoint.http2_connections)
+        ]
+        self.in_flight: list[int] = [0] * len(self.clients)
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        """Create a client which owns a single HTTP/2 connection."""
+        import httpx
+
+        socket_options = [
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, SocketDefaults.SO_RCVBUF),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, SocketDefaults.SO_SNDBUF),
+        ]
+        unix_socket_path = self.model_endpoint.endpoint.unix_socket_path
+        if not unix_socket_path:
+            # The TCP options do not apply to a Unix domain socket
+            socket_options += [
+                (socket.SOL_TCP, socket.TCP_NODELAY, SocketDefaults.TCP_NODELAY),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, SocketDefaults.SO_KEEPALIVE),
+            ]
+        transport = httpx.AsyncHTTPTransport(
+            http1=False,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=1,
+                max_keepalive_connections=1,
+                keepalive_expiry=AioHttpDefaults.KEEPALIVE_TIMEOUT,
+            ),
+            uds=unix_socket_path,
+            socket_options=socket_options,
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                self.model_endpoint.endpoint.timeout, connect=self.connect_timeout
+            ),
+            trust_env=False,
+        )
+        # Do not ask for compressed responses, which would add decompression time to the timing
+        del client.headers["Accept-Encoding"]
+        return client
+
+    async def close(self) -> None:
+        """Close the client and all of its connections."""
+        clients, self.clients = self.clients, []
+        for client in clients:
+            await client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: str | bytes | None = None,
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Generic request method that handles common logic for all HTTP methods.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: The URL to send the request to
+            headers: Request headers
+            data: Request payload (for POST, PUT, etc.)
+            **kwargs: Additional arguments to pass to the request
+
+        Returns:
+            RequestRecord with the response data
+        """
+        self.debug(lambda: f"Sending HTTP/2 {method} request to {url}")
+
+        record: RequestRecord = RequestRecord(
+            start_perf_ns=time.perf_counter_ns(),
+            connection_timing=ConnectionTiming(reused=True),
+        )
+
+        index = min(range(len(self.clients)), key=self.in_flight.__getitem__)
+        client = self.clients[index]
+        self.in_flight[index] += 1
+        watchdog = StallWatchdog(
+            self.model_endpoint.endpoint.first_token_timeout,
+            self.model_endpoint.endpoint.inter_chunk_timeout,
+        )
+        try:
+            async with watchdog:
+                await self._send(
+                    client, record, watchdog, method, url, headers, data, **kwargs
+                )
+
+        except Exception as e:
+            import httpx
+
+            record.end_perf_ns = time.perf_counter_ns()
+            if isinstance(e, httpx.ConnectTimeout):
+                e = ConnectTimeoutError(
+                    f"No connection opened within the connect timeout of {self.connect_timeout} seconds"
+                )
+            self.error(f"Error in HTTP/2 request: {e!r}")
+            record.error = ErrorDetails(type=e.__class__.__name__, message=str(e))
+        finally:
+            self.in_flight[index] -= 1
+
+        return record
+
+    async def _send(
+        self,
+        client: "httpx.AsyncClient",
+        record: RequestRecord,
+        watchdog: StallWatchdog,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: str | bytes | None,
+        **kwargs: Any,
+    ) -> None:
+        """Send the request on the given client and read the response into the record."""
+        request = client.build_request(
+            method,
+            url,
+            headers=headers,
+            content=data,
+            extensions={"trace": Http2ConnectionTracer(record.connection_timing)},
+            **kwargs,
+        )
+        record.start_perf_ns = time.perf_counter_ns()
+        response = await client.send(request, stream=True)
+        try:
+            record.status = response.status_code
+            # Check for HTTP errors
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode(errors="replace")
+                record.error = ErrorDetails(
+                    code=response.status_code,
+                    type=response.reason_phrase,
+                    message=error_text,
+                )
+                return
+
+            record.recv_start_perf_ns = time.perf_counter_ns()
+
+            content_type = (
+                response.headers.get("Content-Type", "").split(";")[0].strip()
+            )
+            if method == "POST" and content_type == "text/event-stream":
+                splitter = SSEStreamSplitter()
+                append = (
+                    partial(append_timing_only_message, record.responses)
+                    if self.timing_only
+                    else record.responses.append
+                )
+                num_bytes = 0
+                async for chunk in response.aiter_raw():
+                    perf_ns = time.perf_counter_ns()
+                    watchdog.last_chunk_perf_ns = perf_ns
+                    num_bytes += len(chunk)
+                    for message in splitter.feed(chunk, perf_ns):
+                        append(message)
+                if (message := splitter.flush()) is not None:
+                    append(message)
+                record.coalesced_response_count = splitter.coalesced_count
+                if self.timing_only:
+                    record.response_bytes = num_bytes
+            elif self.timing_only:
+                raw_body = await response.aread()
+                record.end_perf_ns = time.perf_counter_ns()
+                record.response_bytes = len(raw_body)
+                record.responses.append(
+                    timing_only_text_response(
+                        record.end_perf_ns,
+                        content_type,
+                        raw_body.decode(errors="replace"),
+                    )
+                )
+            else:
+                raw_response = await response.aread()
+                record.end_perf_ns = time.perf_counter_ns()
+                record.responses.append(
+                    TextResponse(
+                        perf_ns=record.end_perf_ns,
+                        content_type=content_type,
+                        text=raw_response.decode(errors="replace"),
+                    )
+                )
+            record.end_perf_ns = time.perf_counter_ns()
+        finally:
+            await response.aclose()
+
+    async def post_request(
+        self,
+        url: str,
+        payload: str | bytes,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Send a streaming or non-streaming POST request to the specified URL with the given payload and headers.
+
+        If the response is an SSE stream, the response will be parsed into a list of SSE messages.
+        Otherwise, the response will be parsed into a TextResponse object.
+        """
+        return await self._request("POST", url, headers, data=payload, **kwargs)
+
+    async def get_request(
+        self, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> RequestRecord:
+        """Send a GET request to the specified URL with the given headers.
+
+        The response will be parsed into a TextResponse object.
+        """
+        return await self._request("GET", url, headers, **kwargs)
+
+    async def open_connections(
+        self,
+        url: str,
+        headers: dict[str, str],
+        num_connections: int,
+        send_request: bool = True,
+    ) -> list[RequestRecord]:
+        """Open keep-alive connections by sending concurrent GET requests to the URL, one over each of
+        the HTTP/2 connections, as they are opened for the first request.
+
+        Any response, including an HTTP error, leaves its connection open in the pool.
+        """
+        records = await asyncio.gather(
+            *[
+                self.get_request(url, headers)
+                for _ in range(min(num_connections, len(self.clients)))
+            ]
+        )
+        for record in records:
+            if record.end_perf_ns is None:
+                record.end_perf_ns = time.perf_counter_ns()
+        return list(records)
+
+
+class Http2ConnectionTracer:
+    """A httpcore `trace` extension, which captures the connection timing of a request.
+
+    A request is assumed to reuse an open connection, unless the connection is opened for it.
+    httpcore resolves the host name while connecting, so the DNS time is part of the connect time.
+    """
+
+    __slots__ = ("timing", "connect_start_perf_ns", "tls_start_perf_ns")
+
+    def __init__(self, timing: ConnectionTiming) -> None:
+        self.timing = timing
+        self.connect_start_perf_ns: int | None = None
+        self.tls_start_perf_ns: int | None = None
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        perf_ns = time.perf_counter_ns()
+        timing = self.timing
+        if event_name in (
+            "connection.connect_tcp.started",
+            "connection.connect_unix_socket.started",
+        ):
+            timing.reused = False
+            self.connect_start_perf_ns = perf_ns
+        elif event_name == "connection.start_tls.started":
+            self.tls_start_perf_ns = perf_ns
+        elif event_name in (
+            "connection.connect_tcp.complete",
+            "connection.connect_unix_socket.complete",
+            "connection.start_tls.complete",
+        ):
+            if self.connect_start_perf_ns is not None:
+                timing.connect_ns = perf_ns - self.connect_start_perf_ns
+            if self.tls_start_perf_ns is not None:
+                timing.tls_ns = perf_ns - self.tls_start_perf_ns
+        elif event_name == "http2.send_request_headers.started":
+            timing.connection_ready_perf_ns = perf_ns
+        elif event_name == "http2.send_request_body.complete":
+            timing.request_sent_perf_ns = perf_ns
+        elif event_name == "http2.receive_response_headers.complete":
+            timing.headers_received_perf_ns = perf_ns
@@ -0,0 +1,639 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import socket
+import ssl
+import time
+from collections import deque
+from typing import Any
+from urllib.parse import SplitResult, urlsplit
+
+from aiperf.clients.http.defaults import AioHttpDefaults, SocketDefaults
+from aiperf.clients.http.sse_stream import SSEStreamSplitter
+from aiperf.clients.http.stall_watchdog import StallWatchdog
+from aiperf.clients.http.timing_only import (
+    append_timing_only_message,
+    timing_only_text_response,
+)
+from aiperf.clients.model_endpoint_info import ModelEndpointInfo
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import HttpClientType
+from aiperf.common.exceptions import ConnectTimeoutError
+from aiperf.common.factories import HttpClientFactory
+from aiperf.common.mixins import AIPerfLoggerMixin
+from aiperf.common.models import (
+    ConnectionTiming,
+    ErrorDetails,
+    RequestRecord,
+    SSEMessage,
+    TextResponse,
+)
+from aiperf.common.protocols import HttpClientProtocol
+
+################################################################################
+# Raw asyncio Protocol HTTP/1.1 Client
+################################################################################
+
+# The states of the HTTP/1.1 response parser
+_STATUS_AND_HEADERS = 0
+_BODY_LENGTH = 1
+_CHUNK_SIZE = 2
+_CHUNK_DATA = 3
+_CHUNK_END = 4
+_TRAILERS = 5
+_BODY_UNTIL_CLOSE = 6
+
+_ConnectionKey = tuple[str, int, bool]
+
+
+class RawHttpResponse:
+    """The parsed response of a single request sent over a :class:`RawHttpProtocol`."""
+
+    __slots__ = (
+        "method",
+        "status",
+        "reason",
+        "headers",
+        "keep_alive",
+        "headers_perf_ns",
+        "end_perf_ns",
+        "body",
+        "sse_splitter",
+        "sse_messages",
+        "num_bytes",
+        "timing_only",
+        "watchdog",
+        "done",
+    )
+
+    def __init__(self, method: str, done: asyncio.Future[None]) -> None:
+        self.method = method
+        self.status = 0
+        self.reason = ""
+        self.headers: dict[str, str] = {}
+        self.keep_alive = True
+        self.headers_perf_ns: int | None = None
+        self.end_perf_ns: int | None = None
+        self.body = bytearray()
+        self.sse_splitter: SSEStreamSplitter | None = None
+        self.sse_messages: list[SSEMessage] = []
+        self.num_bytes = 0
+        self.timing_only = False
+        self.watchdog: StallWatchdog | None = None
+        self.done = done
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "").split(";")[0].strip()
+
+
+class RawHttpProtocol(asyncio.Protocol):
+    """A single HTTP/1.1 connection, which parses the response to each request as its bytes arrive.
+
+    The arrival time of each chunk of bytes is taken first thing in `data_received`, before any
+    parsing, and is carried through to the timestamps of the response headers, of each SSE
+    message, and of the end of the response.
+    """
+
+    def __init__(self) -> None:
+        self.transport: asyncio.Transport | None = None
+        self.closed = False
+        self.response: RawHttpResponse | None = None
+        self._buffer = bytearray()
+        self._state = _STATUS_AND_HEADERS
+        self._remaining = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.closed = True
+        if self.response is None:
+            return
+        if self._state == _BODY_UNTIL_CLOSE and exc is None:
+            self._finish(time.perf_counter_ns())
+        else:
+            self._fail(
+                exc
+                or ConnectionResetError(
+                    "Connection closed before the response was complete"
+                )
+            )
+
+    def send_request(self, method: str, request: bytes) -> RawHttpResponse:
+        """Write a request to the connection, and return the response that will be filled in as it arrives."""
+        if self.closed or self.transport is None or self.response is not None:
+            raise ConnectionError("Connection is not available to send a request")
+        self.response = RawHttpResponse(
+            method, asyncio.get_running_loop().create_future()
+        )
+        self._buffer.clear()
+        self._state = _STATUS_AND_HEADERS
+        self.transport.write(request)
+        return self.response
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+        self.closed = True
+
+    def data_received(self, data: bytes) -> None:
+        perf_ns = time.perf_counter_ns()
+        if self.response is None:
+            # Unsolicited bytes mean the connection can no longer be trusted
+            self.close()
+            return
+        self._buffer += data
+        try:
+            self._parse(perf_ns)
+        except Exception as e:
+            self._fail(e)
+            self.close()
+
+    def _parse(self, perf_ns: int) -> None:
+        buffer = self._buffer
+        while self.response is not None:
+            if self._state == _STATUS_AND_HEADERS:
+                end = buffer.find(b"\r\n\r\n")
+                if end == -1:
+                    return
+                head = bytes(buffer[:end])
+                del buffer[: end + 4]
+                self._parse_headers(head, perf_ns)
+
+            elif self._state in (_BODY_LENGTH, _CHUNK_DATA):
+                if not buffer and self._remaining:
+                    return
+                size = min(len(buffer), self._remaining)
+                if size:
+                    self._on_body(bytes(buffer[:size]), perf_ns)
+                    del buffer[:size]
+                    self._remaining -= size
+                if self._remaining:
+                    return
+                if self._state == _BODY_LENGTH:
+                    self._finish(perf_ns)
+                else:
+                    self._state = _CHUNK_END
+
+            elif self._state == _CHUNK_SIZE:
+                end = buffer.find(b"\r\n")
+                if end == -1:
+                    return
+                size = int(bytes(buffer[:end]).split(b";", 1)[0].strip(), 16)
+                del buffer[: end + 2]
+                self._remaining = size
+                self._state = _CHUNK_DATA if size else _TRAILERS
+
+            elif self._state == _CHUNK_END:
+                if len(buffer) < 2:
+                    return
+                if buffer[:2] != b"\r\n":
+                    raise ValueError("Invalid chunked encoding: missing chunk CRLF")
+                del buffer[:2]
+                self._state = _CHUNK_SIZE
+
+            elif self._state == _TRAILERS:
+                end = buffer.find(b"\r\n")
+                if end == -1:
+                    return
+                del buffer[: end + 2]
+                if end == 0:
+                    self._finish(perf_ns)
+
+            elif self._state == _BODY_UNTIL_CLOSE:
+                self._on_body(bytes(buffer), perf_ns)
+                buffer.clear()
+                return
+
+    def _parse_headers(self, head: bytes, perf_ns: int) -> None:
+        response = self.response
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        _, status, *reason = status_line.split(" ", 2)
+        if 100 <= int(status) < 200:
+            # Informational responses are followed by the final response
+            return
+        response.status = int(status)
+        response.reason = reason[0] if reason else ""
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            response.headers[name.strip().lower()] = value.strip()
+        response.headers_perf_ns = perf_ns
+        response.keep_alive = response.headers.get("connection", "").lower() != "close"
+
+        if response.method == "POST" and response.content_type == "text/event-stream":
+            response.sse_splitter = SSEStreamSplitter()
+
+        if response.method == "HEAD" or response.status in (204, 304):
+            self._remaining = 0
+            self._state = _BODY_LENGTH
+        elif "chunked" in response.headers.get("transfer-encoding", "").lower():
+            self._state = _CHUNK_SIZE
+        elif "content-length" in response.headers:
+            self._remaining = int(response.headers["content-length"])
+            self._state = _BODY_LENGTH
+        else:
+            # The body is delimited by the server closing the connection
+            response.keep_alive = False
+            self._state = _BODY_UNTIL_CLOSE
+
+    def _on_body(self, data: bytes, perf_ns: int) -> None:
+        response = self.response
+        if response.watchdog is not None:
+            response.watchdog.last_chunk_perf_ns = perf_ns
+        response.num_bytes += len(data)
+        if response.sse_splitter is not None:
+            messages = response.sse_splitter.feed(data, perf_ns)
+            if response.timing_only:
+                for message in messages:
+                    append_timing_only_message(response.sse_messages, message)
+            else:
+                response.sse_messages.extend(messages)
+        else:
+            response.body += data
+
+    def _finish(self, perf_ns: int) -> None:
+        response, self.response = self.response, None
+        response.end_perf_ns = perf_ns
+        if response.sse_splitter is not None and (
+            message := response.sse_splitter.flush()
+        ):
+            if response.timing_only:
+                append_timing_only_message(response.sse_messages, message)
+            else:
+                response.sse_messages.append(message)
+        self._buffer.clear()
+        self._state = _STATUS_AND_HEADERS
+        if not response.done.done():
+            response.done.set_result(None)
+
+    def _fail(self, exc: BaseException) -> None:
+        response, self.response = self.response, None
+        if response is not None and not response.done.done():
+            response.done.set_exception(exc)
+
+
+@implements_protocol(HttpClientProtocol)
+@HttpClientFactory.register(HttpClientType.RAW)
+class RawHttpClient(AIPerfLoggerMixin):
+    """A minimal, low-overhead HTTP/1.1 client built directly on asyncio protocols.
+
+    Each response is parsed incrementally in `data_received`, so every chunk of bytes is
+    timestamped as soon as the event loop hands it over, without the per-read task switches of a
+    stream reader. Connections are kept alive and reused, with the same connection limit and
+    socket options as the aiohttp client.
+    """
+
+    def __init__(self, model_endpoint: ModelEndpointInfo, **kwargs) -> None:
+        self.model_endpoint = model_endpoint
+        super().__init__(model_endpoint=model_endpoint, **kwargs)
+        self.timeout = self.model_endpoint.endpoint.timeout
+        self.timing_only = self.model_endpoint.endpoint.timing_only
+        self.connect_timeout = (
+            self.model_endpoint.endpoint.connect_timeout or self.timeout
+        )
+        self.stall_timeouts_enabled = (
+            self.model_endpoint.endpoint.first_token_timeout is not None
+            or self.model_endpoint.endpoint.inter_chunk_timeout is not None
+        )
+        self._connection_limit = asyncio.Semaphore(AioHttpDefaults.LIMIT)
+        self._idle_connections: dict[_ConnectionKey, deque[RawHttpProtocol]] = {}
+        self._connections: set[RawHttpProtocol] = set()
+        self._ssl_context: ssl.SSLContext | None = None
+        self.unix_socket_path = self.model_endpoint.endpoint.unix_socket_path
+
+    async def close(self) -> None:
+        """Close the client and all of its connections."""
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+        self._idle_connections.clear()
+
+    async def _connect(
+        self,
+        host: str,
+        port: int,
+        secure: bool,
+        timing: ConnectionTiming | None = None,
+    ) -> RawHttpProtocol:
+        """Open a new connection, applying the socket options before connecting. The connection is
+        made to the Unix domain socket of the endpoint instead of the host, if it has one.
+
+        If `timing` is given, the DNS resolution, connect and TLS handshake times are recorded in it.
+        """
+        loop = asyncio.get_running_loop()
+        dns_start_ns = time.perf_counter_ns()
+        if self.unix_socket_path:
+            family, sock_type, proto = socket.AF_UNIX, socket.SOCK_STREAM, 0
+            address = self.unix_socket_path
+        else:
+            family, sock_type, proto, _, address = (
+                await loop.getaddrinfo(
+                    host,
+                    port,
+                    family=AioHttpDefaults.SOCKET_FAMILY,
+                    type=socket.SOCK_STREAM,
+                )
+            )[0]
+        connect_start_ns = time.perf_counter_ns()
+        sock = socket.socket(family=family, type=sock_type, proto=proto)
+        try:
+            if family == socket.AF_UNIX:
+                SocketDefaults.apply_to_unix_socket(sock)
+            else:
+                SocketDefaults.apply_to_socket(sock)
+            sock.setblocking(False)
+            await loop.sock_connect(sock, address)
+            tls_start_ns = time.perf_counter_ns()
+            if secure and self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            _, connection = await loop.create_connection(
+                RawHttpProtocol,
+                sock=sock,
+                ssl=self._ssl_context if secure else None,
+                server_hostname=host if secure else None,
+            )
+        except BaseException:
+            sock.close()
+            raise
+        self._connections.add(connection)
+
+        if timing is not None:
+            end_ns = time.perf_counter_ns()
+            if family != socket.AF_UNIX:
+                timing.dns_ns = connect_start_ns - dns_start_ns
+            timing.connect_ns = end_ns - connect_start_ns
+            if secure:
+                timing.tls_ns = end_ns - tls_start_ns
+        return connection
+
+    async def _connect_with_timeout(
+        self, key: _ConnectionKey, timing: ConnectionTiming | None = None
+    ) -> RawHttpProtocol:
+        """Open a new connection, failing with a ConnectTimeoutError after the connect timeout."""
+        try:
+            return await asyncio.wait_for(
+                self._connect(*key, timing), timeout=self.connect_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise ConnectTimeoutError(
+                f"No connection opened within the connect timeout of {self.connect_timeout} seconds"
+            ) from e
+
+    async def _acquire(
+        self, key: _ConnectionKey, timing: ConnectionTiming
+    ) -> RawHttpProtocol:
+        """Reuse an idle keep-alive connection, or open a new one."""
+        idle = self._idle_connections.get(key)
+        while idle:
+            connection = idle.pop()
+            if not connection.closed:
+                timing.reused = True
+                return connection
+            self._connections.discard(connection)
+        return await self._connect_with_timeout(key, timing)
+
+    def _release(self, key: _ConnectionKey, connection: RawHttpProtocol) -> None:
+        if connection.closed:
+            self._connections.discard(connection)
+        else:
+            self._idle_connections.setdefault(key, deque()).append(connection)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: str | bytes | None = None,
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Generic request method that handles common logic for all HTTP methods.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: The URL to send the request to
+            headers: Request headers
+            data: Request payload (for POST, PUT, etc.)
+            **kwargs: Unused, accepted for compatibility with the other HTTP clients
+
+        Returns:
+            RequestRecord with the response data
+        """
+        self.debug(lambda: f"Sending raw {method} request to {url}")
+
+        record: RequestRecord = RequestRecord(
+            start_perf_ns=time.perf_counter_ns(),
+        )
+        try:
+            async with self._connection_limit:
+                await self._send(record, method, url, headers, data)
+        except Exception as e:
+            record.end_perf_ns = time.perf_counter_ns()
+            self.error(f"Error in raw HTTP request: {e!r}")
+            record.error = ErrorDetails(type=e.__class__.__name__, message=str(e))
+
+        return record
+
+    async def _send(
+        self,
+        record: RequestRecord,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: str | bytes | None,
+    ) -> None:
+        split_url = urlsplit(url)
+        key = _connection_key(split_url)
+        body = data.encode() if isinstance(data, str) else data or b""
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+
+        timing = record.connection_timing = ConnectionTiming()
+        record.start_perf_ns = time.perf_counter_ns()
+        watchdog: StallWatchdog | None = None
+        response: RawHttpResponse | None = None
+        if self.stall_timeouts_enabled:
+
+            def on_stall(error: Exception) -> None:
+                # Fail the response the same way as the request timeout
+                if response is not None:
+                    _fail_response(response, error)
+
+            watchdog = StallWatchdog(
+                self.model_endpoint.endpoint.first_token_timeout,
+                self.model_endpoint.endpoint.inter_chunk_timeout,
+            )
+            watchdog.start(on_stall)
+        try:
+            connection = await self._acquire(key, timing)
+            if watchdog is not None and watchdog.error is not None:
+                # The first token timeout expired while connecting
+                self._release(key, connection)
+                raise watchdog.error
+            timing.connection_ready_perf_ns = time.perf_counter_ns()
+            try:
+                response = connection.send_request(
+                    method, _build_request(method, split_url, headers, body) + body
+                )
+                response.watchdog = watchdog
+                response.timing_only = self.timing_only
+                # The transport writes as much as it can to the socket right away
+                timing.request_sent_perf_ns = time.perf_counter_ns()
+                # Expire the response with a timer, instead of wrapping every request in a task
+                timeout_handle = loop.call_at(
+                    deadline, _expire_response, response, self.timeout
+                )
+                try:
+                    await response.done
+                finally:
+                    timeout_handle.cancel()
+            except BaseException:
+                connection.close()
+                self._connections.discard(connection)
+                raise
+        finally:
+            if watchdog is not None:
+                watchdog.stop()
+
+        if response.keep_alive:
+            self._release(key, connection)
+        else:
+            connection.close()
+            self._connections.discard(connection)
+
+        timing.headers_received_perf_ns = response.headers_perf_ns
+        record.status = response.status
+        # Check for HTTP errors
+        if response.status != 200:
+            record.error = ErrorDetails(
+                code=response.status,
+                type=response.reason,
+                message=response.body.decode(errors="replace"),
+            )
+            return
+
+        record.recv_start_perf_ns = response.headers_perf_ns
+        if self.timing_only:
+            record.response_bytes = response.num_bytes
+        if response.sse_splitter is not None:
+            record.responses.extend(response.sse_messages)
+            record.coalesced_response_count = response.sse_splitter.coalesced_count
+        elif self.timing_only:
+            record.responses.append(
+                timing_only_text_response(
+                    response.end_perf_ns,
+                    response.content_type,
+                    response.body.decode(errors="replace"),
+                )
+            )
+        else:
+            record.responses.append(
+                TextResponse(
+                    perf_ns=response.end_perf_ns,
+                    content_type=response.content_type,
+                    text=response.body.decode(errors="replace"),
+                )
+            )
+        record.end_perf_ns = response.end_perf_ns
+
+    async def post_request(
+        self,
+        url: str,
+        payload: str | bytes,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Send a streaming or non-streaming POST request to the specified URL with the given payload and headers.
+
+        If the response is an SSE stream, the response will be parsed into a list of SSE messages.
+        Otherwise, the response will be parsed into a TextResponse object.
+        """
+        return await self._request("POST", url, headers, data=payload, **kwargs)
+
+    async def get_request(
+        self, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> RequestRecord:
+        """Send a GET request to the specified URL with the given headers.
+
+        The response will be parsed into a TextResponse object.
+        """
+        return await self._request("GET", url, headers, **kwargs)
+
+    async def open_connections(
+        self,
+        url: str,
+        headers: dict[str, str],
+        num_connections: int,
+        send_request: bool = True,
+    ) -> list[RequestRecord]:
+        """Open keep-alive connections to the host of the URL, and add them to the idle pool.
+
+        If `send_request` is True, a GET request is sent to the URL over each connection.
+        Otherwise, the connections are only opened, and each record times the connection setup.
+        """
+        if send_request:
+            records = await asyncio.gather(
+                *[self.get_request(url, headers) for _ in range(num_connections)]
+            )
+            for record in records:
+                if record.end_perf_ns is None:
+                    record.end_perf_ns = time.perf_counter_ns()
+            return list(records)
+
+        key = _connection_key(urlsplit(url))
+        return list(
+            await asyncio.gather(
+                *[self._open_idle_connection(key) for _ in range(num_connections)]
+            )
+        )
+
+    async def _open_idle_connection(self, key: _ConnectionKey) -> RequestRecord:
+        record = RequestRecord(start_perf_ns=time.perf_counter_ns())
+        try:
+            connection = await self._connect_with_timeout(key)
+            record.end_perf_ns = time.perf_counter_ns()
+            self._release(key, connection)
+        except Exception as e:
+            record.end_perf_ns = time.perf_counter_ns()
+            self.error(f"Error opening raw HTTP connection: {e!r}")
+            record.error = ErrorDetails(type=e.__class__.__name__, message=str(e))
+        return record
+
+
+def _connection_key(split_url: SplitResult) -> _ConnectionKey:
+    secure = split_url.scheme == "https"
+    return (
+        split_url.hostname or "localhost",
+        split_url.port or (443 if secure else 80),
+        secure,
+    )
+
+
+def _expire_response(response: RawHttpResponse, timeout: float) -> None:
+    _fail_response(
+        response, asyncio.TimeoutError(f"Request timed out after {timeout} seconds")
+    )
+
+
+def _fail_response(response: RawHttpResponse, exc: BaseException) -> None:
+    if not response.done.done():
+        response.done.set_exception(exc)
+
+
+def _build_request(
+    method: str, split_url, headers: dict[str, str], body: bytes
+) -> bytes:
+    """Build the request line and headers of an HTTP/1.1 request."""
+    target = split_url.path or "/"
+    if split_url.query:
+        target += "?" + split_url.query
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {split_url.netloc}"]
+    lines.extend(
+        f"{name}: {value}"
+        for name, value in headers.items()
+        if name.lower() not in ("host", "content-length")
+    )
+    if body or method == "POST":
+        lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
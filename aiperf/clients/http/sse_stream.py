@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from aiperf.clients.http.aiohttp_client import parse_sse_message
+from aiperf.common.models import SSEMessage
+
+
+class SSEStreamSplitter:
+    """Splits the raw bytes of an SSE stream into SSE messages as the bytes arrive.
+
+    Unlike :class:`AioHttpSSEStreamReader`, this does not depend on the HTTP client, so it can be
+    fed with the chunks of any transport. Each message is timestamped with the arrival time of
+    the chunk that contained its first byte, which is the most accurate timestamp available
+    without timing each byte.
+
+    As each chunk is a single read of the transport, `coalesced_count` counts the messages whose
+    first byte arrived in the same read as the first byte of the message before them.
+    """
+
+    __slots__ = ("_buffer", "_first_byte_ns", "_last_message_ns", "coalesced_count")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._first_byte_ns: int | None = None
+        self._last_message_ns: int | None = None
+        self.coalesced_count = 0
+
+    def feed(self, data: bytes, perf_ns: int) -> list[SSEMessage]:
+        """Add a chunk of the stream that arrived at `perf_ns`, and return the messages that it completed."""
+        messages: list[SSEMessage] = []
+        if not data:
+            return messages
+        if self._first_byte_ns is None:
+            self._first_byte_ns = perf_ns
+        self._buffer += data
+
+        start = 0
+        while (end := self._buffer.find(b"\n\n", start)) != -1:
+            if raw_message := _decode(self._buffer[start:end]):
+                messages.append(self._parse(raw_message, self._first_byte_ns))
+            start = end + 2
+            # The next message starts within this chunk
+            self._first_byte_ns = perf_ns
+
+        del self._buffer[:start]
+        if not self._buffer:
+            self._first_byte_ns = None
+        return messages
+
+    def flush(self) -> SSEMessage | None:
+        """Return the final message of a stream that ended without a trailing blank line, if any."""
+        raw_message = _decode(self._buffer)
+        first_byte_ns = self._first_byte_ns
+        self._buffer.clear()
+        self._first_byte_ns = None
+        if not raw_message or first_byte_ns is None:
+            return None
+        return self._parse(raw_message, first_byte_ns)
+
+    def _parse(self, raw_message: str, first_byte_ns: int) -> SSEMessage:
+        if first_byte_ns == self._last_message_ns:
+            self.coalesced_count += 1
+        self._last_message_ns = first_byte_ns
+        return parse_sse_message(raw_message, first_byte_ns)
+
+
+def _decode(raw: bytes | bytearray) -> str:
+    try:
+        return raw.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        # Handle potential encoding issues gracefully
+        return raw.decode("utf-8", errors="replace").strip()
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import time
+from collections.abc import Callable
+from types import TracebackType
+
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.exceptions import (
+    FirstTokenTimeoutError,
+    InferenceClientError,
+    InterChunkTimeoutError,
+)
+
+_TASK_HAS_UNCANCEL = hasattr(asyncio.Task, "uncancel")
+"""Whether the tasks track their cancellation requests, which is only the case from Python 3.11."""
+
+
+class StallWatchdog:
+    """Enforces the first token and inter-chunk timeouts of a single request, so that a stalled
+    response frees its concurrency slot long before the request timeout.
+
+    The HTTP client sets `last_chunk_perf_ns` as each chunk of the response arrives. Rather than
+    rescheduling a timer for every chunk, a single timer checks the time of the latest chunk when
+    it fires, and is pushed back from there for as long as the response keeps progressing.
+
+    The watchdog can be used as an async context manager around the request, which cancels the
+    current task on a stall and raises the timeout error in its place. Otherwise, `start` takes a
+    callback which is given the timeout error, such as to fail a response future.
+
+    Before Python 3.11, the tasks do not count their cancellation requests, so a cancellation
+    requested by someone else at the same time as a stall is also replaced by the timeout error.
+    """
+
+    __slots__ = (
+        "first_token_timeout",
+        "inter_chunk_timeout",
+        "last_chunk_perf_ns",
+        "error",
+        "_start_perf_ns",
+        "_handle",
+        "_task",
+        "_cancelling",
+        "_cancel_requested",
+    )
+
+    def __init__(
+        self, first_token_timeout: float | None, inter_chunk_timeout: float | None
+    ) -> None:
+        self.first_token_timeout = first_token_timeout
+        self.inter_chunk_timeout = inter_chunk_timeout
+        self.last_chunk_perf_ns: int | None = None
+        self.error: InferenceClientError | None = None
+        self._start_perf_ns = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+        self._cancelling = 0
+        self._cancel_requested = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether either of the timeouts is set."""
+        return (
+            self.first_token_timeout is not None or self.inter_chunk_timeout is not None
+        )
+
+    def start(self, on_stall: Callable[[InferenceClientError], None]) -> None:
+        """Start watching the response, calling `on_stall` with the timeout error if it stalls."""
+        if not self.enabled:
+            return
+        self._start_perf_ns = time.perf_counter_ns()
+        self._schedule(
+            min(
+                timeout
+                for timeout in (self.first_token_timeout, self.inter_chunk_timeout)
+                if timeout is not None
+            ),
+            on_stall,
+        )
+
+    def stop(self) -> None:
+        """Stop watching the response."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(
+        self, delay: float, on_stall: Callable[[InferenceClientError], None]
+    ) -> None:
+        self._handle = asyncio.get_running_loop().call_later(
+            delay, self._check, on_stall
+        )
+
+    def _check(self, on_stall: Callable[[InferenceClientError], None]) -> None:
+        self._handle = None
+        now_ns = time.perf_counter_ns()
+        if self.last_chunk_perf_ns is None:
+            if self.first_token_timeout is not None:
+                remaining_ns = (
+                    self._start_perf_ns
+                    + int(self.first_token_timeout * NANOS_PER_SECOND)
+                    - now_ns
+                )
+                if remaining_ns <= 0:
+                    self.error = FirstTokenTimeoutError(
+                        f"No response received within the first token timeout of {self.first_token_timeout} seconds"
+                    )
+                    on_stall(self.error)
+                    return
+                delay = remaining_ns / NANOS_PER_SECOND
+                # Check back within the inter-chunk timeout, in case the first chunk arrives
+                if self.inter_chunk_timeout is not None:
+                    delay = min(delay, self.inter_chunk_timeout)
+            else:
+                # Without a first token timeout, the inter-chunk timeout only starts at the first chunk
+                delay = self.inter_chunk_timeout  # type: ignore[assignment]
+        else:
+            if self.inter_chunk_timeout is None:
+                return
+            remaining_ns = (
+                self.last_chunk_perf_ns
+                + int(self.inter_chunk_timeout * NANOS_PER_SECOND)
+                - now_ns
+            )
+            if remaining_ns <= 0:
+                self.error = InterChunkTimeoutError(
+                    f"No response chunk received within the inter-chunk timeout of {self.inter_chunk_timeout} seconds"
+                )
+                on_stall(self.error)
+                return
+            delay = remaining_ns / NANOS_PER_SECOND
+
+        self._schedule(delay, on_stall)
+
+    async def __aenter__(self) -> "StallWatchdog":
+        if not self.enabled:
+            return self
+        self._task = asyncio.current_task()
+        if _TASK_HAS_UNCANCEL:
+            self._cancelling = self._task.cancelling()  # type: ignore[union-attr]
+        self.start(self._cancel_task)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+        if not self._cancel_requested:
+            return
+        # Only replace the cancellation caused by the watchdog, not one requested by someone else
+        if _TASK_HAS_UNCANCEL and self._task.uncancel() > self._cancelling:  # type: ignore[union-attr]
+            return
+        if exc_type is asyncio.CancelledError:
+            raise self.error from exc_val
+
+    def _cancel_task(self, error: InferenceClientError) -> None:
+        self._cancel_requested = True
+        self._task.cancel()  # type: ignore[union-attr]
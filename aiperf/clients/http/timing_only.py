@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import json
+import re
+
+import orjson
+
+from aiperf.common.models import SSEMessage, TextResponse
+
+_USAGE_KEY_RE = re.compile(r'"usage"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def append_timing_only_message(messages: list[SSEMessage], message: SSEMessage) -> None:
+    """Append an SSE message of a stream in timing-only mode.
+
+    Only the timestamp of each message is kept, apart from the packets of the latest message, as the
+    final message of a stream is where the server reports the usage. The [DONE] message is dropped.
+
+    Messages without any content, such as the role-only first message, are dropped once the next
+    message arrives, by the same check as the response extractor, so that the timing metrics are the
+    same as in normal mode. The latest message is checked by the parser instead, which keeps its usage.
+    """
+    if message.extract_data_content() == "[DONE]":
+        return
+    if messages:
+        if has_content(messages[-1]):
+            messages[-1].packets.clear()
+        else:
+            messages.pop()
+    messages.append(message)
+
+
+def has_content(message: SSEMessage) -> bool:
+    """Whether an SSE message has any content, by the same check as the response extractor."""
+    # Imported here, as the parsers depend on the clients
+    from aiperf.parsers.openai_parsers import parse_raw_text
+
+    return parse_raw_text(message.extract_data_content()) is not None
+
+
+def timing_only_text_response(
+    perf_ns: int, content_type: str | None, body: str
+) -> TextResponse:
+    """Create the response of a non-streaming request in timing-only mode, which only keeps the
+    usage reported by the server out of the body."""
+    return TextResponse(
+        perf_ns=perf_ns, content_type=content_type, text=extract_usage(body)
+    )
+
+
+def extract_usage(body: str) -> str:
+    """Extract the `usage` object of a JSON response body as a JSON object of its own, without
+    decoding the rest of the body. Returns an empty string if the body has no usage.
+
+    The usage is the last field of an OpenAI response, so the body is searched from the end. The
+    quotes of any JSON string within the content are escaped, so the content cannot match the key.
+    """
+    index = body.rfind('"usage"')
+    if index == -1 or not (match := _USAGE_KEY_RE.match(body, index)):
+        return ""
+    try:
+        usage, _ = _JSON_DECODER.raw_decode(body, match.end())
+    except ValueError:
+        return ""
+    if not isinstance(usage, dict):
+        return ""
+    return orjson.dumps({"usage": usage}).decode()
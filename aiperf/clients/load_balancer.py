@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import random
+
+from aiperf.common.enums import LoadBalancingStrategy
+
+
+class EndpointLoadBalancer:
+    """Selects which of multiple endpoint URLs to send each request to, based on a
+    :class:`LoadBalancingStrategy`.
+
+    The balancer tracks the number of requests in flight to each endpoint, which must be released
+    once the request has completed. Each worker balances its own requests, so the least outstanding
+    strategies only account for the requests in flight from the same worker.
+    """
+
+    def __init__(self, num_endpoints: int, strategy: LoadBalancingStrategy) -> None:
+        if num_endpoints < 1:
+            raise ValueError("At least one endpoint is required for load balancing")
+        self.strategy = strategy
+        self.in_flight: list[int] = [0] * num_endpoints
+        self._next_index = 0
+        self._select_func = {
+            LoadBalancingStrategy.ROUND_ROBIN: self._select_round_robin,
+            LoadBalancingStrategy.LEAST_OUTSTANDING: self._select_least_outstanding,
+            LoadBalancingStrategy.POWER_OF_TWO: self._select_power_of_two,
+        }[strategy]
+
+    def acquire(self) -> int:
+        """Select the endpoint to send the next request to, and count the request as in flight.
+
+        Returns:
+            The index of the selected endpoint.
+        """
+        index = self._select_func()
+        self.in_flight[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        """Count the request to the endpoint at the given index as completed."""
+        self.in_flight[index] -= 1
+
+    def _select_round_robin(self) -> int:
+        index = self._next_index
+        self._next_index = (index + 1) % len(self.in_flight)
+        return index
+
+    def _select_least_outstanding(self) -> int:
+        # Start the search at a rotating index, so that ties do not always go to the first endpoint
+        start = self._select_round_robin()
+        num_endpoints = len(self.in_flight)
+        return min(
+            ((start + offset) % num_endpoints for offset in range(num_endpoints)),
+            key=self.in_flight.__getitem__,
+        )
+
+    def _select_power_of_two(self) -> int:
+        if len(self.in_flight) == 1:
+            return 0
+        first, second = random.sample(range(len(self.in_flight)), 2)
+        return first if self.in_flight[first] <= self.in_flight[second] else second
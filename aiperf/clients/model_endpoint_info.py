@@ -12,7 +12,13 @@ from typing import Any
 from pydantic import Field
 
 from aiperf.common.config import EndpointDefaults, UserConfig
-from aiperf.common.enums import EndpointType, ModelSelectionStrategy
+from aiperf.common.constants import UNIX_SOCKET_URL_PREFIX
+from aiperf.common.enums import (
+    EndpointType,
+    HttpClientType,
+    LoadBalancingStrategy,
+    ModelSelectionStrategy,
+)
 from aiperf.common.models import AIPerfBaseModel
 
 
@@ -65,6 +71,19 @@ class EndpointInfo(AIPerfBaseModel):
         default=None,
         description="URL of the endpoint.",
     )
+    unix_socket_path: str | None = Field(
+        default=None,
+        description="The path of the Unix domain socket to connect to instead of the host of the URL.",
+    )
+    base_urls: list[str] = Field(
+        default_factory=list,
+        description="All of the URLs of the endpoint as specified by the user, including the base URL. "
+        "When there is more than one, the requests are load balanced across them.",
+    )
+    load_balancing: LoadBalancingStrategy = Field(
+        default=EndpointDefaults.LOAD_BALANCING,
+        description="The strategy to use for spreading the requests across the URLs of the endpoint.",
+    )
     custom_endpoint: str | None = Field(
         default=None,
         description="Custom endpoint to use for the models.",
@@ -92,6 +111,37 @@ class EndpointInfo(AIPerfBaseModel):
         default=EndpointDefaults.TIMEOUT,
         description="The timeout in seconds for each request to the endpoint.",
     )
+    connect_timeout: float | None = Field(
+        default=EndpointDefaults.CONNECT_TIMEOUT,
+        description="The timeout in seconds for opening a connection to the endpoint, or None to use the request timeout.",
+    )
+    first_token_timeout: float | None = Field(
+        default=EndpointDefaults.FIRST_TOKEN_TIMEOUT,
+        description="The timeout in seconds from the start of a request until the first chunk of the response, "
+        "or None to use the request timeout.",
+    )
+    inter_chunk_timeout: float | None = Field(
+        default=EndpointDefaults.INTER_CHUNK_TIMEOUT,
+        description="The maximum gap in seconds between two chunks of a response, or None to use the request timeout.",
+    )
+    http_client: HttpClientType = Field(
+        default=EndpointDefaults.HTTP_CLIENT,
+        description="The HTTP client to send requests with.",
+    )
+    http2_connections: int = Field(
+        default=EndpointDefaults.HTTP2_CONNECTIONS,
+        ge=1,
+        description="The number of HTTP/2 connections to open to the endpoint.",
+    )
+    timing_only: bool = Field(
+        default=EndpointDefaults.TIMING_ONLY,
+        description="Whether to only record the timing and size of the responses, and discard their content "
+        "apart from the usage reported by the server.",
+    )
+    socket_read_timestamps: bool = Field(
+        default=EndpointDefaults.SOCKET_READ_TIMESTAMPS,
+        description="Whether to timestamp the responses with the arrival time of each socket read.",
+    )
     extra: list[tuple[str, Any]] | None = Field(
         default=None,
         description="Additional inputs to include with every request. "
@@ -102,18 +152,38 @@ class EndpointInfo(AIPerfBaseModel):
     @classmethod
     def from_user_config(cls, user_config: UserConfig) -> "EndpointInfo":
         """Create an HttpEndpointInfo from a UserConfig."""
+        urls = user_config.endpoint.urls
+        base_url, unix_socket_path = _parse_base_url(urls[0])
         return cls(
             type=EndpointType(user_config.endpoint.type),
             custom_endpoint=user_config.endpoint.custom_endpoint,
             streaming=user_config.endpoint.streaming,
-            base_url=user_config.endpoint.url,
+            base_url=base_url,
+            unix_socket_path=unix_socket_path,
+            base_urls=urls,
+            load_balancing=user_config.endpoint.load_balancing,
             headers=user_config.input.headers,
             extra=user_config.input.extra,
             timeout=user_config.endpoint.timeout_seconds,
+            connect_timeout=user_config.endpoint.connect_timeout_seconds,
+            first_token_timeout=user_config.endpoint.first_token_timeout_seconds,
+            inter_chunk_timeout=user_config.endpoint.inter_chunk_timeout_seconds,
             api_key=user_config.endpoint.api_key,
+            http_client=user_config.endpoint.http_client,
+            http2_connections=user_config.endpoint.http2_connections,
+            timing_only=user_config.endpoint.timing_only,
+            socket_read_timestamps=user_config.endpoint.socket_read_timestamps,
         )
 
 
+def _parse_base_url(url: str) -> tuple[str, str | None]:
+    """Split a user specified URL into the base URL and the path of the Unix domain socket, if any."""
+    if url.startswith(UNIX_SOCKET_URL_PREFIX):
+        # Requests are sent over the socket, so the host of the URL is only a placeholder
+        return "http://localhost", url.removeprefix(UNIX_SOCKET_URL_PREFIX)
+    return url, None
+
+
 class ModelEndpointInfo(AIPerfBaseModel):
     """Information about a model endpoint."""
 
@@ -144,6 +214,24 @@ class ModelEndpointInfo(AIPerfBaseModel):
             url += "/" + path.lstrip("/")
         return url
 
+    def split_by_base_url(self) -> list["ModelEndpointInfo"]:
+        """Split the model endpoint into one model endpoint per URL of the endpoint, for load balancing.
+        If the endpoint has a single URL, only this model endpoint is returned."""
+        if len(self.endpoint.base_urls) <= 1:
+            return [self]
+        model_endpoints = []
+        for url in self.endpoint.base_urls:
+            base_url, unix_socket_path = _parse_base_url(url)
+            endpoint = self.endpoint.model_copy(
+                update={
+                    "base_url": base_url,
+                    "unix_socket_path": unix_socket_path,
+                    "base_urls": [url],
+                }
+            )
+            model_endpoints.append(self.model_copy(update={"endpoint": endpoint}))
+        return model_endpoints
+
     @property
     def primary_model(self) -> ModelInfo:
         """Get the primary model."""
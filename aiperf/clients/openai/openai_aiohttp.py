@@ -1,17 +1,20 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-import json
+import asyncio
 import time
 from abc import ABC
 from typing import Any
 
-from aiperf.clients.http.aiohttp_client import AioHttpClientMixin
+import orjson
+
+from aiperf.clients.load_balancer import EndpointLoadBalancer
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.enums import EndpointType
-from aiperf.common.factories import InferenceClientFactory
+from aiperf.common.factories import HttpClientFactory, InferenceClientFactory
 from aiperf.common.mixins import AIPerfLoggerMixin
 from aiperf.common.models import ErrorDetails, RequestRecord
+from aiperf.common.protocols import HttpClientProtocol
 
 
 @InferenceClientFactory.register_all(
@@ -20,12 +23,36 @@ from aiperf.common.models import ErrorDetails, RequestRecord
     EndpointType.EMBEDDINGS,
     EndpointType.RANKINGS,
 )
-class OpenAIClientAioHttp(AioHttpClientMixin, AIPerfLoggerMixin, ABC):
-    """Inference client for OpenAI based requests using aiohttp."""
+class OpenAIClientAioHttp(AIPerfLoggerMixin, ABC):
+    """Inference client for OpenAI based requests.
+
+    The requests are sent using the HTTP client selected by `--http-client`, which is aiohttp by default.
+    When the endpoint has multiple URLs, each URL gets its own HTTP client and connection pool, and the
+    requests are spread across them using the `--load-balancing` strategy.
+    """
 
     def __init__(self, model_endpoint: ModelEndpointInfo, **kwargs) -> None:
-        super().__init__(model_endpoint, **kwargs)
+        super().__init__(model_endpoint=model_endpoint, **kwargs)
         self.model_endpoint = model_endpoint
+        self.endpoint_model_endpoints = model_endpoint.split_by_base_url()
+        self.http_clients: list[HttpClientProtocol] = [
+            HttpClientFactory.create_instance(
+                model_endpoint.endpoint.http_client,
+                model_endpoint=endpoint_model_endpoint,
+            )
+            for endpoint_model_endpoint in self.endpoint_model_endpoints
+        ]
+        self.http_client = self.http_clients[0]
+        self.load_balancer: EndpointLoadBalancer | None = None
+        if len(self.http_clients) > 1:
+            self.load_balancer = EndpointLoadBalancer(
+                len(self.http_clients), model_endpoint.endpoint.load_balancing
+            )
+
+    async def close(self) -> None:
+        """Close the client."""
+        for http_client in self.http_clients:
+            await http_client.close()
 
     def get_headers(
         self,
@@ -64,6 +91,53 @@ class OpenAIClientAioHttp(AioHttpClientMixin, AIPerfLoggerMixin, ABC):
             url = f"http://{url}"
         return url
 
+    async def prewarm_connections(
+        self,
+        model_endpoint: ModelEndpointInfo,
+        num_connections: int,
+        path: str | None = None,
+    ) -> list[RequestRecord]:
+        """Open connections to the server before they are needed, optionally sending a cheap
+        GET request over each of them, such as to `/v1/models`.
+
+        When the requests are load balanced, the connections are split evenly across the URLs.
+        """
+        headers = self.get_headers(model_endpoint)
+        headers["Accept"] = "application/json"
+        if self.load_balancer is None:
+            return await self.http_client.open_connections(
+                self._get_prewarm_url(model_endpoint, path),
+                headers,
+                num_connections,
+                send_request=bool(path),
+            )
+
+        connections_per_endpoint = -(-num_connections // len(self.http_clients))
+        results = await asyncio.gather(
+            *[
+                http_client.open_connections(
+                    self._get_prewarm_url(endpoint_model_endpoint, path),
+                    headers,
+                    connections_per_endpoint,
+                    send_request=bool(path),
+                )
+                for http_client, endpoint_model_endpoint in zip(
+                    self.http_clients, self.endpoint_model_endpoints, strict=True
+                )
+            ]
+        )
+        return [record for records in results for record in records]
+
+    def _get_prewarm_url(
+        self, model_endpoint: ModelEndpointInfo, path: str | None
+    ) -> str:
+        url = model_endpoint.endpoint.base_url or ""
+        if not url.startswith("http"):
+            url = f"http://{url}"
+        if path:
+            url = url.rstrip("/") + "/" + path.lstrip("/")
+        return url
+
     async def send_request(
         self,
         model_endpoint: ModelEndpointInfo,
@@ -71,18 +145,24 @@ class OpenAIClientAioHttp(AioHttpClientMixin, AIPerfLoggerMixin, ABC):
         x_request_id: str | None = None,
         x_correlation_id: str | None = None,
     ) -> RequestRecord:
-        """Send OpenAI request using aiohttp."""
+        """Send OpenAI request using the selected HTTP client."""
 
         # capture start time before request is sent in the case of an error
         start_perf_ns = time.perf_counter_ns()
+        index, endpoint_url = 0, None
+        url_model_endpoint = model_endpoint
+        if self.load_balancer is not None:
+            index = self.load_balancer.acquire()
+            url_model_endpoint = self.endpoint_model_endpoints[index]
+            endpoint_url = url_model_endpoint.endpoint.base_urls[0]
         try:
             self.debug(
-                lambda: f"Sending OpenAI request to {model_endpoint.url}, payload: {payload}"
+                lambda: f"Sending OpenAI request to {url_model_endpoint.url}, payload: {payload}"
             )
 
-            record = await self.post_request(
-                self.get_url(model_endpoint),
-                json.dumps(payload),
+            record = await self.http_clients[index].post_request(
+                self.get_url(url_model_endpoint),
+                orjson.dumps(payload),
                 self.get_headers(
                     model_endpoint,
                     x_request_id=x_request_id,
@@ -97,5 +177,9 @@ class OpenAIClientAioHttp(AioHttpClientMixin, AIPerfLoggerMixin, ABC):
                 error=ErrorDetails(type=e.__class__.__name__, message=str(e)),
             )
             self.exception(f"Error in OpenAI request: {e.__class__.__name__} {str(e)}")
+        finally:
+            if self.load_balancer is not None:
+                self.load_balancer.release(index)
 
+        record.endpoint_url = endpoint_url
         return record
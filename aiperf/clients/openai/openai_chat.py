@@ -3,11 +3,13 @@
 
 from typing import Any
 
+import orjson
+
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.enums import EndpointType
 from aiperf.common.factories import RequestConverterFactory
 from aiperf.common.mixins import AIPerfLoggerMixin
-from aiperf.common.models import Turn
+from aiperf.common.models import ConversationHistory, Turn
 
 DEFAULT_ROLE = "user"
 
@@ -20,10 +22,16 @@ class OpenAIChatCompletionRequestConverter(AIPerfLoggerMixin):
         self,
         model_endpoint: ModelEndpointInfo,
         turn: Turn,
+        history: ConversationHistory | None = None,
     ) -> dict[str, Any]:
-        """Format payload for a chat completion request."""
+        """Format payload for a chat completion request.
+
+        If a conversation history is provided, the previous turns are sent before the new turn.
+        """
 
         messages = self._create_messages(turn)
+        if history:
+            messages = self._create_history_messages(history, messages)
 
         payload = {
             "messages": messages,
@@ -40,6 +48,27 @@ class OpenAIChatCompletionRequestConverter(AIPerfLoggerMixin):
         self.debug(lambda: f"Formatted payload: {payload}")
         return payload
 
+    def _create_history_messages(
+        self, history: ConversationHistory, messages: list[dict[str, Any]]
+    ) -> orjson.Fragment:
+        """Create the messages of a multi-turn request as a pre-serialized JSON array.
+
+        The messages of previous turns are serialized once and appended to the payload cache of
+        the history, so the cost of building each request is proportional to the new content only.
+        """
+        cache = history.payload_cache
+        for turn in history.turns[history.num_cached_turns :]:
+            for message in self._create_messages(turn):
+                if cache:
+                    cache += b","
+                cache += orjson.dumps(message)
+        history.num_cached_turns = len(history.turns)
+
+        new_messages = b",".join(orjson.dumps(message) for message in messages)
+        if cache:
+            return orjson.Fragment(b"[" + cache + b"," + new_messages + b"]")
+        return orjson.Fragment(b"[" + new_messages + b"]")
+
     def _create_messages(self, turn: Turn) -> list[dict[str, Any]]:
         message = {
             "role": turn.role or DEFAULT_ROLE,
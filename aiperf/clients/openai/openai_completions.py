@@ -7,7 +7,7 @@ from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.enums import EndpointType
 from aiperf.common.factories import RequestConverterFactory
 from aiperf.common.mixins import AIPerfLoggerMixin
-from aiperf.common.models import Turn
+from aiperf.common.models import ConversationHistory, Turn
 
 
 # TODO: Not fully implemented yet.
@@ -19,8 +19,9 @@ class OpenAICompletionRequestConverter(AIPerfLoggerMixin):
         self,
         model_endpoint: ModelEndpointInfo,
         turn: Turn,
+        history: ConversationHistory | None = None,
     ) -> dict[str, Any]:
-        """Format payload for a completion request."""
+        """Format payload for a completion request. The conversation history is not used."""
 
         prompts = [
             content for text in turn.texts for content in text.contents if content
@@ -7,7 +7,7 @@ from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.enums import EndpointType
 from aiperf.common.factories import RequestConverterFactory
 from aiperf.common.mixins import AIPerfLoggerMixin
-from aiperf.common.models import Turn
+from aiperf.common.models import ConversationHistory, Turn
 
 
 @RequestConverterFactory.register(EndpointType.EMBEDDINGS)
@@ -18,8 +18,9 @@ class OpenAIEmbeddingsRequestConverter(AIPerfLoggerMixin):
         self,
         model_endpoint: ModelEndpointInfo,
         turn: Turn,
+        history: ConversationHistory | None = None,
     ) -> dict[str, Any]:
-        """Format payload for an embeddings request."""
+        """Format payload for an embeddings request. The conversation history is not used."""
 
         if turn.max_tokens:
             self.error("Max_tokens is provided but is not supported for embeddings.")
@@ -6,9 +6,12 @@ from typing import cast
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import CommClientType
 from aiperf.common.mixins import AIPerfLifecycleMixin
+from aiperf.common.models import CommClientStats
 from aiperf.common.protocols import (
     CommunicationClientProtocol,
     CommunicationProtocol,
+    DispatchClientProtocol,
+    DispatchTargetClientProtocol,
     PubClientProtocol,
     PullClientProtocol,
     PushClientProtocol,
@@ -42,6 +45,7 @@ class BaseCommunication(AIPerfLifecycleMixin, ABC):
         bind: bool = False,
         socket_ops: dict | None = None,
         max_pull_concurrency: int | None = None,
+        **kwargs,
     ) -> CommunicationClientProtocol:
         """Create a communication client for a given client type and address.
 
@@ -51,8 +55,14 @@ class BaseCommunication(AIPerfLifecycleMixin, ABC):
             bind: Whether to bind or connect the socket.
             socket_ops: Additional socket options to set.
             max_pull_concurrency: The maximum number of concurrent pull requests to allow. (Only used for pull clients)
+            **kwargs: Additional client specific arguments.
         """
 
+    @abstractmethod
+    def get_client_stats(self) -> list[CommClientStats]:
+        """Get the message counters of the push, pull, and request clients, to track the queue depth of
+        each channel, and the request timeouts and latencies."""
+
     def create_pub_client(
         self,
         address: CommAddressType,
@@ -125,3 +135,32 @@ class BaseCommunication(AIPerfLifecycleMixin, ABC):
             ReplyClientProtocol,
             self.create_client(CommClientType.REPLY, address, bind, socket_ops),
         )
+
+    def create_dispatch_client(
+        self,
+        address: CommAddressType,
+        bind: bool = True,
+        socket_ops: dict | None = None,
+    ) -> DispatchClientProtocol:
+        return cast(
+            DispatchClientProtocol,
+            self.create_client(CommClientType.DISPATCH, address, bind, socket_ops),
+        )
+
+    def create_dispatch_target_client(
+        self,
+        address: CommAddressType,
+        target_id: str,
+        bind: bool = False,
+        socket_ops: dict | None = None,
+    ) -> DispatchTargetClientProtocol:
+        return cast(
+            DispatchTargetClientProtocol,
+            self.create_client(
+                CommClientType.DISPATCH_TARGET,
+                address,
+                bind,
+                socket_ops,
+                target_id=target_id,
+            ),
+        )
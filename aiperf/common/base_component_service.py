@@ -7,12 +7,13 @@ import uuid
 from aiperf.common.base_service import BaseService
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.constants import (
+    DEFAULT_COMM_STATS_INTERVAL,
     DEFAULT_HEARTBEAT_INTERVAL,
     DEFAULT_MAX_REGISTRATION_ATTEMPTS,
     DEFAULT_REGISTRATION_INTERVAL,
 )
 from aiperf.common.decorators import implements_protocol
-from aiperf.common.enums import CommandType, LifecycleState, ServiceType
+from aiperf.common.enums import CommAddress, CommandType, LifecycleState, ServiceType
 from aiperf.common.hooks import (
     background_task,
     on_command,
@@ -21,6 +22,7 @@ from aiperf.common.hooks import (
 )
 from aiperf.common.messages import (
     CommandMessage,
+    CommStatsMessage,
     HeartbeatMessage,
     StatusMessage,
 )
@@ -29,7 +31,7 @@ from aiperf.common.messages.command_messages import (
     RegisterServiceCommand,
 )
 from aiperf.common.models.error_models import ErrorDetails
-from aiperf.common.protocols import ServiceProtocol
+from aiperf.common.protocols import PushClientProtocol, ServiceProtocol
 
 
 @implements_protocol(ServiceProtocol)
@@ -56,6 +58,9 @@ class BaseComponentService(BaseService):
             service_id=service_id,
             **kwargs,
         )
+        self.comm_stats_push_client: PushClientProtocol = self.comms.create_push_client(
+            CommAddress.COMM_STATS
+        )
 
     @background_task(interval=DEFAULT_HEARTBEAT_INTERVAL, immediate=False)
     async def _heartbeat_task(self) -> None:
@@ -65,6 +70,18 @@ class BaseComponentService(BaseService):
                 service_id=self.service_id,
                 service_type=self.service_type,
                 state=self.state,
+                event_loop_lag=self.get_event_loop_lag(),
+            )
+        )
+
+    @background_task(interval=DEFAULT_COMM_STATS_INTERVAL, immediate=False)
+    async def _comm_stats_task(self) -> None:
+        """Push the message counters of the push and pull clients to the timing manager, to track the queue depth
+        of each channel. They are pushed instead of published, as every service sends them."""
+        await self.comm_stats_push_client.push(
+            CommStatsMessage(
+                service_id=self.service_id,
+                client_stats=self.comms.get_client_stats(),
             )
         )
 
@@ -10,9 +10,12 @@ from aiperf.common.enums import (
     AIPerfUIType,
     AudioFormat,
     CommunicationBackend,
+    CreditRoutingMode,
     EndpointType,
     ExportLevel,
+    HttpClientType,
     ImageFormat,
+    LoadBalancingStrategy,
     ModelSelectionStrategy,
     RequestRateMode,
     ServiceRunType,
@@ -34,8 +37,18 @@ class EndpointDefaults:
     TYPE = EndpointType.CHAT
     STREAMING = False
     URL = "localhost:8000"
+    LOAD_BALANCING = LoadBalancingStrategy.ROUND_ROBIN
     TIMEOUT = 600.0
+    CONNECT_TIMEOUT = None
+    FIRST_TOKEN_TIMEOUT = None
+    INTER_CHUNK_TIMEOUT = None
     API_KEY = None
+    HTTP_CLIENT = HttpClientType.AIOHTTP
+    HTTP2_CONNECTIONS = 1
+    CONNECTION_PREWARM = False
+    CONNECTION_PREWARM_PATH = "/v1/models"
+    TIMING_ONLY = False
+    SOCKET_READ_TIMESTAMPS = False
 
 
 @dataclass(frozen=True)
@@ -119,8 +132,12 @@ class OutputDefaults:
     LOG_FOLDER = Path("logs")
     LOG_FILE = Path("aiperf.log")
     INPUTS_JSON_FILE = Path("inputs.json")
+    DATASET_STORE_FILE = Path("dataset_store.bin")
     PROFILE_EXPORT_AIPERF_CSV_FILE = Path("profile_export_aiperf.csv")
     PROFILE_EXPORT_AIPERF_JSON_FILE = Path("profile_export_aiperf.json")
+    PROFILE_EXPORT_AIPERF_ENDPOINTS_JSON_FILE = Path(
+        "profile_export_aiperf_endpoints.json"
+    )
     EXPORT_LEVEL = ExportLevel.RECORDS
 
 
@@ -147,6 +164,9 @@ class ServiceDefaults:
     LOG_PATH = None
     RECORD_PROCESSOR_SERVICE_COUNT = None
     UI_TYPE = AIPerfUIType.DASHBOARD
+    ZMQ_PUSH_BATCH_SIZE = None
+    ZMQ_PUSH_BATCH_TIMEOUT_US = None
+    MAX_PIPELINE_BACKLOG = None
 
 
 @dataclass(frozen=True)
@@ -161,12 +181,19 @@ class LoadGeneratorDefaults:
     TIMING_MODE = TimingMode.REQUEST_RATE
     REQUEST_CANCELLATION_RATE = 0.0
     REQUEST_CANCELLATION_DELAY = 0.0
+    CREDIT_ROUTING_MODE = CreditRoutingMode.LEAST_LOADED
+    SESSION_AFFINITY_LOAD_FACTOR = 1.25
+    CLIENT_LAG_THRESHOLD = 50.0
+    INVALIDATE_ON_CLIENT_SATURATION = False
 
 
 @dataclass(frozen=True)
 class WorkersDefaults:
     MIN = None
     MAX = None
+    AUTOSCALE = False
+    COMPUTE_METRICS = False
+    MAX_SESSIONS = 25_000
 
 
 @dataclass(frozen=True)
@@ -15,7 +15,12 @@ from aiperf.common.config.config_validators import (
     parse_str_or_list,
 )
 from aiperf.common.config.groups import Groups
-from aiperf.common.enums import EndpointType, ModelSelectionStrategy
+from aiperf.common.enums import (
+    EndpointType,
+    HttpClientType,
+    LoadBalancingStrategy,
+    ModelSelectionStrategy,
+)
 
 _logger = AIPerfLogger(__name__)
 
@@ -109,11 +114,15 @@ class EndpointConfig(BaseConfig):
         ),
     ] = EndpointDefaults.STREAMING
 
-    url: Annotated[
-        str,
+    urls: Annotated[
+        list[str],
         Field(
-            description="URL of the endpoint to target for benchmarking.",
+            description="URL(s) of the endpoint to target for benchmarking. "
+            "Use `unix:///path/to.sock` to connect to a server on the same host over a Unix domain socket. "
+            "Can be a comma-separated list or repeated to spread the requests across multiple replicas "
+            "of the server, using the `--load-balancing` strategy.",
         ),
+        BeforeValidator(parse_str_or_list),
         CLIParameter(
             name=(
                 "--url",  # GenAI-Perf
@@ -121,7 +130,25 @@ class EndpointConfig(BaseConfig):
             ),
             group=_CLI_GROUP,
         ),
-    ] = EndpointDefaults.URL
+    ] = [EndpointDefaults.URL]
+
+    # NEW AIPerf Option
+    load_balancing: Annotated[
+        LoadBalancingStrategy,
+        Field(
+            description="When multiple URLs are specified, this is how each worker spreads its requests across them. "
+            "Each URL gets its own connection pool.\n"
+            "round_robin: the nth request is sent to the URL at index n-mod len(urls).\n"
+            "least_outstanding: each request is sent to the URL with the fewest requests in flight.\n"
+            "power_of_two: two URLs are picked at random, and the request is sent to the one with fewer "
+            "requests in flight.",
+        ),
+        CLIParameter(
+            name=("--load-balancing"),
+            group=_CLI_GROUP,
+            converter=custom_enum_converter,
+        ),
+    ] = EndpointDefaults.LOAD_BALANCING
 
     # NEW AIPerf Option
     timeout_seconds: Annotated[
@@ -135,6 +162,50 @@ class EndpointConfig(BaseConfig):
         ),
     ] = EndpointDefaults.TIMEOUT
 
+    # NEW AIPerf Option
+    connect_timeout_seconds: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The timeout in floating-point seconds for opening a connection to the endpoint. "
+            "Requests that time out fail with a ConnectTimeoutError. Defaults to the request timeout.",
+        ),
+        CLIParameter(
+            name=("--connect-timeout-seconds"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.CONNECT_TIMEOUT
+
+    # NEW AIPerf Option
+    first_token_timeout_seconds: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The timeout in floating-point seconds from the start of a request until the first chunk "
+            "of the response is received. Requests that time out fail with a FirstTokenTimeoutError. "
+            "Defaults to the request timeout.",
+        ),
+        CLIParameter(
+            name=("--first-token-timeout-seconds"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.FIRST_TOKEN_TIMEOUT
+
+    # NEW AIPerf Option
+    inter_chunk_timeout_seconds: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description="The maximum gap in floating-point seconds between two chunks of a response. A stalled "
+            "response fails with an InterChunkTimeoutError, which frees its concurrency slot instead of holding it "
+            "until the request timeout. Defaults to the request timeout.",
+        ),
+        CLIParameter(
+            name=("--inter-chunk-timeout-seconds"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.INTER_CHUNK_TIMEOUT
+
     # NEW AIPerf Option
     api_key: Annotated[
         str | None,
@@ -147,3 +218,97 @@ class EndpointConfig(BaseConfig):
             group=_CLI_GROUP,
         ),
     ] = EndpointDefaults.API_KEY
+
+    # NEW AIPerf Option
+    http_client: Annotated[
+        HttpClientType,
+        Field(
+            description="The HTTP client to send requests with.\n"
+            "aiohttp: HTTP/1.1, with one pooled keep-alive connection per in-flight request.\n"
+            "http2: HTTP/2, with many concurrent requests multiplexed as streams over each connection. "
+            "Plain `http://` URLs use HTTP/2 with prior knowledge (h2c). Requires the `h2` package.\n"
+            "raw: HTTP/1.1, using a minimal client built directly on asyncio protocols, which has the "
+            "lowest overhead and timestamps the response bytes as soon as they arrive.",
+        ),
+        CLIParameter(
+            name=("--http-client"),
+            group=_CLI_GROUP,
+            converter=custom_enum_converter,
+        ),
+    ] = EndpointDefaults.HTTP_CLIENT
+
+    # NEW AIPerf Option
+    http2_connections: Annotated[
+        int,
+        Field(
+            ge=1,
+            description="The number of HTTP/2 connections each worker opens to the endpoint when using "
+            "`--http-client http2`. Requests are spread across the connections, preferring the one with "
+            "the fewest requests in flight.",
+        ),
+        CLIParameter(
+            name=("--http2-connections"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.HTTP2_CONNECTIONS
+
+    # NEW AIPerf Option
+    connection_prewarm: Annotated[
+        bool,
+        Field(
+            description="Open enough connections to cover each worker's share of `--concurrency` before "
+            "profiling starts, so that the profiling phase only measures requests over established connections. "
+            "The connect times are reported separately. This is disabled by default, as it sends extra requests "
+            "to the `--connection-prewarm-path`, which not every server serves.",
+        ),
+        CLIParameter(
+            name=("--connection-prewarm"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.CONNECTION_PREWARM
+
+    # NEW AIPerf Option
+    connection_prewarm_path: Annotated[
+        str | None,
+        Field(
+            description="The path of a cheap GET request to send over each pre-warmed connection, relative to "
+            "the `--url`. If empty, the raw HTTP client only opens the connections, and the other HTTP clients "
+            "send the request to the `--url` itself, as they can only open a connection for a request.",
+        ),
+        CLIParameter(
+            name=("--connection-prewarm-path"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.CONNECTION_PREWARM_PATH
+
+    # NEW AIPerf Option
+    timing_only: Annotated[
+        bool,
+        Field(
+            description="Only record the timing and the size in bytes of the responses, and discard their "
+            "content as it is received. This cuts the memory and serialization cost of each record, especially "
+            "for embeddings and large non-streaming responses. The token counts come from the `usage` reported "
+            "by the server, which is kept from the final chunk of a stream or from a non-streaming response, "
+            "such as when `stream_options.include_usage` is set with `--extra-inputs`.",
+        ),
+        CLIParameter(
+            name=("--timing-only"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.TIMING_ONLY
+
+    # NEW AIPerf Option
+    socket_read_timestamps: Annotated[
+        bool,
+        Field(
+            description="Timestamp each socket read of the responses of `--http-client aiohttp`, and timestamp "
+            "each SSE message with the earliest read which contained its first byte, rather than with the time "
+            "the client got around to reading it. The number of messages which arrived in the same read as the "
+            "message before them is reported as the Coalesced Response Count. The raw and HTTP/2 clients always "
+            "timestamp each read.",
+        ),
+        CLIParameter(
+            name=("--socket-read-timestamps"),
+            group=_CLI_GROUP,
+        ),
+    ] = EndpointDefaults.SOCKET_READ_TIMESTAMPS
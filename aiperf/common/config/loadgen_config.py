@@ -9,7 +9,7 @@ from aiperf.common.config.base_config import BaseConfig
 from aiperf.common.config.cli_parameter import CLIParameter
 from aiperf.common.config.config_defaults import LoadGeneratorDefaults
 from aiperf.common.config.groups import Groups
-from aiperf.common.enums import RequestRateMode
+from aiperf.common.enums import CreditRoutingMode, RequestRateMode
 
 
 class LoadGeneratorConfig(BaseConfig):
@@ -148,3 +148,62 @@ class LoadGeneratorConfig(BaseConfig):
             group=_CLI_GROUP,
         ),
     ] = LoadGeneratorDefaults.REQUEST_CANCELLATION_DELAY
+
+    # NEW AIPerf Option
+    credit_routing_mode: Annotated[
+        CreditRoutingMode,
+        Field(
+            description="Sets how requests are routed to the workers. Valid values: least_loaded, session_affinity.\n"
+            "least_loaded: Send each request to the worker with the lowest load.\n"
+            "session_affinity: Send all requests of a conversation to the same worker, using consistent hashing. "
+            "This only applies to fixed schedule mode, as the other modes do not assign the conversations "
+            "to the credits, and falls back to least_loaded otherwise.",
+        ),
+        CLIParameter(
+            name=("--credit-routing-mode",),
+            group=_CLI_GROUP,
+            show_choices=False,
+        ),
+    ] = LoadGeneratorDefaults.CREDIT_ROUTING_MODE
+
+    # NEW AIPerf Option
+    session_affinity_load_factor: Annotated[
+        float,
+        Field(
+            ge=1.0,
+            description="The maximum load of a worker relative to the average load of all workers, before requests "
+            "overflow to the next worker. This is used when --credit-routing-mode is session_affinity.",
+        ),
+        CLIParameter(
+            name=("--session-affinity-load-factor",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.SESSION_AFFINITY_LOAD_FACTOR
+
+    # NEW AIPerf Option
+    client_lag_threshold: Annotated[
+        float,
+        Field(
+            gt=0.0,
+            description="The p99 event loop lag in milliseconds of any worker, above which the client is considered "
+            "saturated during the profiling phase. When the client is saturated, the measured latencies include "
+            "client-side delays, and do not reflect the performance of the server.",
+        ),
+        CLIParameter(
+            name=("--client-lag-threshold",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.CLIENT_LAG_THRESHOLD
+
+    # NEW AIPerf Option
+    invalidate_on_client_saturation: Annotated[
+        bool,
+        Field(
+            description="Report the results as invalid when the client is saturated during the profiling phase "
+            "(see --client-lag-threshold), instead of only warning about it.",
+        ),
+        CLIParameter(
+            name=("--invalidate-on-client-saturation",),
+            group=_CLI_GROUP,
+        ),
+    ] = LoadGeneratorDefaults.INVALIDATE_ON_CLIENT_SATURATION
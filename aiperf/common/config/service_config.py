@@ -68,6 +68,11 @@ class ServiceConfig(BaseSettings):
         else:
             _logger.info("Using default ZMQ IPC configuration")
             self._comm_config = ZMQIPCConfig()
+
+        if self.zmq_push_batch_size is not None:
+            self._comm_config.push_batch_size = self.zmq_push_batch_size
+        if self.zmq_push_batch_timeout_us is not None:
+            self._comm_config.push_batch_timeout_us = self.zmq_push_batch_timeout_us
         return self
 
     service_run_type: Annotated[
@@ -92,6 +97,49 @@ class ServiceConfig(BaseSettings):
         ),
     ] = None
 
+    zmq_push_batch_size: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            description="Coalesce the messages of the high volume push channels (records and raw inference results) "
+            "into batches of up to this many messages. Each batch is sent as a single multipart ZMQ message, and is "
+            "dispatched by the pull client in a single task. Credit returns are never coalesced, as their latency "
+            "gates the credits that follow. Disabled by default.",
+        ),
+        CLIParameter(
+            name=("--zmq-push-batch-size"),
+            group=Groups.ZMQ_COMMUNICATION,
+        ),
+    ] = ServiceDefaults.ZMQ_PUSH_BATCH_SIZE
+
+    zmq_push_batch_timeout_us: Annotated[
+        int | None,
+        Field(
+            ge=0,
+            description="The maximum time in microseconds that a message waits for its batch to fill up "
+            "before the partial batch is sent, when --zmq-push-batch-size is set. Defaults to 1000.",
+        ),
+        CLIParameter(
+            name=("--zmq-push-batch-timeout-us"),
+            group=Groups.ZMQ_COMMUNICATION,
+        ),
+    ] = ServiceDefaults.ZMQ_PUSH_BATCH_TIMEOUT_US
+
+    max_pipeline_backlog: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            description="Pause issuing credits while more than this many messages have been sent to the records and "
+            "raw inference channels but not yet processed, until the backlog drains back below it. This keeps the "
+            "workers from outrunning the record processors, at the cost of the configured load. The backlog is "
+            "sampled about once per second. Disabled by default.",
+        ),
+        CLIParameter(
+            name=("--max-pipeline-backlog"),
+            group=Groups.ZMQ_COMMUNICATION,
+        ),
+    ] = ServiceDefaults.MAX_PIPELINE_BACKLOG
+
     workers: Annotated[
         WorkersConfig,
         Field(
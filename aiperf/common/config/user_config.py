@@ -18,7 +18,7 @@ from aiperf.common.config.input_config import InputConfig
 from aiperf.common.config.loadgen_config import LoadGeneratorConfig
 from aiperf.common.config.output_config import OutputConfig
 from aiperf.common.config.tokenizer_config import TokenizerConfig
-from aiperf.common.enums import CustomDatasetType
+from aiperf.common.enums import CreditRoutingMode, CustomDatasetType
 from aiperf.common.enums.endpoints_enums import EndpointServiceKind
 from aiperf.common.enums.timing_enums import RequestRateMode, TimingMode
 from aiperf.common.utils import load_json_str
@@ -75,6 +75,21 @@ class UserConfig(BaseConfig):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_credit_routing_mode(self) -> Self:
+        """Fall back to least loaded routing when session affinity cannot apply. Only the fixed schedule
+        credits name their conversation, so there is no session to route on in the other timing modes."""
+        if (
+            self.loadgen.credit_routing_mode == CreditRoutingMode.SESSION_AFFINITY
+            and self._timing_mode != TimingMode.FIXED_SCHEDULE
+        ):
+            _logger.warning(
+                f"--credit-routing-mode {CreditRoutingMode.SESSION_AFFINITY} only applies to fixed schedule mode, "
+                f"using {CreditRoutingMode.LEAST_LOADED} instead"
+            )
+            self.loadgen.credit_routing_mode = CreditRoutingMode.LEAST_LOADED
+        return self
+
     @model_validator(mode="after")
     def validate_benchmark_mode(self) -> Self:
         """Validate benchmarking is count-based or timing-based, plus associated args are correctly set."""
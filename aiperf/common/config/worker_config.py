@@ -5,7 +5,7 @@ from typing import Annotated
 from pydantic import Field
 
 from aiperf.common.config.base_config import BaseConfig
-from aiperf.common.config.cli_parameter import CLIParameter, DisableCLI
+from aiperf.common.config.cli_parameter import CLIParameter
 from aiperf.common.config.config_defaults import WorkersDefaults
 from aiperf.common.config.groups import Groups
 from aiperf.common.constants import DEFAULT_MAX_WORKERS_CAP
@@ -19,9 +19,13 @@ class WorkersConfig(BaseConfig):
     min: Annotated[
         int | None,
         Field(
-            description="Minimum number of workers to maintain",
+            description="Minimum number of workers to maintain. When auto-scaling is enabled,"
+            " idle workers are never shut down below this number.",
+        ),
+        CLIParameter(
+            name=("--workers-min", "--min-workers"),
+            group=_CLI_GROUP,
         ),
-        DisableCLI(reason="Not currently supported"),
     ] = WorkersDefaults.MIN
 
     max: Annotated[
@@ -37,3 +41,47 @@ class WorkersConfig(BaseConfig):
             group=_CLI_GROUP,
         ),
     ] = WorkersDefaults.MAX
+
+    autoscale: Annotated[
+        bool,
+        Field(
+            description="Automatically spawn more workers when the workers are saturated (high CPU usage,"
+            " or credits waiting to be sent), and shut down idle workers. When enabled, the number of workers"
+            " is bounded by `--workers-min` and `--workers-max`, and if `--workers-max` is not specified,"
+            " it is bounded by `min(concurrency, num CPUs - 1)` instead of the default max cap.",
+        ),
+        CLIParameter(
+            name=("--workers-autoscale"),
+            group=_CLI_GROUP,
+        ),
+    ] = WorkersDefaults.AUTOSCALE
+
+    compute_metrics: Annotated[
+        bool,
+        Field(
+            description="Compute the per-request metrics within the workers, and send only the metric values to the"
+            " records manager instead of the full responses. This skips the record processors for every request"
+            " whose token counts are reported in the `usage` of the response, such as when"
+            " `stream_options.include_usage` is set with `--extra-inputs`. The requests without usage, and those"
+            " that failed, are still sent to the record processors to be tokenized.",
+        ),
+        CLIParameter(
+            name=("--workers-compute-metrics"),
+            group=_CLI_GROUP,
+        ),
+    ] = WorkersDefaults.COMPUTE_METRICS
+
+    max_sessions: Annotated[
+        int,
+        Field(
+            ge=1,
+            description="Maximum number of sessions (virtual users) that each worker holds at once. Sessions that are"
+            " waiting for the think time between turns do not hold a connection, so this can be higher than the HTTP"
+            " connection limit, which only bounds the requests in flight. The timing manager routes credits to the"
+            " workers based on this capacity.",
+        ),
+        CLIParameter(
+            name=("--workers-max-sessions"),
+            group=_CLI_GROUP,
+        ),
+    ] = WorkersDefaults.MAX_SESSIONS
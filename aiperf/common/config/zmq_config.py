@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import platform
 import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -9,10 +10,14 @@ from typing import Annotated, ClassVar
 from pydantic import BaseModel, Field, model_validator
 from typing_extensions import Self
 
+from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.config.cli_parameter import CLIParameter, DisableCLI
 from aiperf.common.config.groups import Groups
+from aiperf.common.constants import SHARED_MEMORY_RING_MACHINES
 from aiperf.common.enums import CommAddress, CommunicationBackend
 
+_logger = AIPerfLogger(__name__)
+
 
 class BaseZMQProxyConfig(BaseModel, ABC):
     """Configuration Protocol for ZMQ Proxy."""
@@ -43,6 +48,18 @@ class BaseZMQCommunicationConfig(BaseModel, ABC):
 
     comm_backend: ClassVar[CommunicationBackend]
 
+    push_batch_size: Annotated[int | None, DisableCLI()] = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of messages to coalesce into a single multipart message on the "
+        "high volume push channels. Coalescing is disabled when not set.",
+    )
+    push_batch_timeout_us: Annotated[int, DisableCLI()] = Field(
+        default=1000,
+        ge=0,
+        description="The maximum time in microseconds that a message waits for its batch to fill up.",
+    )
+
     # Proxy config options to be overridden by subclasses
     event_bus_proxy_config: ClassVar[BaseZMQProxyConfig]
     dataset_manager_proxy_config: ClassVar[BaseZMQProxyConfig]
@@ -63,6 +80,21 @@ class BaseZMQCommunicationConfig(BaseModel, ABC):
     def credit_return_address(self) -> str:
         """Get the credit return address based on protocol configuration."""
 
+    @property
+    @abstractmethod
+    def worker_health_address(self) -> str:
+        """Get the worker health address based on protocol configuration."""
+
+    @property
+    @abstractmethod
+    def comm_stats_address(self) -> str:
+        """Get the comm stats address based on protocol configuration."""
+
+    @property
+    def shared_memory_enabled(self) -> bool:
+        """Whether the push/pull channels send their messages over shared memory rings."""
+        return False
+
     def get_address(self, address_type: CommAddress) -> str:
         """Get the actual address based on the address type."""
         address_map = {
@@ -72,6 +104,8 @@ class BaseZMQCommunicationConfig(BaseModel, ABC):
             CommAddress.DATASET_MANAGER_PROXY_BACKEND: self.dataset_manager_proxy_config.backend_address,
             CommAddress.CREDIT_DROP: self.credit_drop_address,
             CommAddress.CREDIT_RETURN: self.credit_return_address,
+            CommAddress.WORKER_HEALTH: self.worker_health_address,
+            CommAddress.COMM_STATS: self.comm_stats_address,
             CommAddress.RECORDS: self.records_push_pull_address,
             CommAddress.RAW_INFERENCE_PROXY_FRONTEND: self.raw_inference_proxy_config.frontend_address,
             CommAddress.RAW_INFERENCE_PROXY_BACKEND: self.raw_inference_proxy_config.backend_address,
@@ -219,6 +253,12 @@ class ZMQTCPConfig(BaseZMQCommunicationConfig):
     credit_return_port: Annotated[int, DisableCLI()] = Field(
         default=5563, description="Port for credit return operations"
     )
+    worker_health_port: Annotated[int, DisableCLI()] = Field(
+        default=5564, description="Port for worker health messages"
+    )
+    comm_stats_port: Annotated[int, DisableCLI()] = Field(
+        default=5565, description="Port for comm stats messages"
+    )
     dataset_manager_proxy_config: Annotated[  # type: ignore
         ZMQTCPProxyConfig, DisableCLI()
     ] = Field(
@@ -262,6 +302,16 @@ class ZMQTCPConfig(BaseZMQCommunicationConfig):
         """Get the credit return address based on protocol configuration."""
         return f"tcp://{self.host}:{self.credit_return_port}"
 
+    @property
+    def worker_health_address(self) -> str:
+        """Get the worker health address based on protocol configuration."""
+        return f"tcp://{self.host}:{self.worker_health_port}"
+
+    @property
+    def comm_stats_address(self) -> str:
+        """Get the comm stats address based on protocol configuration."""
+        return f"tcp://{self.host}:{self.comm_stats_port}"
+
 
 class ZMQIPCConfig(BaseZMQCommunicationConfig):
     """Configuration for IPC transport."""
@@ -285,6 +335,19 @@ class ZMQIPCConfig(BaseZMQCommunicationConfig):
                 proxy_config.path = self.path
         return self
 
+    @model_validator(mode="after")
+    def validate_shared_memory(self) -> Self:
+        """Disable the shared memory rings on the machines where they are not safe to use."""
+        if (
+            self.shared_memory
+            and platform.machine().lower() not in SHARED_MEMORY_RING_MACHINES
+        ):
+            _logger.warning(
+                f"Shared memory rings are not supported on {platform.machine()}, sending all messages over IPC sockets"
+            )
+            self.shared_memory = False
+        return self
+
     path: Annotated[
         Path | None,
         Field(
@@ -296,6 +359,20 @@ class ZMQIPCConfig(BaseZMQCommunicationConfig):
         ),
     ] = None
 
+    shared_memory: Annotated[
+        bool,
+        Field(
+            description="Send the messages of the high volume push/pull channels (records and credit returns) over "
+            "shared memory ring buffers instead of IPC sockets. Each push client writes to a ring of its own, which "
+            "the pull client polls. ZMQ is still used to set up the rings, and for any message that does not fit "
+            "in the ring. Only supported on x86-64.",
+        ),
+        CLIParameter(
+            name=("--zmq-ipc-shared-memory"),
+            group=_CLI_GROUP,
+        ),
+    ] = False
+
     dataset_manager_proxy_config: Annotated[  # type: ignore
         ZMQIPCProxyConfig, DisableCLI()
     ] = Field(
@@ -335,3 +412,22 @@ class ZMQIPCConfig(BaseZMQCommunicationConfig):
         if not self.path:
             raise ValueError("Path is required for IPC transport")
         return f"ipc://{self.path / 'credit_return.ipc'}"
+
+    @property
+    def worker_health_address(self) -> str:
+        """Get the worker health address based on protocol configuration."""
+        if not self.path:
+            raise ValueError("Path is required for IPC transport")
+        return f"ipc://{self.path / 'worker_health.ipc'}"
+
+    @property
+    def comm_stats_address(self) -> str:
+        """Get the comm stats address based on protocol configuration."""
+        if not self.path:
+            raise ValueError("Path is required for IPC transport")
+        return f"ipc://{self.path / 'comm_stats.ipc'}"
+
+    @property
+    def shared_memory_enabled(self) -> bool:
+        """Whether the push/pull channels send their messages over shared memory rings."""
+        return self.shared_memory
@@ -6,6 +6,7 @@ import os
 NANOS_PER_SECOND = 1_000_000_000
 NANOS_PER_MILLIS = 1_000_000
 MILLIS_PER_SECOND = 1000
+MICROS_PER_SECOND = 1_000_000
 BYTES_PER_MIB = 1024 * 1024
 
 STAT_KEYS = [
@@ -40,6 +41,9 @@ TASK_CANCEL_TIMEOUT_SHORT = 2.0
 DEFAULT_COMMS_REQUEST_TIMEOUT = 90.0
 """Default timeout for requests from req_clients to rep_clients in seconds."""
 
+DEFAULT_REQUEST_EVICTION_INTERVAL = 1.0
+"""Default interval in seconds between evictions of the requests that did not receive a response before their deadline."""
+
 DEFAULT_PULL_CLIENT_MAX_CONCURRENCY = 100_000
 """Default maximum concurrency for pull clients."""
 
@@ -73,6 +77,11 @@ DEFAULT_REGISTRATION_INTERVAL = 1.0
 DEFAULT_HEARTBEAT_INTERVAL = 5.0
 """Default interval between heartbeat messages in seconds for component services."""
 
+DEFAULT_COMM_STATS_INTERVAL = 1.0
+"""Default interval in seconds between the messages with the counters of the push and pull clients of
+component services, which are pushed to the timing manager, and between the channel stats that the timing
+manager publishes from them. These are used to track the queue depth of each channel."""
+
 AIPERF_DEV_MODE = os.getenv("AIPERF_DEV_MODE", "false").lower() in ("true", "1")
 
 DEFAULT_UI_MIN_UPDATE_PERCENT = 1.0
@@ -116,14 +125,83 @@ DEFAULT_MAX_WORKERS_CAP = 32
 """Default absolute maximum number of workers to spawn, regardless of the number of CPU cores.
 Only applies if the user does not specify a max workers value."""
 
+DEFAULT_EVENT_LOOP_LAG_PROBE_INTERVAL = 0.05
+"""Default interval in seconds between event loop lag probes. Each probe sleeps for this long, and measures
+how much later than scheduled the event loop woke it up."""
+
+DEFAULT_EVENT_LOOP_LAG_WINDOW = 100
+"""Default number of the most recent event loop lag samples used to compute the lag percentiles."""
+
+DEFAULT_AUTOSCALE_EVENT_LOOP_LAG = 0.010
+"""Default average p99 event loop lag in seconds above which the workers are considered saturated,
+and the WorkerManager spawns more workers (when auto-scaling is enabled)."""
+
+DEFAULT_AUTOSCALE_CREDIT_DROP_LATENCY = 0.010
+"""Default average credit drop latency in seconds above which the workers are considered saturated,
+and the WorkerManager spawns more workers (when auto-scaling is enabled)."""
+
+DEFAULT_AUTOSCALE_STEP_FRACTION = 0.25
+"""Default fraction of the current number of workers to add or remove in a single auto-scaling step.
+At least one worker is always added or removed."""
+
+DEFAULT_AUTOSCALE_COOLDOWN = 10.0
+"""Default time in seconds to wait after an auto-scaling step before scaling again,
+to give new workers time to start and the health reports time to reflect the change."""
+
+DEFAULT_AUTOSCALE_IDLE_TIME = 30.0
+"""Default time in seconds that a worker must be idle while the other workers are busy,
+before the WorkerManager shuts it down (when auto-scaling is enabled)."""
+
+DEFAULT_WORKER_DRAIN_TIMEOUT = 30.0
+"""Default time in seconds a stopping worker waits for its active sessions to finish
+and return their credits, before shutting down anyway."""
+
+DEFAULT_CONNECTION_PREWARM_TIMEOUT = 30.0
+"""Default time in seconds a worker waits for its connections to be pre-warmed, before profiling
+starts anyway."""
+
 DEFAULT_ZMQ_CONTEXT_TERM_TIMEOUT = 10.0
 """Default timeout for terminating the ZMQ context in seconds."""
 
 AIPERF_HTTP_CONNECTION_LIMIT = int(os.environ.get("AIPERF_HTTP_CONNECTION_LIMIT", 2500))
 """Maximum number of concurrent connections for HTTP clients."""
 
+UNIX_SOCKET_URL_PREFIX = "unix://"
+"""Prefix of a `--url` which targets a Unix domain socket, such as `unix:///tmp/server.sock`."""
+
 GOOD_REQUEST_COUNT_TAG = "good_request_count"
 """GoodRequestCount metric tag"""
 
 DEFAULT_RECORD_EXPORT_BATCH_SIZE = 100
 """Default batch size for record export results processor."""
+
+DEFAULT_DATASET_TIMING_CHUNK_SIZE = 100_000
+"""Default number of fixed schedule entries sent in each DatasetTimingResponse chunk. This keeps
+each message small, even for traces with tens of millions of entries."""
+
+DEFAULT_DATASET_TIMING_CHUNKS_IN_FLIGHT = 8
+"""Default number of fixed schedule chunks that the timing manager requests at once, so that it does
+not wait for a round trip per chunk, while bounding the number of chunks held in memory."""
+
+DEFAULT_CREDIT_ROUTER_VIRTUAL_NODES = 100
+"""Default number of virtual nodes per worker on the consistent hash ring used for session affinity
+credit routing. More virtual nodes spread the conversations more evenly across the workers."""
+
+DEFAULT_INPUT_TOKEN_COUNT_CACHE_SIZE = 100_000
+"""Default maximum number of turns whose input token count is cached by each inference result parser,
+so that a turn which is sent many times is only tokenized once."""
+
+DEFAULT_SHM_RING_CAPACITY = 1024 * 1024
+"""Default capacity in bytes of the shared memory ring of each shared memory push client. This is kept
+small, as every push client of a channel has a ring of its own, and /dev/shm is often limited in containers."""
+
+SHARED_MEMORY_RING_MACHINES = ("x86_64", "amd64")
+"""The machine types on which the shared memory rings can be used, as returned by platform.machine() in lower
+case. The rings rely on the stores to memory not being reordered with each other, which holds on x86-64."""
+
+DEFAULT_SHM_RING_MIN_POLL_INTERVAL = 0.0001
+"""Default minimum interval in seconds between the polls of an idle shared memory ring."""
+
+DEFAULT_SHM_RING_MAX_POLL_INTERVAL = 0.005
+"""Default maximum interval in seconds between the polls of an idle shared memory ring. The interval
+backs off from the minimum while the ring stays idle."""
@@ -40,6 +40,8 @@ from aiperf.common.enums.endpoints_enums import (
     EndpointServiceKind,
     EndpointType,
     EndpointTypeInfo,
+    HttpClientType,
+    LoadBalancingStrategy,
 )
 from aiperf.common.enums.logging_enums import (
     AIPerfLogLevel,
@@ -90,6 +92,7 @@ from aiperf.common.enums.system_enums import (
 )
 from aiperf.common.enums.timing_enums import (
     CreditPhase,
+    CreditRoutingMode,
     RequestRateMode,
     TimingMode,
 )
@@ -117,6 +120,7 @@ __all__ = [
     "ComposerType",
     "ConsoleExporterType",
     "CreditPhase",
+    "CreditRoutingMode",
     "CustomDatasetType",
     "DataExporterType",
     "EndpointServiceKind",
@@ -124,8 +128,10 @@ __all__ = [
     "EndpointTypeInfo",
     "ExportLevel",
     "GenericMetricUnit",
+    "HttpClientType",
     "ImageFormat",
     "LifecycleState",
+    "LoadBalancingStrategy",
     "MediaType",
     "MessageType",
     "MetricFlags",
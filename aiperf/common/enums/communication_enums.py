@@ -16,6 +16,10 @@ class CommClientType(CaseInsensitiveStrEnum):
     PULL = "pull"
     REQUEST = "request"
     REPLY = "reply"
+    DISPATCH = "dispatch"
+    DISPATCH_TARGET = "dispatch_target"
+    SHM_PUSH = "shm_push"
+    SHM_PULL = "shm_pull"
 
 
 class CommAddress(CaseInsensitiveStrEnum):
@@ -29,11 +33,18 @@ class CommAddress(CaseInsensitiveStrEnum):
     """Backend address for services to subscribe to messages."""
 
     CREDIT_DROP = "credit_drop"
-    """Address to send CreditDrop messages from the TimingManager to the Worker."""
+    """Address to send CreditDrop messages from the TimingManager to the Worker, and for
+    the Workers to advertise their credit capacity to the TimingManager."""
 
     CREDIT_RETURN = "credit_return"
     """Address to send CreditReturn messages from the Worker to the TimingManager."""
 
+    WORKER_HEALTH = "worker_health"
+    """Address to send WorkerHealth messages from the Workers to the WorkerManager."""
+
+    COMM_STATS = "comm_stats"
+    """Address to send CommStats messages from all of the services to the TimingManager."""
+
     RECORDS = "records"
     """Address to send parsed records from InferenceParser to RecordManager."""
 
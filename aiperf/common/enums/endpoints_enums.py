@@ -18,6 +18,34 @@ class EndpointServiceKind(CaseInsensitiveStrEnum):
     OPENAI = "openai"
 
 
+class HttpClientType(CaseInsensitiveStrEnum):
+    """The HTTP client implementation used to send requests to the endpoint."""
+
+    AIOHTTP = "aiohttp"
+    """HTTP/1.1 client based on aiohttp, which sends each in-flight request over its own pooled connection."""
+
+    HTTP2 = "http2"
+    """HTTP/2 client, which multiplexes many concurrent requests as streams over a few connections.
+    Requires the optional `h2` package."""
+
+    RAW = "raw"
+    """Minimal HTTP/1.1 client built directly on asyncio protocols, which parses and timestamps the
+    response bytes as they arrive, for the lowest overhead and most accurate timestamps."""
+
+
+class LoadBalancingStrategy(CaseInsensitiveStrEnum):
+    """The strategy for spreading the requests of a worker across multiple endpoint URLs."""
+
+    ROUND_ROBIN = "round_robin"
+    """Send the nth request to the URL at index n-mod the number of URLs."""
+
+    LEAST_OUTSTANDING = "least_outstanding"
+    """Send each request to the URL with the fewest requests in flight."""
+
+    POWER_OF_TWO = "power_of_two"
+    """Pick two URLs at random, and send the request to the one with fewer requests in flight."""
+
+
 class EndpointTypeInfo(BasePydanticEnumInfo):
     """Pydantic model for endpoint-specific metadata. This model is used to store additional info on each EndpointType enum value.
 
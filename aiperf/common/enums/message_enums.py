@@ -15,12 +15,15 @@ class MessageType(CaseInsensitiveStrEnum):
     ALL_RECORDS_RECEIVED = "all_records_received"
     COMMAND = "command"
     COMMAND_RESPONSE = "command_response"
+    COMM_CHANNEL_STATS = "comm_channel_stats"
+    COMM_STATS = "comm_stats"
     CONNECTION_PROBE = "connection_probe"
     CONVERSATION_REQUEST = "conversation_request"
     CONVERSATION_RESPONSE = "conversation_response"
     CONVERSATION_TURN_REQUEST = "conversation_turn_request"
     CONVERSATION_TURN_RESPONSE = "conversation_turn_response"
     CREDITS_COMPLETE = "credits_complete"
+    CREDIT_CAPACITY = "credit_capacity"
     CREDIT_DROP = "credit_drop"
     CREDIT_PHASE_COMPLETE = "credit_phase_complete"
     CREDIT_PHASE_PROGRESS = "credit_phase_progress"
@@ -42,6 +45,7 @@ class MessageType(CaseInsensitiveStrEnum):
     REALTIME_METRICS = "realtime_metrics"
     REGISTRATION = "registration"
     SERVICE_ERROR = "service_error"
+    SHARED_MEMORY_RING = "shared_memory_ring"
     STATUS = "status"
     WORKER_HEALTH = "worker_health"
     WORKER_STATUS_SUMMARY = "worker_status_summary"
@@ -31,3 +31,7 @@ class ResultsProcessorType(CaseInsensitiveStrEnum):
     RECORD_EXPORT = "record_export"
     """Processor that exports per-record metrics to JSONL files with display unit conversion and filtering.
     Only enabled when export_level is set to RECORDS."""
+
+    ENDPOINT_BREAKDOWN = "endpoint_breakdown"
+    """Processor that breaks down the latency and throughput of the requests by endpoint URL, and exports it to a JSON file.
+    Only enabled when the requests are load balanced across multiple URLs."""
@@ -29,6 +29,17 @@ class RequestRateMode(CaseInsensitiveStrEnum):
     """Generate requests as soon as possible, up to a max concurrency limit. Only allowed when a request rate is not specified."""
 
 
+class CreditRoutingMode(CaseInsensitiveStrEnum):
+    """The different ways the TimingManager should choose which worker receives each credit."""
+
+    LEAST_LOADED = "least_loaded"
+    """Send each credit to the worker with the lowest load relative to its capacity."""
+
+    SESSION_AFFINITY = "session_affinity"
+    """Send all credits for the same conversation to the same worker, using consistent hashing.
+    Credits overflow to the next worker on the hash ring when the worker is overloaded."""
+
+
 class CreditPhase(CaseInsensitiveStrEnum):
     """The type of credit phase. This is used to identify which phase of the
     benchmark the credit is being used in, for tracking and reporting purposes."""
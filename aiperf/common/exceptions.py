@@ -119,6 +119,18 @@ class InvalidPayloadError(InferenceClientError):
     """Exception raised when a inference client receives an invalid payload."""
 
 
+class ConnectTimeoutError(InferenceClientError):
+    """Exception raised when a connection to the inference server could not be opened within the connect timeout."""
+
+
+class FirstTokenTimeoutError(InferenceClientError):
+    """Exception raised when the first chunk of a response was not received within the first token timeout."""
+
+
+class InterChunkTimeoutError(InferenceClientError):
+    """Exception raised when no chunk of a response was received for longer than the inter-chunk timeout."""
+
+
 class InvalidStateError(AIPerfError):
     """Exception raised when something is in an invalid state."""
 
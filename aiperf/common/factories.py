@@ -15,6 +15,7 @@ from aiperf.common.enums import (
     CustomDatasetType,
     DataExporterType,
     EndpointType,
+    HttpClientType,
     OpenAIObjectType,
     RecordProcessorType,
     RequestRateMode,
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
         CommunicationProtocol,
         ConsoleExporterProtocol,
         DataExporterProtocol,
+        HttpClientProtocol,
         InferenceClientProtocol,
         RecordProcessorProtocol,
         RequestRateGeneratorProtocol,
@@ -447,6 +449,23 @@ class DataExporterFactory(AIPerfFactory[DataExporterType, "DataExporterProtocol"
         )
 
 
+class HttpClientFactory(AIPerfFactory[HttpClientType, "HttpClientProtocol"]):
+    """Factory for registering and creating HttpClientProtocol instances based on the specified HTTP client type.
+    see: :class:`aiperf.common.factories.AIPerfFactory` for more details.
+    """
+
+    @classmethod
+    def create_instance(  # type: ignore[override]
+        cls,
+        class_type: HttpClientType | str,
+        model_endpoint: "ModelEndpointInfo",
+        **kwargs,
+    ) -> "HttpClientProtocol":
+        return super().create_instance(
+            class_type, model_endpoint=model_endpoint, **kwargs
+        )
+
+
 class InferenceClientFactory(AIPerfFactory[EndpointType, "InferenceClientProtocol"]):
     """Factory for registering and creating InferenceClientProtocol instances based on the specified endpoint type.
     see: :class:`aiperf.common.factories.AIPerfFactory` for more details.
@@ -41,6 +41,7 @@ from aiperf.common.types import (
 class AIPerfHook(CaseInsensitiveStrEnum):
     BACKGROUND_TASK = "@background_task"
     ON_COMMAND = "@on_command"
+    ON_COMM_STATS_UPDATE = "@on_comm_stats_update"
     ON_INIT = "@on_init"
     ON_MESSAGE = "@on_message"
     ON_REALTIME_METRICS = "@on_realtime_metrics"
@@ -483,6 +484,27 @@ def on_warmup_progress(func: Callable) -> Callable:
     return _hook_decorator(AIPerfHook.ON_WARMUP_PROGRESS, func)
 
 
+def on_comm_stats_update(func: Callable) -> Callable:
+    """Decorator to specify that the function is a hook that should be called when the message counters
+    of the push and pull clients of a service are received.
+    See :func:`aiperf.common.hooks._hook_decorator`.
+
+    Example:
+    ```python
+    class MyPlugin(CommStatsTrackerMixin):
+        @on_comm_stats_update
+        def _on_comm_stats_update(self, channel_stats: dict[str, CommChannelStats]) -> None:
+            pass
+    ```
+
+    The above is the equivalent to setting:
+    ```python
+    MyPlugin._on_comm_stats_update.__aiperf_hook_type__ = AIPerfHook.ON_COMM_STATS_UPDATE
+    ```
+    """
+    return _hook_decorator(AIPerfHook.ON_COMM_STATS_UPDATE, func)
+
+
 def on_worker_status_summary(func: Callable) -> Callable:
     """Decorator to specify that the function is a hook that should be called when a worker status summary is received
     from the WorkerManager.
@@ -34,6 +34,7 @@ from aiperf.common.messages.command_messages import (
     TargetedServiceMessage,
 )
 from aiperf.common.messages.credit_messages import (
+    CreditCapacityMessage,
     CreditDropMessage,
     CreditPhaseCompleteMessage,
     CreditPhaseProgressMessage,
@@ -69,8 +70,11 @@ from aiperf.common.messages.service_messages import (
     BaseServiceErrorMessage,
     BaseServiceMessage,
     BaseStatusMessage,
+    CommChannelStatsMessage,
+    CommStatsMessage,
     HeartbeatMessage,
     RegistrationMessage,
+    SharedMemoryRingMessage,
     StatusMessage,
 )
 from aiperf.common.messages.worker_messages import (
@@ -83,6 +87,8 @@ __all__ = [
     "BaseServiceErrorMessage",
     "BaseServiceMessage",
     "BaseStatusMessage",
+    "CommChannelStatsMessage",
+    "CommStatsMessage",
     "CommandAcknowledgedResponse",
     "CommandErrorResponse",
     "CommandMessage",
@@ -94,6 +100,7 @@ __all__ = [
     "ConversationResponseMessage",
     "ConversationTurnRequestMessage",
     "ConversationTurnResponseMessage",
+    "CreditCapacityMessage",
     "CreditDropMessage",
     "CreditPhaseCompleteMessage",
     "CreditPhaseProgressMessage",
@@ -125,6 +132,7 @@ __all__ = [
     "RegisterServiceCommand",
     "RegistrationMessage",
     "RequiresRequestNSMixin",
+    "SharedMemoryRingMessage",
     "ShutdownCommand",
     "ShutdownWorkersCommand",
     "SpawnWorkersCommand",
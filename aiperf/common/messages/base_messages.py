@@ -4,6 +4,7 @@ import json
 import time
 from typing import ClassVar
 
+import orjson
 from pydantic import Field
 
 from aiperf.common.aiperf_logger import AIPerfLogger
@@ -85,7 +86,9 @@ class Message(AIPerfBaseModel):
 
     @classmethod
     def from_json_with_type(
-        cls, message_type: MessageTypeT, json_str: str | bytes | bytearray
+        cls,
+        message_type: MessageTypeT,
+        json_str: str | bytes | bytearray | memoryview,
     ) -> "Message":
         """Deserialize a message from a JSON string with a specific message type.
         NOTE: This is more performant than :meth:`from_json` because it does not need to
@@ -94,8 +97,16 @@ class Message(AIPerfBaseModel):
         message_class = cls._message_type_lookup[message_type]
         if not message_class:
             raise ValueError(f"Unknown message type: {message_type}")
+        if isinstance(json_str, memoryview):
+            # Pydantic cannot validate JSON from a buffer, so parse it in place instead of copying it
+            return message_class.model_validate(orjson.loads(json_str))
         return message_class.model_validate_json(json_str)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the message to JSON bytes, without the round trip through a string
+        of :meth:`model_dump_json`."""
+        return self.__pydantic_serializer__.to_json(self)
+
     def __str__(self) -> str:
         return self.model_dump_json()
 
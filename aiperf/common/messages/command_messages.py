@@ -303,6 +303,11 @@ class ProfileConfigureCommand(CommandMessage):
 
     # TODO: Define this type
     config: Any = Field(..., description="Configuration for the profile")
+    num_workers: int | None = Field(
+        default=None,
+        description="The number of workers that will send requests, which is used to divide the "
+        "connections to pre-warm between them",
+    )
 
 
 class ProfileStartCommand(CommandMessage):
@@ -7,6 +7,7 @@ from pydantic import Field
 
 from aiperf.common.enums import CreditPhase, MessageType
 from aiperf.common.messages.service_messages import BaseServiceMessage
+from aiperf.common.models import CreditRoutingSummary
 from aiperf.common.types import MessageTypeT
 
 
@@ -77,6 +78,21 @@ class CreditReturnMessage(BaseServiceMessage):
         return self.delayed_ns is not None
 
 
+class CreditCapacityMessage(BaseServiceMessage):
+    """Message sent by a worker to the timing manager to advertise how many credits it can process
+    concurrently. The timing manager uses this to route each credit to the least loaded worker.
+    """
+
+    message_type: MessageTypeT = MessageType.CREDIT_CAPACITY
+
+    capacity: int = Field(
+        ...,
+        ge=0,
+        description="The maximum number of credits the worker can process concurrently. "
+        "A capacity of 0 means the worker is no longer accepting credits.",
+    )
+
+
 class CreditPhaseStartMessage(BaseServiceMessage):
     """Message for credit phase start. Sent by the TimingManager to report that a credit phase has started."""
 
@@ -113,6 +129,10 @@ class CreditPhaseProgressMessage(BaseServiceMessage):
         ge=0,
         description="The number of completed credits (returned from the workers)",
     )
+    worker_queue_depths: dict[str, int] = Field(
+        default_factory=dict,
+        description="The number of credits in flight for each worker, keyed by the worker service ID",
+    )
 
 
 class CreditPhaseSendingCompleteMessage(BaseServiceMessage):
@@ -151,6 +171,10 @@ class CreditPhaseCompleteMessage(BaseServiceMessage):
         default=False,
         description="Whether this phase completed because a timeout was triggered",
     )
+    credit_routing: CreditRoutingSummary | None = Field(
+        default=None,
+        description="How the credits routed so far were spread across the workers",
+    )
 
 
 class CreditsCompleteMessage(BaseServiceMessage):
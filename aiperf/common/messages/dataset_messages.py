@@ -1,7 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from aiperf.common.enums import CreditPhase, MessageType
 from aiperf.common.messages.service_messages import BaseServiceMessage
@@ -29,6 +29,29 @@ class ConversationResponseMessage(BaseServiceMessage):
     message_type: MessageTypeT = MessageType.CONVERSATION_RESPONSE
     conversation: Conversation = Field(..., description="The conversation data")
 
+    _conversation_json: bytes | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_conversation_json(
+        cls, conversation_json: bytes, **kwargs
+    ) -> "ConversationResponseMessage":
+        """Create a response that sends the JSON of a conversation as is, without parsing and validating it.
+        The conversation field is left unset, so it is only available once the response is received."""
+        message = cls.model_construct(**kwargs)
+        message._conversation_json = conversation_json
+        return message
+
+    def to_json_bytes(self) -> bytes:
+        if self._conversation_json is None:
+            return super().to_json_bytes()
+        # Splice the conversation into the JSON of the other fields
+        fields_json = self.__pydantic_serializer__.to_json(
+            self, exclude={"conversation"}
+        )
+        return b"".join(
+            (fields_json[:-1], b',"conversation":', self._conversation_json, b"}")
+        )
+
 
 class ConversationTurnRequestMessage(BaseServiceMessage):
     """Message to request a single turn from a conversation."""
@@ -44,6 +67,11 @@ class ConversationTurnRequestMessage(BaseServiceMessage):
         ge=0,
         description="The index of the turn in the conversation.",
     )
+    texts_only: bool = Field(
+        default=False,
+        description="Whether to only return the texts of the turn, without its images and audios. "
+        "This keeps the response small when only the texts are needed, such as to count the input tokens.",
+    )
 
 
 class ConversationTurnResponseMessage(BaseServiceMessage):
@@ -55,19 +83,61 @@ class ConversationTurnResponseMessage(BaseServiceMessage):
 
 
 class DatasetTimingRequest(BaseServiceMessage):
-    """Message for a dataset timing request."""
+    """Message for a dataset timing request. The fixed schedule is returned in chunks,
+    so the requester should keep requesting with an increasing offset until it has
+    received all of the entries and conversation IDs."""
 
     message_type: MessageTypeT = MessageType.DATASET_TIMING_REQUEST
 
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="The index of the first entry (and conversation ID) to return.",
+    )
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        description="The maximum number of entries (and conversation IDs) to return. If not provided, "
+        "the dataset manager will use its default chunk size.",
+    )
+
 
 class DatasetTimingResponse(BaseServiceMessage):
-    """Message for a dataset timing response."""
+    """Message for a dataset timing response. Contains a single chunk of the fixed schedule.
+
+    The schedule is sorted by timestamp, and is made up of two parallel arrays (timestamps and
+    conversation indices), as well as a lookup table of conversation IDs that the indices refer to.
+    Both the schedule entries and the conversation ID table are paged using the same offset and limit.
+    """
 
     message_type: MessageTypeT = MessageType.DATASET_TIMING_RESPONSE
 
-    timing_data: list[tuple[int, str]] = Field(
+    offset: int = Field(
+        ...,
+        ge=0,
+        description="The index of the first entry (and conversation ID) in this chunk.",
+    )
+    total_entries: int = Field(
         ...,
-        description="The timing data of the dataset. Tuple of (timestamp, conversation_id)",
+        ge=0,
+        description="The total number of entries in the fixed schedule.",
+    )
+    total_conversations: int = Field(
+        ...,
+        ge=0,
+        description="The total number of conversation IDs in the lookup table.",
+    )
+    timestamps: list[int] = Field(
+        default_factory=list,
+        description="The timestamps (in milliseconds) of the schedule entries in this chunk, sorted in ascending order.",
+    )
+    conversation_indices: list[int] = Field(
+        default_factory=list,
+        description="The index into the conversation ID table for each of the schedule entries in this chunk.",
+    )
+    conversation_ids: list[str] = Field(
+        default_factory=list,
+        description="The slice of the conversation ID lookup table for this chunk.",
     )
 
 
@@ -75,3 +145,14 @@ class DatasetConfiguredNotification(BaseServiceMessage):
     """Notification sent to notify other services that the dataset has been configured."""
 
     message_type: MessageTypeT = MessageType.DATASET_CONFIGURED_NOTIFICATION
+
+    dataset_store_path: str | None = Field(
+        default=None,
+        description="The path of the memory-mapped dataset store, for services on the same host "
+        "to read the conversations from directly, instead of requesting them",
+    )
+    sequential_iteration: bool = Field(
+        default=False,
+        description="Whether the conversations of the credits that do not name a conversation are used in order "
+        "of the dataset, instead of being sampled at random",
+    )
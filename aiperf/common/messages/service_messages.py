@@ -11,7 +11,9 @@ from aiperf.common.enums import (
     MessageType,
 )
 from aiperf.common.messages.base_messages import Message
+from aiperf.common.models.comm_models import CommChannelStats, CommClientStats
 from aiperf.common.models.error_models import ErrorDetails
+from aiperf.common.models.health_models import EventLoopLag
 from aiperf.common.types import MessageTypeT, ServiceTypeT
 
 
@@ -69,6 +71,11 @@ class HeartbeatMessage(BaseStatusMessage):
 
     message_type: MessageTypeT = MessageType.HEARTBEAT
 
+    event_loop_lag: EventLoopLag | None = Field(
+        default=None,
+        description="The recent event loop lag percentiles of the service",
+    )
+
 
 class BaseServiceErrorMessage(BaseServiceMessage):
     """Base message containing error data."""
@@ -76,3 +83,36 @@ class BaseServiceErrorMessage(BaseServiceMessage):
     message_type: MessageTypeT = MessageType.SERVICE_ERROR
 
     error: ErrorDetails = Field(..., description="Error information")
+
+
+class SharedMemoryRingMessage(BaseServiceMessage):
+    """Message sent by a shared memory push client over ZMQ, for the pull client to attach to the
+    shared memory ring that the push client writes its messages to."""
+
+    message_type: MessageTypeT = MessageType.SHARED_MEMORY_RING
+
+    ring_name: str = Field(..., description="The name of the shared memory ring")
+
+
+class CommStatsMessage(BaseServiceMessage):
+    """Message pushed periodically by a service to the timing manager with the message counters of its push
+    and pull clients, so that the queue depth of each channel can be tracked across the services."""
+
+    message_type: MessageTypeT = MessageType.COMM_STATS
+
+    client_stats: list[CommClientStats] = Field(
+        ...,
+        description="The message counters of the push and pull clients of the service",
+    )
+
+
+class CommChannelStatsMessage(BaseServiceMessage):
+    """Message published periodically by the timing manager with the message counters of each push/pull
+    channel, summed over the push and pull clients of all of the services."""
+
+    message_type: MessageTypeT = MessageType.COMM_CHANNEL_STATS
+
+    channel_stats: dict[str, CommChannelStats] = Field(
+        ...,
+        description="A mapping of the channel names to their message counters",
+    )
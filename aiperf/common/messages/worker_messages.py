@@ -6,12 +6,13 @@ from pydantic import Field
 from aiperf.common.enums import MessageType
 from aiperf.common.enums.worker_enums import WorkerStatus
 from aiperf.common.messages.service_messages import BaseServiceMessage
-from aiperf.common.models import ProcessHealth, WorkerTaskStats
+from aiperf.common.models import ProcessHealth, WorkerStats, WorkerTaskStats
 from aiperf.common.types import MessageTypeT
 
 
 class WorkerHealthMessage(BaseServiceMessage):
-    """Message for a worker health check."""
+    """Message for a worker health check. It is pushed to the WorkerManager only, which
+    aggregates the health of all workers into a :class:`WorkerStatusSummaryMessage`."""
 
     message_type: MessageTypeT = MessageType.WORKER_HEALTH
 
@@ -22,6 +23,15 @@ class WorkerHealthMessage(BaseServiceMessage):
         ...,
         description="Stats for the tasks that have been sent to the worker",
     )
+    active_sessions: int = Field(
+        default=0,
+        description="The number of sessions the worker is running, including the ones waiting for think time",
+    )
+    credit_drop_latency_ns: int | None = Field(
+        default=None,
+        description="The average time in nanoseconds between receiving a credit and sending its request, "
+        "since the previous health message. None if no requests were sent.",
+    )
 
     @property
     def error_rate(self) -> float:
@@ -40,3 +50,8 @@ class WorkerStatusSummaryMessage(BaseServiceMessage):
         ...,
         description="A mapping of worker IDs to their status",
     )
+    worker_stats: dict[str, WorkerStats] = Field(
+        default_factory=dict,
+        description="A mapping of worker IDs to their latest health and task stats, only for the workers "
+        "that reported their health since the previous summary",
+    )
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from aiperf.common.config import ServiceConfig
+from aiperf.common.enums import MessageType
+from aiperf.common.hooks import AIPerfHook, on_message, provides_hooks
+from aiperf.common.messages import CommChannelStatsMessage
+from aiperf.common.mixins.message_bus_mixin import MessageBusClientMixin
+from aiperf.common.models import CommChannelStats
+
+
+@provides_hooks(AIPerfHook.ON_COMM_STATS_UPDATE)
+class CommStatsTrackerMixin(MessageBusClientMixin):
+    """A tracker of the queue depth of each push/pull channel, from the channel stats that the
+    timing manager publishes. The timing manager sums the message counters that the services push to it."""
+
+    def __init__(self, service_config: ServiceConfig, **kwargs):
+        super().__init__(service_config=service_config, **kwargs)
+        self.comm_channel_stats: dict[str, CommChannelStats] = {}
+
+    @on_message(MessageType.COMM_CHANNEL_STATS)
+    async def _on_comm_channel_stats(self, message: CommChannelStatsMessage) -> None:
+        """Update the channel stats with the latest channel stats of the timing manager."""
+        self.comm_channel_stats = message.channel_stats
+        await self.run_hooks(
+            AIPerfHook.ON_COMM_STATS_UPDATE, channel_stats=self.comm_channel_stats
+        )
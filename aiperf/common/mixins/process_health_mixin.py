@@ -1,15 +1,24 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import time
+from collections import deque
 
+import numpy as np
 import psutil
 
-from aiperf.common.mixins.base_mixin import BaseMixin
-from aiperf.common.models import CPUTimes, CtxSwitches, ProcessHealth
+from aiperf.common.constants import (
+    DEFAULT_EVENT_LOOP_LAG_PROBE_INTERVAL,
+    DEFAULT_EVENT_LOOP_LAG_WINDOW,
+    NANOS_PER_SECOND,
+)
+from aiperf.common.hooks import background_task
+from aiperf.common.mixins.aiperf_lifecycle_mixin import AIPerfLifecycleMixin
+from aiperf.common.models import CPUTimes, CtxSwitches, EventLoopLag, ProcessHealth
 
 
-class ProcessHealthMixin(BaseMixin):
-    """Mixin to provide process health information."""
+class ProcessHealthMixin(AIPerfLifecycleMixin):
+    """Mixin to provide process health information, including the event loop lag of the process."""
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -21,6 +30,35 @@ class ProcessHealthMixin(BaseMixin):
         self._process_health: ProcessHealth | None = None
         self._previous: ProcessHealth | None = None
 
+        self._event_loop_lag_samples: deque[int] = deque(
+            maxlen=DEFAULT_EVENT_LOOP_LAG_WINDOW
+        )
+
+    @background_task(immediate=True, interval=None)
+    async def _event_loop_lag_probe(self) -> None:
+        """Measure how much later than scheduled the event loop wakes up a sleeping task."""
+        interval_ns = int(DEFAULT_EVENT_LOOP_LAG_PROBE_INTERVAL * NANOS_PER_SECOND)
+        while not self.stop_requested:
+            scheduled_ns = time.perf_counter_ns() + interval_ns
+            await asyncio.sleep(DEFAULT_EVENT_LOOP_LAG_PROBE_INTERVAL)
+            self._event_loop_lag_samples.append(
+                max(0, time.perf_counter_ns() - scheduled_ns)
+            )
+
+    def get_event_loop_lag(self) -> EventLoopLag | None:
+        """Get the percentiles of the most recent event loop lag samples, or None if there are none yet."""
+        if not self._event_loop_lag_samples:
+            return None
+        samples = np.fromiter(self._event_loop_lag_samples, dtype=np.int64)
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        return EventLoopLag(
+            samples=len(samples),
+            p50_ns=int(p50),
+            p90_ns=int(p90),
+            p99_ns=int(p99),
+            max_ns=int(samples.max()),
+        )
+
     def get_process_health(self) -> ProcessHealth:
         """Get the process health information for the current process."""
 
@@ -44,5 +82,6 @@ class ProcessHealthMixin(BaseMixin):
             cpu_times=cpu_times,
             num_ctx_switches=CtxSwitches(*self._process.num_ctx_switches()),
             num_threads=self._process.num_threads(),
+            event_loop_lag=self.get_event_loop_lag(),
         )  # fmt: skip
         return self._process_health
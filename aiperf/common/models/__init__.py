@@ -12,14 +12,20 @@ from aiperf.common.models.base_models import (
     AIPerfBaseModel,
     exclude_if_none,
 )
+from aiperf.common.models.comm_models import (
+    CommChannelStats,
+    CommClientStats,
+)
 from aiperf.common.models.credit_models import (
     CreditPhaseConfig,
     CreditPhaseStats,
+    CreditRoutingSummary,
     ProcessingStats,
 )
 from aiperf.common.models.dataset_models import (
     Audio,
     Conversation,
+    ConversationHistory,
     Image,
     InputsFile,
     Media,
@@ -33,12 +39,15 @@ from aiperf.common.models.error_models import (
     ExitErrorInfo,
 )
 from aiperf.common.models.export_models import (
+    EndpointBreakdown,
+    EndpointBreakdownExportData,
     JsonExportData,
     JsonMetricResult,
 )
 from aiperf.common.models.health_models import (
     CPUTimes,
     CtxSwitches,
+    EventLoopLag,
     IOCounters,
     ProcessHealth,
 )
@@ -52,6 +61,7 @@ from aiperf.common.models.progress_models import (
 )
 from aiperf.common.models.record_models import (
     BaseResponseData,
+    ConnectionTiming,
     EmbeddingResponseData,
     InferenceServerResponse,
     MetricRecordInfo,
@@ -82,6 +92,7 @@ from aiperf.common.models.service_models import (
     ServiceRunInfo,
 )
 from aiperf.common.models.worker_models import (
+    ConnectionPrewarmStats,
     WorkerTaskStats,
 )
 
@@ -90,15 +101,24 @@ __all__ = [
     "Audio",
     "BaseResponseData",
     "CPUTimes",
+    "CommChannelStats",
+    "CommClientStats",
     "ComputedStats",
+    "ConnectionPrewarmStats",
+    "ConnectionTiming",
     "Conversation",
+    "ConversationHistory",
     "CreditPhaseConfig",
     "CreditPhaseStats",
+    "CreditRoutingSummary",
     "CtxSwitches",
     "DistributionParser",
     "EmbeddingResponseData",
+    "EndpointBreakdown",
+    "EndpointBreakdownExportData",
     "ErrorDetails",
     "ErrorDetailsCount",
+    "EventLoopLag",
     "ExitErrorInfo",
     "FullPhaseProgress",
     "IOCounters",
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from pydantic import Field
+
+from aiperf.common.models.base_models import AIPerfBaseModel
+
+
+def _merge_histogram(total: dict[int, int], histogram: dict[int, int]) -> None:
+    """Add the counts of a histogram to the total, by bucket."""
+    for bucket, count in histogram.items():
+        total[bucket] = total.get(bucket, 0) + count
+
+
+class CommClientStats(AIPerfBaseModel):
+    """The message counters of a push, pull, or request client. The counters are cumulative since
+    the client was created."""
+
+    channel: str = Field(
+        ...,
+        description="The channel of the client. The frontend and backend of a proxy are the same channel.",
+    )
+    sent: int = Field(default=0, description="The number of messages sent")
+    received: int = Field(default=0, description="The number of messages received")
+    in_flight: int = Field(
+        default=0,
+        description="The number of received messages that are still being processed",
+    )
+    send_blocked_ns: int = Field(
+        default=0,
+        description="The total time in nanoseconds that sends waited for the socket to accept the "
+        "message, such as when the high water mark is reached, or no peer is connected yet",
+    )
+    batch_size_histogram: dict[int, int] = Field(
+        default_factory=dict,
+        description="The number of batches sent by a push client, or received by a pull client, by the number "
+        "of messages coalesced into each batch",
+    )
+    request_timeouts: int = Field(
+        default=0,
+        description="The number of requests that did not receive a response before their deadline",
+    )
+    request_late_replies: int = Field(
+        default=0,
+        description="The number of responses received for requests that were no longer pending",
+    )
+    request_latency_histograms: dict[str, dict[int, int]] = Field(
+        default_factory=dict,
+        description="The number of completed requests per message type, by the power of two in milliseconds "
+        "that their latency is below",
+    )
+
+
+class CommChannelStats(AIPerfBaseModel):
+    """The message counters of a channel, summed over the push and pull clients of all of the services."""
+
+    channel: str = Field(..., description="The channel of the clients")
+    sent: int = Field(default=0, description="The number of messages sent")
+    received: int = Field(default=0, description="The number of messages received")
+    in_flight: int = Field(
+        default=0,
+        description="The number of received messages that are still being processed",
+    )
+    send_blocked_ns: int = Field(
+        default=0,
+        description="The total time in nanoseconds that sends waited for the sockets to accept the messages",
+    )
+    batch_size_histogram: dict[int, int] = Field(
+        default_factory=dict,
+        description="The number of batches received by the pull clients, by the number of messages coalesced "
+        "into each batch. Each batch sent by a push client is received once, so only the pull side is counted.",
+    )
+    request_timeouts: int = Field(
+        default=0,
+        description="The number of requests that did not receive a response before their deadline",
+    )
+    request_late_replies: int = Field(
+        default=0,
+        description="The number of responses received for requests that were no longer pending",
+    )
+    request_latency_histograms: dict[str, dict[int, int]] = Field(
+        default_factory=dict,
+        description="The number of completed requests per message type, by the power of two in milliseconds "
+        "that their latency is below",
+    )
+
+    @classmethod
+    def from_client_stats(
+        cls, channel: str, client_stats: Iterable[CommClientStats]
+    ) -> "CommChannelStats":
+        """Sum the counters of the clients of a channel."""
+        stats = cls(channel=channel)
+        for client in client_stats:
+            stats.sent += client.sent
+            stats.received += client.received
+            stats.in_flight += client.in_flight
+            stats.send_blocked_ns += client.send_blocked_ns
+            if client.received:
+                _merge_histogram(
+                    stats.batch_size_histogram, client.batch_size_histogram
+                )
+            stats.request_timeouts += client.request_timeouts
+            stats.request_late_replies += client.request_late_replies
+            for message_type, histogram in client.request_latency_histograms.items():
+                _merge_histogram(
+                    stats.request_latency_histograms.setdefault(message_type, {}),
+                    histogram,
+                )
+        return stats
+
+    @classmethod
+    def group_by_channel(
+        cls, client_stats: Iterable[CommClientStats]
+    ) -> dict[str, "CommChannelStats"]:
+        """Sum the counters of the clients of each channel, by channel name."""
+        clients_by_channel: dict[str, list[CommClientStats]] = defaultdict(list)
+        for client in client_stats:
+            clients_by_channel[client.channel].append(client)
+        return {
+            channel: cls.from_client_stats(channel, clients)
+            for channel, clients in clients_by_channel.items()
+        }
+
+    @property
+    def queued(self) -> int:
+        """The number of messages sent but not yet received, which are queued in the sockets and proxies.
+
+        NOTE: The counters of the services are sampled at slightly different times, so this is an estimate.
+        """
+        return max(self.sent - self.received, 0)
+
+    @property
+    def backlog(self) -> int:
+        """The number of messages that have been sent but not yet processed."""
+        return self.queued + self.in_flight
@@ -6,7 +6,7 @@ import time
 from pydantic import Field
 
 from aiperf.common.constants import NANOS_PER_SECOND
-from aiperf.common.enums import CreditPhase
+from aiperf.common.enums import CreditPhase, CreditRoutingMode
 from aiperf.common.exceptions import InvalidStateError
 from aiperf.common.models.base_models import AIPerfBaseModel
 
@@ -131,6 +131,39 @@ class CreditPhaseStats(CreditPhaseConfig):
         )
 
 
+class CreditRoutingSummary(AIPerfBaseModel):
+    """Model for how the credits were routed across the workers, to report how evenly the load was balanced."""
+
+    mode: CreditRoutingMode = Field(..., description="The credit routing mode")
+    routed_counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="The number of credits routed to each worker, including the workers that have since been removed",
+    )
+    max_queue_depths: dict[str, int] = Field(
+        default_factory=dict,
+        description="The maximum number of credits in flight at once for each worker",
+    )
+    affinity_overflows: int = Field(
+        default=0,
+        ge=0,
+        description="The number of credits that overflowed to another worker than their conversation's, "
+        "in session affinity mode",
+    )
+
+    @property
+    def total(self) -> int:
+        """The total number of credits routed."""
+        return sum(self.routed_counts.values())
+
+    @property
+    def imbalance(self) -> float:
+        """The ratio of the most credits routed to a single worker to the mean per worker, which is 1.0 when the
+        credits are spread perfectly evenly."""
+        if not self.routed_counts:
+            return 1.0
+        return max(self.routed_counts.values()) * len(self.routed_counts) / self.total
+
+
 class ProcessingStats(AIPerfBaseModel):
     """Model for phase processing stats. How many requests were processed and
     how many errors were encountered."""
@@ -83,6 +83,31 @@ class Conversation(AIPerfBaseModel):
     session_id: str = Field(default="", description="Session ID of the conversation.")
 
 
+class ConversationHistory:
+    """The turns that have been exchanged so far within a multi-turn conversation.
+
+    This contains both the user turns that were sent, and the assistant turns that were received.
+    Request converters may use the payload cache to store the serialized form of the first
+    `num_cached_turns` turns, so that they only need to serialize the new turns of each request.
+
+    NOTE: This is a plain class with __slots__ instead of a pydantic model, as it is created for
+    every session, and mutated after every turn.
+    """
+
+    __slots__ = ("turns", "payload_cache", "num_cached_turns")
+
+    def __init__(self) -> None:
+        self.turns: list[Turn] = []
+        self.payload_cache = bytearray()
+        self.num_cached_turns = 0
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def append(self, turn: Turn) -> None:
+        self.turns.append(turn)
+
+
 class SessionPayloads(AIPerfBaseModel):
     """A single session, with its session ID and a list of formatted payloads (one per turn)."""
 
@@ -6,8 +6,11 @@ from datetime import datetime
 from pydantic import ConfigDict, Field
 
 from aiperf.common.config import UserConfig
+from aiperf.common.enums import LoadBalancingStrategy
 from aiperf.common.models import ErrorDetailsCount
 from aiperf.common.models.base_models import AIPerfBaseModel, exclude_if_none
+from aiperf.common.models.credit_models import CreditRoutingSummary
+from aiperf.common.models.health_models import EventLoopLag
 
 
 @exclude_if_none(
@@ -83,5 +86,41 @@ class JsonExportData(AIPerfBaseModel):
     input_config: UserConfig | None = None
     was_cancelled: bool | None = None
     error_summary: list[ErrorDetailsCount] | None = None
+    client_event_loop_lag: EventLoopLag | None = None
+    client_saturated: bool | None = None
+    credit_routing: CreditRoutingSummary | None = None
     start_time: datetime | None = None
     end_time: datetime | None = None
+
+
+class EndpointBreakdown(AIPerfBaseModel):
+    """The results of the requests sent to a single endpoint URL, when load balancing across multiple URLs."""
+
+    url: str = Field(description="The URL of the endpoint, as specified by the user.")
+    request_count: int = Field(
+        default=0, description="The number of valid requests sent to the endpoint."
+    )
+    error_request_count: int = Field(
+        default=0, description="The number of failed requests sent to the endpoint."
+    )
+    request_throughput: float | None = Field(
+        default=None,
+        description="The number of valid requests per second completed by the endpoint, measured from the "
+        "start of its first request to the end of its last request.",
+    )
+    metrics: dict[str, JsonMetricResult] = Field(
+        default_factory=dict,
+        description="The latency metrics of the valid requests sent to the endpoint, in display units.",
+    )
+
+
+class EndpointBreakdownExportData(AIPerfBaseModel):
+    """The per-endpoint breakdown of the results to be exported to a JSON file, which shows the skew
+    in latency and throughput across the endpoint URLs."""
+
+    load_balancing: LoadBalancingStrategy = Field(
+        description="The strategy used to spread the requests across the endpoint URLs."
+    )
+    endpoints: list[EndpointBreakdown] = Field(
+        default_factory=list, description="The results of each endpoint URL."
+    )
@@ -27,6 +27,24 @@ CPUTimes = namedtuple(
 CtxSwitches = namedtuple("CtxSwitches", ["voluntary", "involuntary"])
 
 
+class EventLoopLag(AIPerfBaseModel):
+    """Percentiles of the event loop lag of a process, which is how much later than scheduled the
+    event loop wakes up a sleeping task. A high lag means the event loop is saturated, and any
+    timestamps taken by the process are delayed by up to that much."""
+
+    samples: int = Field(..., description="The number of lag samples")
+    p50_ns: int = Field(
+        ..., description="The 50th percentile of the lag in nanoseconds"
+    )
+    p90_ns: int = Field(
+        ..., description="The 90th percentile of the lag in nanoseconds"
+    )
+    p99_ns: int = Field(
+        ..., description="The 99th percentile of the lag in nanoseconds"
+    )
+    max_ns: int = Field(..., description="The maximum lag in nanoseconds")
+
+
 class ProcessHealth(AIPerfBaseModel):
     """Model for process health data."""
 
@@ -60,3 +78,7 @@ class ProcessHealth(AIPerfBaseModel):
         default=None,
         description="The current number of threads",
     )
+    event_loop_lag: EventLoopLag | None = Field(
+        default=None,
+        description="The recent event loop lag percentiles of the process",
+    )
@@ -15,11 +15,14 @@ from pydantic import (
 from aiperf.common.constants import NANOS_PER_SECOND, STAT_KEYS
 from aiperf.common.enums import CreditPhase, SSEFieldType
 from aiperf.common.enums.metric_enums import MetricValueTypeT
-from aiperf.common.models.base_models import AIPerfBaseModel
+from aiperf.common.models.base_models import AIPerfBaseModel, exclude_if_none
+from aiperf.common.models.credit_models import CreditRoutingSummary
 from aiperf.common.models.dataset_models import Turn
 from aiperf.common.models.error_models import ErrorDetails, ErrorDetailsCount
 from aiperf.common.models.export_models import JsonMetricResult
+from aiperf.common.models.health_models import EventLoopLag
 from aiperf.common.types import MetricTagT
+from aiperf.common.utils import compute_time_ns
 
 
 class MetricResult(JsonMetricResult):
@@ -58,6 +61,7 @@ class MetricValue(AIPerfBaseModel):
     unit: str
 
 
+@exclude_if_none("endpoint_url")
 class MetricRecordMetadata(AIPerfBaseModel):
     """The metadata of a metric record for export."""
 
@@ -99,6 +103,10 @@ class MetricRecordMetadata(AIPerfBaseModel):
     worker_id: str = Field(
         ..., description="The ID of the AIPerf worker that processed the request."
     )
+    endpoint_url: str | None = Field(
+        default=None,
+        description="The URL the request was sent to, when the requests are load balanced across multiple URLs.",
+    )
     record_processor_id: str = Field(
         ...,
         description="The ID of the AIPerf record processor that processed the record.",
@@ -117,6 +125,40 @@ class MetricRecordMetadata(AIPerfBaseModel):
         "This is only applicable to requests that were cancelled.",
     )
 
+    @classmethod
+    def from_request_record(
+        cls, record: "RequestRecord", worker_id: str, record_processor_id: str
+    ) -> "MetricRecordMetadata":
+        """Create the metadata of a request record, converting its timestamps from perf_ns to time_ns for the user."""
+        start_time_ns = record.timestamp_ns
+        start_perf_ns = record.start_perf_ns
+        return cls(
+            request_start_ns=start_time_ns,
+            request_ack_ns=compute_time_ns(
+                start_time_ns, start_perf_ns, record.recv_start_perf_ns
+            ),
+            request_end_ns=compute_time_ns(
+                start_time_ns,
+                start_perf_ns,
+                record.responses[-1].perf_ns
+                if record.responses
+                else record.end_perf_ns,
+            ),
+            conversation_id=record.conversation_id,
+            turn_index=record.turn_index,
+            record_processor_id=record_processor_id,
+            benchmark_phase=record.credit_phase,
+            x_request_id=record.x_request_id,
+            x_correlation_id=record.x_correlation_id,
+            session_num=record.credit_num,
+            worker_id=worker_id,
+            endpoint_url=record.endpoint_url,
+            was_cancelled=record.was_cancelled,
+            cancellation_time_ns=compute_time_ns(
+                start_time_ns, start_perf_ns, record.cancellation_perf_ns
+            ),
+        )
+
 
 class MetricRecordInfo(AIPerfBaseModel):
     """The full info of a metric record including the metadata, metrics, and error for export."""
@@ -160,6 +202,19 @@ class ProfileResults(AIPerfBaseModel):
         default_factory=list,
         description="A list of the unique error details and their counts",
     )
+    client_event_loop_lag: EventLoopLag | None = Field(
+        default=None,
+        description="The event loop lag percentiles of the most lagged worker during the profiling phase",
+    )
+    client_saturated: bool = Field(
+        default=False,
+        description="Whether the p99 event loop lag of any worker exceeded the client lag threshold during the "
+        "profiling phase, meaning that the measured latencies include client-side delays",
+    )
+    credit_routing: CreditRoutingSummary | None = Field(
+        default=None,
+        description="How the credits were spread across the workers",
+    )
 
     def get(self, tag: MetricTagT) -> MetricResult | None:
         """Get a metric result by tag, if it exists."""
@@ -248,12 +303,66 @@ class SSEMessage(InferenceServerResponse):
         )
 
 
+@exclude_if_none(
+    "dns_ns",
+    "connect_ns",
+    "tls_ns",
+    "connection_ready_perf_ns",
+    "request_sent_perf_ns",
+    "headers_received_perf_ns",
+)
+class ConnectionTiming(AIPerfBaseModel):
+    """Timing of the connection a request was sent over, captured by the HTTP client. Any timing
+    point the client could not capture is None."""
+
+    reused: bool = Field(
+        default=False,
+        description="Whether the request was sent over an already open keep-alive connection.",
+    )
+    dns_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The time spent resolving the host name of a new connection in nanoseconds. "
+        "None if the connection was reused, or the address was cached.",
+    )
+    connect_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The time spent opening a new connection after the host name was resolved in nanoseconds, "
+        "including the TLS handshake. None if the connection was reused.",
+    )
+    tls_ns: int | None = Field(
+        default=None,
+        ge=0,
+        description="The part of the connect time spent on the TLS handshake in nanoseconds, "
+        "if the HTTP client measures it separately.",
+    )
+    connection_ready_perf_ns: int | None = Field(
+        default=None,
+        description="The time the connection was ready to send the request in nanoseconds (perf_counter_ns).",
+    )
+    request_sent_perf_ns: int | None = Field(
+        default=None,
+        description="The time the request, including its body, was handed to the transport in nanoseconds (perf_counter_ns).",
+    )
+    headers_received_perf_ns: int | None = Field(
+        default=None,
+        description="The time the response headers were received in nanoseconds (perf_counter_ns).",
+    )
+
+
 class RequestRecord(AIPerfBaseModel):
     """Record of a request with its associated responses."""
 
     turn: Turn | None = Field(
         default=None,
-        description="The turn of the request, if applicable.",
+        description="The turn of the request, if applicable. This is only attached for the raw export level, "
+        "as it may contain large images or audios.",
+    )
+    input_texts: list[str] | None = Field(
+        default=None,
+        description="The texts of the turn, with the contents of each text joined. This is attached instead of "
+        "the turn when the turn is not attached, so that the input tokens can be counted without the turn.",
     )
     credit_num: int | None = Field(
         default=None,
@@ -274,6 +383,11 @@ class RequestRecord(AIPerfBaseModel):
         default=None,
         description="The name of the model targeted by the request.",
     )
+    endpoint_url: str | None = Field(
+        default=None,
+        description="The URL the request was sent to, as specified by the user, when the requests are load balanced "
+        "across multiple URLs. Otherwise None.",
+    )
     timestamp_ns: int = Field(
         default_factory=time.time_ns,
         description="The wall clock timestamp of the request in nanoseconds. DO NOT USE FOR LATENCY CALCULATIONS. (time.time_ns).",
@@ -306,6 +420,17 @@ class RequestRecord(AIPerfBaseModel):
         default_factory=list,
         description="The raw responses received from the request.",
     )
+    response_bytes: int | None = Field(
+        default=None,
+        description="The number of bytes in the body of the response. Only counted in timing-only mode, "
+        "where the content of the responses is discarded.",
+    )
+    coalesced_response_count: int | None = Field(
+        default=None,
+        description="The number of streamed responses that arrived in the same socket read as the response "
+        "before them, when the HTTP client timestamps each socket read. A high count means that the server "
+        "batched its responses, or that the client fell behind in reading them.",
+    )
     error: ErrorDetails | None = Field(
         default=None,
         description="The error details if the request failed.",
@@ -348,6 +473,10 @@ class RequestRecord(AIPerfBaseModel):
         default=None,
         description="The X-Correlation-ID header of the request. This is the ID of the credit drop.",
     )
+    connection_timing: ConnectionTiming | None = Field(
+        default=None,
+        description="The timing of the connection the request was sent over, if captured by the HTTP client.",
+    )
 
     @property
     def delayed(self) -> bool:
@@ -5,6 +5,7 @@
 from pydantic import Field
 
 from aiperf.common.models.base_models import AIPerfBaseModel
+from aiperf.common.models.record_models import RequestRecord
 
 
 class WorkerTaskStats(AIPerfBaseModel):
@@ -37,3 +38,36 @@ class WorkerTaskStats(AIPerfBaseModel):
         This is the total number of tasks sent to the worker minus the number of failed and successfully completed tasks.
         """
         return self.total - self.completed - self.failed
+
+
+class ConnectionPrewarmStats(AIPerfBaseModel):
+    """Stats for the connections a worker opened to the endpoint before the profiling phase."""
+
+    num_connections: int = Field(
+        default=0,
+        description="The number of connections the worker tried to open",
+    )
+    failed: int = Field(
+        default=0,
+        description="The number of connections that could not be opened",
+    )
+    connect_times_ns: list[int] = Field(
+        default_factory=list,
+        description="The time taken to open each connection in nanoseconds, including the "
+        "warm-up request when one was sent",
+    )
+
+    @classmethod
+    def from_records(cls, records: list[RequestRecord]) -> "ConnectionPrewarmStats":
+        """Create the stats from the records of the connections that were opened.
+
+        A record with an HTTP error status still counts as an open connection, as the server
+        responded over it. Only records without a status failed to connect.
+        """
+        stats = cls(num_connections=len(records))
+        for record in records:
+            if record.status is None and record.error is not None:
+                stats.failed += 1
+            elif record.end_perf_ns is not None:
+                stats.connect_times_ns.append(record.end_perf_ns - record.start_perf_ns)
+        return stats
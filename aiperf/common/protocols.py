@@ -18,6 +18,8 @@ from aiperf.common.enums import (
 from aiperf.common.hooks import Hook, HookType
 from aiperf.common.models import (
     BaseResponseData,
+    CommClientStats,
+    ConversationHistory,
     ParsedResponse,
     ParsedResponseRecord,
     RequestRecord,
@@ -136,6 +138,28 @@ class CommunicationClientProtocol(AIPerfLifecycleProtocol, Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class DispatchClientProtocol(CommunicationClientProtocol, Protocol):
+    async def send_to(self, target_id: str, message: MessageT) -> None: ...
+
+    def register_receive_callback(
+        self,
+        message_type: MessageTypeT,
+        callback: Callable[[MessageT], Coroutine[Any, Any, None]],
+    ) -> None: ...
+
+
+@runtime_checkable
+class DispatchTargetClientProtocol(CommunicationClientProtocol, Protocol):
+    async def send(self, message: MessageT) -> None: ...
+
+    def register_receive_callback(
+        self,
+        message_type: MessageTypeT,
+        callback: Callable[[MessageT], Coroutine[Any, Any, None]],
+    ) -> None: ...
+
+
 @runtime_checkable
 class PubClientProtocol(CommunicationClientProtocol, Protocol):
     async def publish(self, message: MessageT) -> None: ...
@@ -149,11 +173,15 @@ class PullClientProtocol(CommunicationClientProtocol, Protocol):
         callback: Callable[[MessageT], Coroutine[Any, Any, None]],
     ) -> None: ...
 
+    def get_stats(self) -> CommClientStats: ...
+
 
 @runtime_checkable
 class PushClientProtocol(CommunicationClientProtocol, Protocol):
     async def push(self, message: MessageT) -> None: ...
 
+    def get_stats(self) -> CommClientStats: ...
+
 
 @runtime_checkable
 class ReplyClientProtocol(CommunicationClientProtocol, Protocol):
@@ -177,8 +205,17 @@ class RequestClientProtocol(CommunicationClientProtocol, Protocol):
         self,
         message: MessageT,
         callback: Callable[[MessageOutputT], Coroutine[Any, Any, None]],
+        timeout: float | None = None,
     ) -> None: ...
 
+    async def request_many(
+        self,
+        messages: list[MessageT],
+        timeout: float = DEFAULT_COMMS_REQUEST_TIMEOUT,
+    ) -> list[MessageOutputT]: ...
+
+    def get_stats(self) -> CommClientStats: ...
+
 
 @runtime_checkable
 class SubClientProtocol(CommunicationClientProtocol, Protocol):
@@ -216,11 +253,16 @@ class CommunicationProtocol(AIPerfLifecycleProtocol, Protocol):
         bind: bool = False,
         socket_ops: dict | None = None,
         max_pull_concurrency: int | None = None,
+        **kwargs,
     ) -> CommunicationClientProtocol:
         """Create a client for the given client type and address, which will be automatically
         started and stopped with the CommunicationProtocol instance."""
         ...
 
+    def get_client_stats(self) -> list[CommClientStats]:
+        """Get the message counters of the push and pull clients."""
+        ...
+
     def create_pub_client(
         self,
         address: CommAddressType,
@@ -282,6 +324,28 @@ class CommunicationProtocol(AIPerfLifecycleProtocol, Protocol):
         started and stopped with the CommunicationProtocol instance."""
         ...
 
+    def create_dispatch_client(
+        self,
+        address: CommAddressType,
+        bind: bool = True,
+        socket_ops: dict | None = None,
+    ) -> DispatchClientProtocol:
+        """Create a DISPATCH client for the given address, which will be automatically
+        started and stopped with the CommunicationProtocol instance."""
+        ...
+
+    def create_dispatch_target_client(
+        self,
+        address: CommAddressType,
+        target_id: str,
+        bind: bool = False,
+        socket_ops: dict | None = None,
+    ) -> DispatchTargetClientProtocol:
+        """Create a DISPATCH_TARGET client for the given address, which will be automatically
+        started and stopped with the CommunicationProtocol instance. The target ID is used by
+        the DISPATCH client to address messages to this client."""
+        ...
+
 
 @runtime_checkable
 class MessageBusClientProtocol(PubClientProtocol, SubClientProtocol, Protocol):
@@ -352,6 +416,53 @@ class HooksProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class HttpClientProtocol(Protocol):
+    """Protocol for the HTTP client that an inference client uses to send its requests.
+
+    Each implementation records the same timing points, so that the metrics are comparable
+    regardless of the HTTP client that is used.
+    """
+
+    def __init__(self, model_endpoint: ModelEndpointInfoT) -> None:
+        """Create a new HTTP client for the provided endpoint."""
+        ...
+
+    async def post_request(
+        self,
+        url: str,
+        payload: str | bytes,
+        headers: dict[str, str],
+        **kwargs: Any,
+    ) -> RequestRecord:
+        """Send a streaming or non-streaming POST request, and return the timed response."""
+        ...
+
+    async def get_request(
+        self, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> RequestRecord:
+        """Send a GET request, and return the timed response."""
+        ...
+
+    async def open_connections(
+        self,
+        url: str,
+        headers: dict[str, str],
+        num_connections: int,
+        send_request: bool = True,
+    ) -> list[RequestRecord]:
+        """Open keep-alive connections to the host of the URL, and keep them in the pool for later requests.
+
+        A GET request is sent to the URL over each connection. If `send_request` is False and the
+        client supports it, the connections are only opened. Returns a timed record per connection.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close the client and all of its connections."""
+        ...
+
+
 @runtime_checkable
 class InferenceClientProtocol(Protocol):
     """Protocol for an inference server client.
@@ -389,6 +500,24 @@ class InferenceClientProtocol(Protocol):
         """
         ...
 
+    async def prewarm_connections(
+        self,
+        model_endpoint: ModelEndpointInfoT,
+        num_connections: int,
+        path: str | None = None,
+    ) -> list[RequestRecord]:
+        """Open connections to the inference server before they are needed, so that requests do not
+        pay for the connection setup.
+
+        Args:
+            model_endpoint: The endpoint to open the connections to.
+            num_connections: The number of connections to open.
+            path: The path of a cheap GET request to send over each connection, if any.
+        Returns:
+            A timed record for each connection.
+        """
+        ...
+
     async def close(self) -> None:
         """Close the client."""
         ...
@@ -420,9 +549,13 @@ class RequestConverterProtocol(Protocol):
     """Protocol for a request converter that converts a raw request to a formatted request for the inference server."""
 
     async def format_payload(
-        self, model_endpoint: ModelEndpointInfoT, turn: Turn
+        self,
+        model_endpoint: ModelEndpointInfoT,
+        turn: Turn,
+        history: ConversationHistory | None = None,
     ) -> RequestOutputT:
-        """Format the turn for the inference server."""
+        """Format the turn for the inference server. The history contains the previous turns of
+        the conversation, for converters that support multi-turn requests."""
         ...
 
 
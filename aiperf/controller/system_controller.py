@@ -6,6 +6,7 @@ import sys
 import time
 from typing import cast
 
+import numpy as np
 from rich.console import Console
 
 from aiperf.common.base_service import BaseService
@@ -17,6 +18,7 @@ from aiperf.common.constants import (
     DEFAULT_PROFILE_CONFIGURE_TIMEOUT,
     DEFAULT_PROFILE_START_TIMEOUT,
     DEFAULT_RECORD_PROCESSOR_SCALE_FACTOR,
+    NANOS_PER_MILLIS,
 )
 from aiperf.common.enums import (
     CommandResponseStatus,
@@ -36,6 +38,7 @@ from aiperf.common.logging import get_global_log_queue
 from aiperf.common.messages import (
     CommandErrorResponse,
     CommandResponse,
+    CommandSuccessResponse,
     CreditsCompleteMessage,
     HeartbeatMessage,
     ProcessRecordsResultMessage,
@@ -50,6 +53,7 @@ from aiperf.common.messages import (
     StatusMessage,
 )
 from aiperf.common.models import (
+    ConnectionPrewarmStats,
     ErrorDetails,
     ProcessRecordsResult,
     ServiceRunInfo,
@@ -99,6 +103,10 @@ class SystemController(SignalHandlerMixin, BaseService):
             self.scale_record_processors_with_workers = False
         else:
             self.scale_record_processors_with_workers = True
+        # Track the number of spawned workers and record processors, as workers can be spawned
+        # and shut down multiple times when the worker manager is auto-scaling.
+        self._num_workers = 0
+        self._num_record_processors = 0
 
         self.proxy_manager: ProxyManager = ProxyManager(
             service_config=self.service_config
@@ -189,10 +197,16 @@ class SystemController(SignalHandlerMixin, BaseService):
         """
         self.info("Configuring all services to start profiling")
         begin = time.perf_counter()
+        worker_ids = [
+            service_id
+            for service_id, service_info in self.service_manager.service_id_map.items()
+            if service_info.service_type == ServiceType.WORKER
+        ]
         responses = await self.send_command_and_wait_for_all_responses(
             ProfileConfigureCommand(
                 service_id=self.service_id,
                 config=self.user_config,
+                num_workers=len(worker_ids),
             ),
             list(self.service_manager.service_id_map.keys()),
             timeout=DEFAULT_PROFILE_CONFIGURE_TIMEOUT,
@@ -200,6 +214,39 @@ class SystemController(SignalHandlerMixin, BaseService):
         duration = time.perf_counter() - begin
         self._parse_responses_for_errors(responses, "Configure Profiling")
         self.info(f"All services configured in {duration:.2f} seconds")
+        self._log_connection_prewarm_stats(responses, set(worker_ids))
+
+    def _log_connection_prewarm_stats(
+        self, responses: list[CommandResponse | ErrorDetails], worker_ids: set[str]
+    ) -> None:
+        """Report the connect times of the connections the workers pre-warmed, separately from the
+        profiling metrics."""
+        connect_times_ns: list[int] = []
+        num_connections = failed = 0
+        for response in responses:
+            if (
+                isinstance(response, CommandSuccessResponse)
+                and response.service_id in worker_ids
+                and response.data
+            ):
+                stats = ConnectionPrewarmStats.model_validate(response.data)
+                num_connections += stats.num_connections
+                failed += stats.failed
+                connect_times_ns.extend(stats.connect_times_ns)
+        if not num_connections:
+            return
+
+        summary = f"Pre-warmed {num_connections - failed:,} of {num_connections:,} connections"
+        if connect_times_ns:
+            p50, p99 = np.percentile(connect_times_ns, [50, 99]) / NANOS_PER_MILLIS
+            summary += (
+                f", connect time p50 {p50:,.2f} ms, p99 {p99:,.2f} ms, "
+                f"max {max(connect_times_ns) / NANOS_PER_MILLIS:,.2f} ms"
+            )
+        if failed:
+            self.warning(summary)
+        else:
+            self.info(summary)
 
     async def _start_profiling_all_services(self) -> None:
         """Tell all services to start profiling."""
@@ -369,12 +416,19 @@ class SystemController(SignalHandlerMixin, BaseService):
         self.debug(lambda: f"Received spawn workers command: {message}")
         # Spawn the workers
         await self.service_manager.run_service(ServiceType.WORKER, message.num_workers)
-        # If we are scaling the record processor service count with the number of workers, spawn the record processors
+        self._num_workers += message.num_workers
+        # If we are scaling the record processor service count with the number of workers, spawn the record processors.
+        # NOTE: Record processors are never shut down when workers are, as they may still have records to process.
         if self.scale_record_processors_with_workers:
-            await self.service_manager.run_service(
-                ServiceType.RECORD_PROCESSOR,
-                max(1, message.num_workers // DEFAULT_RECORD_PROCESSOR_SCALE_FACTOR),
+            num_record_processors = max(
+                1, self._num_workers // DEFAULT_RECORD_PROCESSOR_SCALE_FACTOR
             )
+            if num_record_processors > self._num_record_processors:
+                await self.service_manager.run_service(
+                    ServiceType.RECORD_PROCESSOR,
+                    num_record_processors - self._num_record_processors,
+                )
+                self._num_record_processors = num_record_processors
 
     @on_command(CommandType.SHUTDOWN_WORKERS)
     async def _handle_shutdown_workers_command(
@@ -382,7 +436,20 @@ class SystemController(SignalHandlerMixin, BaseService):
     ) -> None:
         """Handle a shutdown workers command."""
         self.debug(lambda: f"Received shutdown workers command: {message}")
-        # TODO: Handle individual worker shutdowns via worker id
+        if message.worker_ids:
+            # Ask the workers to stop themselves, so that they can return the credits of their
+            # active sessions before they exit.
+            for worker_id in message.worker_ids:
+                await self.publish(
+                    ShutdownCommand(
+                        service_id=self.service_id,
+                        target_service_id=worker_id,
+                    )
+                )
+            self._num_workers -= len(message.worker_ids)
+            return
+
+        # TODO: Handle shutting down a number of workers via num_workers
         await self.service_manager.stop_service(ServiceType.WORKER)
         if self.scale_record_processors_with_workers:
             await self.service_manager.stop_service(ServiceType.RECORD_PROCESSOR)
@@ -11,6 +11,13 @@ from aiperf.dataset.dataset_manager import (
     DatasetManager,
     main,
 )
+from aiperf.dataset.dataset_store import (
+    DATASET_STORE_MAGIC,
+    DATASET_STORE_VERSION,
+    MISSING_VALUE,
+    DatasetStore,
+    write_dataset_store,
+)
 from aiperf.dataset.generator import (
     DEFAULT_CORPUS_FILE,
     MP3_SUPPORTED_SAMPLE_RATES,
@@ -55,9 +62,13 @@ __all__ = [
     "CustomDatasetLoaderProtocol",
     "CustomDatasetT",
     "DATASET_CONFIGURATION_TIMEOUT",
+    "DATASET_STORE_MAGIC",
+    "DATASET_STORE_VERSION",
     "DEFAULT_CORPUS_FILE",
     "DatasetManager",
+    "DatasetStore",
     "ImageGenerator",
+    "MISSING_VALUE",
     "MP3_SUPPORTED_SAMPLE_RATES",
     "MediaConversionMixin",
     "MooncakeTrace",
@@ -79,4 +90,5 @@ __all__ = [
     "sample_normal",
     "sample_positive_normal",
     "sample_positive_normal_integer",
+    "write_dataset_store",
 ]
@@ -3,14 +3,17 @@
 import asyncio
 import random
 import time
+from collections.abc import Iterable
 
 import aiofiles
+import numpy as np
 
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.config.config_defaults import OutputDefaults
+from aiperf.common.constants import DEFAULT_DATASET_TIMING_CHUNK_SIZE
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import (
     CommAddress,
@@ -25,7 +28,7 @@ from aiperf.common.factories import (
     RequestConverterFactory,
     ServiceFactory,
 )
-from aiperf.common.hooks import on_command, on_request
+from aiperf.common.hooks import on_command, on_request, on_stop
 from aiperf.common.messages import (
     ConversationRequestMessage,
     ConversationResponseMessage,
@@ -41,6 +44,11 @@ from aiperf.common.models import Conversation, InputsFile
 from aiperf.common.models.dataset_models import SessionPayloads
 from aiperf.common.protocols import RequestConverterProtocol, ServiceProtocol
 from aiperf.common.tokenizer import Tokenizer
+from aiperf.dataset.dataset_store import (
+    MISSING_VALUE,
+    DatasetStore,
+    write_dataset_store,
+)
 from aiperf.dataset.loader import ShareGPTLoader
 
 DATASET_CONFIGURATION_TIMEOUT = 300.0
@@ -54,6 +62,10 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
     The DatasetManager primary responsibility is to manage the data generation or acquisition.
     For synthetic generation, it contains the code to generate the prompts or tokens.
     It will have an API for dataset acquisition of a dataset if available in a remote repository or database.
+
+    Once generated or loaded, the dataset is compiled into a :class:`DatasetStore` file in the artifact
+    directory, which is memory-mapped instead of being kept on the heap. The workers on the same host
+    map the same file, and read the conversations from it directly.
     """
 
     def __init__(
@@ -72,14 +84,16 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         self.debug("Dataset manager __init__")
         self.user_config = user_config
         self.tokenizer: Tokenizer | None = None
-        self.dataset: dict[str, Conversation] = {}  # session ID -> Conversation mapping
-        self._session_ids_cache: list[str] = []
+        self.dataset_store: DatasetStore | None = None
         self._conversation_query_random = random.Random(
             self.user_config.input.random_seed
         )
         self.dataset_configured = asyncio.Event()
         self._sequential_iterator_index = 0
         self._use_sequential_iteration = False
+        # Sorted fixed schedule arrays, lazily built on the first timing request
+        self._timing_timestamps: np.ndarray | None = None
+        self._timing_conversation_indices: np.ndarray | None = None
 
     @on_command(CommandType.PROFILE_CONFIGURE)
     async def _profile_configure_command(
@@ -121,7 +135,10 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
     ) -> InputsFile:
         """Generate input payloads from the dataset for use in the inputs.json file."""
         inputs = InputsFile()
-        for conversation in self.dataset.values():
+        if self.dataset_store is None:
+            return inputs
+        for conversation_index in range(len(self.dataset_store)):
+            conversation = self.dataset_store.get_conversation(conversation_index)
             payloads = await asyncio.gather(
                 *[
                     request_converter.format_payload(model_endpoint, turn)
@@ -196,16 +213,42 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
             )
             conversations = composer.create_dataset()
 
-        self.dataset = {conv.session_id: conv for conv in conversations}
-        self._session_ids_cache = list(self.dataset.keys())
+        self._set_dataset(conversations)
+        del conversations
 
         self.dataset_configured.set()
         await self.publish(
             DatasetConfiguredNotification(
                 service_id=self.service_id,
+                dataset_store_path=str(self.dataset_store.path.resolve()),  # type: ignore[union-attr]
+                sequential_iteration=self._use_sequential_iteration,
             ),
         )
 
+    def _set_dataset(self, conversations: Iterable[Conversation]) -> None:
+        """Compile the conversations into the dataset store, and memory-map it."""
+        path = (
+            self.user_config.output.artifact_directory
+            / OutputDefaults.DATASET_STORE_FILE
+        )
+        if self.dataset_store is not None:
+            self.dataset_store.close()
+        write_dataset_store(path, conversations)
+        self.dataset_store = DatasetStore(path)
+        self._timing_timestamps = None
+        self._timing_conversation_indices = None
+        self.debug(
+            lambda: f"Compiled {self.dataset_store.num_conversations:,} conversations and "  # type: ignore[union-attr]
+            f"{self.dataset_store.num_turns:,} turns into {path}"  # type: ignore[union-attr]
+        )
+
+    @on_stop
+    async def _remove_dataset_store(self) -> None:
+        """Close and remove the dataset store. Any services that still map it keep it until they close it."""
+        if self.dataset_store is not None:
+            self.dataset_store.close()
+            self.dataset_store.path.unlink(missing_ok=True)
+
     @on_request(MessageType.CONVERSATION_REQUEST)
     async def _handle_conversation_request(
         self, message: ConversationRequestMessage
@@ -215,7 +258,7 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
 
         await self._wait_for_dataset_configuration()
 
-        if not self.dataset:
+        if not self.dataset_store:
             raise self._service_error(
                 "Dataset is empty and must be configured before handling requests.",
             )
@@ -234,58 +277,60 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         self, request_id: str | None
     ) -> ConversationResponseMessage:
         """Return any conversation from the dataset based on the user specified method."""
+        store: DatasetStore = self.dataset_store  # type: ignore[assignment]
 
         if self._use_sequential_iteration:
-            if self._sequential_iterator_index >= len(self._session_ids_cache):
+            if self._sequential_iterator_index >= len(store):
                 # Reset iterator if we've gone through all conversations
                 _logger.warning(
                     "All conversations have been used. Resetting sequential iterator to start over."
                 )
                 self._sequential_iterator_index = 0
 
-            session_id = self._session_ids_cache[self._sequential_iterator_index]
+            conversation_index = self._sequential_iterator_index
             self._sequential_iterator_index += 1
 
-            conversation = self.dataset[session_id]
-
             self.trace_or_debug(
-                lambda: f"Sending sequential conversation response: {conversation}",
-                lambda: f"Sending sequential conversation response with id: {conversation.session_id}",
+                lambda: f"Sending sequential conversation response: {store.conversation_json(conversation_index).decode()}",
+                lambda: f"Sending sequential conversation response with id: {store.session_id(conversation_index)}",
             )
         else:
             # TODO: Implement the user specified method (random, round robin, etc.)
-            session_id = self._conversation_query_random.choice(self._session_ids_cache)
-            conversation = self.dataset[session_id]
+            conversation_index = self._conversation_query_random.randrange(len(store))
             self.trace_or_debug(
-                lambda: f"Sending random conversation response: {conversation}",
-                lambda: f"Sending random conversation response with id: {conversation.session_id}",
+                lambda: f"Sending random conversation response: {store.conversation_json(conversation_index).decode()}",
+                lambda: f"Sending random conversation response with id: {store.session_id(conversation_index)}",
             )
 
-        return ConversationResponseMessage(
-            service_id=self.service_id,
-            request_id=request_id,
-            conversation=conversation,
-        )
+        return self._conversation_response(request_id, conversation_index)
 
     def _return_conversation_by_id(
         self, request_id: str | None, conversation_id: str
     ) -> ConversationResponseMessage:
         """Return a conversation if it exists, otherwise raise an error."""
+        store: DatasetStore = self.dataset_store  # type: ignore[assignment]
 
-        if conversation_id not in self.dataset:
+        conversation_index = store.index_of(conversation_id)
+        if conversation_index is None:
             raise self._service_error(
                 f"Conversation {conversation_id} not found in dataset.",
             )
 
-        conversation = self.dataset[conversation_id]
         self.trace_or_debug(
-            lambda: f"Sending conversation response: {conversation}",
-            lambda: f"Sending conversation response with id: {conversation.session_id}",
+            lambda: f"Sending conversation response: {store.conversation_json(conversation_index).decode()}",
+            lambda: f"Sending conversation response with id: {conversation_id}",
         )
-        return ConversationResponseMessage(
+        return self._conversation_response(request_id, conversation_index)
+
+    def _conversation_response(
+        self, request_id: str | None, conversation_index: int
+    ) -> ConversationResponseMessage:
+        """Create the response for a conversation, which sends the turn payloads of the dataset store
+        as is, instead of parsing them into a conversation only to serialize it again."""
+        return ConversationResponseMessage.from_conversation_json(
+            self.dataset_store.conversation_json(conversation_index),  # type: ignore[union-attr]
             service_id=self.service_id,
             request_id=request_id,
-            conversation=conversation,
         )
 
     @on_request(MessageType.CONVERSATION_TURN_REQUEST)
@@ -295,18 +340,25 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
         """Handle a turn request."""
         self.debug(lambda: f"Handling turn request: {message}")
 
-        if message.conversation_id not in self.dataset:
+        conversation_index = (
+            self.dataset_store.index_of(message.conversation_id)
+            if self.dataset_store
+            else None
+        )
+        if conversation_index is None:
             raise self._service_error(
                 f"Conversation {message.conversation_id} not found in dataset.",
             )
 
-        conversation = self.dataset[message.conversation_id]
-        if message.turn_index >= len(conversation.turns):
+        store: DatasetStore = self.dataset_store  # type: ignore[assignment]
+        if message.turn_index >= store.get_num_turns(conversation_index):
             raise self._service_error(
                 f"Turn index {message.turn_index} is out of range for conversation {message.conversation_id}.",
             )
 
-        turn = conversation.turns[message.turn_index]
+        turn = store.get_turn(conversation_index, message.turn_index)
+        if message.texts_only:
+            turn = turn.model_copy(update={"images": [], "audios": []})
 
         self.trace_or_debug(
             lambda: f"Sending turn response: {turn}",
@@ -330,22 +382,59 @@ class DatasetManager(ReplyClientMixin, BaseComponentService):
 
         await self._wait_for_dataset_configuration()
 
-        if not self.dataset:
+        if not self.dataset_store:
             raise self._service_error(
                 "Dataset is empty and must be configured before handling timing requests.",
             )
 
-        timing_dataset = []
-        for conversation_id, conversation in self.dataset.items():
-            for turn in conversation.turns:
-                timing_dataset.append((turn.timestamp, conversation_id))
+        if self._timing_timestamps is None:
+            self._build_timing_schedule()
+
+        timestamps = self._timing_timestamps
+        conversation_indices = self._timing_conversation_indices
+        start = message.offset
+        end = start + (message.limit or DEFAULT_DATASET_TIMING_CHUNK_SIZE)
 
         return DatasetTimingResponse(
             service_id=self.service_id,
             request_id=message.request_id,
-            timing_data=timing_dataset,
+            offset=start,
+            total_entries=len(timestamps),
+            total_conversations=len(self.dataset_store),
+            timestamps=timestamps[start:end].tolist(),
+            conversation_indices=conversation_indices[start:end].tolist(),
+            conversation_ids=[
+                self.dataset_store.session_id(i)
+                for i in range(start, min(end, len(self.dataset_store)))
+            ],
         )
 
+    def _build_timing_schedule(self) -> None:
+        """Build the fixed schedule as a pair of parallel numpy arrays sorted by timestamp.
+
+        The timestamps are stored as int64 milliseconds, and the conversations are stored as int32
+        indices into the session IDs of the dataset store. This uses 12 bytes per entry, as opposed
+        to a python tuple and int per entry. The sort is stable, so entries with the same timestamp
+        keep their dataset order. The timestamps are read from the timestamp column of the dataset
+        store, without parsing any turns.
+        """
+        store: DatasetStore = self.dataset_store  # type: ignore[assignment]
+        conversation_indices = np.repeat(
+            np.arange(len(store), dtype=np.int32),
+            np.diff(store.conversation_turn_offsets),
+        )
+        missing = np.flatnonzero(store.timestamps == MISSING_VALUE)
+        if missing.size:
+            conversation_id = store.session_id(int(conversation_indices[missing[0]]))
+            raise self._service_error(
+                f"Conversation {conversation_id} has a turn without a timestamp, "
+                "which is required for a fixed schedule.",
+            )
+
+        order = np.argsort(store.timestamps, kind="stable")
+        self._timing_timestamps = store.timestamps[order]
+        self._timing_conversation_indices = conversation_indices[order]
+
     async def _wait_for_dataset_configuration(self) -> None:
         """Wait for the dataset to be configured if it is not already."""
         if not self.dataset_configured.is_set():
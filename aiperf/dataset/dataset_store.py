@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+from aiperf.common.exceptions import DatasetError
+from aiperf.common.models import Conversation, Turn
+
+DATASET_STORE_MAGIC = b"AIPERFDS"
+"""The magic bytes at the start of a dataset store file."""
+
+DATASET_STORE_VERSION = 2
+"""The version of the dataset store file format."""
+
+MISSING_VALUE = np.iinfo(np.int64).min
+"""Stored in the timestamp and delay columns in place of a turn without a timestamp or delay."""
+
+_HEADER = struct.Struct("<8sQQQQQQ")
+"""The header of the file: the magic, the version, the number of conversations, the number of turns,
+the size of the turn payloads, the size of the session IDs, and the offset of the columns."""
+
+_INT64 = np.dtype("<i8")
+
+
+def _hash_session_id(session_id: bytes) -> int:
+    """Hash a UTF-8 session ID to a signed 64-bit integer, for the sorted session ID hash column."""
+    return int.from_bytes(
+        hashlib.blake2b(session_id, digest_size=8).digest(), "little", signed=True
+    )
+
+
+def write_dataset_store(path: Path, conversations: Iterable[Conversation]) -> None:
+    """Compile the conversations into a dataset store file, which is opened with :class:`DatasetStore`.
+
+    The file is laid out as a header, followed by the JSON payloads of all of the turns back to back,
+    then the UTF-8 session IDs back to back, and finally the int64 columns:
+    - the index of the first turn of each conversation, plus the total number of turns
+    - the offset of the payload of each turn, plus the total size of the payloads
+    - the offset of each session ID, plus the total size of the session IDs
+    - the timestamp and the delay of each turn
+    - the hash of each session ID in sorted order, and the index of the conversation of each hash
+
+    The turn payloads are streamed to the file as the conversations are iterated, so only the columns
+    are kept in memory. The file is written next to the path and renamed into place once complete,
+    so a reader never opens a partially written store.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    conversation_turn_offsets = array("q", [0])
+    turn_payload_offsets = array("q", [0])
+    session_id_offsets = array("q", [0])
+    timestamps = array("q")
+    delays = array("q")
+    session_ids: list[bytes] = []
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(bytes(_HEADER.size))
+        payload_size = 0
+        for conversation in conversations:
+            for turn in conversation.turns:
+                payload = turn.model_dump_json().encode()
+                f.write(payload)
+                payload_size += len(payload)
+                turn_payload_offsets.append(payload_size)
+                timestamps.append(
+                    MISSING_VALUE if turn.timestamp is None else turn.timestamp
+                )
+                delays.append(MISSING_VALUE if turn.delay is None else turn.delay)
+            conversation_turn_offsets.append(len(timestamps))
+            session_ids.append(conversation.session_id.encode())
+            session_id_offsets.append(session_id_offsets[-1] + len(session_ids[-1]))
+
+        f.write(b"".join(session_ids))
+        session_id_hashes = np.fromiter(
+            (_hash_session_id(session_id) for session_id in session_ids),
+            dtype=_INT64,
+            count=len(session_ids),
+        )
+        session_id_order = np.argsort(session_id_hashes, kind="stable")
+        # Align the columns, so that they can be viewed as int64 arrays in place
+        f.write(bytes(-f.tell() % _INT64.itemsize))
+        columns_offset = f.tell()
+        for column in (
+            conversation_turn_offsets,
+            turn_payload_offsets,
+            session_id_offsets,
+            timestamps,
+            delays,
+            session_id_hashes[session_id_order],
+            session_id_order,
+        ):
+            f.write(np.asarray(column, dtype=_INT64).tobytes())
+
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                DATASET_STORE_MAGIC,
+                DATASET_STORE_VERSION,
+                len(session_ids),
+                len(timestamps),
+                payload_size,
+                session_id_offsets[-1],
+                columns_offset,
+            )
+        )
+    os.replace(tmp_path, path)
+
+
+class DatasetStore:
+    """A read-only view of a dataset store file, which is memory-mapped so that the DatasetManager and the
+    workers share the same pages of the OS page cache, instead of each holding the dataset on their heap.
+
+    The conversations are addressed by their index in the store, and the turn payloads are returned as
+    zero-copy slices of the mapping. They are only parsed into :class:`Turn` objects when requested.
+    The session IDs are also only decoded when requested, and are looked up with a binary search of the
+    sorted session ID hash column, so the store holds nothing per conversation on the heap.
+    See :func:`write_dataset_store` for the file layout.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise DatasetError(f"Dataset store {self.path} is truncated")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            num_conversations,
+            num_turns,
+            payload_size,
+            session_ids_size,
+            columns_offset,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != DATASET_STORE_MAGIC or version != DATASET_STORE_VERSION:
+            raise DatasetError(
+                f"{self.path} is not a version {DATASET_STORE_VERSION} dataset store"
+            )
+
+        self.num_conversations: int = num_conversations
+        self.num_turns: int = num_turns
+        self._payloads = memoryview(self._mmap)[
+            _HEADER.size : _HEADER.size + payload_size
+        ]
+        session_ids_start = _HEADER.size + payload_size
+        self._session_ids = memoryview(self._mmap)[
+            session_ids_start : session_ids_start + session_ids_size
+        ]
+
+        offset = columns_offset
+        columns = []
+        for count in (
+            num_conversations + 1,
+            num_turns + 1,
+            num_conversations + 1,
+            num_turns,
+            num_turns,
+            num_conversations,
+            num_conversations,
+        ):
+            columns.append(
+                np.frombuffer(self._mmap, dtype=_INT64, count=count, offset=offset)
+            )
+            offset += count * _INT64.itemsize
+        (
+            self.conversation_turn_offsets,
+            self.turn_payload_offsets,
+            self._session_id_offsets,
+            self.timestamps,
+            self.delays,
+            self._session_id_hashes,
+            self._session_id_order,
+        ) = columns
+
+    def __len__(self) -> int:
+        return self.num_conversations
+
+    def session_id(self, conversation_index: int) -> str:
+        """Get the session ID of a conversation."""
+        start, end = self._session_id_offsets[
+            conversation_index : conversation_index + 2
+        ].tolist()
+        return str(self._session_ids[start:end], "utf-8")
+
+    def index_of(self, session_id: str) -> int | None:
+        """Get the index of the conversation with a session ID, or None if it is not in the store."""
+        session_id_hash = _hash_session_id(session_id.encode())
+        start = int(np.searchsorted(self._session_id_hashes, session_id_hash, "left"))
+        end = int(np.searchsorted(self._session_id_hashes, session_id_hash, "right"))
+        # Compare the session IDs themselves, in case of a hash collision
+        for conversation_index in self._session_id_order[start:end].tolist():
+            if self.session_id(conversation_index) == session_id:
+                return conversation_index
+        return None
+
+    def get_num_turns(self, conversation_index: int) -> int:
+        """Get the number of turns of a conversation."""
+        return int(
+            self.conversation_turn_offsets[conversation_index + 1]
+            - self.conversation_turn_offsets[conversation_index]
+        )
+
+    def turn_payload(self, conversation_index: int, turn_index: int) -> memoryview:
+        """Get the JSON payload of a turn, as a zero-copy slice of the mapping."""
+        if not 0 <= turn_index < self.get_num_turns(conversation_index):
+            raise IndexError(
+                f"Turn index {turn_index} is out of range for conversation {conversation_index}"
+            )
+        i = int(self.conversation_turn_offsets[conversation_index]) + turn_index
+        start, end = self.turn_payload_offsets[i : i + 2].tolist()
+        return self._payloads[start:end]
+
+    def get_turn(self, conversation_index: int, turn_index: int) -> Turn:
+        """Parse a turn of a conversation."""
+        return Turn.model_validate(
+            orjson.loads(self.turn_payload(conversation_index, turn_index))
+        )
+
+    def conversation_json(self, conversation_index: int) -> bytes:
+        """Get the JSON of a conversation, assembled from the turn payloads without parsing them."""
+        start, end = self.conversation_turn_offsets[
+            conversation_index : conversation_index + 2
+        ].tolist()
+        offsets = self.turn_payload_offsets[start : end + 1].tolist()
+        turns = b",".join(
+            self._payloads[offset:next_offset]
+            for offset, next_offset in zip(offsets[:-1], offsets[1:], strict=True)
+        )
+        return b"".join(
+            (
+                b'{"turns":[',
+                turns,
+                b'],"session_id":',
+                orjson.dumps(self.session_id(conversation_index)),
+                b"}",
+            )
+        )
+
+    def get_conversation(self, conversation_index: int) -> Conversation:
+        """Parse a conversation, with all of its turns."""
+        return Conversation(
+            session_id=self.session_id(conversation_index),
+            turns=[
+                self.get_turn(conversation_index, turn_index)
+                for turn_index in range(self.get_num_turns(conversation_index))
+            ],
+        )
+
+    def close(self) -> None:
+        """Release the mapping. If any turn payloads are still referenced, the mapping stays open until they are released."""
+        self.conversation_turn_offsets = self.turn_payload_offsets = np.empty(0, _INT64)
+        self.timestamps = self.delays = np.empty(0, _INT64)
+        self._session_id_offsets = np.empty(0, _INT64)
+        self._session_id_hashes = self._session_id_order = np.empty(0, _INT64)
+        try:
+            self._payloads.release()
+            self._session_ids.release()
+            self._mmap.close()
+        except BufferError:
+            pass
@@ -80,6 +80,9 @@ class JsonExporter(AIPerfLoggerMixin):
             input_config=self._input_config,
             was_cancelled=self._results.was_cancelled,
             error_summary=self._results.error_summary,
+            client_event_loop_lag=self._results.client_event_loop_lag,
+            client_saturated=self._results.client_saturated,
+            credit_routing=self._results.credit_routing,
             start_time=start_time,
             end_time=end_time,
         )
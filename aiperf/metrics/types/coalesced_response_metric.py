@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.enums import GenericMetricUnit, MetricFlags
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import ParsedResponseRecord
+from aiperf.metrics import BaseRecordMetric
+from aiperf.metrics.metric_dicts import MetricRecordDict
+
+
+class CoalescedResponseCountMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating Coalesced Response Count metrics from records. This is only applicable to streaming responses.
+
+    This is the number of streamed responses that arrived in the same socket read as the response before them,
+    and so share its timestamp. A high count means that the server batched its responses, or that the client
+    fell behind in reading them, either of which hides the true gaps between the responses in the ITL.
+
+    Formula:
+        Coalesced Response Count = Sum(Responses whose first byte arrived in the same read as the previous response)
+    """
+
+    tag = "coalesced_response_count"
+    header = "Coalesced Response Count"
+    short_header = "Coalesced"
+    short_header_hide_unit = True
+    unit = GenericMetricUnit.COUNT
+    flags = (
+        MetricFlags.STREAMING_ONLY | MetricFlags.NO_CONSOLE | MetricFlags.EXPERIMENTAL
+    )
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the coalesced response count captured by the HTTP client."""
+        if record.request.coalesced_response_count is None:
+            raise NoMetricValue(
+                "The HTTP client did not timestamp the socket reads of the response."
+            )
+
+        return record.request.coalesced_response_count
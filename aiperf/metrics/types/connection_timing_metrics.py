@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.common.enums import GenericMetricUnit, MetricFlags, MetricTimeUnit
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import ConnectionTiming, ParsedResponseRecord
+from aiperf.metrics import BaseRecordMetric
+from aiperf.metrics.base_aggregate_counter_metric import BaseAggregateCounterMetric
+from aiperf.metrics.base_derived_metric import BaseDerivedMetric
+from aiperf.metrics.metric_dicts import MetricRecordDict, MetricResultsDict
+from aiperf.metrics.types.request_count_metric import RequestCountMetric
+
+
+def _connection_timing(record: ParsedResponseRecord) -> ConnectionTiming:
+    if record.request.connection_timing is None:
+        raise NoMetricValue("The HTTP client did not capture the connection timing.")
+    return record.request.connection_timing
+
+
+class ConnectLatencyMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating Connect Latency metrics from records.
+
+    This is the time it took from the start of the request until a connection was ready to send it over.
+    For a reused keep-alive connection, this is only the time spent acquiring it from the pool. For a new
+    connection, it also includes the DNS resolution, the TCP handshake and the TLS handshake, which would
+    otherwise be hidden in the TTFT.
+
+    Formula:
+        Connect Latency = Connection Ready Timestamp - Request Start Timestamp
+    """
+
+    tag = "connect_latency"
+    header = "Connect Latency"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the connection ready timestamp, and calculates the connect latency."""
+        ready_ns = _connection_timing(record).connection_ready_perf_ns
+        if ready_ns is None:
+            raise NoMetricValue(
+                "Connect latency metric requires a connection ready time"
+            )
+        if ready_ns < record.start_perf_ns:
+            raise ValueError("connection_ready_perf_ns is less than start_perf_ns")
+
+        return ready_ns - record.start_perf_ns
+
+
+class RequestSendDurationMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating Request Send Duration metrics from records.
+
+    This is the time it took to write the request headers and body to the connection once it was ready.
+
+    Formula:
+        Request Send Duration = Request Sent Timestamp - Connection Ready Timestamp
+    """
+
+    tag = "request_send_duration"
+    header = "Request Send Duration"
+    short_header = "Send Duration"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the connection ready and request sent timestamps, and calculates the send duration."""
+        timing = _connection_timing(record)
+        if (
+            timing.connection_ready_perf_ns is None
+            or timing.request_sent_perf_ns is None
+        ):
+            raise NoMetricValue(
+                "Request send duration metric requires a connection ready and request sent time"
+            )
+        if timing.request_sent_perf_ns < timing.connection_ready_perf_ns:
+            raise ValueError(
+                "request_sent_perf_ns is less than connection_ready_perf_ns"
+            )
+
+        return timing.request_sent_perf_ns - timing.connection_ready_perf_ns
+
+
+class ServerWaitTimeMetric(BaseRecordMetric[int]):
+    """
+    Post-processor for calculating Server Wait Time metrics from records.
+
+    This is the time the client waited for the response headers after the request was fully sent, which
+    excludes all of the connection setup from the time spent by the server before it started responding.
+
+    Formula:
+        Server Wait Time = Response Headers Received Timestamp - Request Sent Timestamp
+    """
+
+    tag = "server_wait_time"
+    header = "Server Wait Time"
+    short_header = "Server Wait"
+    unit = MetricTimeUnit.NANOSECONDS
+    display_unit = MetricTimeUnit.MILLISECONDS
+    flags = MetricFlags.NO_CONSOLE
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """This method extracts the request sent and headers received timestamps, and calculates the wait time."""
+        timing = _connection_timing(record)
+        if (
+            timing.request_sent_perf_ns is None
+            or timing.headers_received_perf_ns is None
+        ):
+            raise NoMetricValue(
+                "Server wait time metric requires a request sent and headers received time"
+            )
+        if timing.headers_received_perf_ns < timing.request_sent_perf_ns:
+            raise ValueError(
+                "headers_received_perf_ns is less than request_sent_perf_ns"
+            )
+
+        return timing.headers_received_perf_ns - timing.request_sent_perf_ns
+
+
+class ReusedConnectionCountMetric(BaseAggregateCounterMetric[int]):
+    """
+    This is the total number of valid requests that were sent over an already open keep-alive connection.
+
+    Formula:
+        ```
+        Reused Connection Count = Sum(Requests Sent Over A Reused Connection)
+        ```
+    """
+
+    tag = "reused_connection_count"
+    header = "Reused Connection Count"
+    short_header = "Reused Connections"
+    short_header_hide_unit = True
+    unit = GenericMetricUnit.REQUESTS
+    flags = MetricFlags.NO_CONSOLE | MetricFlags.NO_INDIVIDUAL_RECORDS
+    required_metrics = None
+
+    def _parse_record(
+        self,
+        record: ParsedResponseRecord,
+        record_metrics: MetricRecordDict,
+    ) -> int:
+        """Returns 1 if the request was sent over a reused connection; otherwise 0."""
+        return 1 if _connection_timing(record).reused else 0
+
+
+class ConnectionReuseRatioMetric(BaseDerivedMetric[float]):
+    """
+    Postprocessor for calculating the Connection Reuse Ratio metric. This is the fraction of the valid requests
+    that did not have to open a new connection.
+
+    Formula:
+        Connection Reuse Ratio = Reused Connection Count / Request Count
+    """
+
+    tag = "connection_reuse_ratio"
+    header = "Connection Reuse Ratio"
+    short_header = "Reuse Ratio"
+    short_header_hide_unit = True
+    unit = GenericMetricUnit.RATIO
+    flags = MetricFlags.NO_CONSOLE | MetricFlags.LARGER_IS_BETTER
+    required_metrics = {ReusedConnectionCountMetric.tag, RequestCountMetric.tag}
+
+    def _derive_value(self, metric_results: MetricResultsDict) -> float:
+        # NOTE: A reused connection count of 0 is a valid value, so get_or_raise can not be used
+        tag = ReusedConnectionCountMetric.tag
+        if tag not in metric_results:
+            raise NoMetricValue(f"Metric '{tag}' is not available for the run.")
+        request_count = metric_results.get_or_raise(RequestCountMetric)
+        return metric_results[tag] / request_count  # type: ignore
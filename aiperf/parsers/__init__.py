@@ -10,6 +10,7 @@ __ignore__ = ["logger", "main"]
 ########################################################################
 from aiperf.parsers.inference_result_parser import (
     InferenceResultParser,
+    parse_record_from_usage,
 )
 from aiperf.parsers.openai_parsers import (
     ChatCompletionChunkParser,
@@ -20,6 +21,7 @@ from aiperf.parsers.openai_parsers import (
     RankingsParser,
     ResponseParser,
     TextCompletionParser,
+    parse_raw_text,
 )
 
 __all__ = [
@@ -32,4 +34,6 @@ __all__ = [
     "RankingsParser",
     "ResponseParser",
     "TextCompletionParser",
+    "parse_raw_text",
+    "parse_record_from_usage",
 ]
@@ -2,9 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
 import time
+from typing import Any
 
+import orjson
+
+from aiperf.clients.http.timing_only import has_content
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
 from aiperf.common.config import ServiceConfig, UserConfig
+from aiperf.common.constants import DEFAULT_INPUT_TOKEN_COUNT_CACHE_SIZE
 from aiperf.common.enums import CommAddress
 from aiperf.common.factories import ResponseExtractorFactory
 from aiperf.common.hooks import on_init
@@ -15,9 +20,14 @@ from aiperf.common.messages import (
 )
 from aiperf.common.mixins import CommunicationMixin
 from aiperf.common.models import (
+    BaseResponseData,
     ErrorDetails,
+    InferenceServerResponse,
+    ParsedResponse,
     ParsedResponseRecord,
     RequestRecord,
+    SSEMessage,
+    TextResponse,
 )
 from aiperf.common.models.dataset_models import Turn
 from aiperf.common.models.record_models import ReasoningResponseData
@@ -44,6 +54,8 @@ class InferenceResultParser(CommunicationMixin):
             )
         )
         self.tokenizers: dict[str, Tokenizer] = {}
+        # The input token counts of the turns that were already counted, by model, conversation ID and turn index
+        self.input_token_counts: dict[tuple[str | None, str, int], int] = {}
         self.user_config: UserConfig = user_config
         self.tokenizer_lock: asyncio.Lock = asyncio.Lock()
         self.model_endpoint: ModelEndpointInfo = ModelEndpointInfo.from_user_config(
@@ -183,6 +195,9 @@ class InferenceResultParser(CommunicationMixin):
                 output_token_count=None,
             )
 
+        if self.model_endpoint.endpoint.timing_only:
+            return await self.process_timing_only_record(request_record)
+
         resp = await self.extractor.extract_response_data(request_record)
         input_token_count = await self.compute_input_token_count(request_record)
 
@@ -213,6 +228,38 @@ class InferenceResultParser(CommunicationMixin):
             reasoning_token_count=reasoning_token_count,
         )
 
+    async def process_timing_only_record(
+        self, request_record: RequestRecord
+    ) -> ParsedResponseRecord:
+        """Process a valid record of timing-only mode, whose responses only carry their timestamps.
+
+        The token counts come from the usage reported by the server in the final response, if any.
+        Without it, the input token count falls back to tokenizing the input. The final message of a
+        stream is the only one which may have no content, such as a usage-only message, in which case
+        its timestamp is left out of the responses, the same as in normal mode.
+        """
+        final_response = request_record.responses[-1]
+        input_token_count, output_token_count, reasoning_token_count = (
+            _get_usage_token_counts(_get_usage(final_response))
+        )
+        if input_token_count is None:
+            input_token_count = await self.compute_input_token_count(request_record)
+
+        responses = request_record.responses
+        if isinstance(final_response, SSEMessage) and not has_content(final_response):
+            responses = responses[:-1]
+
+        return ParsedResponseRecord(
+            request=request_record,
+            responses=[
+                ParsedResponse(perf_ns=response.perf_ns, data=BaseResponseData())
+                for response in responses
+            ],
+            input_token_count=input_token_count,
+            output_token_count=output_token_count,
+            reasoning_token_count=reasoning_token_count,
+        )
+
     async def get_turn(self, request_record: RequestRecord) -> Turn | None:
         """Get the turn for a given request record."""
         if request_record.turn is not None:
@@ -230,6 +277,7 @@ class InferenceResultParser(CommunicationMixin):
                     service_id=self.id,
                     conversation_id=request_record.conversation_id,
                     turn_index=request_record.turn_index,
+                    texts_only=True,
                 )
             )
         )
@@ -242,13 +290,97 @@ class InferenceResultParser(CommunicationMixin):
     async def compute_input_token_count(
         self, request_record: RequestRecord
     ) -> int | None:
-        """Compute the number of tokens in the input for a given request record."""
-        turn = await self.get_turn(request_record)
-        if turn is None:
-            return None
+        """Compute the number of tokens in the input for a given request record.
+
+        The texts are taken from the record. The count is cached by the conversation ID and turn index,
+        as the same turn is often sent many times over a benchmark.
+        """
+        key = None
+        if (
+            request_record.conversation_id is not None
+            and request_record.turn_index is not None
+        ):
+            key = (
+                request_record.model_name,
+                request_record.conversation_id,
+                request_record.turn_index,
+            )
+            if (input_token_count := self.input_token_counts.get(key)) is not None:
+                return input_token_count
+
+        input_texts = request_record.input_texts
+        if input_texts is None:
+            turn = await self.get_turn(request_record)
+            if turn is None:
+                return None
+            input_texts = ["".join(text.contents) for text in turn.texts]
 
         tokenizer = await self.get_tokenizer(request_record.model_name)
         input_token_count = 0
-        for text in turn.texts:
-            input_token_count += len(tokenizer.encode("".join(text.contents)))
+        for text in input_texts:
+            input_token_count += len(tokenizer.encode(text))
+
+        if key is not None:
+            if len(self.input_token_counts) >= DEFAULT_INPUT_TOKEN_COUNT_CACHE_SIZE:
+                # Evict the oldest entry
+                del self.input_token_counts[next(iter(self.input_token_counts))]
+            self.input_token_counts[key] = input_token_count
         return input_token_count
+
+
+def parse_record_from_usage(
+    request_record: RequestRecord, responses: list[ParsedResponse]
+) -> ParsedResponseRecord | None:
+    """Parse a valid record with the token counts from the usage reported by the server, instead of
+    tokenizing its input and output. This allows the record to be parsed without a tokenizer, such as
+    within the worker that sent it.
+
+    Returns None if the server did not report both the prompt and completion tokens in one of the
+    final two responses (the usage chunk of a stream is followed by the [DONE] message).
+    """
+    for response in reversed(request_record.responses[-2:]):
+        input_token_count, output_token_count, reasoning_token_count = (
+            _get_usage_token_counts(_get_usage(response))
+        )
+        if input_token_count is not None and output_token_count is not None:
+            return ParsedResponseRecord(
+                request=request_record,
+                responses=responses,
+                input_token_count=input_token_count,
+                output_token_count=output_token_count,
+                reasoning_token_count=reasoning_token_count,
+            )
+    return None
+
+
+def _get_usage_token_counts(
+    usage: dict[str, Any],
+) -> tuple[int | None, int | None, int | None]:
+    """Get the input, output and reasoning token counts of the usage reported by the server."""
+    # The completion tokens include the reasoning tokens, which are counted separately
+    output_token_count = usage.get("completion_tokens")
+    reasoning_token_count = (usage.get("completion_tokens_details") or {}).get(
+        "reasoning_tokens"
+    )
+    if output_token_count is not None and reasoning_token_count:
+        output_token_count -= reasoning_token_count
+    return usage.get("prompt_tokens"), output_token_count, reasoning_token_count
+
+
+def _get_usage(response: InferenceServerResponse) -> dict[str, Any]:
+    """Get the usage reported by the server in a response, or an empty dict if there is none."""
+    match response:
+        case TextResponse():
+            text = response.text
+        case SSEMessage():
+            text = response.extract_data_content()
+        case _:
+            return {}
+    if not text:
+        return {}
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return {}
+    usage = data.get("usage") if isinstance(data, dict) else None
+    return usage if isinstance(usage, dict) else {}
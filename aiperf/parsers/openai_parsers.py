@@ -6,6 +6,7 @@ from typing import Any
 import orjson
 
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
+from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.enums import EndpointType, OpenAIObjectType
 from aiperf.common.factories import (
     FactoryCreationError,
@@ -28,6 +29,8 @@ from aiperf.common.models import (
 from aiperf.common.protocols import OpenAIObjectParserProtocol
 from aiperf.common.utils import load_json_str
 
+_logger = AIPerfLogger(__name__)
+
 
 @ResponseExtractorFactory.register_all(
     EndpointType.CHAT,
@@ -82,44 +85,56 @@ class OpenAIResponseExtractor(AIPerfLoggerMixin):
         Returns:
             ParsedResponse | None: The parsed response, or None if the response is not a valid or supported OpenAI object.
         """
-        if raw_text in ("", None, "[DONE]"):
-            return None
+        return parse_raw_text(raw_text)
 
-        try:
-            json_str = load_json_str(raw_text)
-        except orjson.JSONDecodeError as e:
-            self.warning(f"Invalid JSON: {raw_text} - {e!r}")
-            return None
 
-        if "object" in json_str:
-            try:
-                object_type = OpenAIObjectType(json_str["object"])
-            except ValueError:
-                self.warning(
-                    f"Unsupported OpenAI object type received: {json_str['object']}"
-                )
-                return None
-        else:
-            object_type = self._infer_object_type(json_str)
-            if object_type is None:
-                return None
+def parse_raw_text(raw_text: str) -> BaseResponseData | None:
+    """Parse the raw text of a response using the appropriate parser from OpenAIObjectParserFactory.
+    This is also the check of whether a response has any content, for the timing-only mode.
+
+    Returns:
+        BaseResponseData | None: The parsed data, or None if the response has no content, or is not a valid
+        or supported OpenAI object.
+    """
+    if raw_text in ("", None, "[DONE]"):
+        return None
 
+    try:
+        json_str = load_json_str(raw_text)
+    except orjson.JSONDecodeError as e:
+        _logger.warning(f"Invalid JSON: {raw_text} - {e!r}")
+        return None
+
+    if "object" in json_str:
         try:
-            parser = OpenAIObjectParserFactory.get_or_create_instance(object_type)
-            return parser.parse(json_str)
-        except FactoryCreationError:
-            self.warning(f"No parser found for object type: {object_type!r}")
+            object_type = OpenAIObjectType(json_str["object"])
+        except ValueError:
+            _logger.warning(
+                f"Unsupported OpenAI object type received: {json_str['object']}"
+            )
+            return None
+    else:
+        object_type = _infer_object_type(json_str)
+        if object_type is None:
             return None
 
-    def _infer_object_type(self, json_obj: dict[str, Any]) -> OpenAIObjectType | None:
-        """Infer the object type from the JSON structure for responses without explicit 'object' field."""
-        if "rankings" in json_obj:
-            return OpenAIObjectType.RANKINGS
-
-        self.warning(f"Could not infer object type from response: {json_obj}")
+    try:
+        parser = OpenAIObjectParserFactory.get_or_create_instance(object_type)
+        return parser.parse(json_str)
+    except FactoryCreationError:
+        _logger.warning(f"No parser found for object type: {object_type!r}")
         return None
 
 
+def _infer_object_type(json_obj: dict[str, Any]) -> OpenAIObjectType | None:
+    """Infer the object type from the JSON structure for responses without explicit 'object' field."""
+    if "rankings" in json_obj:
+        return OpenAIObjectType.RANKINGS
+
+    _logger.warning(f"Could not infer object type from response: {json_obj}")
+    return None
+
+
 def _parse_chat_common(sub_obj: dict[str, Any]) -> BaseResponseData | None:
     """Parse the common ChatCompletion and ChatCompletionChunk objects into a ResponseData object."""
     content = sub_obj.get("content")
@@ -140,7 +155,7 @@ class ChatCompletionParser(OpenAIObjectParserProtocol):
 
     def parse(self, obj: dict[str, Any]) -> BaseResponseData | None:
         """Parse a ChatCompletion into a ResponseData object."""
-        return _parse_chat_common(obj.get("choices", [{}])[0].get("message", {}))
+        return _parse_chat_common((obj.get("choices") or [{}])[0].get("message", {}))
 
 
 @OpenAIObjectParserFactory.register(OpenAIObjectType.CHAT_COMPLETION_CHUNK)
@@ -149,7 +164,7 @@ class ChatCompletionChunkParser(OpenAIObjectParserProtocol):
 
     def parse(self, obj: dict[str, Any]) -> BaseResponseData | None:
         """Parse a ChatCompletionChunk into a ResponseData object."""
-        return _parse_chat_common(obj.get("choices", [{}])[0].get("delta", {}))
+        return _parse_chat_common((obj.get("choices") or [{}])[0].get("delta", {}))
 
 
 @OpenAIObjectParserFactory.register(OpenAIObjectType.COMPLETION)
@@ -158,7 +173,7 @@ class CompletionParser(OpenAIObjectParserProtocol):
 
     def parse(self, obj: dict[str, Any]) -> BaseResponseData | None:
         """Parse a Completion object."""
-        return _make_text_response_data(obj.get("choices", [{}])[0].get("text"))
+        return _make_text_response_data((obj.get("choices") or [{}])[0].get("text"))
 
 
 @OpenAIObjectParserFactory.register(OpenAIObjectType.LIST)
@@ -204,7 +219,7 @@ class TextCompletionParser(OpenAIObjectParserProtocol):
 
     def parse(self, obj: dict[str, Any]) -> BaseResponseData | None:
         """Parse a TextCompletion object."""
-        return _make_text_response_data(obj.get("choices", [{}])[0].get("text"))
+        return _make_text_response_data((obj.get("choices") or [{}])[0].get("text"))
 
 
 def _make_text_response_data(text: str | None) -> TextResponseData | None:
@@ -11,6 +11,9 @@ __ignore__ = ["logger"]
 from aiperf.post_processors.base_metrics_processor import (
     BaseMetricsProcessor,
 )
+from aiperf.post_processors.endpoint_breakdown_results_processor import (
+    EndpointBreakdownResultsProcessor,
+)
 from aiperf.post_processors.metric_record_processor import (
     MetricRecordProcessor,
 )
@@ -23,6 +26,7 @@ from aiperf.post_processors.record_export_results_processor import (
 
 __all__ = [
     "BaseMetricsProcessor",
+    "EndpointBreakdownResultsProcessor",
     "MetricRecordProcessor",
     "MetricResultsProcessor",
     "RecordExportResultsProcessor",
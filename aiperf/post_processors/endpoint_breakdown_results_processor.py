@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from dataclasses import dataclass, field
+
+import aiofiles
+
+from aiperf.common.config import ServiceConfig, UserConfig
+from aiperf.common.config.config_defaults import OutputDefaults
+from aiperf.common.constants import NANOS_PER_SECOND
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import ResultsProcessorType
+from aiperf.common.exceptions import PostProcessorDisabled
+from aiperf.common.factories import ResultsProcessorFactory
+from aiperf.common.hooks import on_stop
+from aiperf.common.messages.inference_messages import MetricRecordsData
+from aiperf.common.models import (
+    EndpointBreakdown,
+    EndpointBreakdownExportData,
+    MetricResult,
+)
+from aiperf.common.protocols import ResultsProcessorProtocol
+from aiperf.metrics.base_metric import BaseMetric
+from aiperf.metrics.metric_dicts import MetricArray
+from aiperf.metrics.types.inter_token_latency_metric import InterTokenLatencyMetric
+from aiperf.metrics.types.request_latency_metric import RequestLatencyMetric
+from aiperf.metrics.types.ttft_metric import TTFTMetric
+from aiperf.post_processors.base_metrics_processor import BaseMetricsProcessor
+
+
+@dataclass
+class _EndpointStats:
+    """The running totals of the requests sent to a single endpoint URL."""
+
+    request_count: int = 0
+    error_request_count: int = 0
+    first_start_ns: int | None = None
+    last_end_ns: int | None = None
+    metrics: dict[str, MetricArray] = field(default_factory=dict)
+
+
+@implements_protocol(ResultsProcessorProtocol)
+@ResultsProcessorFactory.register(ResultsProcessorType.ENDPOINT_BREAKDOWN)
+class EndpointBreakdownResultsProcessor(BaseMetricsProcessor):
+    """Breaks down the latency and throughput of the requests by endpoint URL, when the requests are
+    load balanced across multiple URLs, to show the skew across the replicas of the server.
+
+    The breakdown is exported to a separate JSON file, as it is not part of the overall metrics.
+    """
+
+    breakdown_metrics: tuple[type[BaseMetric], ...] = (
+        RequestLatencyMetric,
+        TTFTMetric,
+        InterTokenLatencyMetric,
+    )
+
+    def __init__(
+        self,
+        service_id: str,
+        service_config: ServiceConfig,
+        user_config: UserConfig,
+        **kwargs,
+    ):
+        super().__init__(user_config=user_config, **kwargs)
+        urls = user_config.endpoint.urls
+        if len(urls) <= 1:
+            raise PostProcessorDisabled(
+                "Endpoint breakdown results processor is disabled for a single URL"
+            )
+
+        self.output_file = (
+            user_config.output.artifact_directory
+            / OutputDefaults.PROFILE_EXPORT_AIPERF_ENDPOINTS_JSON_FILE
+        )
+        self._endpoints: dict[str, _EndpointStats] = {
+            url: _EndpointStats() for url in urls
+        }
+
+    async def process_result(self, record_data: MetricRecordsData) -> None:
+        """Add the record to the totals of the endpoint it was sent to."""
+        metadata = record_data.metadata
+        stats = self._endpoints.get(metadata.endpoint_url)  # type: ignore[arg-type]
+        if stats is None:
+            return
+
+        if (
+            stats.first_start_ns is None
+            or metadata.request_start_ns < stats.first_start_ns
+        ):
+            stats.first_start_ns = metadata.request_start_ns
+        if stats.last_end_ns is None or metadata.request_end_ns > stats.last_end_ns:
+            stats.last_end_ns = metadata.request_end_ns
+
+        if not record_data.valid:
+            stats.error_request_count += 1
+            return
+
+        stats.request_count += 1
+        for metric in self.breakdown_metrics:
+            value = record_data.metrics.get(metric.tag)
+            if value is None:
+                continue
+            if metric.tag not in stats.metrics:
+                stats.metrics[metric.tag] = MetricArray()
+            stats.metrics[metric.tag].append(value)  # type: ignore[arg-type]
+
+    async def summarize(self) -> list[MetricResult]:
+        """Summarize the results. The breakdown is exported separately, so nothing is returned."""
+        return []
+
+    def get_breakdown(self) -> EndpointBreakdownExportData:
+        """Get the per-endpoint breakdown of the results, with the metrics in display units."""
+        breakdown = EndpointBreakdownExportData(
+            load_balancing=self.user_config.endpoint.load_balancing
+        )
+        for url, stats in self._endpoints.items():
+            endpoint = EndpointBreakdown(
+                url=url,
+                request_count=stats.request_count,
+                error_request_count=stats.error_request_count,
+            )
+            if (
+                stats.first_start_ns is not None
+                and stats.last_end_ns is not None
+                and stats.last_end_ns > stats.first_start_ns
+            ):
+                endpoint.request_throughput = stats.request_count / (
+                    (stats.last_end_ns - stats.first_start_ns) / NANOS_PER_SECOND
+                )
+            for metric in self.breakdown_metrics:
+                if metric.tag not in stats.metrics:
+                    continue
+                result = stats.metrics[metric.tag].to_result(
+                    metric.tag, metric.header, str(metric.unit)
+                )
+                endpoint.metrics[metric.tag] = result.to_display_unit().to_json_result()
+            breakdown.endpoints.append(endpoint)
+        return breakdown
+
+    @on_stop
+    async def _export_breakdown(self) -> None:
+        """Log the breakdown and export it to the JSON file."""
+        breakdown = self.get_breakdown()
+        for endpoint in breakdown.endpoints:
+            latency = endpoint.metrics.get(RequestLatencyMetric.tag)
+            self.info(
+                f"Endpoint {endpoint.url}: {endpoint.request_count:,} requests, "
+                f"{endpoint.error_request_count:,} errors, "
+                f"{endpoint.request_throughput or 0:,.2f} requests/sec, "
+                f"avg request latency {latency.avg if latency else 0:,.2f} ms"
+            )
+
+        try:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(self.output_file, "w") as f:
+                await f.write(breakdown.model_dump_json(indent=2))
+            self.info(f"Endpoint breakdown exported to {self.output_file}")
+        except Exception as e:
+            self.error(f"Failed to export the endpoint breakdown: {e!r}")
@@ -18,6 +18,7 @@ from aiperf.records.phase_completion import (
 )
 from aiperf.records.record_processor_service import (
     RecordProcessor,
+    create_record_processors,
 )
 from aiperf.records.records_manager import (
     RecordsManager,
@@ -32,4 +33,5 @@ __all__ = [
     "PhaseCompletionContext",
     "RecordProcessor",
     "RecordsManager",
+    "create_record_processors",
 ]
@@ -3,6 +3,7 @@
 import asyncio
 
 from aiperf.clients.model_endpoint_info import ModelEndpointInfo
+from aiperf.common.aiperf_logger import AIPerfLogger
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.constants import DEFAULT_PULL_CLIENT_MAX_CONCURRENCY
@@ -31,10 +32,32 @@ from aiperf.common.protocols import (
     RequestClientProtocol,
 )
 from aiperf.common.tokenizer import Tokenizer
-from aiperf.common.utils import compute_time_ns
 from aiperf.metrics.metric_dicts import MetricRecordDict
 from aiperf.parsers.inference_result_parser import InferenceResultParser
 
+_logger = AIPerfLogger(__name__)
+
+
+def create_record_processors(
+    service_config: ServiceConfig, user_config: UserConfig
+) -> list[RecordProcessorProtocol]:
+    """Create an instance of each type of record processor, skipping those that are disabled for the given config."""
+    processors: list[RecordProcessorProtocol] = []
+    for processor_type in RecordProcessorFactory.get_all_class_types():
+        try:
+            processors.append(
+                RecordProcessorFactory.create_instance(
+                    processor_type,
+                    service_config=service_config,
+                    user_config=user_config,
+                )
+            )
+        except PostProcessorDisabled:
+            _logger.debug(
+                f"Record processor {processor_type} is disabled and will not be used"
+            )
+    return processors
+
 
 @ServiceFactory.register(ServiceType.RECORD_PROCESSOR)
 class RecordProcessor(PullClientMixin, BaseComponentService):
@@ -76,25 +99,12 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
             user_config=user_config,
         )
 
-        self.records_processors: list[RecordProcessorProtocol] = []
-        for processor_type in RecordProcessorFactory.get_all_class_types():
-            try:
-                processor: RecordProcessorProtocol = (
-                    RecordProcessorFactory.create_instance(
-                        processor_type,
-                        service_config=self.service_config,
-                        user_config=self.user_config,
-                    )
-                )
-                self.records_processors.append(processor)
-                self.attach_child_lifecycle(processor)
-                self.debug(
-                    f"Created record processor: {processor_type}: {processor.__class__.__name__}"
-                )
-            except PostProcessorDisabled:
-                self.debug(
-                    f"Record processor {processor_type} is disabled and will not be used"
-                )
+        self.records_processors = create_record_processors(
+            service_config=self.service_config, user_config=self.user_config
+        )
+        for processor in self.records_processors:
+            self.attach_child_lifecycle(processor)
+            self.debug(f"Created record processor: {processor.__class__.__name__}")
 
     @on_command(CommandType.PROFILE_CONFIGURE)
     async def _profile_configure_command(
@@ -114,43 +124,6 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
                 )
             return self.tokenizers[model]
 
-    def _create_metric_record_metadata(
-        self, record: ParsedResponseRecord, worker_id: str
-    ) -> MetricRecordMetadata:
-        """Create a metric record metadata based on a parsed response record."""
-
-        start_time_ns = record.timestamp_ns
-        start_perf_ns = record.start_perf_ns
-
-        # Convert all timestamps from perf_ns to time_ns for the user
-        request_end_ns = compute_time_ns(
-            start_time_ns,
-            start_perf_ns,
-            record.responses[-1].perf_ns if record.responses else record.end_perf_ns,
-        )
-        request_ack_ns = compute_time_ns(
-            start_time_ns, start_perf_ns, record.recv_start_perf_ns
-        )
-        cancellation_time_ns = compute_time_ns(
-            start_time_ns, start_perf_ns, record.cancellation_perf_ns
-        )
-
-        return MetricRecordMetadata(
-            request_start_ns=start_time_ns,
-            request_ack_ns=request_ack_ns,
-            request_end_ns=request_end_ns,
-            conversation_id=record.conversation_id,
-            turn_index=record.turn_index,
-            record_processor_id=self.service_id,
-            benchmark_phase=record.credit_phase,
-            x_request_id=record.x_request_id,
-            x_correlation_id=record.x_correlation_id,
-            session_num=record.credit_num,
-            worker_id=worker_id,
-            was_cancelled=record.was_cancelled,
-            cancellation_time_ns=cancellation_time_ns,
-        )
-
     @on_pull_message(MessageType.INFERENCE_RESULTS)
     async def _on_inference_results(self, message: InferenceResultsMessage) -> None:
         """Handle an inference results message."""
@@ -168,8 +141,10 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
         await self.records_push_client.push(
             MetricRecordsMessage(
                 service_id=self.service_id,
-                metadata=self._create_metric_record_metadata(
-                    message.record, message.service_id
+                metadata=MetricRecordMetadata.from_request_record(
+                    message.record,
+                    worker_id=message.service_id,
+                    record_processor_id=self.service_id,
                 ),
                 results=results,
                 error=message.record.error,
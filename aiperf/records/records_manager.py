@@ -10,6 +10,7 @@ from aiperf.common.constants import (
     DEFAULT_PULL_CLIENT_MAX_CONCURRENCY,
     DEFAULT_REALTIME_METRICS_INTERVAL,
     DEFAULT_RECORDS_PROGRESS_REPORT_INTERVAL,
+    NANOS_PER_MILLIS,
     NANOS_PER_SECOND,
 )
 from aiperf.common.decorators import implements_protocol
@@ -37,14 +38,17 @@ from aiperf.common.messages import (
     ProfileCancelCommand,
     RealtimeMetricsMessage,
     RecordsProcessingStatsMessage,
+    WorkerStatusSummaryMessage,
 )
 from aiperf.common.messages.command_messages import RealtimeMetricsCommand
 from aiperf.common.messages.credit_messages import CreditPhaseSendingCompleteMessage
 from aiperf.common.messages.inference_messages import MetricRecordsData
 from aiperf.common.mixins import PullClientMixin
 from aiperf.common.models import (
+    CreditRoutingSummary,
     ErrorDetails,
     ErrorDetailsCount,
+    EventLoopLag,
     ProcessingStats,
     ProcessRecordsResult,
     ProfileResults,
@@ -102,6 +106,14 @@ class RecordsManager(PullClientMixin, BaseComponentService):
 
         self._previous_realtime_records: int | None = None
 
+        # Track the event loop lag of the workers during the profiling phase, to detect client-side saturation
+        self.client_lag_threshold_ns = int(
+            self.user_config.loadgen.client_lag_threshold * NANOS_PER_MILLIS
+        )
+        self.client_event_loop_lag: EventLoopLag | None = None
+        self.client_saturated: bool = False
+        self.credit_routing: CreditRoutingSummary | None = None
+
         self._results_processors: list[ResultsProcessorProtocol] = []
         for results_processor_type in ResultsProcessorFactory.get_all_class_types():
             try:
@@ -310,6 +322,7 @@ class RecordsManager(PullClientMixin, BaseComponentService):
                 self.final_request_count = message.completed
             self.end_time_ns = message.end_ns
             self.timeout_triggered = message.timeout_triggered
+            self.credit_routing = message.credit_routing
 
             self.notice(
                 f"All requests have completed, please wait for the results to be processed "
@@ -319,6 +332,35 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         # all records before we have the final request count set.
         await self._check_if_all_records_received()
 
+    @on_message(MessageType.WORKER_STATUS_SUMMARY)
+    async def _on_worker_status_summary(
+        self, message: WorkerStatusSummaryMessage
+    ) -> None:
+        """Track the event loop lag of the workers during the profiling phase, and warn when the
+        client is saturated, as the measured latencies would then include client-side delays."""
+        if self.start_time_ns is None or self.end_time_ns is not None:
+            return
+
+        for worker_id, worker_stats in message.worker_stats.items():
+            lag = worker_stats.health.event_loop_lag if worker_stats.health else None
+            if lag is None:
+                continue
+
+            if (
+                self.client_event_loop_lag is None
+                or lag.p99_ns > self.client_event_loop_lag.p99_ns
+            ):
+                self.client_event_loop_lag = lag
+
+            if lag.p99_ns > self.client_lag_threshold_ns and not self.client_saturated:
+                self.client_saturated = True
+                self.warning(
+                    f"Client-side saturation detected: the p99 event loop lag of {worker_id} is "
+                    f"{lag.p99_ns / NANOS_PER_MILLIS:,.1f} ms, above the threshold of "
+                    f"{self.user_config.loadgen.client_lag_threshold:,.1f} ms. The measured latencies include "
+                    "client-side delays. Consider using more workers, or a lower load."
+                )
+
     @background_task(interval=DEFAULT_RECORDS_PROGRESS_REPORT_INTERVAL, immediate=False)
     async def _report_records_task(self) -> None:
         """Report the records processing stats."""
@@ -434,6 +476,18 @@ class RecordsManager(PullClientMixin, BaseComponentService):
             elif isinstance(result, BaseException):
                 error_results.append(ErrorDetails.from_exception(result))
 
+        if (
+            self.client_saturated
+            and self.user_config.loadgen.invalidate_on_client_saturation
+        ):
+            error_results.append(
+                ErrorDetails(
+                    type="ClientSaturationError",
+                    message="The results are invalid, as the client was saturated during the profiling phase "
+                    f"(p99 event loop lag above {self.user_config.loadgen.client_lag_threshold:,.1f} ms)",
+                )
+            )
+
         result = ProcessRecordsResult(
             results=ProfileResults(
                 records=records_results,
@@ -442,6 +496,9 @@ class RecordsManager(PullClientMixin, BaseComponentService):
                 end_ns=self.end_time_ns or time.time_ns(),
                 error_summary=await self.get_error_summary(),
                 was_cancelled=cancelled,
+                client_event_loop_lag=self.client_event_loop_lag,
+                client_saturated=self.client_saturated,
+                credit_routing=self.credit_routing,
             ),
             errors=error_results,
         )
@@ -20,6 +20,13 @@ from aiperf.timing.credit_manager import (
     CreditPhaseMessagesMixin,
     CreditPhaseMessagesRequirements,
 )
+from aiperf.timing.credit_router import (
+    CreditRouter,
+    WorkerCreditLoad,
+)
+from aiperf.timing.fixed_schedule import (
+    FixedSchedule,
+)
 from aiperf.timing.fixed_schedule_strategy import (
     FixedScheduleStrategy,
 )
@@ -44,10 +51,13 @@ __all__ = [
     "CreditManagerProtocol",
     "CreditPhaseMessagesMixin",
     "CreditPhaseMessagesRequirements",
+    "CreditRouter",
+    "FixedSchedule",
     "FixedScheduleStrategy",
     "PoissonRateGenerator",
     "RequestCancellationStrategy",
     "RequestRateStrategy",
     "TimingManager",
     "TimingManagerConfig",
+    "WorkerCreditLoad",
 ]
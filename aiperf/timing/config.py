@@ -6,7 +6,7 @@ from aiperf.common.config import (
     LoadGeneratorDefaults,
     UserConfig,
 )
-from aiperf.common.enums import RequestRateMode, TimingMode
+from aiperf.common.enums import CreditRoutingMode, RequestRateMode, TimingMode
 from aiperf.common.models import AIPerfBaseModel
 
 
@@ -27,6 +27,10 @@ class TimingManagerConfig(AIPerfBaseModel):
     fixed_schedule_end_offset: int | None = InputDefaults.FIXED_SCHEDULE_END_OFFSET
     request_cancellation_rate: float = LoadGeneratorDefaults.REQUEST_CANCELLATION_RATE
     request_cancellation_delay: float = LoadGeneratorDefaults.REQUEST_CANCELLATION_DELAY
+    credit_routing_mode: CreditRoutingMode = LoadGeneratorDefaults.CREDIT_ROUTING_MODE
+    session_affinity_load_factor: float = (
+        LoadGeneratorDefaults.SESSION_AFFINITY_LOAD_FACTOR
+    )
 
     @classmethod
     def from_user_config(cls, user_config: UserConfig) -> "TimingManagerConfig":
@@ -47,4 +51,6 @@ class TimingManagerConfig(AIPerfBaseModel):
             fixed_schedule_end_offset=user_config.input.fixed_schedule_end_offset,
             request_cancellation_rate=user_config.loadgen.request_cancellation_rate,
             request_cancellation_delay=user_config.loadgen.request_cancellation_delay,
+            credit_routing_mode=user_config.loadgen.credit_routing_mode,
+            session_affinity_load_factor=user_config.loadgen.session_affinity_load_factor,
         )
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import bisect
+import hashlib
+import math
+
+from aiperf.common.config import LoadGeneratorDefaults
+from aiperf.common.constants import DEFAULT_CREDIT_ROUTER_VIRTUAL_NODES
+from aiperf.common.enums import CreditRoutingMode
+from aiperf.common.mixins import AIPerfLoggerMixin
+from aiperf.common.models import CreditRoutingSummary
+
+
+def _hash_key(key: str) -> int:
+    """A stable 64-bit hash of a key, which is the same across processes and runs."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class WorkerCreditLoad:
+    """The credit capacity and current load of a single worker."""
+
+    __slots__ = ("worker_id", "capacity", "in_flight")
+
+    def __init__(self, worker_id: str, capacity: int) -> None:
+        self.worker_id = worker_id
+        self.capacity = capacity
+        self.in_flight = 0
+
+    @property
+    def load(self) -> float:
+        """The fraction of the worker's capacity that is in use."""
+        return self.in_flight / self.capacity
+
+    @property
+    def free_capacity(self) -> int:
+        """The number of credits the worker can still receive before it is at capacity."""
+        return max(self.capacity - self.in_flight, 0)
+
+
+class CreditRouter(AIPerfLoggerMixin):
+    """Keeps track of the credit capacity and load of each worker, in order to choose which worker
+    receives each credit.
+
+    Workers advertise their capacity when they start, and the load is tracked from the credits
+    that are routed to each worker, and the credits that each worker returns. Credits are only
+    routed to workers with free capacity. When every worker is at capacity, the caller waits for
+    `capacity_available` before selecting a worker, which applies backpressure to the credit
+    issuing instead of overloading the workers.
+
+    In session affinity mode, conversations are mapped to workers using a consistent hash ring,
+    so that all credits of a conversation are routed to the same worker, and only a small
+    fraction of conversations move when workers are added or removed. To prevent a hot
+    conversation from overloading a single worker, credits overflow to the next worker on the
+    ring whenever the worker's load exceeds `load_factor` times the average load (consistent
+    hashing with bounded loads).
+    """
+
+    def __init__(
+        self,
+        mode: CreditRoutingMode = CreditRoutingMode.LEAST_LOADED,
+        load_factor: float = LoadGeneratorDefaults.SESSION_AFFINITY_LOAD_FACTOR,
+        virtual_nodes: int = DEFAULT_CREDIT_ROUTER_VIRTUAL_NODES,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.load_factor = load_factor
+        self.virtual_nodes = virtual_nodes
+        self._workers: dict[str, WorkerCreditLoad] = {}
+        self.capacity_available = asyncio.Event()
+
+        # The consistent hash ring, stored as two parallel lists sorted by hash
+        self._ring_hashes: list[int] = []
+        self._ring_worker_ids: list[str] = []
+
+        # Stats for the load balance report. These are kept for removed workers as well.
+        self.routed_counts: dict[str, int] = {}
+        self.max_queue_depths: dict[str, int] = {}
+        self.affinity_overflows = 0
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def update_capacity(self, worker_id: str, capacity: int) -> None:
+        """Update the capacity of a worker. A capacity of 0 removes the worker."""
+        if capacity <= 0:
+            self.remove_worker(worker_id)
+            return
+
+        if worker_id in self._workers:
+            self._workers[worker_id].capacity = capacity
+        else:
+            self.debug(
+                lambda: f"Worker {worker_id} registered with capacity {capacity}"
+            )
+            self._workers[worker_id] = WorkerCreditLoad(worker_id, capacity)
+            self._rebuild_ring()
+        self._update_capacity_available()
+
+    def remove_worker(self, worker_id: str) -> None:
+        """Stop routing credits to a worker."""
+        if self._workers.pop(worker_id, None) is not None:
+            self.debug(lambda: f"Worker {worker_id} removed from credit routing")
+            self._rebuild_ring()
+        self._update_capacity_available()
+
+    def _update_capacity_available(self) -> None:
+        if any(worker.free_capacity for worker in self._workers.values()):
+            self.capacity_available.set()
+        else:
+            self.capacity_available.clear()
+
+    def _rebuild_ring(self) -> None:
+        ring = sorted(
+            (_hash_key(f"{worker_id}#{i}"), worker_id)
+            for worker_id in self._workers
+            for i in range(self.virtual_nodes)
+        )
+        self._ring_hashes = [node_hash for node_hash, _ in ring]
+        self._ring_worker_ids = [worker_id for _, worker_id in ring]
+
+    def select_worker(self, conversation_id: str | None = None) -> str | None:
+        """Select the worker for a credit, and count the credit against it. Returns None if every
+        worker is at capacity, in which case the caller should wait for `capacity_available`.
+
+        Raises:
+            ValueError: If no workers are available.
+        """
+        if not self._workers:
+            raise ValueError("No workers are available to route credits to")
+
+        worker = None
+        if self.mode == CreditRoutingMode.SESSION_AFFINITY and conversation_id:
+            worker = self._select_affinity_worker(conversation_id)
+        if worker is None:
+            worker = min(
+                (worker for worker in self._workers.values() if worker.free_capacity),
+                key=lambda worker: worker.load,
+                default=None,
+            )
+            if worker is None:
+                self.capacity_available.clear()
+                return None
+
+        worker.in_flight += 1
+        if not worker.free_capacity:
+            self._update_capacity_available()
+        self.routed_counts[worker.worker_id] = (
+            self.routed_counts.get(worker.worker_id, 0) + 1
+        )
+        if worker.in_flight > self.max_queue_depths.get(worker.worker_id, 0):
+            self.max_queue_depths[worker.worker_id] = worker.in_flight
+        return worker.worker_id
+
+    def _select_affinity_worker(self, conversation_id: str) -> WorkerCreditLoad | None:
+        """Walk the hash ring from the conversation's position, and select the first worker whose
+        load would stay within the bound. Returns None if every worker is over the bound.
+
+        The bound of each worker is its share of the total capacity, times the load factor, of the
+        credits in flight (including the new one), rounded up so that an idle worker always fits.
+        """
+        total_in_flight = sum(worker.in_flight for worker in self._workers.values())
+        total_capacity = sum(worker.capacity for worker in self._workers.values())
+        max_load = self.load_factor * (total_in_flight + 1) / total_capacity
+
+        start = bisect.bisect(self._ring_hashes, _hash_key(conversation_id))
+        num_nodes = len(self._ring_hashes)
+        visited: set[str] = set()
+        for offset in range(num_nodes):
+            worker_id = self._ring_worker_ids[(start + offset) % num_nodes]
+            if worker_id in visited:
+                continue
+            worker = self._workers[worker_id]
+            if worker.free_capacity and worker.in_flight + 1 <= math.ceil(
+                max_load * worker.capacity
+            ):
+                if visited:
+                    self.affinity_overflows += 1
+                return worker
+            visited.add(worker_id)
+            if len(visited) == len(self._workers):
+                break
+
+        self.affinity_overflows += 1
+        return None
+
+    def credit_returned(self, worker_id: str) -> None:
+        """Record that a worker has returned a credit."""
+        worker = self._workers.get(worker_id)
+        if worker is not None and worker.in_flight > 0:
+            worker.in_flight -= 1
+            if worker.free_capacity:
+                self.capacity_available.set()
+
+    def queue_depths(self) -> dict[str, int]:
+        """The number of credits in flight for each worker."""
+        return {
+            worker_id: worker.in_flight for worker_id, worker in self._workers.items()
+        }
+
+    def routing_summary(self) -> CreditRoutingSummary:
+        """How the credits were spread across the workers, for the results export."""
+        return CreditRoutingSummary(
+            mode=self.mode,
+            routed_counts=dict(self.routed_counts),
+            max_queue_depths=dict(self.max_queue_depths),
+            affinity_overflows=self.affinity_overflows,
+        )
+
+    def load_balance_summary(self) -> str:
+        """A human readable summary of how evenly the credits were spread across the workers."""
+        if not self.routed_counts:
+            return "No credits were routed"
+
+        routing_summary = self.routing_summary()
+        counts = routing_summary.routed_counts.values()
+        mean = routing_summary.total / len(counts)
+        summary = (
+            f"{routing_summary.total:,} credits routed to {len(counts)} workers "
+            f"({self.mode}): min {min(counts):,}, mean {mean:,.1f}, max {max(counts):,} "
+            f"per worker (max/mean {routing_summary.imbalance:.2f}), "
+            f"max queue depth {max(routing_summary.max_queue_depths.values()):,}"
+        )
+        if self.mode == CreditRoutingMode.SESSION_AFFINITY:
+            summary += (
+                f", {self.affinity_overflows:,} credits overflowed to another worker"
+            )
+        return summary
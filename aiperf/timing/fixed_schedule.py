@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterator
+
+import numpy as np
+
+
+class FixedSchedule:
+    """A compact, timestamp sorted fixed schedule.
+
+    The schedule is stored as two parallel numpy arrays: the timestamps of each entry in
+    milliseconds (int64), and the index of the conversation for each entry (int32) into a
+    lookup table of conversation IDs. This avoids creating a python object per entry, which
+    is important for traces with tens of millions of entries.
+    """
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        conversation_indices: np.ndarray,
+        conversation_ids: list[str],
+    ) -> None:
+        if len(timestamps) != len(conversation_indices):
+            raise ValueError(
+                f"Timestamps and conversation indices must be the same length: "
+                f"{len(timestamps)} != {len(conversation_indices)}"
+            )
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.conversation_indices = np.asarray(conversation_indices, dtype=np.int32)
+        self.conversation_ids = conversation_ids
+
+    @classmethod
+    def from_entries(cls, entries: list[tuple[int, str]]) -> "FixedSchedule":
+        """Create a fixed schedule from a list of (timestamp, conversation_id) tuples.
+        The entries do not need to be sorted."""
+        id_lookup: dict[str, int] = {}
+        timestamps = np.empty(len(entries), dtype=np.int64)
+        conversation_indices = np.empty(len(entries), dtype=np.int32)
+        for i, (timestamp, conversation_id) in enumerate(entries):
+            timestamps[i] = timestamp
+            conversation_indices[i] = id_lookup.setdefault(
+                conversation_id, len(id_lookup)
+            )
+
+        order = np.argsort(timestamps, kind="stable")
+        return cls(timestamps[order], conversation_indices[order], list(id_lookup))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def first_timestamp(self) -> int:
+        """The earliest timestamp in the schedule in milliseconds."""
+        return int(self.timestamps[0])
+
+    def conversation_id(self, index: int) -> str:
+        """Get the conversation ID of the schedule entry at the given index."""
+        return self.conversation_ids[self.conversation_indices[index]]
+
+    def iter_timestamp_groups(self) -> Iterator[tuple[int, int, int]]:
+        """Iterate over the schedule one timestamp at a time, without building any intermediate
+        collections. Yields tuples of (timestamp, start_index, end_index), where the entries in the
+        range [start_index, end_index) all share the same timestamp."""
+        start = 0
+        num_entries = len(self.timestamps)
+        while start < num_entries:
+            timestamp = self.timestamps[start]
+            end = int(np.searchsorted(self.timestamps, timestamp, side="right"))
+            yield int(timestamp), start, end
+            start = end
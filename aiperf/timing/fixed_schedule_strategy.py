@@ -3,7 +3,6 @@
 
 import asyncio
 import time
-from collections import defaultdict
 
 from aiperf.common.constants import MILLIS_PER_SECOND
 from aiperf.common.enums import CreditPhase, TimingMode
@@ -14,6 +13,7 @@ from aiperf.timing.credit_issuing_strategy import (
     CreditIssuingStrategyFactory,
 )
 from aiperf.timing.credit_manager import CreditManagerProtocol
+from aiperf.timing.fixed_schedule import FixedSchedule
 
 
 @CreditIssuingStrategyFactory.register(TimingMode.FIXED_SCHEDULE)
@@ -26,36 +26,32 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
         self,
         config: TimingManagerConfig,
         credit_manager: CreditManagerProtocol,
-        schedule: list[tuple[int, str]],
+        schedule: FixedSchedule | list[tuple[int, str]],
     ):
         # NOTE: This all needs to be set before the super call, because the base class will call
         # _setup_profiling_phase_config() which uses it to set the total expected requests.
-        self._schedule: list[tuple[int, str]] = schedule
+        if not isinstance(schedule, FixedSchedule):
+            schedule = FixedSchedule.from_entries(schedule)
+        self._schedule: FixedSchedule = schedule
         self._num_requests = len(self._schedule)
         self._auto_offset_timestamps = config.auto_offset_timestamps
         self._start_offset = config.fixed_schedule_start_offset
         self._end_offset = config.fixed_schedule_end_offset
         super().__init__(config=config, credit_manager=credit_manager)
 
-    def _create_timestamp_groups(self) -> None:
+    def _validate_schedule(self) -> None:
         """
-        Create a dictionary of timestamp groups, and filter the schedule to only include the requested subset.
+        Validate the schedule, and define the zero reference point for the schedule.
+        The schedule is already sorted by timestamp, so no grouping or sorting is needed here.
         """
-        if not self._schedule or self._num_requests == 0:
+        if self._num_requests == 0:
             raise ValueError(
                 "No schedule loaded, unable to setup fixed schedule strategy"
             )
-        # Group the schedule by timestamp
-        self._timestamp_groups = defaultdict(list)
-        for timestamp, conversation_id in self._schedule:
-            self._timestamp_groups[timestamp].append(conversation_id)
-
-        # Sort the timestamps, so we can drop credits in order
-        self._sorted_timestamp_keys = sorted(self._timestamp_groups.keys())
 
         # Define the zero reference point for the schedule
         if self._auto_offset_timestamps:
-            self._schedule_zero_ms = self._sorted_timestamp_keys[0]
+            self._schedule_zero_ms = self._schedule.first_timestamp
         elif self._start_offset is not None:
             self._schedule_zero_ms = self._start_offset
         else:
@@ -67,7 +63,7 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
 
         Overrides the base implementation to set the total expected requests based on the number of requests in the schedule.
         """
-        self._create_timestamp_groups()
+        self._validate_schedule()
 
         self.ordered_phase_configs.append(
             CreditPhaseConfig(
@@ -83,11 +79,8 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
         # This is used as a reference point for the wait duration calculation
         start_time_ms = self._perf_counter_ms()
 
-        # Drop credits in order of the schedule
-        for timestamp in self._sorted_timestamp_keys:
-            # Lookup/cache the conversation IDs now, so that way they are ready to go
-            conversation_ids = self._timestamp_groups[timestamp]
-
+        # Drop credits in order of the schedule, walking the sorted schedule one timestamp at a time
+        for timestamp, start, end in self._schedule.iter_timestamp_groups():
             # Calculate the wait duration for this timestamp
             # (timestamp - schedule_zero_ms) is the offset of the conversation(s) from the start of the schedule
             # (self._perf_counter_ms() - start_time_ms) is how much time has passed since we started dropping credits
@@ -100,14 +93,14 @@ class FixedScheduleStrategy(CreditIssuingStrategy):
                 await asyncio.sleep(wait_duration_sec)
 
             # Drop credits asynchronously for all conversations at this timestamp
-            for conversation_id in conversation_ids:
+            for index in range(start, end):
                 should_cancel = self.cancellation_strategy.should_cancel_request()
                 cancel_after_ns = self.cancellation_strategy.get_cancellation_delay_ns()
 
                 await self.credit_manager.drop_credit(
                     credit_phase=CreditPhase.PROFILING,
                     credit_num=phase_stats.sent,
-                    conversation_id=conversation_id,
+                    conversation_id=self._schedule.conversation_id(index),
                     # We already waited, so it can be sent ASAP
                     credit_drop_ns=None,
                     should_cancel=should_cancel,
@@ -1,9 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 
+import numpy as np
 
 from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
+from aiperf.common.constants import (
+    DEFAULT_COMM_STATS_INTERVAL,
+    DEFAULT_DATASET_TIMING_CHUNK_SIZE,
+    DEFAULT_DATASET_TIMING_CHUNKS_IN_FLIGHT,
+)
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import (
     CommAddress,
@@ -12,17 +19,24 @@ from aiperf.common.enums import (
     MessageType,
     ServiceType,
 )
-from aiperf.common.exceptions import InvalidStateError
+from aiperf.common.exceptions import CommunicationError, InvalidStateError
 from aiperf.common.factories import ServiceFactory
 from aiperf.common.hooks import (
+    background_task,
     on_command,
+    on_init,
     on_pull_message,
     on_stop,
 )
 from aiperf.common.messages import (
     CommandAcknowledgedResponse,
     CommandMessage,
+    CommChannelStatsMessage,
+    CommStatsMessage,
+    CreditCapacityMessage,
     CreditDropMessage,
+    CreditPhaseCompleteMessage,
+    CreditPhaseProgressMessage,
     CreditReturnMessage,
     DatasetTimingRequest,
     DatasetTimingResponse,
@@ -30,8 +44,10 @@ from aiperf.common.messages import (
     ProfileConfigureCommand,
 )
 from aiperf.common.mixins import PullClientMixin
+from aiperf.common.models import CommChannelStats, CommClientStats
 from aiperf.common.protocols import (
-    PushClientProtocol,
+    DispatchClientProtocol,
+    PullClientProtocol,
     RequestClientProtocol,
     ServiceProtocol,
 )
@@ -44,14 +60,23 @@ from aiperf.timing.credit_issuing_strategy import (
     CreditIssuingStrategyFactory,
 )
 from aiperf.timing.credit_manager import CreditPhaseMessagesMixin
+from aiperf.timing.credit_router import CreditRouter
+from aiperf.timing.fixed_schedule import FixedSchedule
 
 
 @implements_protocol(ServiceProtocol)
 @ServiceFactory.register(ServiceType.TIMING_MANAGER)
-class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMixin):
+class TimingManager(
+    PullClientMixin,
+    BaseComponentService,
+    CreditPhaseMessagesMixin,
+):
     """
     The TimingManager service is responsible to generate the schedule and issuing
     timing credits for requests.
+
+    It also receives the message counters that every service pushes, and publishes the
+    counters of each channel, to track the backlog of the pipeline.
     """
 
     def __init__(
@@ -75,15 +100,46 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
                 CommAddress.DATASET_MANAGER_PROXY_FRONTEND,
             )
         )
-        self.credit_drop_push_client: PushClientProtocol = (
-            self.comms.create_push_client(
+        self.credit_dispatch_client: DispatchClientProtocol = (
+            self.comms.create_dispatch_client(
                 CommAddress.CREDIT_DROP,
                 bind=True,
             )
         )
+        self.comm_stats_pull_client: PullClientProtocol = self.comms.create_pull_client(
+            CommAddress.COMM_STATS,
+            bind=True,
+        )
+        # The latest message counters of each service, and whether any were received since they were last published
+        self._comm_client_stats: dict[str, list[CommClientStats]] = {}
+        self._comm_client_stats_updated = False
+        self.credit_router = CreditRouter(
+            mode=self.config.credit_routing_mode,
+            load_factor=self.config.session_affinity_load_factor,
+        )
 
         self._credit_issuing_strategy: CreditIssuingStrategy | None = None
 
+        self.max_pipeline_backlog = self.service_config.max_pipeline_backlog
+        self.pipeline_backlog_clear = asyncio.Event()
+        self.pipeline_backlog_clear.set()
+
+    @on_init
+    async def _register_credit_capacity_callback(self) -> None:
+        self.credit_dispatch_client.register_receive_callback(
+            MessageType.CREDIT_CAPACITY, self._on_credit_capacity
+        )
+        self.comm_stats_pull_client.register_pull_callback(
+            MessageType.COMM_STATS, self._on_comm_stats
+        )
+
+    async def _on_credit_capacity(self, message: CreditCapacityMessage) -> None:
+        """Handle a worker advertising its credit capacity."""
+        self.debug(
+            lambda: f"Worker {message.service_id} advertised capacity {message.capacity}"
+        )
+        self.credit_router.update_capacity(message.service_id, message.capacity)
+
     @on_command(CommandType.PROFILE_CONFIGURE)
     async def _profile_configure_command(
         self, message: ProfileConfigureCommand
@@ -92,24 +148,15 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
         self.debug(f"Configuring credit issuing strategy for {self.service_id}")
 
         if self.config.timing_mode == TimingMode.FIXED_SCHEDULE:
-            # This will block until the dataset is ready and the timing response is received
-            dataset_timing_response: DatasetTimingResponse = (
-                await self.dataset_request_client.request(
-                    message=DatasetTimingRequest(
-                        service_id=self.service_id,
-                    ),
-                )
-            )
-            self.debug(
-                lambda: f"Received dataset timing response: {dataset_timing_response}"
-            )
+            # This will block until the dataset is ready and the timing responses are received
+            schedule = await self._request_fixed_schedule()
             self.info("Using fixed schedule strategy")
             self._credit_issuing_strategy = (
                 CreditIssuingStrategyFactory.create_instance(
                     TimingMode.FIXED_SCHEDULE,
                     config=self.config,
                     credit_manager=self,
-                    schedule=dataset_timing_response.timing_data,
+                    schedule=schedule,
                 )
             )
         else:
@@ -128,6 +175,56 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
             lambda: f"Timing manager configured with credit issuing strategy: {self._credit_issuing_strategy}"
         )
 
+    async def _request_fixed_schedule(self) -> FixedSchedule:
+        """Request the fixed schedule from the dataset manager in chunks, and copy each chunk into
+        pre-allocated numpy arrays. This avoids ever building the entire schedule as a single
+        message, or as python objects. The first chunk reports the size of the schedule, and the
+        remaining chunks are then requested several at a time, to avoid a round trip per chunk."""
+
+        def timing_request(offset: int) -> DatasetTimingRequest:
+            return DatasetTimingRequest(
+                service_id=self.service_id,
+                offset=offset,
+                limit=DEFAULT_DATASET_TIMING_CHUNK_SIZE,
+            )
+
+        first: DatasetTimingResponse = await self.dataset_request_client.request(
+            message=timing_request(0)
+        )
+        total_entries = first.total_entries
+        timestamps = np.empty(total_entries, dtype=np.int64)
+        conversation_indices = np.empty(total_entries, dtype=np.int32)
+        conversation_ids: list[str] = []
+
+        def copy_chunk(response: DatasetTimingResponse) -> None:
+            start = response.offset
+            end = start + len(response.timestamps)
+            timestamps[start:end] = response.timestamps
+            conversation_indices[start:end] = response.conversation_indices
+            conversation_ids.extend(response.conversation_ids)
+
+        copy_chunk(first)
+        offsets = range(
+            DEFAULT_DATASET_TIMING_CHUNK_SIZE,
+            max(total_entries, first.total_conversations),
+            DEFAULT_DATASET_TIMING_CHUNK_SIZE,
+        )
+        for i in range(0, len(offsets), DEFAULT_DATASET_TIMING_CHUNKS_IN_FLIGHT):
+            window = offsets[i : i + DEFAULT_DATASET_TIMING_CHUNKS_IN_FLIGHT]
+            # The responses are returned in the order of the requests, which keeps the conversation IDs in order
+            for response in await self.dataset_request_client.request_many(
+                [timing_request(offset) for offset in window]
+            ):
+                copy_chunk(response)
+            received = min(
+                window[-1] + DEFAULT_DATASET_TIMING_CHUNK_SIZE, total_entries
+            )
+            self.debug(
+                lambda received=received: f"Received {received:,} of {total_entries:,} fixed schedule entries"
+            )
+
+        return FixedSchedule(timestamps, conversation_indices, conversation_ids)
+
     @on_command(CommandType.PROFILE_START)
     async def _on_start_profiling(self, message: CommandMessage) -> None:
         """Start the timing manager and issue credit drops according to the configured strategy."""
@@ -169,6 +266,7 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
         """Handle the credit return message."""
         if self.is_debug_enabled:
             self.debug(f"Timing manager received credit return message: {message}")
+        self.credit_router.credit_returned(message.service_id)
         if self._credit_issuing_strategy:
             await self._credit_issuing_strategy._on_credit_return(message)
 
@@ -182,18 +280,126 @@ class TimingManager(PullClientMixin, BaseComponentService, CreditPhaseMessagesMi
         should_cancel: bool = False,
         cancel_after_ns: int = 0,
     ) -> None:
-        """Drop a credit."""
+        """Drop a credit. This returns once the credit has been sent to a worker, so that the credit
+        issuing strategy waits while the pipeline backlog exceeds the max, or every worker is at
+        capacity, before it issues and counts the next credit, and the credits are sent in order."""
+        await self.pipeline_backlog_clear.wait()
+        await self._dispatch_credit(
+            CreditDropMessage(
+                service_id=self.service_id,
+                phase=credit_phase,
+                credit_num=credit_num,
+                credit_drop_ns=credit_drop_ns,
+                conversation_id=conversation_id,
+                should_cancel=should_cancel,
+                cancel_after_ns=cancel_after_ns,
+            )
+        )
+
+    async def _on_comm_stats(self, message: CommStatsMessage) -> None:
+        """Keep the latest message counters of a service."""
+        self._comm_client_stats[message.service_id] = message.client_stats
+        self._comm_client_stats_updated = True
+
+    @background_task(interval=DEFAULT_COMM_STATS_INTERVAL, immediate=False)
+    async def _publish_comm_channel_stats(self) -> None:
+        """Sum the message counters of the services by channel, and publish them if any service has
+        pushed its counters since the last time."""
+        if not self._comm_client_stats_updated:
+            return
+        self._comm_client_stats_updated = False
+        channel_stats = CommChannelStats.group_by_channel(
+            client
+            for client_stats in self._comm_client_stats.values()
+            for client in client_stats
+        )
+        self._update_pipeline_backlog(channel_stats)
+        await self.publish(
+            CommChannelStatsMessage(
+                service_id=self.service_id, channel_stats=channel_stats
+            )
+        )
+
+    def _update_pipeline_backlog(
+        self, channel_stats: dict[str, CommChannelStats]
+    ) -> None:
+        """Pause issuing credits while the backlog of the channels downstream of the workers
+        exceeds the max pipeline backlog, and resume once it drains back below it."""
+        if self.max_pipeline_backlog is None:
+            return
+        backlog = sum(
+            stats.backlog
+            for channel, stats in channel_stats.items()
+            if channel not in (CommAddress.CREDIT_RETURN, CommAddress.COMM_STATS)
+        )
+        if backlog > self.max_pipeline_backlog:
+            if self.pipeline_backlog_clear.is_set():
+                self.warning(
+                    f"Pausing credits, as the pipeline backlog of {backlog:,} messages exceeds "
+                    f"the max of {self.max_pipeline_backlog:,}"
+                )
+                self.pipeline_backlog_clear.clear()
+        elif not self.pipeline_backlog_clear.is_set():
+            self.info(
+                f"Resuming credits, as the pipeline backlog drained to {backlog:,} messages"
+            )
+            self.pipeline_backlog_clear.set()
+
+    async def _dispatch_credit(self, message: CreditDropMessage) -> None:
+        """Send a credit to the least loaded worker, waiting until a worker has free capacity. If the
+        worker is no longer connected, it is removed from the credit router, and the credit is sent
+        to the next least loaded worker."""
+        while not self.stop_requested:
+            await self.credit_router.capacity_available.wait()
+            worker_id = self.credit_router.select_worker(message.conversation_id)
+            if worker_id is None:
+                continue
+            try:
+                await self.credit_dispatch_client.send_to(worker_id, message)
+                return
+            except CommunicationError as e:
+                self.warning(f"Unable to send credit to worker {worker_id}: {e}")
+                self.credit_router.remove_worker(worker_id)
+
+    async def publish_credits_complete(self) -> None:
+        """Publish the credits complete message, and report how the credits were balanced across the workers."""
+        self.info(f"Credit routing: {self.credit_router.load_balance_summary()}")
+        await super().publish_credits_complete()
+
+    async def publish_phase_complete(
+        self,
+        phase: CreditPhase,
+        completed: int,
+        end_ns: int,
+        timeout_triggered: bool = False,
+    ) -> None:
+        """Publish the phase complete message, including how the credits were spread across the workers."""
         self.execute_async(
-            self.credit_drop_push_client.push(
-                message=CreditDropMessage(
+            self.publish(
+                CreditPhaseCompleteMessage(
                     service_id=self.service_id,
-                    phase=credit_phase,
-                    credit_num=credit_num,
-                    credit_drop_ns=credit_drop_ns,
-                    conversation_id=conversation_id,
-                    should_cancel=should_cancel,
-                    cancel_after_ns=cancel_after_ns,
-                ),
+                    phase=phase,
+                    completed=completed,
+                    end_ns=end_ns,
+                    timeout_triggered=timeout_triggered,
+                    credit_routing=self.credit_router.routing_summary(),
+                )
+            )
+        )
+
+    async def publish_progress(
+        self, phase: CreditPhase, sent: int, completed: int
+    ) -> None:
+        """Publish the progress message, including the credit queue depth of each worker."""
+        self.execute_async(
+            self.publish(
+                CreditPhaseProgressMessage(
+                    service_id=self.service_id,
+                    phase=phase,
+                    sent=sent,
+                    completed=completed,
+                    worker_queue_depths=self.credit_router.queue_depths(),
+                )
             )
         )
 
@@ -2,21 +2,27 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from aiperf.common.mixins import (
+    CommStatsTrackerMixin,
     ProgressTrackerMixin,
     RealtimeMetricsMixin,
     WorkerTrackerMixin,
 )
 
 
-class BaseAIPerfUI(ProgressTrackerMixin, WorkerTrackerMixin, RealtimeMetricsMixin):
+class BaseAIPerfUI(
+    ProgressTrackerMixin,
+    WorkerTrackerMixin,
+    RealtimeMetricsMixin,
+    CommStatsTrackerMixin,
+):
     """Base class for AIPerf UI implementations.
 
     This class provides a simple starting point for a UI for AIPerf components.
-    It inherits from the :class:`ProgressTrackerMixin`, :class:`WorkerTrackerMixin`, and :class:`RealtimeMetricsMixin`
-    to provide a simple starting point for a UI for AIPerf components.
+    It inherits from the :class:`ProgressTrackerMixin`, :class:`WorkerTrackerMixin`, :class:`RealtimeMetricsMixin`,
+    and :class:`CommStatsTrackerMixin` to provide a simple starting point for a UI for AIPerf components.
 
-    Now, you can use the various hooks defined in the :class:`ProgressTrackerMixin`, :class:`WorkerTrackerMixin`, and :class:`RealtimeMetricsMixin`
-    to create a UI for AIPerf components.
+    Now, you can use the various hooks defined in the :class:`ProgressTrackerMixin`, :class:`WorkerTrackerMixin`,
+    :class:`RealtimeMetricsMixin`, and :class:`CommStatsTrackerMixin` to create a UI for AIPerf components.
 
     Example:
     ```python
@@ -44,5 +50,10 @@ class BaseAIPerfUI(ProgressTrackerMixin, WorkerTrackerMixin, RealtimeMetricsMixi
         def _on_realtime_metrics(self, metrics: list[MetricResult]):
             '''Callback for real-time metrics updates.'''
             pass
+
+        @on_comm_stats_update
+        def _on_comm_stats_update(self, channel_stats: dict[str, CommChannelStats]):
+            '''Callback for the queue depth of each push/pull channel.'''
+            pass
     ```
     """
@@ -70,6 +70,7 @@ class AIPerfDashboardUI(BaseAIPerfUI):
             AIPerfHook.ON_WORKER_STATUS_SUMMARY, self.app.on_worker_status_summary
         )
         self.attach_hook(AIPerfHook.ON_REALTIME_METRICS, self.app.on_realtime_metrics)
+        self.attach_hook(AIPerfHook.ON_COMM_STATS_UPDATE, self.app.on_comm_stats_update)
 
     @on_start
     async def _run_app(self) -> None:
@@ -14,7 +14,13 @@ from textual.widgets import Footer
 from aiperf.common.config.service_config import ServiceConfig
 from aiperf.common.constants import AIPERF_DEV_MODE
 from aiperf.common.enums import WorkerStatus
-from aiperf.common.models import MetricResult, RecordsStats, RequestsStats, WorkerStats
+from aiperf.common.models import (
+    CommChannelStats,
+    MetricResult,
+    RecordsStats,
+    RequestsStats,
+    WorkerStats,
+)
 from aiperf.controller.system_controller import SystemController
 from aiperf.ui.dashboard.aiperf_theme import AIPERF_THEME
 from aiperf.ui.dashboard.progress_dashboard import ProgressDashboard
@@ -233,3 +239,11 @@ class AIPerfTextualApp(App):
         if self.realtime_metrics_dashboard:
             async with self.realtime_metrics_dashboard.batch():
                 self.realtime_metrics_dashboard.on_realtime_metrics(metrics)
+
+    async def on_comm_stats_update(
+        self, channel_stats: dict[str, CommChannelStats]
+    ) -> None:
+        """Forward the queue depth of each push/pull channel to the Textual App."""
+        if self.progress_dashboard:
+            async with self.progress_dashboard.batch():
+                self.progress_dashboard.on_comm_stats_update(channel_stats)
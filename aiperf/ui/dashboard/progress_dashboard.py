@@ -17,8 +17,14 @@ from textual.timer import Timer
 from textual.visual import VisualType
 from textual.widgets import Static
 
+from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase
-from aiperf.common.models import RecordsStats, RequestsStats, StatsProtocol
+from aiperf.common.models import (
+    CommChannelStats,
+    RecordsStats,
+    RequestsStats,
+    StatsProtocol,
+)
 from aiperf.ui.dashboard.custom_widgets import MaximizableWidget
 from aiperf.ui.utils import format_elapsed_time, format_eta
 
@@ -74,6 +80,7 @@ class ProgressDashboard(Container, MaximizableWidget):
         self.records_stats: RecordsStats | None = None
         self.profiling_stats: RequestsStats | None = None
         self.warmup_stats: RequestsStats | None = None
+        self.channel_stats: dict[str, CommChannelStats] = {}
         self.refresh_timer: Timer | None = None
 
     def on_mount(self) -> None:
@@ -143,6 +150,14 @@ class ProgressDashboard(Container, MaximizableWidget):
         # NOTE: Send the profiling stats to the display, not the records stats
         self.update_display(CreditPhase.PROFILING, self.profiling_stats)
 
+    def on_comm_stats_update(self, channel_stats: dict[str, CommChannelStats]) -> None:
+        """Callback for the queue depth of each push/pull channel."""
+        self.channel_stats = channel_stats
+        if self.profiling_stats:
+            self.update_display(CreditPhase.PROFILING, self.profiling_stats)
+        elif self.warmup_stats:
+            self.update_display(CreditPhase.WARMUP, self.warmup_stats)
+
     def update_display(
         self, phase: CreditPhase, stats: StatsProtocol | None = None
     ) -> None:
@@ -165,6 +180,21 @@ class ProgressDashboard(Container, MaximizableWidget):
         else:
             return Text("Waiting for profile data...", style="dim")
 
+    def _get_backlog(self) -> Text:
+        """Get the messages sent but not yet processed on each channel, and how long the sends were blocked."""
+        backlog = Text()
+        for channel, stats in sorted(self.channel_stats.items()):
+            if backlog:
+                backlog.append(", ")
+            style = "green" if stats.backlog == 0 else "yellow"
+            backlog.append(f"{channel} {stats.backlog:,}", style=style)
+            if stats.send_blocked_ns >= NANOS_PER_SECOND:
+                backlog.append(
+                    f" (blocked {stats.send_blocked_ns / NANOS_PER_SECOND:,.1f}s)",
+                    style="red",
+                )
+        return backlog
+
     def create_stats_table(
         self, phase: CreditPhase, stats: StatsProtocol | None = None
     ) -> VisualType:
@@ -212,6 +242,9 @@ class ProgressDashboard(Container, MaximizableWidget):
                 f"{self.records_stats.per_second or 0:,.1f} records/s",
             )
 
+        if self.channel_stats:
+            stats_table.add_row("Backlog:", self._get_backlog())
+
         if not stats.is_complete:
             # Display request stats while profiling
             if stats.start_ns:
@@ -8,6 +8,10 @@ __ignore__ = ["main"]
 ## ⚠️        This file is auto-generated by mkinit                 ⚠️ ##
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
+from aiperf.workers.session import (
+    SessionScheduler,
+    VirtualUserSession,
+)
 from aiperf.workers.worker import (
     Worker,
 )
@@ -16,4 +20,10 @@ from aiperf.workers.worker_manager import (
     WorkerStatusInfo,
 )
 
-__all__ = ["Worker", "WorkerManager", "WorkerStatusInfo"]
+__all__ = [
+    "SessionScheduler",
+    "VirtualUserSession",
+    "Worker",
+    "WorkerManager",
+    "WorkerStatusInfo",
+]
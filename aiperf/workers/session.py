@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+
+from aiperf.common.constants import NANOS_PER_MILLIS, NANOS_PER_SECOND
+from aiperf.common.messages import CreditDropMessage
+from aiperf.common.models import Conversation, ConversationHistory, Turn
+
+
+class VirtualUserSession:
+    """The state of a single virtual user working through a conversation.
+
+    A session is created when a credit is received, and lives until the last turn of the
+    conversation has been sent. Between turns the session is parked in the
+    :class:`SessionScheduler` while the user "thinks", without holding a request slot.
+
+    NOTE: This class uses __slots__ and only holds references to data that already exists, to
+    keep the per-user cost low enough to simulate tens of thousands of users per worker.
+    """
+
+    __slots__ = ("message", "conversation", "drop_perf_ns", "turn_index", "history")
+
+    def __init__(
+        self,
+        message: CreditDropMessage,
+        conversation: Conversation,
+        drop_perf_ns: int,
+    ) -> None:
+        self.message = message
+        self.conversation = conversation
+        self.drop_perf_ns = drop_perf_ns
+        self.turn_index = 0
+        # The user turns sent so far, interleaved with the assistant responses received.
+        self.history = ConversationHistory()
+
+    @property
+    def session_id(self) -> str:
+        return self.conversation.session_id
+
+    @property
+    def current_turn(self) -> Turn:
+        return self.conversation.turns[self.turn_index]
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether all of the turns in the conversation have been sent."""
+        return self.turn_index >= len(self.conversation.turns)
+
+    @property
+    def think_time_ns(self) -> int:
+        """The amount of time to wait before sending the current turn, in nanoseconds."""
+        delay = self.current_turn.delay
+        return int(delay * NANOS_PER_MILLIS) if delay and delay > 0 else 0
+
+    def advance(self, user_turn: Turn, response_turn: Turn | None) -> None:
+        """Record the result of the current turn in the history and move to the next turn."""
+        self.history.append(user_turn)
+        if response_turn is not None:
+            self.history.append(response_turn)
+        self.turn_index += 1
+
+
+class SessionScheduler:
+    """A min-heap of sessions waiting for their think time to elapse.
+
+    Waiting sessions are plain heap entries instead of sleeping tasks, so the cost of a parked
+    session is a single tuple, and a single consumer loop can wake any number of sessions.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[int, int, VirtualUserSession]] = []
+        # Tie-breaker to keep the ordering stable and avoid comparing sessions
+        self._counter = itertools.count()
+        self._wakeup_event = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, session: VirtualUserSession, wake_perf_ns: int) -> None:
+        """Park a session until the perf counter reaches wake_perf_ns."""
+        heapq.heappush(self._heap, (wake_perf_ns, next(self._counter), session))
+        if self._heap[0][2] is session:
+            # The earliest wake time changed, so the consumer needs to recompute its sleep.
+            self._wakeup_event.set()
+
+    def pop_due(self, now_perf_ns: int) -> list[VirtualUserSession]:
+        """Remove and return all sessions whose wake time is at or before now_perf_ns."""
+        due = []
+        while self._heap and self._heap[0][0] <= now_perf_ns:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    async def wait_until_due(self) -> None:
+        """Wait until the earliest session is due, or a session with an earlier wake time is scheduled."""
+        self._wakeup_event.clear()
+        if not self._heap:
+            await self._wakeup_event.wait()
+            return
+
+        sleep_ns = self._heap[0][0] - time.perf_counter_ns()
+        if sleep_ns <= 0:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                self._wakeup_event.wait(), timeout=sleep_ns / NANOS_PER_SECOND
+            )
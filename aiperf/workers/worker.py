@@ -3,6 +3,8 @@
 
 
 import asyncio
+import math
+import random
 import time
 import uuid
 from collections.abc import Awaitable
@@ -12,6 +14,8 @@ from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.constants import (
     AIPERF_HTTP_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_PREWARM_TIMEOUT,
+    DEFAULT_WORKER_DRAIN_TIMEOUT,
     DEFAULT_WORKER_HEALTH_CHECK_INTERVAL,
     NANOS_PER_SECOND,
 )
@@ -19,46 +23,68 @@ from aiperf.common.enums import (
     CommAddress,
     CommandType,
     CreditPhase,
+    ExportLevel,
     MessageType,
     ServiceType,
 )
-from aiperf.common.exceptions import NotInitializedError
+from aiperf.common.exceptions import DatasetError, NotInitializedError
 from aiperf.common.factories import (
     InferenceClientFactory,
     RequestConverterFactory,
     ResponseExtractorFactory,
     ServiceFactory,
 )
-from aiperf.common.hooks import background_task, on_command, on_pull_message, on_stop
+from aiperf.common.hooks import (
+    background_task,
+    on_command,
+    on_init,
+    on_message,
+    on_start,
+    on_stop,
+)
 from aiperf.common.messages import (
     CommandAcknowledgedResponse,
     ConversationRequestMessage,
     ConversationResponseMessage,
+    CreditCapacityMessage,
     CreditDropMessage,
     CreditReturnMessage,
+    DatasetConfiguredNotification,
     ErrorMessage,
     InferenceResultsMessage,
+    MetricRecordsMessage,
     ProfileCancelCommand,
+    ProfileConfigureCommand,
     WorkerHealthMessage,
 )
-from aiperf.common.mixins import ProcessHealthMixin, PullClientMixin
+from aiperf.common.mixins import ProcessHealthMixin
 from aiperf.common.models import (
+    ConnectionPrewarmStats,
     Conversation,
+    ConversationHistory,
     ErrorDetails,
+    MetricRecordMetadata,
+    ParsedResponse,
     RequestRecord,
     Text,
     Turn,
     WorkerTaskStats,
 )
 from aiperf.common.protocols import (
+    DispatchTargetClientProtocol,
     PushClientProtocol,
+    RecordProcessorProtocol,
     RequestClientProtocol,
     ResponseExtractorProtocol,
 )
+from aiperf.dataset.dataset_store import DatasetStore
+from aiperf.parsers.inference_result_parser import parse_record_from_usage
+from aiperf.records.record_processor_service import create_record_processors
+from aiperf.workers.session import SessionScheduler, VirtualUserSession
 
 
 @ServiceFactory.register(ServiceType.WORKER)
-class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
+class Worker(BaseComponentService, ProcessHealthMixin):
     """Worker is primarily responsible for making API calls to the inference server.
     It also manages the conversation between turns and returns the results to the Inference Results Parsers.
     """
@@ -74,20 +100,39 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             service_config=service_config,
             user_config=user_config,
             service_id=service_id,
-            pull_client_address=CommAddress.CREDIT_DROP,
-            pull_client_bind=False,
-            # NOTE: We set the max concurrency to the same as the HTTP connection limit to ensure
-            # that the worker will not receive any more credits while the connection limit is reached.
-            pull_client_max_concurrency=AIPERF_HTTP_CONNECTION_LIMIT,
             **kwargs,
         )
 
+        # NOTE: We advertise a credit capacity equal to the max number of sessions, so that the timing
+        # manager routes credits to the least loaded worker. The number of in-flight requests is
+        # bounded separately by the request slots, as sessions do not hold a slot during think time.
+        self.credit_capacity = self.service_config.workers.max_sessions
+        self.request_slots = asyncio.Semaphore(AIPERF_HTTP_CONNECTION_LIMIT)
+        self.session_scheduler = SessionScheduler()
+
+        # The number of sessions that have not yet returned their credit. When the worker is stopped,
+        # it waits for them to drain, so that no credits are lost when workers are scaled down.
+        self.active_sessions = 0
+        self._sessions_drained = asyncio.Event()
+        self._sessions_drained.set()
+        self._profile_cancelled = False
+
+        # The credit drop latency of the requests sent since the previous health message
+        self._credit_drop_latency_sum_ns = 0
+        self._credit_drop_latency_count = 0
+
         self.debug(lambda: f"Worker process __init__ (pid: {self._process.pid})")
 
         self.health_check_interval = DEFAULT_WORKER_HEALTH_CHECK_INTERVAL
 
         self.task_stats: WorkerTaskStats = WorkerTaskStats()
 
+        self.credit_drop_client: DispatchTargetClientProtocol = (
+            self.comms.create_dispatch_target_client(
+                CommAddress.CREDIT_DROP,
+                target_id=self.service_id,
+            )
+        )
         self.credit_return_push_client: PushClientProtocol = (
             self.comms.create_push_client(
                 CommAddress.CREDIT_RETURN,
@@ -98,6 +143,9 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
                 CommAddress.RAW_INFERENCE_PROXY_FRONTEND,
             )
         )
+        self.health_push_client: PushClientProtocol = self.comms.create_push_client(
+            CommAddress.WORKER_HEALTH,
+        )
         self.conversation_request_client: RequestClientProtocol = (
             self.comms.create_request_client(
                 CommAddress.DATASET_MANAGER_PROXY_FRONTEND,
@@ -105,6 +153,29 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         )
 
         self.model_endpoint = ModelEndpointInfo.from_user_config(self.user_config)
+        # The memory-mapped dataset store of the dataset manager, if it is reachable from this host
+        self.dataset_store: DatasetStore | None = None
+        self._sequential_iteration = False
+        self._conversation_query_random = random.Random(
+            self.user_config.input.random_seed
+        )
+        # The records only carry their turn for the raw export level. Otherwise, the turn is referenced by
+        # its conversation ID and turn index, as it may contain large images or audios.
+        self.attach_turn = self.user_config.output.export_level == ExportLevel.RAW
+
+        # When the workers compute the metrics, the records are pushed straight to the records manager,
+        # and only sent to the record processors when they need to be tokenized.
+        self.records_processors: list[RecordProcessorProtocol] = []
+        self.records_push_client: PushClientProtocol | None = None
+        if self.service_config.workers.compute_metrics:
+            self.records_push_client = self.comms.create_push_client(
+                CommAddress.RECORDS,
+            )
+            self.records_processors = create_record_processors(
+                service_config=self.service_config, user_config=self.user_config
+            )
+            for processor in self.records_processors:
+                self.attach_child_lifecycle(processor)
 
         self.debug(
             lambda: f"Creating inference client for {self.model_endpoint.endpoint.type}, "
@@ -124,86 +195,184 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             )
         )
 
-    @on_pull_message(MessageType.CREDIT_DROP)
+    @on_init
+    async def _register_credit_drop_callback(self) -> None:
+        self.credit_drop_client.register_receive_callback(
+            MessageType.CREDIT_DROP, self._credit_drop_callback
+        )
+
+    @on_start
+    async def _advertise_credit_capacity(self) -> None:
+        """Advertise the credit capacity of the worker to the timing manager."""
+        await self.credit_drop_client.send(
+            CreditCapacityMessage(
+                service_id=self.service_id, capacity=self.credit_capacity
+            )
+        )
+
     async def _credit_drop_callback(self, message: CreditDropMessage) -> None:
         """Handle an incoming credit drop message from the timing manager. Every credit must be returned after processing."""
+        if self.stop_requested:
+            # The credit was routed to this worker before it withdrew its capacity
+            self.warning(
+                f"Worker is stopping, returning credit {message.request_id} without sending a request"
+            )
+            await self._return_credit(message)
+            return
 
+        self.active_sessions += 1
+        self._sessions_drained.clear()
         try:
-            # NOTE: This must be awaited to ensure that the max concurrency is respected
-            await self._process_credit_drop_internal(message)
+            session = await self._start_session(message)
         except Exception as e:
             self.error(f"Error processing credit drop: {e!r}")
-            await self.credit_return_push_client.push(
-                CreditReturnMessage(
-                    service_id=self.service_id,
-                    phase=message.phase,
-                    credit_drop_id=message.request_id,
-                )
-            )
+            await self._end_session(message)
+            return
+
+        await self._run_session(session)
 
     @on_stop
     async def _shutdown_worker(self) -> None:
         self.debug("Shutting down worker")
+        try:
+            # Stop the timing manager from routing any more credits to this worker
+            await self.credit_drop_client.send(
+                CreditCapacityMessage(service_id=self.service_id, capacity=0)
+            )
+        except Exception as e:
+            self.debug(lambda e=e: f"Unable to withdraw credit capacity: {e!r}")
+
+        if self.active_sessions and not self._profile_cancelled:
+            self.info(
+                f"Waiting for {self.active_sessions} active sessions to return their credits"
+            )
+            try:
+                await asyncio.wait_for(
+                    self._sessions_drained.wait(), timeout=DEFAULT_WORKER_DRAIN_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                self.warning(
+                    f"Timed out waiting for {self.active_sessions} active sessions to return their credits"
+                )
+
         if self.inference_client:
             await self.inference_client.close()
 
+        if self.dataset_store is not None:
+            self.dataset_store.close()
+
+    @on_message(MessageType.DATASET_CONFIGURED_NOTIFICATION)
+    async def _on_dataset_configured(
+        self, message: DatasetConfiguredNotification
+    ) -> None:
+        """Map the dataset store, to read the conversations from it instead of requesting them."""
+        if message.dataset_store_path is None:
+            return
+        try:
+            dataset_store = DatasetStore(message.dataset_store_path)
+        except (OSError, DatasetError) as e:
+            # The dataset manager may be on another host
+            self.info(
+                f"Unable to map the dataset store, requesting the conversations from the dataset manager instead: {e!r}"
+            )
+            return
+
+        if self.dataset_store is not None:
+            self.dataset_store.close()
+        self.dataset_store = dataset_store
+        self._sequential_iteration = message.sequential_iteration
+        self.debug(
+            lambda: f"Mapped the dataset store with {len(dataset_store):,} conversations"
+        )
+
     @background_task(
         immediate=False,
         interval=lambda self: self.health_check_interval,
     )
     async def _health_check_task(self) -> None:
         """Task to report the health of the worker to the worker manager."""
-        await self.publish(self.create_health_message())
+        await self.health_push_client.push(self.create_health_message())
 
     def create_health_message(self) -> WorkerHealthMessage:
+        credit_drop_latency_ns = None
+        if self._credit_drop_latency_count:
+            credit_drop_latency_ns = (
+                self._credit_drop_latency_sum_ns // self._credit_drop_latency_count
+            )
+            self._credit_drop_latency_sum_ns = 0
+            self._credit_drop_latency_count = 0
+
         return WorkerHealthMessage(
             service_id=self.service_id,
             health=self.get_process_health(),
             task_stats=self.task_stats,
+            active_sessions=self.active_sessions,
+            credit_drop_latency_ns=credit_drop_latency_ns,
         )
 
+    @on_command(CommandType.PROFILE_CONFIGURE)
+    async def _prewarm_connections(
+        self, message: ProfileConfigureCommand
+    ) -> ConnectionPrewarmStats | None:
+        """Open enough connections to cover this worker's share of the concurrency before profiling
+        starts, so that the first requests do not pay for the connection setup."""
+        num_connections = self._num_connections_to_prewarm(message.num_workers)
+        if not num_connections:
+            return None
+
+        self.debug(lambda: f"Pre-warming {num_connections} connections")
+        try:
+            records = await asyncio.wait_for(
+                self.inference_client.prewarm_connections(
+                    self.model_endpoint,
+                    num_connections,
+                    self.user_config.endpoint.connection_prewarm_path,
+                ),
+                timeout=DEFAULT_CONNECTION_PREWARM_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            self.warning(
+                f"Timed out pre-warming {num_connections} connections, profiling will open the rest"
+            )
+            return ConnectionPrewarmStats(
+                num_connections=num_connections, failed=num_connections
+            )
+        return ConnectionPrewarmStats.from_records(records)
+
+    def _num_connections_to_prewarm(self, num_workers: int | None) -> int:
+        """The number of connections needed for this worker's share of the concurrency, which is 0 if
+        pre-warming is disabled or the concurrency is unknown."""
+        concurrency = self.user_config.loadgen.concurrency
+        if not self.user_config.endpoint.connection_prewarm or not concurrency:
+            return 0
+        share = math.ceil(concurrency / max(num_workers or 1, 1))
+        return min(share, AIPERF_HTTP_CONNECTION_LIMIT)
+
     @on_command(CommandType.PROFILE_CANCEL)
     async def _handle_profile_cancel_command(
         self, message: ProfileCancelCommand
     ) -> None:
         self.debug(lambda: f"Received profile cancel command: {message}")
+        self._profile_cancelled = True
         await self.publish(
             CommandAcknowledgedResponse.from_command_message(message, self.service_id)
         )
         await self.stop()
 
-    async def _process_credit_drop_internal(self, message: CreditDropMessage) -> None:
-        """Process a credit drop message. Make sure to return the credit as soon as possible.
-
-        - Every credit must be returned after processing
-        - All results or errors should be converted to a RequestRecord and pushed to the inference results client.
-
-        NOTE: This function MUST NOT return until the credit drop is fully processed.
-        This is to ensure that the max concurrency is respected via the semaphore of the pull client.
-        The way this is enforced is by requiring that this method returns a CreditReturnMessage.
-        """
-
-        try:
-            if self.is_trace_enabled:
-                self.trace(f"Processing credit drop: {message}")
-
-            await self._execute_single_credit_internal(message)
-        finally:
-            # Need to return the credit here to ensure it is always returned
-            return_message = CreditReturnMessage(
-                service_id=self.service_id,
-                phase=message.phase,
-                credit_drop_id=message.request_id,
-                delayed_ns=None,  # TODO: set this properly (from record if available?)
-            )
-            if self.is_trace_enabled:
-                self.trace(f"Returning credit {return_message}")
-            # NOTE: Do not do this execute_async, as we want to give the credit back as soon as possible.
-            await self.credit_return_push_client.push(return_message)
-
-    async def _execute_single_credit_internal(self, message: CreditDropMessage) -> None:
-        """Run a credit task for a single credit."""
+    @background_task(immediate=True, interval=None)
+    async def _session_scheduler_task(self) -> None:
+        """Resume the sessions whose think time has elapsed. This keeps running while the worker is
+        stopping, until all of the active sessions have been drained."""
+        while not self.stop_requested or self.active_sessions:
+            await self.session_scheduler.wait_until_due()
+            for session in self.session_scheduler.pop_due(time.perf_counter_ns()):
+                self.execute_async(self._run_session(session))
+
+    async def _start_session(self, message: CreditDropMessage) -> VirtualUserSession:
+        """Create a new virtual user session for a credit, by retrieving its conversation from the dataset."""
         drop_perf_ns = time.perf_counter_ns()  # The time the credit was received
+        if self.is_trace_enabled:
+            self.trace(f"Processing credit drop: {message}")
 
         if not self.inference_client:
             raise NotInitializedError("Inference server client not initialized.")
@@ -212,25 +381,77 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             service_id=self.service_id,
             conversation_id=message.conversation_id,
             phase=message.phase,
+            credit_num=message.credit_num,
         )
+        return VirtualUserSession(message, conversation, drop_perf_ns)
 
-        turn_list = []
-        for turn_index in range(len(conversation.turns)):
-            self.task_stats.total += 1
-            turn = conversation.turns[turn_index]
-            turn_list.append(turn)
-            # TODO: how do we handle errors in the middle of a conversation?
-            record = await self._build_response_record(
-                conversation_id=conversation.session_id,
-                message=message,
-                turn=turn,
-                turn_index=turn_index,
-                drop_perf_ns=drop_perf_ns,
-            )
+    async def _run_session(self, session: VirtualUserSession) -> None:
+        """Send the turns of a session until it either finishes, or needs to wait for think time.
+
+        A request slot is only held while a turn is being sent. When the next turn has a delay, the
+        session is parked in the session scheduler, and this method returns without holding
+        any resources. The credit is returned once the last turn has been sent, on error, or on cancellation.
+        """
+        parked = False
+        try:
+            while True:
+                async with self.request_slots:
+                    await self._execute_session_turn(session)
+                if session.is_finished:
+                    break
+
+                think_time_ns = session.think_time_ns
+                if think_time_ns:
+                    self.session_scheduler.schedule(
+                        session, time.perf_counter_ns() + think_time_ns
+                    )
+                    parked = True
+                    return
+        except Exception as e:
+            self.error(f"Error processing session {session.session_id}: {e!r}")
+        finally:
+            # A parked session is resumed by the session scheduler, which returns its credit later
+            if not parked:
+                await self._end_session(session.message)
+
+    async def _end_session(self, message: CreditDropMessage) -> None:
+        """Return the credit of a session that is no longer active."""
+        try:
+            await self._return_credit(message)
+        finally:
+            self.active_sessions -= 1
+            if self.active_sessions <= 0:
+                self._sessions_drained.set()
+
+    async def _execute_session_turn(self, session: VirtualUserSession) -> None:
+        """Send the current turn of the session, and record the response in the session history."""
+        self.task_stats.total += 1
+        turn = session.current_turn
+        record = await self._build_response_record(
+            conversation_id=session.session_id,
+            message=session.message,
+            turn=turn,
+            turn_index=session.turn_index,
+            drop_perf_ns=session.drop_perf_ns,
+            history=session.history,
+        )
+        responses = await self.extractor.extract_response_data(record)
+        if not await self._send_metric_records_message(record, responses):
             await self._send_inference_result_message(record)
-            resp_turn = await self._process_response(record)
-            if resp_turn:
-                turn_list.append(resp_turn)
+        session.advance(turn, self._create_response_turn(responses))
+
+    async def _return_credit(self, message: CreditDropMessage) -> None:
+        """Return the credit for a credit drop message to the timing manager."""
+        return_message = CreditReturnMessage(
+            service_id=self.service_id,
+            phase=message.phase,
+            credit_drop_id=message.request_id,
+            delayed_ns=None,  # TODO: set this properly (from record if available?)
+        )
+        if self.is_trace_enabled:
+            self.trace(f"Returning credit {return_message}")
+        # NOTE: Do not do this execute_async, as we want to give the credit back as soon as possible.
+        await self.credit_return_push_client.push(return_message)
 
     async def _retrieve_conversation_response(
         self,
@@ -238,11 +459,25 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         service_id: str,
         conversation_id: str | None,
         phase: CreditPhase,
+        credit_num: int = 0,
     ) -> Conversation:
         """Retrieve the conversation from the dataset manager. If a conversation
         cannot be retrieved, an error message will be sent to the
         inference results client and an Exception is raised.
+
+        If the dataset store is mapped, the conversation is read from the dataset
+        store instead, either by its ID, or selected by the credit number if the
+        credit does not name a conversation.
         """
+        if self.dataset_store is not None:
+            if conversation_id is None:
+                return self.dataset_store.get_conversation(
+                    self._select_conversation_index(phase, credit_num)
+                )
+            conversation_index = self.dataset_store.index_of(conversation_id)
+            if conversation_index is not None:
+                return self.dataset_store.get_conversation(conversation_index)
+
         # retrieve the prompt from the dataset
         conversation_response: ConversationResponseMessage = (
             await self.conversation_request_client.request(
@@ -274,6 +509,25 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
 
         return conversation_response.conversation
 
+    def _select_conversation_index(self, phase: CreditPhase, credit_num: int) -> int:
+        """Select the conversation of a credit that does not name one, the same way as the dataset manager.
+
+        In sequential mode, the conversations are used in order of the dataset, with the profiling
+        credits continuing after the warmup credits. Otherwise, they are sampled at random. With a
+        random seed, each credit is seeded by its number, so that the same conversations are used
+        regardless of which worker receives each credit.
+        """
+        num_conversations = len(self.dataset_store)  # type: ignore[arg-type]
+        if phase == CreditPhase.PROFILING:
+            credit_num += self.user_config.loadgen.warmup_request_count
+        if self._sequential_iteration:
+            return credit_num % num_conversations
+        if self.user_config.input.random_seed is None:
+            return self._conversation_query_random.randrange(num_conversations)
+        return random.Random(
+            f"{self.user_config.input.random_seed}:{credit_num}"
+        ).randrange(num_conversations)
+
     async def _build_response_record(
         self,
         *,
@@ -282,10 +536,13 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         turn: Turn,
         turn_index: int,
         drop_perf_ns: int,
+        history: ConversationHistory | None = None,
     ) -> RequestRecord:
         """Build a RequestRecord from an inference API call for the given turn."""
         x_request_id = str(uuid.uuid4())
-        record = await self._call_inference_api_internal(message, turn, x_request_id)
+        record = await self._call_inference_api_internal(
+            message, turn, x_request_id, history
+        )
         record.model_name = turn.model or self.model_endpoint.primary_model_name
         record.conversation_id = conversation_id
         record.turn_index = turn_index
@@ -294,16 +551,19 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         record.x_request_id = x_request_id
         record.x_correlation_id = message.request_id
         record.credit_num = message.credit_num
+        if record.turn is None:
+            record.input_texts = ["".join(text.contents) for text in turn.texts]
         # If this is the first turn, calculate the credit drop latency
         if turn_index == 0:
             record.credit_drop_latency = record.start_perf_ns - drop_perf_ns
+            self._credit_drop_latency_sum_ns += record.credit_drop_latency
+            self._credit_drop_latency_count += 1
         return record
 
-    async def _process_response(self, record: RequestRecord) -> Turn | None:
-        """Process the response from the inference API call and convert it to a Turn object."""
-        resp = await self.extractor.extract_response_data(record)
+    def _create_response_turn(self, responses: list[ParsedResponse]) -> Turn | None:
+        """Convert the responses extracted from a record to a Turn object."""
         # TODO how do we handle reasoning responses in multi turn?
-        resp_text = "".join([r.data.get_text() for r in resp])
+        resp_text = "".join([r.data.get_text() for r in responses])
         if resp_text:
             return Turn(
                 role="assistant",
@@ -316,8 +576,10 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         message: CreditDropMessage,
         turn: Turn,
         x_request_id: str,
+        history: ConversationHistory | None = None,
     ) -> RequestRecord:
-        """Make a single call to the inference API. Will return an error record if the call fails."""
+        """Make a single call to the inference API. Will return an error record if the call fails.
+        The history contains the previous turns of the conversation, which are sent along with the turn."""
         if self.is_trace_enabled:
             self.trace(f"Calling inference API for turn: {turn}")
         formatted_payload = None
@@ -328,6 +590,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
             formatted_payload = await self.request_converter.format_payload(
                 model_endpoint=self.model_endpoint,
                 turn=turn,
+                history=history,
             )
 
             # NOTE: Current implementation of the TimingManager bypasses this, it is for future use.
@@ -371,7 +634,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
                         f"pre_send_perf_ns to start_perf_ns latency: {result.start_perf_ns - pre_send_perf_ns} ns"
                     )
                 result.delayed_ns = delayed_ns
-                result.turn = turn
+                result.turn = turn if self.attach_turn else None
                 return result
             else:
                 cancellation_perf_ns = time.perf_counter_ns()
@@ -380,7 +643,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
                     self.debug(f"Request cancelled after {delay_s:.3f}s")
 
                 return RequestRecord(
-                    turn=turn,
+                    turn=turn if self.attach_turn else None,
                     timestamp_ns=timestamp_ns,
                     start_perf_ns=pre_send_perf_ns,
                     end_perf_ns=cancellation_perf_ns,
@@ -401,7 +664,7 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
                 f"Error calling inference server API at {self.model_endpoint.url}: {e!r}"
             )
             return RequestRecord(
-                turn=turn,
+                turn=turn if self.attach_turn else None,
                 timestamp_ns=timestamp_ns or time.time_ns(),
                 # Try and use the pre_send_perf_ns if it is available, otherwise use the current time.
                 start_perf_ns=pre_send_perf_ns or time.perf_counter_ns(),
@@ -444,6 +707,41 @@ class Worker(PullClientMixin, BaseComponentService, ProcessHealthMixin):
         )
         self.execute_async(self.inference_results_push_client.push(msg))
 
+    async def _send_metric_records_message(
+        self, record: RequestRecord, responses: list[ParsedResponse]
+    ) -> bool:
+        """Compute the metrics of a record within the worker, and send them to the records manager.
+
+        Returns False if the record still has to be sent to the record processors, which is when the
+        workers do not compute the metrics, the request failed, or the server did not report the usage.
+        """
+        if not self.records_processors or not record.valid:
+            return False
+        parsed_record = parse_record_from_usage(record, responses)
+        if parsed_record is None:
+            return False
+
+        self.task_stats.task_finished(True)
+        results = []
+        for processor in self.records_processors:
+            try:
+                results.append(await processor.process_record(parsed_record))
+            except Exception as e:
+                self.warning(f"Error processing record: {e!r}")
+
+        msg = MetricRecordsMessage(
+            service_id=self.service_id,
+            metadata=MetricRecordMetadata.from_request_record(
+                record,
+                worker_id=self.service_id,
+                record_processor_id=self.service_id,
+            ),
+            results=results,
+            error=record.error,
+        )
+        self.execute_async(self.records_push_client.push(msg))  # type: ignore[union-attr]
+        return True
+
 
 def main() -> None:
     from aiperf.common.bootstrap import bootstrap_and_run_service
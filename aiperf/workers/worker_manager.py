@@ -1,5 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import math
 import multiprocessing
 import time
 
@@ -9,6 +10,11 @@ from aiperf.common.base_component_service import BaseComponentService
 from aiperf.common.bootstrap import bootstrap_and_run_service
 from aiperf.common.config import ServiceConfig, UserConfig
 from aiperf.common.constants import (
+    DEFAULT_AUTOSCALE_COOLDOWN,
+    DEFAULT_AUTOSCALE_CREDIT_DROP_LATENCY,
+    DEFAULT_AUTOSCALE_EVENT_LOOP_LAG,
+    DEFAULT_AUTOSCALE_IDLE_TIME,
+    DEFAULT_AUTOSCALE_STEP_FRACTION,
     DEFAULT_MAX_WORKERS_CAP,
     DEFAULT_WORKER_CHECK_INTERVAL,
     DEFAULT_WORKER_ERROR_RECOVERY_TIME,
@@ -18,16 +24,17 @@ from aiperf.common.constants import (
     DEFAULT_WORKER_STATUS_SUMMARY_INTERVAL,
     NANOS_PER_SECOND,
 )
-from aiperf.common.enums import MessageType, ServiceType
+from aiperf.common.enums import CommAddress, MessageType, ServiceType
 from aiperf.common.enums.worker_enums import WorkerStatus
 from aiperf.common.factories import ServiceFactory
-from aiperf.common.hooks import background_task, on_message, on_start, on_stop
+from aiperf.common.hooks import background_task, on_pull_message, on_start, on_stop
 from aiperf.common.messages import (
     ShutdownWorkersCommand,
     SpawnWorkersCommand,
     WorkerHealthMessage,
 )
 from aiperf.common.messages.worker_messages import WorkerStatusSummaryMessage
+from aiperf.common.mixins import AIPerfLoggerMixin, PullClientMixin
 from aiperf.common.models.progress_models import WorkerStats
 
 
@@ -43,14 +50,132 @@ class WorkerStatusInfo(WorkerStats):
         default=None,
         description="The last time the worker was in high load",
     )
+    active_sessions: int = Field(
+        default=0,
+        description="The number of sessions the worker is running, including the ones waiting for think time",
+    )
+    credit_drop_latency_ns: int | None = Field(
+        default=None,
+        description="The average credit drop latency of the worker since its previous health message",
+    )
+    idle_since_ns: int | None = Field(
+        default=None,
+        description="The time the worker became idle, or None if the worker is not idle",
+    )
+
+
+class WorkerAutoScaler(AIPerfLoggerMixin):
+    """Decides when the WorkerManager should spawn more workers, or shut down idle ones, based on the
+    health reported by the workers.
+
+    The workers are considered saturated when their average CPU usage is above the high load threshold,
+    when their average p99 event loop lag is above `DEFAULT_AUTOSCALE_EVENT_LOOP_LAG`, or when credits
+    wait on average longer than `DEFAULT_AUTOSCALE_CREDIT_DROP_LATENCY` before their request is sent,
+    which means the workers can no longer keep up with the load. Workers are only shut
+    down when they have been idle for `DEFAULT_AUTOSCALE_IDLE_TIME` while the other workers are busy,
+    so that the workers are not scaled down between phases, or before the profiling starts.
+    """
+
+    def __init__(self, min_workers: int, max_workers: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.last_scale_ns: int | None = None
+
+    def _in_cooldown(self, now_ns: int) -> bool:
+        if self.last_scale_ns is None:
+            return False
+        return (
+            now_ns - self.last_scale_ns
+        ) / NANOS_PER_SECOND < DEFAULT_AUTOSCALE_COOLDOWN
+
+    def _step(self, num_workers: int) -> int:
+        return max(1, math.ceil(num_workers * DEFAULT_AUTOSCALE_STEP_FRACTION))
+
+    def is_saturated(self, infos: list[WorkerStatusInfo]) -> bool:
+        """Whether the workers are saturated, based on their average CPU usage, event loop lag and credit drop latency."""
+        cpu_usages = [info.health.cpu_usage for info in infos if info.health]
+        if cpu_usages:
+            avg_cpu_usage = sum(cpu_usages) / len(cpu_usages)
+            if avg_cpu_usage > DEFAULT_WORKER_HIGH_LOAD_CPU_USAGE:
+                return True
+
+        lags = [
+            info.health.event_loop_lag.p99_ns
+            for info in infos
+            if info.health and info.health.event_loop_lag
+        ]
+        if lags:
+            avg_lag_sec = sum(lags) / len(lags) / NANOS_PER_SECOND
+            if avg_lag_sec > DEFAULT_AUTOSCALE_EVENT_LOOP_LAG:
+                return True
+
+        latencies = [
+            info.credit_drop_latency_ns
+            for info in infos
+            if info.credit_drop_latency_ns is not None
+        ]
+        if not latencies:
+            return False
+        avg_latency_sec = sum(latencies) / len(latencies) / NANOS_PER_SECOND
+        return avg_latency_sec > DEFAULT_AUTOSCALE_CREDIT_DROP_LATENCY
+
+    def workers_to_spawn(
+        self, infos: list[WorkerStatusInfo], num_workers: int, now_ns: int
+    ) -> int:
+        """The number of workers to spawn, given the status of the running workers and the
+        total number of workers (including the ones that are still starting)."""
+        if (
+            self._in_cooldown(now_ns)
+            or num_workers >= self.max_workers
+            or not self.is_saturated(infos)
+        ):
+            return 0
+        self.last_scale_ns = now_ns
+        return min(self._step(num_workers), self.max_workers - num_workers)
+
+    def workers_to_shutdown(
+        self, infos: list[WorkerStatusInfo], num_workers: int, now_ns: int
+    ) -> list[str]:
+        """The IDs of the idle workers to shut down, longest idle first."""
+        if (
+            self._in_cooldown(now_ns)
+            or num_workers <= self.min_workers
+            or not any(info.active_sessions for info in infos)
+            or self.is_saturated(infos)
+        ):
+            return []
+
+        idle_infos = sorted(
+            (
+                info
+                for info in infos
+                if info.idle_since_ns is not None
+                and (now_ns - info.idle_since_ns) / NANOS_PER_SECOND
+                >= DEFAULT_AUTOSCALE_IDLE_TIME
+            ),
+            key=lambda info: info.idle_since_ns,
+        )
+        if not idle_infos:
+            return []
+        self.last_scale_ns = now_ns
+        num_to_shutdown = min(
+            len(idle_infos), self._step(num_workers), num_workers - self.min_workers
+        )
+        return [info.worker_id for info in idle_infos[:num_to_shutdown]]
 
 
 @ServiceFactory.register(ServiceType.WORKER_MANAGER)
-class WorkerManager(BaseComponentService):
+class WorkerManager(PullClientMixin, BaseComponentService):
     """
     The WorkerManager service is primary responsibility to manage the worker processes.
     It will spawn the workers, monitor their health, and stop them when the service is stopped.
-    In the future it will also be responsible for the auto-scaling of the workers.
+    When auto-scaling is enabled, it also spawns more workers when the workers are saturated,
+    and shuts down the idle ones (see :class:`WorkerAutoScaler`).
+
+    The workers push their health to the WorkerManager directly, instead of publishing it on the
+    event bus. The WorkerManager publishes a periodic summary of the worker statuses instead, with
+    the health of only the workers that reported since the previous summary.
     """
 
     def __init__(
@@ -64,11 +189,18 @@ class WorkerManager(BaseComponentService):
             service_config=service_config,
             user_config=user_config,
             service_id=service_id,
+            pull_client_address=CommAddress.WORKER_HEALTH,
+            pull_client_bind=True,
             **kwargs,
         )
 
         self.trace("WorkerManager.__init__")
         self.worker_infos: dict[str, WorkerStatusInfo] = {}
+        # The workers that reported their health, and the statuses, since the previous summary
+        self._updated_worker_ids: set[str] = set()
+        self._summary_worker_statuses: dict[str, WorkerStatus] = {}
+        # Workers that were shut down by the auto-scaler, which may still report their health while draining
+        self.retired_worker_ids: set[str] = set()
 
         self.cpu_count = multiprocessing.cpu_count()
         self.debug(lambda: f"Detected {self.cpu_count} CPU cores/threads")
@@ -92,12 +224,29 @@ class WorkerManager(BaseComponentService):
             )
 
         # Ensure we have at least the min workers
-        self.max_workers = max(
-            self.max_workers,
-            self.service_config.workers.min or 1,
-        )
+        self.min_workers = self.service_config.workers.min or 1
+        self.max_workers = max(self.max_workers, self.min_workers)
         self.initial_workers = self.max_workers
 
+        # The total number of workers, including the ones that are still starting
+        self.num_workers = self.initial_workers
+        self.autoscaler: WorkerAutoScaler | None = None
+        if self.service_config.workers.autoscale:
+            # Auto-scaling measures whether more workers are needed, so the default upper bound is
+            # all but one of the CPU cores, instead of the max cap.
+            if self.service_config.workers.max is None:
+                self.max_workers = max(1, self.cpu_count - 1)
+                if self.max_concurrency:
+                    self.max_workers = min(self.max_workers, self.max_concurrency)
+                self.max_workers = max(self.max_workers, self.min_workers)
+            self.autoscaler = WorkerAutoScaler(
+                min_workers=self.min_workers, max_workers=self.max_workers
+            )
+            self.debug(
+                lambda: f"Auto-scaling workers between {self.min_workers} and {self.max_workers}, "
+                f"starting with {self.initial_workers}"
+            )
+
     @on_start
     async def _start(self) -> None:
         """Start worker manager-specific components."""
@@ -126,9 +275,11 @@ class WorkerManager(BaseComponentService):
             )
         )
 
-    @on_message(MessageType.WORKER_HEALTH)
+    @on_pull_message(MessageType.WORKER_HEALTH)
     async def _on_worker_health(self, message: WorkerHealthMessage) -> None:
         worker_id = message.service_id
+        if worker_id in self.retired_worker_ids:
+            return
         info = self.worker_infos.get(worker_id)
         if not info:
             info = WorkerStatusInfo(
@@ -140,6 +291,7 @@ class WorkerManager(BaseComponentService):
             )
             self.worker_infos[worker_id] = info
         self._update_worker_status(info, message)
+        self._updated_worker_ids.add(worker_id)
 
     def _update_worker_status(
         self, info: WorkerStatusInfo, message: WorkerHealthMessage
@@ -170,6 +322,12 @@ class WorkerManager(BaseComponentService):
 
         info.health = message.health
         info.task_stats = message.task_stats
+        info.active_sessions = message.active_sessions
+        info.credit_drop_latency_ns = message.credit_drop_latency_ns
+        if message.active_sessions or message.task_stats.in_progress:
+            info.idle_since_ns = None
+        elif info.idle_since_ns is None:
+            info.idle_since_ns = info.last_update_ns
 
     @background_task(immediate=False, interval=DEFAULT_WORKER_CHECK_INTERVAL)
     async def _worker_status_loop(self) -> None:
@@ -180,15 +338,83 @@ class WorkerManager(BaseComponentService):
             if (time.time_ns() - (info.last_update_ns or 0)) / NANOS_PER_SECOND > DEFAULT_WORKER_STALE_TIME:  # fmt: skip
                 info.status = WorkerStatus.STALE
 
+    @background_task(immediate=False, interval=DEFAULT_WORKER_CHECK_INTERVAL)
+    async def _autoscale_loop(self) -> None:
+        """Spawn more workers when the workers are saturated, and shut down the idle ones."""
+        if self.autoscaler is None:
+            return
+
+        infos = [
+            info
+            for info in self.worker_infos.values()
+            if info.status != WorkerStatus.STALE
+        ]
+        now_ns = time.time_ns()
+
+        num_to_spawn = self.autoscaler.workers_to_spawn(infos, self.num_workers, now_ns)
+        if num_to_spawn:
+            self.info(
+                f"Workers are saturated, scaling up from {self.num_workers} to {self.num_workers + num_to_spawn} workers"
+            )
+            self.num_workers += num_to_spawn
+            await self.send_command_and_wait_for_response(
+                SpawnWorkersCommand(
+                    service_id=self.service_id,
+                    num_workers=num_to_spawn,
+                    target_service_type=ServiceType.SYSTEM_CONTROLLER,
+                )
+            )
+            return
+
+        worker_ids = self.autoscaler.workers_to_shutdown(
+            infos, self.num_workers, now_ns
+        )
+        if worker_ids:
+            self.info(
+                f"Workers are idle, scaling down from {self.num_workers} to {self.num_workers - len(worker_ids)} workers"
+            )
+            self.num_workers -= len(worker_ids)
+            for worker_id in worker_ids:
+                self.worker_infos.pop(worker_id, None)
+                self.retired_worker_ids.add(worker_id)
+            await self.publish(
+                ShutdownWorkersCommand(
+                    service_id=self.service_id,
+                    worker_ids=worker_ids,
+                    target_service_type=ServiceType.SYSTEM_CONTROLLER,
+                )
+            )
+
     @background_task(immediate=False, interval=DEFAULT_WORKER_STATUS_SUMMARY_INTERVAL)
     async def _worker_summary_loop(self) -> None:
-        """Generate a summary of the worker status."""
+        """Publish a summary of the worker statuses, and the health of the workers that reported
+        since the previous summary. Nothing is published if nothing has changed."""
+        worker_statuses = {
+            worker_id: info.status for worker_id, info in self.worker_infos.items()
+        }
+        if (
+            not self._updated_worker_ids
+            and worker_statuses == self._summary_worker_statuses
+        ):
+            return
+
         summary = WorkerStatusSummaryMessage(
             service_id=self.service_id,
-            worker_statuses={
-                worker_id: info.status for worker_id, info in self.worker_infos.items()
+            worker_statuses=worker_statuses,
+            worker_stats={
+                worker_id: WorkerStats(
+                    worker_id=worker_id,
+                    task_stats=info.task_stats,
+                    health=info.health,
+                    status=info.status,
+                    last_update_ns=info.last_update_ns,
+                )
+                for worker_id in self._updated_worker_ids
+                if (info := self.worker_infos.get(worker_id))
             },
         )
+        self._updated_worker_ids.clear()
+        self._summary_worker_statuses = worker_statuses
         self.debug(lambda: f"Publishing worker status summary: {summary}")
         await self.publish(summary)
 
@@ -8,6 +8,9 @@ __ignore__ = []
 ## ⚠️        This file is auto-generated by mkinit                 ⚠️ ##
 ## ⚠️             Do not edit below this line                      ⚠️ ##
 ########################################################################
+from aiperf.zmq.dealer_dispatch_target_client import (
+    ZMQDealerDispatchTargetClient,
+)
 from aiperf.zmq.dealer_request_client import (
     ZMQDealerRequestClient,
 )
@@ -22,9 +25,26 @@ from aiperf.zmq.push_client import (
     RETRY_DELAY_INTERVAL_SEC,
     ZMQPushClient,
 )
+from aiperf.zmq.request_multiplexer import (
+    PendingRequest,
+    RequestMultiplexer,
+    latency_bucket_ms,
+)
+from aiperf.zmq.router_dispatch_client import (
+    ZMQRouterDispatchClient,
+)
 from aiperf.zmq.router_reply_client import (
     ZMQRouterReplyClient,
 )
+from aiperf.zmq.shm_pull_client import (
+    ZMQSharedMemoryPullClient,
+)
+from aiperf.zmq.shm_push_client import (
+    ZMQSharedMemoryPushClient,
+)
+from aiperf.zmq.shm_ring import (
+    SharedMemoryRing,
+)
 from aiperf.zmq.sub_client import (
     ZMQSubClient,
 )
@@ -32,9 +52,13 @@ from aiperf.zmq.zmq_base_client import (
     BaseZMQClient,
 )
 from aiperf.zmq.zmq_comms import (
+    PUSH_BATCH_ADDRESSES,
+    SHARED_MEMORY_ADDRESSES,
+    SHARED_MEMORY_CLIENT_TYPES,
     BaseZMQCommunication,
     ZMQIPCCommunication,
     ZMQTCPCommunication,
+    get_channel_name,
 )
 from aiperf.zmq.zmq_defaults import (
     TOPIC_DELIMITER,
@@ -42,6 +66,13 @@ from aiperf.zmq.zmq_defaults import (
     TOPIC_END_ENCODED,
     ZMQSocketDefaults,
 )
+from aiperf.zmq.zmq_frames import (
+    HEADER_DELIMITER,
+    decode_message_batch,
+    decode_message_frames,
+    decode_message_header,
+    encode_message_frames,
+)
 from aiperf.zmq.zmq_proxy_base import (
     BaseZMQProxy,
     ProxyEndType,
@@ -59,13 +90,21 @@ __all__ = [
     "BaseZMQClient",
     "BaseZMQCommunication",
     "BaseZMQProxy",
+    "HEADER_DELIMITER",
     "MAX_PUSH_RETRIES",
+    "PUSH_BATCH_ADDRESSES",
+    "PendingRequest",
     "ProxyEndType",
     "ProxySocketClient",
     "RETRY_DELAY_INTERVAL_SEC",
+    "RequestMultiplexer",
+    "SHARED_MEMORY_ADDRESSES",
+    "SHARED_MEMORY_CLIENT_TYPES",
+    "SharedMemoryRing",
     "TOPIC_DELIMITER",
     "TOPIC_END",
     "TOPIC_END_ENCODED",
+    "ZMQDealerDispatchTargetClient",
     "ZMQDealerRequestClient",
     "ZMQDealerRouterProxy",
     "ZMQIPCCommunication",
@@ -73,11 +112,20 @@ __all__ = [
     "ZMQPullClient",
     "ZMQPushClient",
     "ZMQPushPullProxy",
+    "ZMQRouterDispatchClient",
     "ZMQRouterReplyClient",
+    "ZMQSharedMemoryPullClient",
+    "ZMQSharedMemoryPushClient",
     "ZMQSocketDefaults",
     "ZMQSubClient",
     "ZMQTCPCommunication",
     "ZMQXPubXSubProxy",
     "create_proxy_socket_class",
+    "decode_message_batch",
+    "decode_message_frames",
+    "decode_message_header",
     "define_proxy_class",
+    "encode_message_frames",
+    "get_channel_name",
+    "latency_bucket_ms",
 ]
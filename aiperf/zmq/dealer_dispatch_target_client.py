@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import zmq.asyncio
+
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import CommClientType
+from aiperf.common.exceptions import CommunicationError
+from aiperf.common.factories import CommunicationClientFactory
+from aiperf.common.hooks import background_task
+from aiperf.common.messages import Message
+from aiperf.common.protocols import DispatchTargetClientProtocol
+from aiperf.common.types import MessageTypeT
+from aiperf.common.utils import yield_to_event_loop
+from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import decode_message_frames, encode_message_frames
+
+
+@implements_protocol(DispatchTargetClientProtocol)
+@CommunicationClientFactory.register(CommClientType.DISPATCH_TARGET)
+class ZMQDealerDispatchTargetClient(BaseZMQClient):
+    """
+    ZMQ DEALER socket client for receiving work from a ROUTER dispatcher.
+
+    The DEALER socket uses the target ID as its ZMQ routing ID, so that the dispatcher
+    can address messages to it directly. see :class:`ZMQRouterDispatchClient` for more details.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        bind: bool,
+        target_id: str,
+        socket_ops: dict | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the ZMQ Dealer (Dispatch Target) client class.
+
+        Args:
+            address (str): The address to bind or connect to.
+            bind (bool): Whether to bind or connect the socket.
+            target_id (str): The ID the dispatcher uses to address this client.
+            socket_ops (dict, optional): Additional socket options to set.
+        """
+        super().__init__(zmq.SocketType.DEALER, address, bind, socket_ops, **kwargs)
+        self.target_id = target_id
+        # NOTE: The routing ID must be set before the socket is connected.
+        self.socket.setsockopt(zmq.ROUTING_ID, target_id.encode())
+        self._receive_callbacks: dict[
+            MessageTypeT, Callable[[Message], Coroutine[Any, Any, None]]
+        ] = {}
+
+    def register_receive_callback(
+        self,
+        message_type: MessageTypeT,
+        callback: Callable[[Message], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Register a callback for messages of the given type received from the dispatcher.
+
+        Note that only one callback can be registered for a given message type.
+        """
+        if message_type in self._receive_callbacks:
+            raise ValueError(
+                f"Callback already registered for message type {message_type}"
+            )
+        self._receive_callbacks[message_type] = callback
+
+    async def send(self, message: Message) -> None:
+        """Send a message to the dispatcher."""
+        await self._check_initialized()
+
+        try:
+            await self.socket.send_multipart(encode_message_frames(message), copy=False)
+        except (asyncio.CancelledError, zmq.ContextTerminated):
+            self.debug("Dealer dispatch target client cancelled or context terminated")
+        except Exception as e:
+            raise CommunicationError(f"Failed to send message: {e}") from e
+
+    @background_task(immediate=True, interval=None)
+    async def _dispatch_target_receiver(self) -> None:
+        """Background task for receiving messages from the dispatcher."""
+        while not self.stop_requested:
+            try:
+                message = decode_message_frames(
+                    await self.socket.recv_multipart(copy=False)
+                )
+                if message.message_type in self._receive_callbacks:
+                    self.execute_async(
+                        self._receive_callbacks[message.message_type](message)
+                    )
+                else:
+                    self.warning(
+                        lambda message_type=message.message_type: f"Message received for message type {message_type} without callback"
+                    )
+            except zmq.Again:
+                self.debug("Dealer dispatch target client receiver task timed out")
+                await yield_to_event_loop()
+            except (asyncio.CancelledError, zmq.ContextTerminated):
+                self.debug("Dealer dispatch target client receiver task cancelled")
+                break
+            except Exception as e:
+                self.exception(f"Exception receiving message from dispatcher: {e}")
+                await yield_to_event_loop()
@@ -7,7 +7,10 @@ from typing import Any
 
 import zmq.asyncio
 
-from aiperf.common.constants import DEFAULT_COMMS_REQUEST_TIMEOUT
+from aiperf.common.constants import (
+    DEFAULT_COMMS_REQUEST_TIMEOUT,
+    DEFAULT_REQUEST_EVICTION_INTERVAL,
+)
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import CommClientType
 from aiperf.common.exceptions import CommunicationError
@@ -15,9 +18,16 @@ from aiperf.common.factories import CommunicationClientFactory
 from aiperf.common.hooks import background_task, on_stop
 from aiperf.common.messages import Message
 from aiperf.common.mixins import TaskManagerMixin
+from aiperf.common.models import CommClientStats
 from aiperf.common.protocols import RequestClientProtocol
 from aiperf.common.utils import yield_to_event_loop
+from aiperf.zmq.request_multiplexer import PendingRequest, RequestMultiplexer
 from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import (
+    decode_message_frames,
+    decode_message_header,
+    encode_message_frames,
+)
 
 
 @implements_protocol(RequestClientProtocol)
@@ -42,6 +52,10 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
 
     DEALER/ROUTER is a Many-to-One communication pattern. If you need Many-to-Many,
     use a ZMQ Proxy as well. see :class:`ZMQDealerRouterProxy` for more details.
+
+    The pending requests are tracked by a :class:`RequestMultiplexer`, which evicts the
+    requests that do not receive a response before their deadline, and counts the timeouts,
+    the late replies, and the latency of the requests per message type.
     """
 
     def __init__(
@@ -61,23 +75,27 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
         """
         super().__init__(zmq.SocketType.DEALER, address, bind, socket_ops, **kwargs)
 
-        self.request_callbacks: dict[
-            str, Callable[[Message], Coroutine[Any, Any, None]]
-        ] = {}
+        self.requests = RequestMultiplexer()
 
     @background_task(immediate=True, interval=None)
     async def _request_async_task(self) -> None:
         """Task to handle incoming requests."""
         while not self.stop_requested:
             try:
-                message = await self.socket.recv_string()
-                self.trace(lambda msg=message: f"Received response: {msg}")
-                response_message = Message.from_json(message)
+                frames = await self.socket.recv_multipart(copy=False)
+                _, request_id = decode_message_header(frames[-2])
+
+                # Only parse the response if a request is still waiting for it
+                request = self.requests.complete(request_id)
+                if request is None:
+                    self.debug(
+                        lambda request_id=request_id: f"Received late reply for request {request_id}"
+                    )
+                    continue
 
-                # Call the callback if it exists
-                if response_message.request_id in self.request_callbacks:
-                    callback = self.request_callbacks.pop(response_message.request_id)
-                    self.execute_async(callback(response_message))
+                response_message = decode_message_frames(frames)
+                self.trace(lambda msg=response_message: f"Received response: {msg}")
+                self._resolve_request(request, response_message)
 
             except zmq.Again:
                 self.debug("No data on dealer socket received, yielding to event loop")
@@ -89,17 +107,65 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
                 self.debug("Dealer request client receiver task cancelled")
                 raise  # re-raise the cancelled error
 
+    def _resolve_request(self, request: PendingRequest, response: Message) -> None:
+        """Pass the response to the future or the callback of the request."""
+        if request.future is not None:
+            if not request.future.done():
+                request.future.set_result(response)
+        elif request.callback is not None:
+            self.execute_async(request.callback(response))
+
+    @background_task(interval=DEFAULT_REQUEST_EVICTION_INTERVAL, immediate=False)
+    async def _evict_expired_requests(self) -> None:
+        """Evict the requests that did not receive a response before their deadline. The callers
+        waiting on a future time out on their own."""
+        for request in self.requests.evict_expired():
+            if request.callback is not None:
+                # Nothing else waits on these requests, so their callbacks are dropped silently otherwise
+                self.warning(
+                    f"Request {request.request_id} ({request.message_type}) timed out, "
+                    "and its callback will not be called"
+                )
+            else:
+                self.debug(
+                    lambda request=request: f"Request {request.request_id} ({request.message_type}) timed out"
+                )
+
+    def get_stats(self) -> CommClientStats:
+        """Get the request counters of the client."""
+        return CommClientStats(
+            channel=self.channel,
+            request_timeouts=self.requests.timeouts,
+            request_late_replies=self.requests.late_replies,
+            request_latency_histograms={
+                message_type: dict(histogram)
+                for message_type, histogram in self.requests.latency_histograms.items()
+            },
+        )
+
     @on_stop
     async def _stop_remaining_tasks(self) -> None:
         """Wait for all tasks to complete."""
         await self.cancel_all_tasks()
+        if self.requests.timeouts or self.requests.late_replies:
+            self.warning(
+                f"Request client for {self.address} had {self.requests.timeouts:,} timeouts "
+                f"and {self.requests.late_replies:,} late replies"
+            )
+        for message_type, histogram in self.requests.latency_histograms.items():
+            self.debug(
+                lambda message_type=message_type,
+                histogram=histogram: f"Request latency (ms) for {message_type}: {dict(sorted(histogram.items()))}"
+            )
 
-    async def request_async(
+    async def _send_request(
         self,
         message: Message,
-        callback: Callable[[Message], Coroutine[Any, Any, None]],
-    ) -> None:
-        """Send a request and be notified when the response is received."""
+        timeout: float | None,
+        callback: Callable[[Message], Coroutine[Any, Any, None]] | None = None,
+        future: asyncio.Future[Message] | None = None,
+    ) -> str:
+        """Add the request to the pending requests, and send it. Returns the request ID."""
         await self._check_initialized()
 
         if not isinstance(message, Message):
@@ -111,18 +177,35 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
         if not message.request_id:
             message.request_id = str(uuid.uuid4())
 
-        self.request_callbacks[message.request_id] = callback
+        self.requests.add(
+            message.request_id,
+            message.message_type,
+            timeout,
+            callback=callback,
+            future=future,
+        )
 
-        request_json = message.model_dump_json()
-        self.trace(lambda msg=request_json: f"Sending request: {msg}")
+        self.trace(lambda msg=message: f"Sending request: {msg}")
 
         try:
-            await self.socket.send_string(request_json)
-
+            await self.socket.send_multipart(encode_message_frames(message), copy=False)
         except Exception as e:
+            self.requests.cancel(message.request_id)
             raise CommunicationError(
                 f"Exception sending request: {e.__class__.__qualname__} {e}",
             ) from e
+        return message.request_id
+
+    async def request_async(
+        self,
+        message: Message,
+        callback: Callable[[Message], Coroutine[Any, Any, None]],
+        timeout: float | None = None,
+    ) -> None:
+        """Send a request and be notified when the response is received. By default, the request
+        waits for its response forever. Otherwise, the callback is never called if the response is
+        not received within timeout seconds, which is logged."""
+        await self._send_request(message, timeout, callback=callback)
 
     async def request(
         self,
@@ -142,10 +225,43 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
             CommunicationError: if the request fails, or
             asyncio.TimeoutError: if the response is not received in time.
         """
-        future = asyncio.Future[Message]()
+        return (await self.request_many([message], timeout=timeout))[0]
 
-        async def callback(response_message: Message) -> None:
-            future.set_result(response_message)
+    async def request_many(
+        self,
+        messages: list[Message],
+        timeout: float = DEFAULT_COMMS_REQUEST_TIMEOUT,
+    ) -> list[Message]:
+        """Send a batch of requests back to back, and wait for all of their responses up to
+        timeout seconds in total.
 
-        await self.request_async(message, callback)
-        return await asyncio.wait_for(future, timeout=timeout)
+        Args:
+            messages (list[Message]): The request messages to send.
+            timeout (float): Maximum time to wait for all of the responses in seconds.
+
+        Returns:
+            list[Message]: The response messages, in the order of the requests.
+
+        Raises:
+            CommunicationError: if a request fails, or
+            asyncio.TimeoutError: if any of the responses are not received in time.
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future[Message]] = {}
+        try:
+            for message in messages:
+                future = loop.create_future()
+                request_id = await self._send_request(message, timeout, future=future)
+                futures[request_id] = future
+            return await asyncio.wait_for(asyncio.gather(*futures.values()), timeout)
+        except asyncio.TimeoutError:
+            for request_id, future in futures.items():
+                if not future.done():
+                    self.requests.expire(request_id)
+            raise
+        except (CommunicationError, asyncio.CancelledError):
+            # Stop waiting for the responses that have not been received yet
+            for request_id, future in futures.items():
+                if not future.done():
+                    self.requests.cancel(request_id)
+            raise
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
+from collections import Counter
 from collections.abc import Callable, Coroutine
 from typing import Any
 
@@ -12,10 +13,12 @@ from aiperf.common.enums import CommClientType
 from aiperf.common.factories import CommunicationClientFactory
 from aiperf.common.hooks import background_task, on_stop
 from aiperf.common.messages import Message
+from aiperf.common.models import CommClientStats
 from aiperf.common.protocols import PullClientProtocol
 from aiperf.common.types import MessageTypeT
 from aiperf.common.utils import yield_to_event_loop
 from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import decode_message_batch
 
 
 @implements_protocol(PullClientProtocol)
@@ -73,6 +76,10 @@ class ZMQPullClient(BaseZMQClient):
         self._pull_callbacks: dict[
             MessageTypeT, Callable[[Message], Coroutine[Any, Any, None]]
         ] = {}
+        self.batch_size_histogram: Counter[int] = Counter()
+        """The number of multipart messages received, by the number of messages coalesced into them."""
+        self.messages_received: int = 0
+        self.messages_in_flight: int = 0
 
         if max_pull_concurrency is not None:
             self.semaphore = asyncio.Semaphore(value=max_pull_concurrency)
@@ -91,15 +98,23 @@ class ZMQPullClient(BaseZMQClient):
         while not self.stop_requested:
             try:
                 # acquire the semaphore to limit the number of concurrent requests
-                # NOTE: This MUST be done BEFORE calling recv_string() to allow the zmq push/pull
+                # NOTE: This MUST be done BEFORE calling recv_multipart() to allow the zmq push/pull
                 # logic to properly load balance the requests.
                 await self.semaphore.acquire()
 
-                message_json = await self.socket.recv_string()
+                frames = await self.socket.recv_multipart(copy=False)
+                # A push client may have coalesced several messages into one multipart message
+                messages = decode_message_batch(frames)
+                self.batch_size_histogram[len(messages)] += 1
+                self.messages_received += len(messages)
+                self.messages_in_flight += len(messages)
                 self.trace(
-                    lambda msg=message_json: f"Received message from pull socket: {msg}"
+                    lambda msgs=messages: f"Received message(s) from pull socket: {msgs}"
                 )
-                self.execute_async(self._process_message(message_json))
+                if len(messages) == 1:
+                    self.execute_async(self._process_message(messages[0]))
+                else:
+                    self.execute_async(self._process_messages(messages))
 
             except zmq.Again:
                 self.debug("Pull client receiver task timed out")
@@ -118,28 +133,60 @@ class ZMQPullClient(BaseZMQClient):
     async def _stop(self) -> None:
         """Wait for all tasks to complete."""
         await self.cancel_all_tasks()
+        if any(batch_size > 1 for batch_size in self.batch_size_histogram):
+            self.info(
+                lambda: f"Pull client batch sizes for {self.address}: {dict(sorted(self.batch_size_histogram.items()))}"
+            )
+
+    async def _call_pull_callback(self, message: Message) -> None:
+        """Call the callback registered for the message type of the message."""
+        if message.message_type in self._pull_callbacks:
+            await self._pull_callbacks[message.message_type](message)
+        else:
+            self.warning(
+                lambda message_type=message.message_type: f"Pull message received for message type {message_type} without callback"
+            )
 
-    async def _process_message(self, message_json: str) -> None:
+    async def _process_message(self, message: Message) -> None:
         """Process a message from the pull socket.
 
         This method is called by the background task when a message is received from
-        the pull socket. It will deserialize the message and call the appropriate
-        callback function.
+        the pull socket. It will call the appropriate callback function.
         """
         try:
-            message = Message.from_json(message_json)
-
-            # Call callbacks with Message object
-            if message.message_type in self._pull_callbacks:
-                await self._pull_callbacks[message.message_type](message)
-            else:
-                self.warning(
-                    lambda message_type=message.message_type: f"Pull message received for message type {message_type} without callback"
-                )
+            await self._call_pull_callback(message)
         finally:
+            self.messages_in_flight -= 1
             # always release the semaphore to allow receiving more messages
             self.semaphore.release()
 
+    async def _process_messages(self, messages: list[Message]) -> None:
+        """Process a batch of coalesced messages from the pull socket in order, in a single task.
+
+        The batch holds a single slot of the semaphore, and an error processing one message
+        does not prevent the rest of the batch from being processed.
+        """
+        try:
+            for message in messages:
+                try:
+                    await self._call_pull_callback(message)
+                except Exception as e:
+                    self.exception(f"Exception processing pulled message: {e!r}")
+                finally:
+                    self.messages_in_flight -= 1
+        finally:
+            # always release the semaphore to allow receiving more messages
+            self.semaphore.release()
+
+    def get_stats(self) -> CommClientStats:
+        """Get the message counters of the client."""
+        return CommClientStats(
+            channel=self.channel,
+            received=self.messages_received,
+            in_flight=self.messages_in_flight,
+            batch_size_histogram=dict(self.batch_size_histogram),
+        )
+
     def register_pull_callback(
         self,
         message_type: MessageTypeT,
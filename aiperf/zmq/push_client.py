@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import time
+from collections import Counter
 
 import zmq.asyncio
 
@@ -9,9 +11,12 @@ from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import CommClientType
 from aiperf.common.exceptions import CommunicationError
 from aiperf.common.factories import CommunicationClientFactory
+from aiperf.common.hooks import on_stop
 from aiperf.common.messages import Message
+from aiperf.common.models import CommClientStats
 from aiperf.common.protocols import PushClientProtocol
 from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import encode_message_frames
 
 MAX_PUSH_RETRIES = 2
 """Maximum number of retries for pushing a message."""
@@ -59,6 +64,8 @@ class ZMQPushClient(BaseZMQClient):
         address: str,
         bind: bool,
         socket_ops: dict | None = None,
+        batch_size: int | None = None,
+        batch_timeout: float = 0.0,
         **kwargs,
     ) -> None:
         """
@@ -68,26 +75,46 @@ class ZMQPushClient(BaseZMQClient):
             address (str): The address to bind or connect to.
             bind (bool): Whether to bind or connect the socket.
             socket_ops (dict, optional): Additional socket options to set.
+            batch_size (int, optional): The maximum number of messages to coalesce into a single
+                multipart message. Coalescing is disabled when not set.
+            batch_timeout (float, optional): The maximum time in seconds that a message waits for
+                its batch to fill up.
         """
         super().__init__(zmq.SocketType.PUSH, address, bind, socket_ops, **kwargs)
-
-    async def _push_message(
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.batch_size_histogram: Counter[int] = Counter()
+        """The number of multipart messages sent, by the number of messages coalesced into them."""
+        self._batch_frames: list[bytes] = []
+        self.messages_sent: int = 0
+        self.send_blocked_ns: int = 0
+        self._batch_flush_handle: asyncio.TimerHandle | None = None
+
+    async def _push_frames(
         self,
-        message: Message,
+        frames: list[bytes],
         retry_count: int = 0,
         max_retries: int = MAX_PUSH_RETRIES,
     ) -> None:
-        """Push a message to the socket. Will retry up to max_retries times.
+        """Push the frames of a multipart message to the socket. Will retry up to max_retries times.
 
         Args:
-            message: Message to be sent must be a Message object
+            frames: The frames of one or more messages, each a header frame followed by a body frame
             retry_count: Current retry count
-            max_retries: Maximum number of times to retry pushing the message
+            max_retries: Maximum number of times to retry pushing the frames
         """
         try:
-            data_json = message.model_dump_json()
-            await self.socket.send_string(data_json)
-            self.trace(lambda msg=data_json: f"Pushed json data: {msg}")
+            send_future = self.socket.send_multipart(frames, copy=False)
+            if not send_future.done():
+                # The socket could not accept the message right away, such as when the high water
+                # mark is reached, so time how long the send was blocked for.
+                start_ns = time.perf_counter_ns()
+                await send_future
+                self.send_blocked_ns += time.perf_counter_ns() - start_ns
+            else:
+                send_future.result()
+            self.messages_sent += len(frames) // 2
+            self.trace(lambda: f"Pushed {len(frames) // 2} message(s): {frames[1::2]}")
         except (asyncio.CancelledError, zmq.ContextTerminated):
             self.debug("Push client cancelled or context terminated")
             return
@@ -99,17 +126,69 @@ class ZMQPushClient(BaseZMQClient):
                 ) from e
 
             await asyncio.sleep(RETRY_DELAY_INTERVAL_SEC)
-            return await self._push_message(message, retry_count + 1, max_retries)
+            return await self._push_frames(frames, retry_count + 1, max_retries)
         except Exception as e:
             raise CommunicationError(f"Failed to push data: {e}") from e
 
+    async def _push_message(self, message: Message) -> None:
+        """Push a single message to the socket, without coalescing it.
+
+        Args:
+            message: Message to be sent must be a Message object
+        """
+        await self._push_frames(encode_message_frames(message))
+
+    def get_stats(self) -> CommClientStats:
+        """Get the message counters of the client."""
+        return CommClientStats(
+            channel=self.channel,
+            sent=self.messages_sent,
+            send_blocked_ns=self.send_blocked_ns,
+            batch_size_histogram=dict(self.batch_size_histogram),
+        )
+
     async def push(self, message: Message) -> None:
         """Push data to a target. The message will be routed automatically
         based on the message type.
 
+        When coalescing is enabled, the message is added to the current batch, which
+        is sent once it is full, or once the batch timeout expires.
+
         Args:
             message: Message to be sent must be a Message object
         """
         await self._check_initialized()
 
-        await self._push_message(message)
+        if not self.batch_size:
+            await self._push_message(message)
+            return
+
+        self._batch_frames.extend(encode_message_frames(message))
+        if len(self._batch_frames) >= self.batch_size * 2:
+            await self._flush_batch()
+        elif self._batch_flush_handle is None:
+            self._batch_flush_handle = asyncio.get_running_loop().call_later(
+                self.batch_timeout, lambda: self.execute_async(self._flush_batch())
+            )
+
+    async def _flush_batch(self) -> None:
+        """Send the messages of the current batch as a single multipart message."""
+        if self._batch_flush_handle is not None:
+            self._batch_flush_handle.cancel()
+            self._batch_flush_handle = None
+        if not self._batch_frames:
+            return
+
+        # Swap out the batch first, as more messages may be added while it is being sent
+        frames, self._batch_frames = self._batch_frames, []
+        self.batch_size_histogram[len(frames) // 2] += 1
+        await self._push_frames(frames)
+
+    @on_stop
+    async def _flush_remaining_batch(self) -> None:
+        """Send the messages of the last partial batch before the socket is closed."""
+        await self._flush_batch()
+        if self.batch_size_histogram:
+            self.info(
+                lambda: f"Push client batch sizes for {self.address}: {dict(sorted(self.batch_size_histogram.items()))}"
+            )
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import heapq
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from aiperf.common.constants import NANOS_PER_MILLIS, NANOS_PER_SECOND
+from aiperf.common.messages import Message
+from aiperf.common.types import MessageTypeT
+
+
+class PendingRequest:
+    """A request that is waiting for its response, which is either passed to a callback, or
+    set as the result of a future."""
+
+    __slots__ = (
+        "request_id",
+        "message_type",
+        "sent_ns",
+        "deadline_ns",
+        "callback",
+        "future",
+    )
+
+    def __init__(
+        self,
+        request_id: str,
+        message_type: MessageTypeT,
+        sent_ns: int,
+        deadline_ns: int | None,
+        callback: Callable[[Message], Coroutine[Any, Any, None]] | None = None,
+        future: asyncio.Future[Message] | None = None,
+    ) -> None:
+        self.request_id = request_id
+        self.message_type = message_type
+        self.sent_ns = sent_ns
+        self.deadline_ns = deadline_ns
+        self.callback = callback
+        self.future = future
+
+
+def latency_bucket_ms(latency_ns: int) -> int:
+    """The bucket of a request latency, which is the power of two in milliseconds that the latency is below."""
+    return 1 << (latency_ns // NANOS_PER_MILLIS).bit_length()
+
+
+class RequestMultiplexer:
+    """The table of the requests of a request client that are waiting for their responses.
+
+    Requests with a timeout are also added to a heap ordered by their deadline, so that expired
+    requests are evicted in O(log n) each, instead of staying in the table forever when their
+    response never arrives. Requests that complete before their deadline leave a stale entry in
+    the heap, which is skipped when it reaches the top, and the heap is rebuilt when the stale
+    entries outnumber the pending requests.
+
+    Responses that arrive for requests that are no longer pending are counted as late replies,
+    and the latency of every completed request is counted in a histogram per message type.
+    """
+
+    def __init__(self) -> None:
+        self.pending: dict[str, PendingRequest] = {}
+        self._deadline_heap: list[tuple[int, str]] = []
+        self.timeouts: int = 0
+        """The number of requests that did not receive a response before their deadline."""
+        self.late_replies: int = 0
+        """The number of responses received for requests that were not pending, such as after their deadline."""
+        self.latency_histograms: dict[MessageTypeT, Counter[int]] = {}
+        """The number of completed requests per message type, by their latency bucket in milliseconds.
+        see :func:`latency_bucket_ms` for more details."""
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(
+        self,
+        request_id: str,
+        message_type: MessageTypeT,
+        timeout: float | None,
+        callback: Callable[[Message], Coroutine[Any, Any, None]] | None = None,
+        future: asyncio.Future[Message] | None = None,
+    ) -> PendingRequest:
+        """Add a pending request, which expires after timeout seconds, or never if timeout is None."""
+        sent_ns = time.perf_counter_ns()
+        deadline_ns = (
+            sent_ns + int(timeout * NANOS_PER_SECOND) if timeout is not None else None
+        )
+        request = PendingRequest(
+            request_id, message_type, sent_ns, deadline_ns, callback, future
+        )
+        self.pending[request_id] = request
+        if deadline_ns is not None:
+            heapq.heappush(self._deadline_heap, (deadline_ns, request_id))
+            if len(self._deadline_heap) > 2 * len(self.pending) + 1024:
+                self._rebuild_heap()
+        return request
+
+    def complete(self, request_id: str | None) -> PendingRequest | None:
+        """Remove the request that a response was received for, and record its latency. Returns
+        None if the request is not pending, in which case the response is a late reply."""
+        request = self.pending.pop(request_id, None) if request_id else None
+        if request is None:
+            self.late_replies += 1
+            return None
+
+        latency_ns = time.perf_counter_ns() - request.sent_ns
+        histogram = self.latency_histograms.setdefault(request.message_type, Counter())
+        histogram[latency_bucket_ms(latency_ns)] += 1
+        return request
+
+    def expire(self, request_id: str) -> PendingRequest | None:
+        """Remove a request that timed out before its deadline was evicted, such as when the caller
+        stops waiting for it. Returns None if the request is not pending."""
+        request = self.pending.pop(request_id, None)
+        if request is not None:
+            self.timeouts += 1
+        return request
+
+    def cancel(self, request_id: str) -> PendingRequest | None:
+        """Remove a request that will not receive a response, such as when it failed to send, without
+        counting it as a timeout. Returns None if the request is not pending."""
+        return self.pending.pop(request_id, None)
+
+    def evict_expired(self) -> list[PendingRequest]:
+        """Remove and return the pending requests whose deadline has passed."""
+        now_ns = time.perf_counter_ns()
+        expired: list[PendingRequest] = []
+        while self._deadline_heap and self._deadline_heap[0][0] <= now_ns:
+            deadline_ns, request_id = heapq.heappop(self._deadline_heap)
+            request = self.pending.get(request_id)
+            # Skip the stale entries of requests that already completed
+            if request is not None and request.deadline_ns == deadline_ns:
+                del self.pending[request_id]
+                expired.append(request)
+        self.timeouts += len(expired)
+        return expired
+
+    def _rebuild_heap(self) -> None:
+        """Rebuild the heap from the pending requests, dropping the stale entries."""
+        self._deadline_heap = [
+            (request.deadline_ns, request_id)
+            for request_id, request in self.pending.items()
+            if request.deadline_ns is not None
+        ]
+        heapq.heapify(self._deadline_heap)
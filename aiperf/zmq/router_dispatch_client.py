@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import zmq.asyncio
+
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import CommClientType
+from aiperf.common.exceptions import CommunicationError
+from aiperf.common.factories import CommunicationClientFactory
+from aiperf.common.hooks import background_task
+from aiperf.common.messages import Message
+from aiperf.common.protocols import DispatchClientProtocol
+from aiperf.common.types import MessageTypeT
+from aiperf.common.utils import yield_to_event_loop
+from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import decode_message_frames, encode_message_frames
+
+
+@implements_protocol(DispatchClientProtocol)
+@CommunicationClientFactory.register(CommClientType.DISPATCH)
+class ZMQRouterDispatchClient(BaseZMQClient):
+    """
+    ZMQ ROUTER socket client for dispatching work to specific DEALER targets.
+
+    Unlike PUSH/PULL, which round-robins messages blindly, the ROUTER socket lets the
+    caller choose which target receives each message. Targets identify themselves using
+    their ZMQ routing ID (see :class:`ZMQDealerDispatchTargetClient`), and can send messages
+    back to the dispatcher, such as advertising their capacity.
+
+    ASCII Diagram:
+    ┌──────────────┐                    ┌──────────────┐
+    │              │───── Work ────────>│    DEALER    │
+    │              │<──── Capacity ─────│  (Target 1)  │
+    │    ROUTER    │                    └──────────────┘
+    │ (Dispatcher) │                    ┌──────────────┐
+    │              │───── Work ────────>│    DEALER    │
+    │              │<──── Capacity ─────│  (Target 2)  │
+    └──────────────┘                    └──────────────┘
+
+    Usage Pattern:
+    - The dispatcher decides which target receives each message (One-to-Many)
+    - Sending to an unknown or disconnected target raises a CommunicationError
+    - Messages from targets are delivered to the registered receive callbacks
+    """
+
+    def __init__(
+        self,
+        address: str,
+        bind: bool,
+        socket_ops: dict | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the ZMQ Router (Dispatch) client class.
+
+        Args:
+            address (str): The address to bind or connect to.
+            bind (bool): Whether to bind or connect the socket.
+            socket_ops (dict, optional): Additional socket options to set.
+        """
+        super().__init__(zmq.SocketType.ROUTER, address, bind, socket_ops, **kwargs)
+        # Raise an error instead of silently dropping messages for unknown targets
+        self.socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
+        self._receive_callbacks: dict[
+            MessageTypeT, Callable[[Message], Coroutine[Any, Any, None]]
+        ] = {}
+
+    def register_receive_callback(
+        self,
+        message_type: MessageTypeT,
+        callback: Callable[[Message], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Register a callback for messages of the given type received from any target.
+
+        Note that only one callback can be registered for a given message type.
+        """
+        if message_type in self._receive_callbacks:
+            raise ValueError(
+                f"Callback already registered for message type {message_type}"
+            )
+        self._receive_callbacks[message_type] = callback
+
+    async def send_to(self, target_id: str, message: Message) -> None:
+        """Send a message to the target with the given ID.
+
+        Raises:
+            CommunicationError: If the target is not connected, or the message could not be sent.
+        """
+        await self._check_initialized()
+
+        try:
+            await self.socket.send_multipart(
+                [target_id.encode(), *encode_message_frames(message)], copy=False
+            )
+            self.trace(lambda: f"Sent message to {target_id}: {message}")
+        except zmq.ZMQError as e:
+            if e.errno == zmq.EHOSTUNREACH:
+                raise CommunicationError(
+                    f"Dispatch target {target_id} is not connected"
+                ) from e
+            raise CommunicationError(
+                f"Failed to send message to {target_id}: {e}"
+            ) from e
+
+    @background_task(immediate=True, interval=None)
+    async def _dispatch_receiver(self) -> None:
+        """Background task for receiving messages from the dispatch targets."""
+        while not self.stop_requested:
+            try:
+                message = decode_message_frames(
+                    await self.socket.recv_multipart(copy=False)
+                )
+                if message.message_type in self._receive_callbacks:
+                    self.execute_async(
+                        self._receive_callbacks[message.message_type](message)
+                    )
+                else:
+                    self.warning(
+                        lambda message_type=message.message_type: f"Message received for message type {message_type} without callback"
+                    )
+            except zmq.Again:
+                self.debug("Router dispatch client receiver task timed out")
+                await yield_to_event_loop()
+            except (asyncio.CancelledError, zmq.ContextTerminated):
+                self.debug("Router dispatch client receiver task cancelled")
+                break
+            except Exception as e:
+                self.exception(f"Exception receiving message from dispatch target: {e}")
+                await yield_to_event_loop()
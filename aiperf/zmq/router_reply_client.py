@@ -16,6 +16,7 @@ from aiperf.common.protocols import ReplyClientProtocol
 from aiperf.common.types import MessageTypeT
 from aiperf.common.utils import yield_to_event_loop
 from aiperf.zmq.zmq_base_client import BaseZMQClient
+from aiperf.zmq.zmq_frames import decode_message_frames, encode_message_frames
 
 
 @implements_protocol(ReplyClientProtocol)
@@ -162,7 +163,7 @@ class ZMQRouterReplyClient(BaseZMQClient):
 
             # Send the response back to the client.
             await self.socket.send_multipart(
-                [*routing_envelope, response.model_dump_json().encode()]
+                [*routing_envelope, *encode_message_frames(response)], copy=False
             )
         except Exception as e:
             self.exception(
@@ -183,17 +184,17 @@ class ZMQRouterReplyClient(BaseZMQClient):
             try:
                 # Receive request
                 try:
-                    data = await self.socket.recv_multipart()
-                    self.trace(lambda msg=data: f"Received request: {msg}")
-
-                    request = Message.from_json(data[-1])
+                    data = await self.socket.recv_multipart(copy=False)
+                    request = decode_message_frames(data)
+                    self.trace(lambda msg=request: f"Received request: {msg}")
                     if not request.request_id:
-                        self.exception(f"Request ID is missing from request: {data}")
+                        self.exception(f"Request ID is missing from request: {request}")
                         continue
 
+                    # Everything before the header and body frames is the routing envelope
                     routing_envelope: tuple[bytes, ...] = (
-                        tuple(data[:-1])
-                        if len(data) > 1
+                        tuple(frame.bytes for frame in data[:-2])
+                        if len(data) > 2
                         else (request.request_id.encode(),)
                     )
                 except zmq.Again:
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+from aiperf.common.constants import (
+    DEFAULT_SHM_RING_MAX_POLL_INTERVAL,
+    DEFAULT_SHM_RING_MIN_POLL_INTERVAL,
+)
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import CommClientType, MessageType
+from aiperf.common.factories import CommunicationClientFactory
+from aiperf.common.messages import Message, SharedMemoryRingMessage
+from aiperf.common.protocols import PullClientProtocol
+from aiperf.zmq.pull_client import ZMQPullClient
+from aiperf.zmq.shm_ring import SharedMemoryRing
+
+
+@implements_protocol(PullClientProtocol)
+@CommunicationClientFactory.register(CommClientType.SHM_PULL)
+class ZMQSharedMemoryPullClient(ZMQPullClient):
+    """
+    PULL client which receives messages both over the socket, and from the shared memory
+    rings of the :class:`ZMQSharedMemoryPushClient` instances that push to it.
+
+    When a push client sends the name of its ring over the socket, the pull client attaches
+    to the ring and polls it for messages, once the push client has handed it over. The polling interval backs off while the ring is
+    idle, and resets as soon as a message is read. The ring is closed once its push client
+    has closed it and the remaining messages have been read.
+
+    The messages from the rings are processed in the same way as those from the socket, and
+    are bounded by the same maximum concurrency.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        bind: bool,
+        socket_ops: dict | None = None,
+        max_pull_concurrency: int | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the ZMQ Shared Memory Pull client class.
+
+        Args:
+            address (str): The address to bind or connect to.
+            bind (bool): Whether to bind or connect the socket.
+            socket_ops (dict, optional): Additional socket options to set.
+            max_pull_concurrency (int, optional): The maximum number of concurrent requests to allow.
+        """
+        super().__init__(address, bind, socket_ops, max_pull_concurrency, **kwargs)
+        self.register_pull_callback(MessageType.SHARED_MEMORY_RING, self._attach_ring)
+
+    async def _attach_ring(self, message: SharedMemoryRingMessage) -> None:
+        """Attach to the shared memory ring of a push client, and start reading from it."""
+        try:
+            ring = SharedMemoryRing.attach(message.ring_name)
+        except OSError as e:
+            # The push client has already closed the ring
+            self.warning(
+                f"Unable to attach to shared memory ring {message.ring_name}: {e!r}"
+            )
+            return
+        ring.mark_attached()
+        self.debug(lambda: f"Attached to shared memory ring {ring.name}")
+        self.execute_async(self._ring_reader(ring))
+
+    async def _ring_reader(self, ring: SharedMemoryRing) -> None:
+        """Read the messages from a shared memory ring until it is closed by its push client."""
+        poll_interval = DEFAULT_SHM_RING_MIN_POLL_INTERVAL
+        try:
+            while not self.stop_requested:
+                accepted = ring.reader_accepted
+                if accepted is False:
+                    # The push client has taken back its messages to send them over the socket
+                    break
+                if accepted is None:
+                    await asyncio.sleep(poll_interval)
+                    continue
+
+                # Check whether the ring is closed before reading, so no message is missed
+                writer_closed = ring.writer_closed
+                frames = ring.read()
+                for frame in frames:
+                    message = Message.from_json(frame)
+                    await self.semaphore.acquire()
+                    self.messages_received += 1
+                    self.messages_in_flight += 1
+                    self.execute_async(self._process_message(message))
+
+                if frames:
+                    poll_interval = DEFAULT_SHM_RING_MIN_POLL_INTERVAL
+                elif writer_closed:
+                    break
+                else:
+                    await asyncio.sleep(poll_interval)
+                    poll_interval = min(
+                        poll_interval * 2, DEFAULT_SHM_RING_MAX_POLL_INTERVAL
+                    )
+        finally:
+            ring.close()
+            self.debug(lambda: f"Closed shared memory ring {ring.name}")
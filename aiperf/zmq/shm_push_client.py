@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+from aiperf.common.constants import (
+    DEFAULT_SHM_RING_CAPACITY,
+    DEFAULT_SHM_RING_MAX_POLL_INTERVAL,
+    DEFAULT_SHM_RING_MIN_POLL_INTERVAL,
+)
+from aiperf.common.decorators import implements_protocol
+from aiperf.common.enums import CommClientType
+from aiperf.common.factories import CommunicationClientFactory
+from aiperf.common.hooks import on_stop
+from aiperf.common.messages import Message, SharedMemoryRingMessage
+from aiperf.common.protocols import PushClientProtocol
+from aiperf.zmq.push_client import ZMQPushClient
+from aiperf.zmq.shm_ring import SharedMemoryRing
+
+
+@implements_protocol(PushClientProtocol)
+@CommunicationClientFactory.register(CommClientType.SHM_PUSH)
+class ZMQSharedMemoryPushClient(ZMQPushClient):
+    """
+    PUSH client which writes its messages to a shared memory ring, for a co-located
+    :class:`ZMQSharedMemoryPullClient` to read, instead of sending them over the socket.
+
+    The ring is created on the first push, and its name is sent to the pull client over the
+    socket, which then attaches to it. This avoids the socket copies and syscalls of every
+    message. Any message that does not fit in the free space of the ring is sent over the
+    socket instead, so a slow pull client never blocks the push client. As such, the messages
+    are not guaranteed to be received in order, which is already the case across push clients.
+
+    The ring is handed over to the pull client once it has attached. If the push client stops
+    before that, it takes back the messages of the ring and sends them over the socket instead.
+    If the shared memory cannot be created, all messages are sent over the socket.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        bind: bool,
+        socket_ops: dict | None = None,
+        ring_capacity: int = DEFAULT_SHM_RING_CAPACITY,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the ZMQ Shared Memory Push client class.
+
+        Args:
+            address (str): The address to bind or connect to.
+            bind (bool): Whether to bind or connect the socket.
+            socket_ops (dict, optional): Additional socket options to set.
+            ring_capacity (int, optional): The capacity of the shared memory ring in bytes.
+        """
+        super().__init__(address, bind, socket_ops, **kwargs)
+        self.ring_capacity = ring_capacity
+        self.ring: SharedMemoryRing | None = None
+        self._ring_unavailable = False
+
+    async def push(self, message: Message) -> None:
+        """Push data to a target, over the shared memory ring if possible.
+
+        Args:
+            message: Message to be sent must be a Message object
+        """
+        await self._check_initialized()
+
+        if self.ring is None and not self._ring_unavailable:
+            await self._create_ring()
+
+        if self.ring is not None and self.ring.write(message.to_json_bytes()):
+            self.messages_sent += 1
+            return
+        await self._push_message(message)
+
+    async def _create_ring(self) -> None:
+        """Create the shared memory ring, and send its name to the pull client."""
+        try:
+            self.ring = SharedMemoryRing.create(self.ring_capacity)
+        except OSError as e:
+            self._ring_unavailable = True
+            self.warning(
+                f"Unable to create a shared memory ring, sending all messages over ZMQ: {e!r}"
+            )
+            return
+
+        self.debug(lambda: f"Created shared memory ring {self.ring.name}")  # type: ignore[union-attr]
+        await self._push_message(
+            SharedMemoryRingMessage(service_id=self.client_id, ring_name=self.ring.name)
+        )
+        self.execute_async(self._accept_reader(self.ring))
+
+    async def _accept_reader(self, ring: SharedMemoryRing) -> None:
+        """Hand the ring over to the pull client once it has attached."""
+        poll_interval = DEFAULT_SHM_RING_MIN_POLL_INTERVAL
+        while not self.stop_requested and not ring.accept_reader():
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, DEFAULT_SHM_RING_MAX_POLL_INTERVAL)
+
+    @on_stop
+    async def _close_ring(self) -> None:
+        """Close and unlink the shared memory ring. If it was never handed over to the pull client,
+        its unread messages are sent over the socket instead, before the socket is closed."""
+        if self.ring is None:
+            return
+        if not self.ring.accept_reader():
+            frames = self.ring.reclaim()
+            if frames:
+                self.warning(
+                    f"The pull client never attached to shared memory ring {self.ring.name}, "
+                    f"sending its {len(frames)} unread messages over ZMQ"
+                )
+            for frame in frames:
+                await self._push_message(Message.from_json(frame))
+        self.ring.close()
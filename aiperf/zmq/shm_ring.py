@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import struct
+import uuid
+from multiprocessing.shared_memory import SharedMemory
+
+_HEADER = struct.Struct("<QQQQQ")
+"""The header of the ring: the write position, the read position, whether the writer is closed, whether a
+reader has attached, and whether the writer has handed the ring over to the reader."""
+
+_UINT64 = struct.Struct("<Q")
+_READ_POS_OFFSET = 8
+_CLOSED_OFFSET = 16
+_ATTACHED_OFFSET = 24
+_HANDOFF_OFFSET = 32
+
+_HANDOFF_PENDING = 0
+_HANDOFF_ACCEPTED = 1
+_HANDOFF_REFUSED = 2
+
+_FRAME_LENGTH = struct.Struct("<I")
+"""Each frame is prefixed with its length."""
+
+_WRAP_MARKER = 0xFFFFFFFF
+"""Written in place of a frame length, when the next frame does not fit before the end of the ring."""
+
+
+class SharedMemoryRing:
+    """A single producer, single consumer ring buffer of binary frames in shared memory.
+
+    The write and read positions only ever increase, and are each updated by one side only, so no lock
+    is needed. The writer copies a frame into the ring before it publishes the new write position, and
+    the reader copies the frames out before it publishes the new read position. This relies on the
+    8-byte aligned stores of the positions being atomic and not being reordered with the stores of the
+    frames, which only holds on x86-64. As such, the rings are only enabled there.
+
+    The reader only reads from the ring once the writer has accepted it. Until then, the writer may
+    instead refuse the reader and read the frames back itself, such as when it closes before any reader
+    has attached. Only the writer decides, so the frames are never read by both.
+
+    A frame is never split across the end of the ring. If it does not fit in the remaining space, the
+    writer skips to the start of the ring, marking the skipped space with a wrap marker if there is room
+    for one.
+    """
+
+    __slots__ = ("shm", "capacity", "_buf", "_owner")
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        self.shm = shm
+        self.capacity = shm.size - _HEADER.size
+        self._buf = shm.buf
+        self._owner = owner
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedMemoryRing":
+        """Create a new ring, owned by the writer."""
+        shm = SharedMemory(
+            name=f"aiperf_{uuid.uuid4().hex[:16]}",
+            create=True,
+            size=_HEADER.size + capacity,
+        )
+        _HEADER.pack_into(shm.buf, 0, 0, 0, 0, 0, _HANDOFF_PENDING)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        """Attach to the ring created by a writer in another process."""
+        # NOTE: This registers the ring with the resource tracker again, which is a no-op, as the services
+        # share the resource tracker of the process that spawned them. The writer unregisters it on unlink.
+        return cls(SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def reader_attached(self) -> bool:
+        """Whether a reader has attached to the ring."""
+        return bool(_UINT64.unpack_from(self._buf, _ATTACHED_OFFSET)[0])
+
+    @property
+    def reader_accepted(self) -> bool | None:
+        """Whether the writer has accepted the reader, or None if it has not decided yet."""
+        handoff = _UINT64.unpack_from(self._buf, _HANDOFF_OFFSET)[0]
+        return None if handoff == _HANDOFF_PENDING else handoff == _HANDOFF_ACCEPTED
+
+    def mark_attached(self) -> None:
+        """Tell the writer that a reader has attached to the ring. Called by the reader."""
+        _UINT64.pack_into(self._buf, _ATTACHED_OFFSET, 1)
+
+    def accept_reader(self) -> bool:
+        """Hand the ring over to the reader, if one has attached. Called by the writer.
+        Returns whether the reader is accepted."""
+        if (accepted := self.reader_accepted) is not None:
+            return accepted
+        if not self.reader_attached:
+            return False
+        _UINT64.pack_into(self._buf, _HANDOFF_OFFSET, _HANDOFF_ACCEPTED)
+        return True
+
+    def reclaim(self) -> list[bytes]:
+        """Refuse the reader and read back the unread frames. Called by the writer, before the reader is accepted."""
+        if self.reader_accepted:
+            raise RuntimeError(
+                f"Unable to reclaim shared memory ring {self.name}, as its reader was accepted"
+            )
+        _UINT64.pack_into(self._buf, _HANDOFF_OFFSET, _HANDOFF_REFUSED)
+        return self.read()
+
+    @property
+    def writer_closed(self) -> bool:
+        """Whether the writer has closed the ring, and will not write to it anymore."""
+        return bool(_UINT64.unpack_from(self._buf, _CLOSED_OFFSET)[0])
+
+    def write(self, frame: bytes) -> bool:
+        """Write a frame to the ring. Returns False if there is not enough free space for it."""
+        write_pos, read_pos, *_ = _HEADER.unpack_from(self._buf, 0)
+        size = _FRAME_LENGTH.size + len(frame)
+        offset = write_pos % self.capacity
+        remaining = self.capacity - offset
+        padding = remaining if size > remaining else 0
+        if padding + size > self.capacity - (write_pos - read_pos):
+            return False
+
+        if padding:
+            if remaining >= _FRAME_LENGTH.size:
+                _FRAME_LENGTH.pack_into(self._buf, _HEADER.size + offset, _WRAP_MARKER)
+            write_pos += padding
+            offset = 0
+
+        start = _HEADER.size + offset
+        _FRAME_LENGTH.pack_into(self._buf, start, len(frame))
+        start += _FRAME_LENGTH.size
+        self._buf[start : start + len(frame)] = frame
+        # Publish the frame to the reader
+        _UINT64.pack_into(self._buf, 0, write_pos + size)
+        return True
+
+    def read(self) -> list[bytes]:
+        """Read all of the frames that have been written to the ring since the last read."""
+        write_pos, read_pos, *_ = _HEADER.unpack_from(self._buf, 0)
+        frames = []
+        while read_pos < write_pos:
+            offset = read_pos % self.capacity
+            remaining = self.capacity - offset
+            if remaining < _FRAME_LENGTH.size:
+                read_pos += remaining
+                continue
+            start = _HEADER.size + offset
+            (length,) = _FRAME_LENGTH.unpack_from(self._buf, start)
+            if length == _WRAP_MARKER:
+                read_pos += remaining
+                continue
+            start += _FRAME_LENGTH.size
+            frames.append(bytes(self._buf[start : start + length]))
+            read_pos += _FRAME_LENGTH.size + length
+        # Release the space of the frames to the writer
+        _UINT64.pack_into(self._buf, _READ_POS_OFFSET, read_pos)
+        return frames
+
+    def close(self) -> None:
+        """Close the ring. When closed by the writer, the reader is notified and the ring is unlinked,
+        although the reader can still read the remaining frames until it closes the ring as well."""
+        if self._buf is None:
+            return
+        if self._owner:
+            _UINT64.pack_into(self._buf, _CLOSED_OFFSET, 1)
+        self._buf = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
@@ -30,6 +30,7 @@ class BaseZMQClient(AIPerfLifecycleMixin):
         bind: bool,
         socket_ops: dict | None = None,
         client_id: str | None = None,
+        channel: str | None = None,
         **kwargs,
     ) -> None:
         """
@@ -40,6 +41,8 @@ class BaseZMQClient(AIPerfLifecycleMixin):
             bind (bool): Whether to BIND or CONNECT the socket.
             socket_type (SocketType): The type of ZMQ socket (eg. PUB, SUB, ROUTER, DEALER, etc.).
             socket_ops (dict, optional): Additional socket options to set.
+            client_id (str, optional): The ID of the client. Generated if not provided.
+            channel (str, optional): The name of the channel of the client, for its stats. Defaults to the address.
         """
         self.context: zmq.asyncio.Context = zmq.asyncio.Context.instance()
         self.socket_type: zmq.SocketType = socket_type
@@ -47,6 +50,7 @@ class BaseZMQClient(AIPerfLifecycleMixin):
         self.address: str = address
         self.bind: bool = bind
         self.socket_ops: dict = socket_ops or {}
+        self.channel: str = channel or address
         self.client_id: str = (
             client_id
             or f"{self.socket_type.name.lower()}_client_{uuid.uuid4().hex[:8]}"
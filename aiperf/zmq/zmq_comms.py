@@ -10,6 +10,7 @@ import zmq.asyncio
 
 from aiperf.common.base_comms import BaseCommunication
 from aiperf.common.config import BaseZMQCommunicationConfig, ZMQIPCConfig, ZMQTCPConfig
+from aiperf.common.constants import MICROS_PER_SECOND
 from aiperf.common.decorators import implements_protocol
 from aiperf.common.enums import (
     CommAddress,
@@ -21,8 +22,35 @@ from aiperf.common.exceptions import InvalidStateError
 from aiperf.common.factories import CommunicationClientFactory, CommunicationFactory
 from aiperf.common.hooks import on_stop
 from aiperf.common.mixins import AIPerfLoggerMixin
+from aiperf.common.models import CommClientStats
 from aiperf.common.protocols import CommunicationClientProtocol, CommunicationProtocol
 from aiperf.common.types import CommAddressType
+from aiperf.zmq.dealer_request_client import ZMQDealerRequestClient
+from aiperf.zmq.pull_client import ZMQPullClient
+from aiperf.zmq.push_client import ZMQPushClient
+
+SHARED_MEMORY_ADDRESSES = (CommAddress.RECORDS, CommAddress.CREDIT_RETURN)
+"""The push/pull channels which use shared memory rings when enabled. These are the high volume channels
+where the push clients connect directly to a single pull client, without going through a proxy."""
+
+SHARED_MEMORY_CLIENT_TYPES = {
+    CommClientType.PUSH: CommClientType.SHM_PUSH,
+    CommClientType.PULL: CommClientType.SHM_PULL,
+}
+"""The shared memory client types that replace the push and pull client types."""
+
+PUSH_BATCH_ADDRESSES = (
+    CommAddress.RECORDS,
+    CommAddress.RAW_INFERENCE_PROXY_FRONTEND,
+)
+"""The push channels which coalesce their messages into batches when enabled. Credit returns are
+excluded, as the timing manager waits for them before it can issue the next credits."""
+
+
+def get_channel_name(address: CommAddressType) -> str:
+    """Get the name of the channel of an address, for the stats of its clients. The frontend
+    and backend addresses of a proxy are the same channel."""
+    return str(address).removesuffix("_proxy_frontend").removesuffix("_proxy_backend")
 
 
 @implements_protocol(CommunicationProtocol)
@@ -71,6 +99,23 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
             socket_ops: Additional socket options to set.
             max_pull_concurrency: The maximum number of concurrent pull requests to allow. (Only used for pull clients)
         """
+        if (
+            self.config.shared_memory_enabled
+            and address in SHARED_MEMORY_ADDRESSES
+            and client_type in SHARED_MEMORY_CLIENT_TYPES
+        ):
+            client_type = SHARED_MEMORY_CLIENT_TYPES[client_type]
+
+        if (
+            self.config.push_batch_size
+            and client_type == CommClientType.PUSH
+            and address in PUSH_BATCH_ADDRESSES
+        ):
+            kwargs.setdefault("batch_size", self.config.push_batch_size)
+            kwargs.setdefault(
+                "batch_timeout", self.config.push_batch_timeout_us / MICROS_PER_SECOND
+            )
+
         if (client_type, address, bind) in self._clients_cache:
             return self._clients_cache[(client_type, address, bind)]
 
@@ -88,6 +133,7 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
             bind=bind,
             socket_ops=socket_ops,
             max_pull_concurrency=max_pull_concurrency,
+            channel=get_channel_name(address),
             **kwargs,
         )
 
@@ -95,6 +141,16 @@ class BaseZMQCommunication(BaseCommunication, AIPerfLoggerMixin, ABC):
         self.attach_child_lifecycle(client)
         return client
 
+    def get_client_stats(self) -> list[CommClientStats]:
+        """Get the message counters of the push, pull, and request clients."""
+        return [
+            client.get_stats()
+            for client in self._clients_cache.values()
+            if isinstance(
+                client, ZMQPushClient | ZMQPullClient | ZMQDealerRequestClient
+            )
+        ]
+
 
 @CommunicationFactory.register(CommunicationBackend.ZMQ_TCP)
 @implements_protocol(CommunicationProtocol)
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from collections.abc import Sequence
+
+import zmq
+
+from aiperf.common.messages import Message
+from aiperf.common.types import MessageTypeT
+
+HEADER_DELIMITER = b"|"
+"""The delimiter between the message type and the request ID in the header frame."""
+
+
+def encode_message_frames(message: Message) -> list[bytes]:
+    """Encode a message into a multipart ZMQ message of two frames.
+
+    The first frame is a small header with the message type and the request ID of the message,
+    so that the receiver can route it without parsing the body. The second frame is the JSON body
+    of the message, serialized directly to bytes. Send them with ``copy=False`` so that ZMQ can take
+    ownership of large bodies instead of copying them.
+    """
+    header = f"{message.message_type}|{message.request_id or ''}".encode()
+    return [header, message.to_json_bytes()]
+
+
+def decode_message_header(frame: bytes | zmq.Frame) -> tuple[MessageTypeT, str | None]:
+    """Decode the message type and request ID from the header frame of a multipart message."""
+    message_type, _, request_id = bytes(frame).partition(HEADER_DELIMITER)
+    return message_type.decode(), request_id.decode() or None
+
+
+def decode_message_frames(frames: Sequence[bytes | zmq.Frame]) -> Message:
+    """Decode a message from the last two frames of a multipart message, ignoring any routing
+    envelope frames before them. The frames can be the ``zmq.Frame`` objects received with
+    ``copy=False``, in which case the body is parsed in place without copying it."""
+    message_type, _ = decode_message_header(frames[-2])
+    return Message.from_json_with_type(message_type, memoryview(frames[-1]))
+
+
+def decode_message_batch(frames: Sequence[bytes | zmq.Frame]) -> list[Message]:
+    """Decode the messages of a multipart message that coalesces one or more messages, each as a
+    header frame followed by a body frame. Routing envelopes are not supported."""
+    return [decode_message_frames(frames[i : i + 2]) for i in range(0, len(frames), 2)]
@@ -46,6 +46,16 @@ class MockServerConfig(BaseSettings):
         ),
     ] = "0.0.0.0"
 
+    uds: Annotated[
+        str | None,
+        Field(
+            description="Path of a Unix domain socket to bind the server to, instead of the host and port",
+        ),
+        cyclopts.Parameter(
+            name=("--uds",),
+        ),
+    ] = None
+
     workers: Annotated[
         int,
         Field(
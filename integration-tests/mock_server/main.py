@@ -49,6 +49,7 @@ def main(
         "mock_server.app:app",
         host=config.host,
         port=config.port,
+        uds=config.uds,
         log_level=config.log_level.lower(),
         access_log=config.access_logs or config.log_level.lower() == "debug",
         workers=config.workers,
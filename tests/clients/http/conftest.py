@@ -102,7 +102,7 @@ def user_config() -> UserConfig:
     return UserConfig(
         endpoint=EndpointConfig(
             type=EndpointType.CHAT,
-            url="http://localhost:8000",
+            urls=["http://localhost:8000"],
             timeout_seconds=600,
             model_names=["gpt-4"],
             api_key="test-api-key",
@@ -11,6 +11,7 @@ import pytest
 
 from aiperf.clients.http.aiohttp_client import (
     AioHttpClientMixin,
+    UnixSocketConnector,
 )
 from aiperf.clients.model_endpoint_info import (
     EndpointInfo,
@@ -95,6 +96,29 @@ class TestAioHttpClientMixin:
             assert client.timeout.sock_read == expected_seconds
             assert client.timeout.ceil_threshold == expected_seconds
 
+    def test_separate_connect_timeout(self) -> None:
+        """Test that the connect timeout overrides the request timeout for connecting."""
+        with patch("aiperf.clients.http.aiohttp_client.create_tcp_connector"):
+            client = AioHttpClientMixin(
+                model_endpoint=ModelEndpointInfo(
+                    endpoint=EndpointInfo(
+                        type=EndpointType.CHAT,
+                        base_url="http://test.com",
+                        timeout=600.0,
+                        connect_timeout=5.0,
+                    ),
+                    models=ModelListInfo(
+                        models=[ModelInfo(name="gpt-4")],
+                        model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+                    ),
+                )
+            )
+
+            assert client.timeout.total == 600.0
+            assert client.timeout.connect == 5.0
+            assert client.timeout.sock_connect == 5.0
+            assert client.timeout.sock_read == 600.0
+
     async def test_cleanup_closes_connector(
         self, aiohttp_client: AioHttpClientMixin
     ) -> None:
@@ -237,6 +261,11 @@ class TestAioHttpClientMixin:
                 "Internal Server Error",
                 "ClientResponseError",
             ),
+            (
+                aiohttp.ConnectionTimeoutError,
+                "Connection timeout",
+                "ConnectTimeoutError",
+            ),
         ],
     )
     async def test_aiohttp_specific_exceptions(
@@ -402,3 +431,147 @@ class TestAioHttpClientMixin:
             mock_session.request.assert_called_once()
             call_args = mock_session.request.call_args
             assert call_args[1]["data"] == large_payload
+
+
+################################################################################
+# Test Connection Timing
+################################################################################
+
+
+async def _handle_keep_alive_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Respond to each keep-alive HTTP/1.1 request with a small JSON body."""
+    try:
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            content_length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    content_length = int(line.split(":", 1)[1])
+            await reader.readexactly(content_length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: 2\r\n\r\n{}"
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.mark.asyncio
+class TestAioHttpConnectionTiming:
+    """Test the connection timing captured with the aiohttp trace config, against a local server."""
+
+    async def test_new_and_reused_connection_timing(
+        self, aiohttp_client: AioHttpClientMixin
+    ) -> None:
+        server = await asyncio.start_server(
+            _handle_keep_alive_connection, "127.0.0.1", 0
+        )
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+        try:
+            first = await aiohttp_client.post_request(url, b"{}", {})
+            second = await aiohttp_client.post_request(url, b"{}", {})
+        finally:
+            server.close()
+
+        for record in (first, second):
+            assert record.error is None
+            timing = record.connection_timing
+            assert (
+                record.start_perf_ns
+                <= timing.connection_ready_perf_ns
+                <= timing.request_sent_perf_ns
+                <= timing.headers_received_perf_ns
+                <= record.end_perf_ns
+            )
+
+        assert not first.connection_timing.reused
+        assert first.connection_timing.connect_ns is not None
+        assert second.connection_timing.reused
+        assert second.connection_timing.connect_ns is None
+
+    async def test_unix_socket(self, tmp_path) -> None:
+        path = str(tmp_path / "server.sock")
+        server = await asyncio.start_unix_server(_handle_keep_alive_connection, path)
+        client = AioHttpClientMixin(
+            ModelEndpointInfo(
+                models=ModelListInfo(
+                    models=[ModelInfo(name="test-model")],
+                    model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+                ),
+                endpoint=EndpointInfo(
+                    type=EndpointType.CHAT,
+                    base_url="http://localhost",
+                    unix_socket_path=path,
+                ),
+            )
+        )
+        try:
+            assert isinstance(client.tcp_connector, UnixSocketConnector)
+            records = [
+                await client.post_request("http://localhost/v1/chat", b"{}", {})
+                for _ in range(2)
+            ]
+        finally:
+            await client.close()
+            server.close()
+
+        assert all(record.error is None for record in records)
+        assert records[0].responses[0].text == "{}"
+        assert not records[0].connection_timing.reused
+        assert records[1].connection_timing.reused
+
+    async def test_unix_socket_connection_refused(self, tmp_path) -> None:
+        client = AioHttpClientMixin(
+            ModelEndpointInfo(
+                models=ModelListInfo(
+                    models=[ModelInfo(name="test-model")],
+                    model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+                ),
+                endpoint=EndpointInfo(
+                    type=EndpointType.CHAT,
+                    base_url="http://localhost",
+                    unix_socket_path=str(tmp_path / "missing.sock"),
+                ),
+            )
+        )
+        try:
+            record = await client.post_request("http://localhost/", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is not None
+        assert record.error.type == "UnixClientConnectorError"
+
+    async def test_unix_socket_connect_timeout(self, tmp_path) -> None:
+        client = AioHttpClientMixin(
+            ModelEndpointInfo(
+                models=ModelListInfo(
+                    models=[ModelInfo(name="test-model")],
+                    model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+                ),
+                endpoint=EndpointInfo(
+                    type=EndpointType.CHAT,
+                    base_url="http://localhost",
+                    unix_socket_path=str(tmp_path / "server.sock"),
+                    connect_timeout=0.01,
+                ),
+            )
+        )
+
+        async def never_connect(sock):
+            await asyncio.Event().wait()
+
+        try:
+            with patch.object(
+                client.tcp_connector, "_connect_socket", side_effect=never_connect
+            ):
+                record = await client.post_request("http://localhost/", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is not None
+        assert record.error.type == "ConnectTimeoutError"
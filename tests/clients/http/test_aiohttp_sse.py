@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from aiperf.clients.http.aiohttp_client import AioHttpSSEStreamReader
+from aiperf.clients.http.stall_watchdog import StallWatchdog
 from aiperf.common.models import SSEMessage
 from tests.clients.http.conftest import (
     create_sse_chunk_list,
@@ -73,6 +74,49 @@ class TestAioHttpSSEStreamReader:
             assert all(isinstance(msg, SSEMessage) for msg in result)
             assert mock_parse.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_read_complete_stream_updates_watchdog(
+        self, mock_sse_response: Mock
+    ) -> None:
+        """Test that the arrival of each message is reported to the stall watchdog."""
+
+        async def mock_aiter():
+            yield ("data: Hello", 123456789)
+            yield ("data: World", 123456791)
+
+        watchdog = StallWatchdog(None, 1.0)
+        with patch.object(
+            AioHttpSSEStreamReader, "__aiter__", return_value=mock_aiter()
+        ):
+            reader = AioHttpSSEStreamReader(mock_sse_response, watchdog)
+            await reader.read_complete_stream()
+
+        assert watchdog.last_chunk_perf_ns == 123456791
+
+    @pytest.mark.asyncio
+    async def test_read_complete_stream_timing_only(
+        self,
+        mock_sse_response: Mock,
+        sample_sse_chunks: list[tuple[bytes, bytes]],
+        monkeypatch,
+    ) -> None:
+        """Test that only the final message keeps its content in timing-only mode."""
+        setup_sse_content_mock(mock_sse_response, sample_sse_chunks)
+        # The sample messages are plain text, which have no content as a chat completion
+        monkeypatch.setattr(
+            "aiperf.clients.http.timing_only.has_content", lambda message: True
+        )
+
+        reader = AioHttpSSEStreamReader(mock_sse_response, timing_only=True)
+        messages = await reader.read_complete_stream()
+
+        assert len(messages) == 2
+        assert messages[0].packets == []
+        assert messages[1].extract_data_content() == "World"
+        assert reader.num_bytes == sum(
+            len(first_byte + rest) for first_byte, rest in sample_sse_chunks
+        )
+
     @pytest.mark.asyncio
     async def test_read_complete_stream_empty(self, mock_sse_response: Mock) -> None:
         """Test reading empty SSE stream."""
@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the HTTP/2 client, using a local HTTP/2 (h2c) mock server built on the h2 package."""
+
+import asyncio
+import subprocess
+import sys
+
+import orjson
+import pytest
+
+from aiperf.clients.http.http2_client import Http2Client
+from aiperf.clients.model_endpoint_info import (
+    EndpointInfo,
+    ModelEndpointInfo,
+    ModelInfo,
+    ModelListInfo,
+)
+from aiperf.common.enums import EndpointType, HttpClientType, ModelSelectionStrategy
+from aiperf.common.exceptions import InferenceClientError
+from aiperf.common.factories import HttpClientFactory
+from aiperf.common.models import SSEMessage, TextResponse
+from tests.conftest import real_sleep
+
+SSE_CHUNKS = [b"data: first\n\n", b"data: second\n\n", b"data: [DONE]\n\n"]
+
+
+class H2MockServerProtocol(asyncio.Protocol):
+    """A minimal HTTP/2 server, which responds to each request based on its path.
+
+    - /sse: an SSE stream of :data:`SSE_CHUNKS`, with a short delay between the chunks
+    - /error: a 500 error
+    - /stall: the first message of an SSE stream, which then stalls
+    - anything else: a JSON body, after a short delay
+    """
+
+    def __init__(self, stats: dict[str, int]) -> None:
+        import h2.config
+        import h2.connection
+
+        self.stats = stats
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.paths: dict[int, str] = {}
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.stats["connections"] += 1
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        import h2.events
+
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.paths[event.stream_id] = dict(event.headers)[":path"]
+            elif isinstance(event, h2.events.DataReceived):
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+        self.transport.write(self.conn.data_to_send())
+
+    def _send(self, stream_id: int, data: bytes, end_stream: bool = False) -> None:
+        self.conn.send_data(stream_id, data, end_stream=end_stream)
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id: int) -> None:
+        self.stats["active"] += 1
+        self.stats["max_active"] = max(self.stats["max_active"], self.stats["active"])
+        try:
+            path = self.paths.pop(stream_id)
+            if path == "/sse":
+                self.conn.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-type", "text/event-stream")],
+                )
+                for chunk in SSE_CHUNKS:
+                    await real_sleep(0.01)
+                    self._send(stream_id, chunk)
+                self._send(stream_id, b"", end_stream=True)
+            elif path == "/stall":
+                self.conn.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-type", "text/event-stream")],
+                )
+                self._send(stream_id, SSE_CHUNKS[0])
+                await real_sleep(10)
+            elif path == "/error":
+                self.conn.send_headers(stream_id, [(":status", "500")])
+                self._send(stream_id, b"boom", end_stream=True)
+            else:
+                await real_sleep(0.05)
+                self.conn.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-type", "application/json")],
+                )
+                self._send(stream_id, orjson.dumps({"path": path}), end_stream=True)
+        finally:
+            self.stats["active"] -= 1
+
+
+@pytest.fixture
+async def h2_server():
+    """Start a local HTTP/2 mock server, and yield its base URL and request stats."""
+    pytest.importorskip("h2")
+    stats = {"connections": 0, "active": 0, "max_active": 0}
+    server = await asyncio.get_running_loop().create_server(
+        lambda: H2MockServerProtocol(stats), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", stats
+    server.close()
+    await server.wait_closed()
+
+
+def _model_endpoint(http2_connections: int = 1, **kwargs) -> ModelEndpointInfo:
+    return ModelEndpointInfo(
+        models=ModelListInfo(
+            models=[ModelInfo(name="test-model")],
+            model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+        ),
+        endpoint=EndpointInfo(
+            type=EndpointType.CHAT,
+            http_client=HttpClientType.HTTP2,
+            http2_connections=http2_connections,
+            timeout=10.0,
+            **kwargs,
+        ),
+    )
+
+
+@pytest.fixture
+async def http2_client():
+    pytest.importorskip("h2")
+    client = Http2Client(_model_endpoint())
+    yield client
+    await client.close()
+
+
+class TestHttp2Client:
+    def test_registered_in_factory(self):
+        assert (
+            HttpClientFactory.get_class_from_type(HttpClientType.HTTP2) is Http2Client
+        )
+
+    @pytest.mark.parametrize("package", ["h2", "httpx"])
+    def test_missing_package_raises_helpful_error(self, monkeypatch, package):
+        monkeypatch.setitem(sys.modules, package, None)
+        with pytest.raises(InferenceClientError, match="pip install aiperf\\[http2\\]"):
+            Http2Client(_model_endpoint())
+
+    def test_import_does_not_require_httpx(self):
+        """The HTTP/2 client is always imported, so httpx must only be imported when it is created."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.modules['httpx'] = None; import aiperf.clients.http",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    @pytest.mark.asyncio
+    async def test_json_request(self, h2_server, http2_client):
+        url, _ = h2_server
+        record = await http2_client.post_request(f"{url}/v1/chat", b"{}", {})
+
+        assert record.error is None
+        assert record.status == 200
+        assert len(record.responses) == 1
+        assert isinstance(record.responses[0], TextResponse)
+        assert orjson.loads(record.responses[0].text) == {"path": "/v1/chat"}
+        assert record.responses[0].content_type == "application/json"
+        assert (
+            record.start_perf_ns
+            <= record.recv_start_perf_ns
+            <= record.responses[0].perf_ns
+            <= record.end_perf_ns
+        )
+
+    @pytest.mark.asyncio
+    async def test_sse_stream_timestamps_each_message(self, h2_server, http2_client):
+        url, _ = h2_server
+        record = await http2_client.post_request(f"{url}/sse", b"{}", {})
+
+        assert record.error is None
+        assert all(isinstance(r, SSEMessage) for r in record.responses)
+        assert [r.packets[0].value for r in record.responses] == [
+            "first",
+            "second",
+            "[DONE]",
+        ]
+        timestamps = [r.perf_ns for r in record.responses]
+        assert timestamps == sorted(timestamps)
+        assert len(set(timestamps)) == len(timestamps)
+        assert record.recv_start_perf_ns <= timestamps[0]
+        assert timestamps[-1] <= record.end_perf_ns
+
+    @pytest.mark.asyncio
+    async def test_http_error(self, h2_server, http2_client):
+        url, _ = h2_server
+        record = await http2_client.post_request(f"{url}/error", b"{}", {})
+
+        assert record.status == 500
+        assert record.error is not None
+        assert record.error.code == 500
+        assert record.error.message == "boom"
+
+    @pytest.mark.asyncio
+    async def test_connection_error(self, http2_client):
+        record = await http2_client.post_request("http://127.0.0.1:1/", b"{}", {})
+
+        assert record.error is not None
+        assert record.end_perf_ns is not None
+        assert http2_client.in_flight == [0]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_multiplexed(self, h2_server, http2_client):
+        url, stats = h2_server
+        records = await asyncio.gather(
+            *[http2_client.post_request(f"{url}/", b"{}", {}) for _ in range(10)]
+        )
+
+        assert all(record.error is None for record in records)
+        assert stats["connections"] == 1
+        assert stats["max_active"] > 1
+
+    @pytest.mark.asyncio
+    async def test_requests_spread_across_connections(self, h2_server):
+        pytest.importorskip("h2")
+        url, stats = h2_server
+        client = Http2Client(_model_endpoint(http2_connections=3))
+        try:
+            records = await asyncio.gather(
+                *[client.post_request(f"{url}/", b"{}", {}) for _ in range(9)]
+            )
+        finally:
+            await client.close()
+
+        assert all(record.error is None for record in records)
+        assert stats["connections"] == 3
+        assert client.in_flight == [0, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_connection_timing(self, h2_server, http2_client):
+        url, _ = h2_server
+        first = await http2_client.post_request(f"{url}/", b"{}", {})
+        second = await http2_client.post_request(f"{url}/", b"{}", {})
+
+        for record in (first, second):
+            timing = record.connection_timing
+            assert (
+                record.start_perf_ns
+                <= timing.connection_ready_perf_ns
+                <= timing.request_sent_perf_ns
+                <= timing.headers_received_perf_ns
+                <= record.end_perf_ns
+            )
+
+        assert not first.connection_timing.reused
+        assert first.connection_timing.connect_ns is not None
+        assert second.connection_timing.reused
+        assert second.connection_timing.connect_ns is None
+
+    @pytest.mark.asyncio
+    async def test_unix_socket(self, tmp_path):
+        pytest.importorskip("h2")
+        path = str(tmp_path / "server.sock")
+        stats = {"connections": 0, "active": 0, "max_active": 0}
+        server = await asyncio.get_running_loop().create_unix_server(
+            lambda: H2MockServerProtocol(stats), path
+        )
+        model_endpoint = _model_endpoint()
+        model_endpoint.endpoint.unix_socket_path = path
+        client = Http2Client(model_endpoint)
+        try:
+            record = await client.post_request("http://localhost/v1/chat", b"{}", {})
+        finally:
+            await client.close()
+            server.close()
+
+        assert record.error is None
+        assert orjson.loads(record.responses[0].text) == {"path": "/v1/chat"}
+        assert stats["connections"] == 1
+        assert record.connection_timing.connect_ns is not None
+
+    @pytest.mark.asyncio
+    async def test_first_token_timeout(self, h2_server):
+        pytest.importorskip("h2")
+        url, _ = h2_server
+        client = Http2Client(_model_endpoint(first_token_timeout=0.01))
+        try:
+            record = await client.post_request(f"{url}/", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error.type == "FirstTokenTimeoutError"
+        assert client.in_flight == [0]
+
+    @pytest.mark.asyncio
+    async def test_inter_chunk_timeout(self, h2_server):
+        pytest.importorskip("h2")
+        url, _ = h2_server
+        client = Http2Client(
+            _model_endpoint(first_token_timeout=5.0, inter_chunk_timeout=0.05)
+        )
+        try:
+            record = await client.post_request(f"{url}/stall", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error.type == "InterChunkTimeoutError"
+        assert client.in_flight == [0]
+
+    @pytest.mark.asyncio
+    async def test_timing_only_sse_stream(self, h2_server, monkeypatch):
+        pytest.importorskip("h2")
+        url, _ = h2_server
+        # The mock server sends plain text messages, which have no content as a chat completion
+        monkeypatch.setattr(
+            "aiperf.clients.http.timing_only.has_content", lambda message: True
+        )
+        client = Http2Client(_model_endpoint(timing_only=True))
+        try:
+            record = await client.post_request(f"{url}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert len(record.responses) == 2
+        assert record.responses[0].packets == []
+        assert record.responses[1].extract_data_content() == "second"
+        assert record.response_bytes == len(b"".join(SSE_CHUNKS))
@@ -0,0 +1,468 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the raw asyncio protocol HTTP/1.1 client."""
+
+import asyncio
+from unittest.mock import Mock
+
+import orjson
+import pytest
+
+from aiperf.clients.http.raw_client import RawHttpClient, RawHttpProtocol
+from aiperf.clients.model_endpoint_info import (
+    EndpointInfo,
+    ModelEndpointInfo,
+    ModelInfo,
+    ModelListInfo,
+)
+from aiperf.common.enums import EndpointType, HttpClientType, ModelSelectionStrategy
+from aiperf.common.factories import HttpClientFactory
+from aiperf.common.models import SSEMessage, TextResponse
+from tests.conftest import real_sleep
+
+SSE_RESPONSE_CHUNKS = [b"data: first\n\nda", b"ta: second\n\n", b"data: [DONE]\n\n"]
+
+
+def _chunked(data: bytes) -> bytes:
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, stats: dict
+) -> None:
+    """Serve keep-alive HTTP/1.1 requests, with a response based on the request path."""
+    stats["connections"] += 1
+    try:
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            request_line, *header_lines = head.decode().split("\r\n")
+            _, path, _ = request_line.split(" ")
+            headers = dict(line.split(": ", 1) for line in header_lines if ": " in line)
+            body = await reader.readexactly(int(headers.get("Content-Length", 0)))
+            stats["requests"].append((request_line, headers, body))
+
+            if path == "/sse":
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+                    b"Transfer-Encoding: chunked\r\n\r\n"
+                )
+                for chunk in SSE_RESPONSE_CHUNKS:
+                    await writer.drain()
+                    await real_sleep(0.01)
+                    writer.write(_chunked(chunk))
+                writer.write(b"0\r\n\r\n")
+            elif path == "/error":
+                writer.write(
+                    b"HTTP/1.1 500 Internal Server Error\r\nContent-Length: 4\r\n\r\nboom"
+                )
+            elif path == "/close":
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n\r\nbye")
+                await writer.drain()
+                break
+            elif path == "/hang":
+                await real_sleep(10)
+            elif path == "/stall":
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                    b"Transfer-Encoding: chunked\r\n\r\n"
+                    + _chunked(SSE_RESPONSE_CHUNKS[0])
+                )
+                await writer.drain()
+                await real_sleep(10)
+            else:
+                payload = orjson.dumps({"path": path})
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def http_server():
+    """Start a local HTTP/1.1 server, and yield its base URL and request stats."""
+    stats = {"connections": 0, "requests": []}
+    server = await asyncio.start_server(
+        lambda r, w: _handle_connection(r, w, stats), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", stats
+    server.close()
+
+
+def _model_endpoint(timeout: float = 10.0, **kwargs) -> ModelEndpointInfo:
+    return ModelEndpointInfo(
+        models=ModelListInfo(
+            models=[ModelInfo(name="test-model")],
+            model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+        ),
+        endpoint=EndpointInfo(
+            type=EndpointType.CHAT,
+            http_client=HttpClientType.RAW,
+            timeout=timeout,
+            **kwargs,
+        ),
+    )
+
+
+@pytest.fixture
+async def raw_client():
+    client = RawHttpClient(_model_endpoint())
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+class TestRawHttpProtocol:
+    """Test the incremental HTTP/1.1 response parser, feeding it bytes directly."""
+
+    def _protocol(self) -> RawHttpProtocol:
+        protocol = RawHttpProtocol()
+        protocol.connection_made(Mock())
+        return protocol
+
+    @pytest.mark.parametrize("split_size", [1, 3, 7, 1000])
+    async def test_chunked_sse_split_anywhere(self, split_size):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        raw = (
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+            + b"".join(_chunked(chunk) for chunk in SSE_RESPONSE_CHUNKS)
+            + b"0\r\n\r\n"
+        )
+        for i in range(0, len(raw), split_size):
+            protocol.data_received(raw[i : i + split_size])
+
+        assert response.done.done()
+        assert response.status == 200
+        assert [m.packets[0].value for m in response.sse_messages] == [
+            "first",
+            "second",
+            "[DONE]",
+        ]
+        assert protocol.response is None
+
+    async def test_content_length_body(self):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        protocol.data_received(b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhel")
+        assert not response.done.done()
+        protocol.data_received(b"lo")
+
+        assert response.done.done()
+        assert bytes(response.body) == b"hello"
+        assert response.keep_alive
+
+    async def test_timestamps_are_taken_on_arrival(self):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        protocol.data_received(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        protocol.data_received(_chunked(b"data: 1\n\n"))
+        protocol.data_received(_chunked(b"data: 2\n\n") + b"0\r\n\r\n")
+
+        first, second = response.sse_messages
+        assert response.headers_perf_ns < first.perf_ns < second.perf_ns
+        assert second.perf_ns == response.end_perf_ns
+
+    async def test_informational_response_is_skipped(self):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        protocol.data_received(
+            b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 204 No Content\r\n\r\n"
+        )
+
+        assert response.done.done()
+        assert response.status == 204
+
+    async def test_body_until_close(self):
+        protocol = self._protocol()
+        response = protocol.send_request("GET", b"request")
+        protocol.data_received(b"HTTP/1.1 200 OK\r\n\r\npartial ")
+        protocol.data_received(b"body")
+        assert not response.done.done()
+        protocol.connection_lost(None)
+
+        assert response.done.done()
+        assert bytes(response.body) == b"partial body"
+        assert not response.keep_alive
+
+    async def test_connection_lost_mid_response_fails(self):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        protocol.data_received(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc")
+        protocol.connection_lost(None)
+
+        with pytest.raises(ConnectionResetError):
+            await response.done
+        assert protocol.closed
+
+    async def test_invalid_chunk_fails(self):
+        protocol = self._protocol()
+        response = protocol.send_request("POST", b"request")
+        protocol.data_received(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n"
+        )
+
+        with pytest.raises(ValueError):
+            await response.done
+        assert protocol.closed
+
+
+@pytest.mark.asyncio
+class TestRawHttpClient:
+    async def test_registered_in_factory(self):
+        assert (
+            HttpClientFactory.get_class_from_type(HttpClientType.RAW) is RawHttpClient
+        )
+
+    async def test_json_request(self, http_server, raw_client):
+        url, stats = http_server
+        record = await raw_client.post_request(
+            f"{url}/v1/chat?x=1", b'{"a":1}', {"Authorization": "Bearer key"}
+        )
+
+        assert record.error is None
+        assert record.status == 200
+        assert isinstance(record.responses[0], TextResponse)
+        assert orjson.loads(record.responses[0].text) == {"path": "/v1/chat?x=1"}
+        assert record.responses[0].content_type == "application/json"
+        assert record.start_perf_ns <= record.recv_start_perf_ns <= record.end_perf_ns
+
+        request_line, headers, body = stats["requests"][0]
+        assert request_line == "POST /v1/chat?x=1 HTTP/1.1"
+        assert headers["Host"] == url.removeprefix("http://")
+        assert headers["Authorization"] == "Bearer key"
+        assert body == b'{"a":1}'
+
+    async def test_sse_stream(self, http_server, raw_client):
+        url, _ = http_server
+        record = await raw_client.post_request(f"{url}/sse", b"{}", {})
+
+        assert record.error is None
+        assert all(isinstance(r, SSEMessage) for r in record.responses)
+        assert [r.packets[0].value for r in record.responses] == [
+            "first",
+            "second",
+            "[DONE]",
+        ]
+        timestamps = [r.perf_ns for r in record.responses]
+        assert record.recv_start_perf_ns < timestamps[0]
+        # The second message started arriving in the same chunk as the first message
+        assert timestamps[0] == timestamps[1] < timestamps[2] <= record.end_perf_ns
+        assert record.coalesced_response_count == 1
+
+    async def test_connections_are_reused(self, http_server, raw_client):
+        url, stats = http_server
+        for _ in range(3):
+            record = await raw_client.get_request(f"{url}/", {})
+            assert record.error is None
+
+        assert stats["connections"] == 1
+
+    async def test_concurrent_requests_use_separate_connections(
+        self, http_server, raw_client
+    ):
+        url, stats = http_server
+        records = await asyncio.gather(
+            *[raw_client.post_request(f"{url}/sse", b"{}", {}) for _ in range(4)]
+        )
+
+        assert all(record.error is None for record in records)
+        assert stats["connections"] == 4
+
+    async def test_connection_close_response(self, http_server, raw_client):
+        url, stats = http_server
+        record = await raw_client.get_request(f"{url}/close", {})
+        assert record.error is None
+        assert record.responses[0].text == "bye"
+
+        record = await raw_client.get_request(f"{url}/", {})
+        assert record.error is None
+        assert stats["connections"] == 2
+
+    async def test_http_error(self, http_server, raw_client):
+        url, _ = http_server
+        record = await raw_client.post_request(f"{url}/error", b"{}", {})
+
+        assert record.status == 500
+        assert record.error.code == 500
+        assert record.error.type == "Internal Server Error"
+        assert record.error.message == "boom"
+
+    async def test_timeout(self, http_server):
+        url, _ = http_server
+        client = RawHttpClient(_model_endpoint(timeout=0.05))
+        try:
+            record = await client.post_request(f"{url}/hang", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is not None
+        assert record.error.type == "TimeoutError"
+        assert not client._connections
+
+    async def test_first_token_timeout(self, http_server):
+        url, _ = http_server
+        client = RawHttpClient(_model_endpoint(first_token_timeout=0.05))
+        try:
+            record = await client.post_request(f"{url}/hang", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error.type == "FirstTokenTimeoutError"
+        assert not client._connections
+
+    async def test_inter_chunk_timeout(self, http_server):
+        url, _ = http_server
+        client = RawHttpClient(
+            _model_endpoint(first_token_timeout=5.0, inter_chunk_timeout=0.05)
+        )
+        try:
+            record = await client.post_request(f"{url}/stall", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error.type == "InterChunkTimeoutError"
+        assert not client._connections
+
+    async def test_inter_chunk_timeout_allows_progressing_stream(self, http_server):
+        url, _ = http_server
+        client = RawHttpClient(_model_endpoint(inter_chunk_timeout=1.0))
+        try:
+            record = await client.post_request(f"{url}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert len(record.responses) == 3
+
+    async def test_connect_timeout(self, raw_client, monkeypatch):
+        async def hang(*args, **kwargs):
+            await real_sleep(10)
+
+        monkeypatch.setattr(raw_client, "_connect", hang)
+        raw_client.connect_timeout = 0.05
+        record = await raw_client.post_request("http://127.0.0.1:1/", b"{}", {})
+
+        assert record.error.type == "ConnectTimeoutError"
+
+    async def test_timing_only_sse_stream(self, http_server, monkeypatch):
+        url, _ = http_server
+        # The mock server sends plain text messages, which have no content as a chat completion
+        monkeypatch.setattr(
+            "aiperf.clients.http.timing_only.has_content", lambda message: True
+        )
+        client = RawHttpClient(_model_endpoint(timing_only=True))
+        try:
+            record = await client.post_request(f"{url}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        # The [DONE] message is dropped, and only the final message keeps its content
+        assert len(record.responses) == 2
+        assert record.responses[0].packets == []
+        assert record.responses[1].extract_data_content() == "second"
+        assert record.response_bytes == len(b"".join(SSE_RESPONSE_CHUNKS))
+
+    async def test_timing_only_json(self, http_server):
+        url, _ = http_server
+        client = RawHttpClient(_model_endpoint(timing_only=True))
+        try:
+            record = await client.post_request(f"{url}/", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert record.responses[0].text == ""
+        assert record.response_bytes == len(orjson.dumps({"path": "/"}))
+
+    async def test_connection_refused(self, raw_client):
+        record = await raw_client.post_request("http://127.0.0.1:1/", b"{}", {})
+
+        assert record.error is not None
+        assert record.end_perf_ns is not None
+
+    async def test_open_connections_without_request(self, http_server, raw_client):
+        url, stats = http_server
+        records = await raw_client.open_connections(
+            f"{url}/", {}, 3, send_request=False
+        )
+
+        assert len(records) == 3
+        assert all(record.error is None for record in records)
+        assert all(record.end_perf_ns >= record.start_perf_ns for record in records)
+        assert stats["connections"] == 3
+        assert not stats["requests"]
+
+        # The pre-warmed connections are reused by the following requests
+        await asyncio.gather(*[raw_client.get_request(f"{url}/", {}) for _ in range(3)])
+        assert stats["connections"] == 3
+
+    async def test_open_connections_with_request(self, http_server, raw_client):
+        url, stats = http_server
+        records = await raw_client.open_connections(f"{url}/v1/models", {}, 2)
+
+        assert [record.status for record in records] == [200, 200]
+        assert stats["connections"] == 2
+        assert [request[0] for request in stats["requests"]] == [
+            "GET /v1/models HTTP/1.1"
+        ] * 2
+
+    async def test_connection_timing(self, http_server, raw_client):
+        url, _ = http_server
+        first = await raw_client.post_request(f"{url}/", b"{}", {})
+        second = await raw_client.post_request(f"{url}/", b"{}", {})
+
+        for record in (first, second):
+            timing = record.connection_timing
+            assert (
+                record.start_perf_ns
+                <= timing.connection_ready_perf_ns
+                <= timing.request_sent_perf_ns
+                <= timing.headers_received_perf_ns
+                <= record.end_perf_ns
+            )
+
+        assert not first.connection_timing.reused
+        assert first.connection_timing.dns_ns is not None
+        assert first.connection_timing.connect_ns is not None
+        assert first.connection_timing.tls_ns is None
+        assert second.connection_timing.reused
+        assert second.connection_timing.connect_ns is None
+
+    async def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "server.sock")
+        stats = {"connections": 0, "requests": []}
+        server = await asyncio.start_unix_server(
+            lambda r, w: _handle_connection(r, w, stats), path
+        )
+        model_endpoint = _model_endpoint()
+        model_endpoint.endpoint.unix_socket_path = path
+        client = RawHttpClient(model_endpoint)
+        try:
+            records = [
+                await client.post_request("http://localhost/sse", b"{}", {})
+                for _ in range(2)
+            ]
+        finally:
+            await client.close()
+            server.close()
+
+        assert all(record.error is None for record in records)
+        assert [r.packets[0].value for r in records[0].responses] == [
+            "first",
+            "second",
+            "[DONE]",
+        ]
+        assert stats["connections"] == 1
+        assert records[0].connection_timing.dns_ns is None
+        assert records[1].connection_timing.reused
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for timestamping the SSE messages of the aiohttp client with the socket reads they arrived in."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from aiperf.clients.http.aiohttp_client import (
+    AioHttpClient,
+    ReadTimestampingResponseHandler,
+    SocketReadLog,
+    create_tcp_connector,
+    enable_socket_read_timestamps,
+    supports_socket_read_timestamps,
+)
+from aiperf.clients.model_endpoint_info import (
+    EndpointInfo,
+    ModelEndpointInfo,
+    ModelInfo,
+    ModelListInfo,
+)
+from aiperf.common.enums import EndpointType, ModelSelectionStrategy
+from tests.conftest import real_sleep
+
+
+def _chunked(data: bytes) -> bytes:
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+
+async def _handle_sse_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Respond with an SSE stream whose first two messages are sent in a single write."""
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n"
+    )
+    await writer.drain()
+    await real_sleep(0.02)
+    writer.write(_chunked(b"data: first\n\ndata: second\n\n"))
+    await writer.drain()
+    await real_sleep(0.02)
+    writer.write(_chunked(b"data: third\n\n") + b"0\r\n\r\n")
+    await writer.drain()
+    writer.close()
+
+
+@pytest.fixture
+async def sse_server():
+    server = await asyncio.start_server(_handle_sse_request, "127.0.0.1", 0)
+    yield f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    server.close()
+
+
+def _model_endpoint(socket_read_timestamps: bool) -> ModelEndpointInfo:
+    return ModelEndpointInfo(
+        models=ModelListInfo(
+            models=[ModelInfo(name="test-model")],
+            model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+        ),
+        endpoint=EndpointInfo(
+            type=EndpointType.CHAT,
+            socket_read_timestamps=socket_read_timestamps,
+        ),
+    )
+
+
+class TestSocketReadLog:
+    def test_find(self):
+        read_log = SocketReadLog(payload=None)  # type: ignore[arg-type]
+        read_log.perf_ns = [100, 200, 300]
+        read_log.end_offsets = [10, 25, 40]
+
+        assert read_log.find(0) == 0
+        assert read_log.find(9) == 0
+        assert read_log.find(10) == 1
+        assert read_log.find(39) == 2
+        assert read_log.find(40) is None
+
+
+@pytest.mark.asyncio
+class TestSocketReadTimestamps:
+    async def test_messages_are_timestamped_with_their_read(self, sse_server):
+        client = AioHttpClient(_model_endpoint(socket_read_timestamps=True))
+        try:
+            record = await client.post_request(f"{sse_server}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert [r.extract_data_content() for r in record.responses] == [
+            "first",
+            "second",
+            "third",
+        ]
+        timestamps = [r.perf_ns for r in record.responses]
+        # The first two messages arrived in the same read
+        assert timestamps[0] == timestamps[1] < timestamps[2]
+        assert record.coalesced_response_count == 1
+
+    async def test_disabled_by_default(self, sse_server):
+        client = AioHttpClient(_model_endpoint(socket_read_timestamps=False))
+        try:
+            record = await client.post_request(f"{sse_server}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert len(record.responses) == 3
+        assert record.coalesced_response_count is None
+
+    async def test_installed_aiohttp_is_supported(self):
+        """Fails if aiohttp changes the private attributes that the socket read timestamps rely on."""
+        connector = create_tcp_connector()
+        try:
+            assert supports_socket_read_timestamps(connector)
+            assert enable_socket_read_timestamps(connector)
+            assert connector._factory().__class__ is ReadTimestampingResponseHandler
+        finally:
+            await connector.close()
+
+    async def test_falls_back_without_aiohttp_internals(self, sse_server):
+        assert not supports_socket_read_timestamps(Mock(spec=[]))
+
+        with patch(
+            "aiperf.clients.http.aiohttp_client.supports_socket_read_timestamps",
+            return_value=False,
+        ):
+            client = AioHttpClient(_model_endpoint(socket_read_timestamps=True))
+        try:
+            record = await client.post_request(f"{sse_server}/sse", b"{}", {})
+        finally:
+            await client.close()
+
+        assert record.error is None
+        assert len(record.responses) == 3
+        assert record.coalesced_response_count is None
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from aiperf.clients.http import SSEStreamSplitter
+
+
+def _data(message) -> list[str]:
+    return [packet.value for packet in message.packets if packet.name == "data"]
+
+
+class TestSSEStreamSplitter:
+    """Test splitting raw SSE stream chunks into timestamped messages."""
+
+    def test_one_message_per_chunk(self):
+        splitter = SSEStreamSplitter()
+        first = splitter.feed(b"data: Hello\n\n", 100)
+        second = splitter.feed(b"data: World\n\n", 200)
+
+        assert [(_data(m), m.perf_ns) for m in first + second] == [
+            (["Hello"], 100),
+            (["World"], 200),
+        ]
+        assert splitter.flush() is None
+
+    def test_message_split_across_chunks_uses_first_byte_time(self):
+        splitter = SSEStreamSplitter()
+        assert splitter.feed(b"da", 100) == []
+        assert splitter.feed(b"ta: Hel", 200) == []
+        messages = splitter.feed(b"lo\n\n", 300)
+
+        assert len(messages) == 1
+        assert _data(messages[0]) == ["Hello"]
+        assert messages[0].perf_ns == 100
+
+    def test_multiple_messages_in_one_chunk(self):
+        splitter = SSEStreamSplitter()
+        messages = splitter.feed(b"data: 1\n\ndata: 2\n\ndata: 3", 100)
+        messages += splitter.feed(b"\n\n", 200)
+
+        assert [_data(m) for m in messages] == [["1"], ["2"], ["3"]]
+        assert [m.perf_ns for m in messages] == [100, 100, 100]
+        # The second and third messages arrived in the same read as the first
+        assert splitter.coalesced_count == 2
+
+    def test_next_message_starts_in_completing_chunk(self):
+        splitter = SSEStreamSplitter()
+        splitter.feed(b"data: 1", 100)
+        first = splitter.feed(b"\n\ndata: 2", 200)
+        second = splitter.feed(b"\n\n", 300)
+
+        assert first[0].perf_ns == 100
+        assert second[0].perf_ns == 200
+        assert splitter.coalesced_count == 0
+
+    def test_delimiter_split_across_chunks(self):
+        splitter = SSEStreamSplitter()
+        assert splitter.feed(b"data: 1\n", 100) == []
+        messages = splitter.feed(b"\ndata: [DONE]\n\n", 200)
+
+        assert [_data(m) for m in messages] == [["1"], ["[DONE]"]]
+        assert [m.perf_ns for m in messages] == [100, 200]
+
+    def test_flush_returns_unterminated_message(self):
+        splitter = SSEStreamSplitter()
+        splitter.feed(b"data: last", 100)
+
+        message = splitter.flush()
+        assert message is not None
+        assert _data(message) == ["last"]
+        assert message.perf_ns == 100
+        assert splitter.flush() is None
+
+    def test_empty_chunks_and_messages_are_ignored(self):
+        splitter = SSEStreamSplitter()
+        assert splitter.feed(b"", 100) == []
+        assert splitter.feed(b"\n\n\n\n", 200) == []
+        messages = splitter.feed(b"data: x\n\n", 300)
+
+        assert [m.perf_ns for m in messages] == [300]
+
+    def test_invalid_utf8_is_replaced(self):
+        splitter = SSEStreamSplitter()
+        messages = splitter.feed(b"data: \xff\n\n", 100)
+
+        assert _data(messages[0]) == ["�"]
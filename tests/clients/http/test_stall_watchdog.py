@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the stall watchdog, which enforces the first token and inter-chunk timeouts."""
+
+import asyncio
+import time
+
+import pytest
+
+from aiperf.clients.http.stall_watchdog import StallWatchdog
+from aiperf.common.exceptions import FirstTokenTimeoutError, InterChunkTimeoutError
+from tests.conftest import real_sleep
+
+
+class _Python310Task(asyncio.tasks._PyTask):
+    """A task without the cancellation counting of Python 3.11."""
+
+    def cancelling(self) -> int:
+        raise AttributeError("cancelling")
+
+    def uncancel(self) -> int:
+        raise AttributeError("uncancel")
+
+
+async def _stream(watchdog: StallWatchdog, gaps: list[float]) -> None:
+    """Simulate a response with the given gaps before each chunk."""
+    for gap in gaps:
+        await real_sleep(gap)
+        watchdog.last_chunk_perf_ns = time.perf_counter_ns()
+
+
+@pytest.mark.asyncio
+class TestStallWatchdog:
+    async def test_disabled(self):
+        watchdog = StallWatchdog(None, None)
+        assert not watchdog.enabled
+
+        async with watchdog:
+            await _stream(watchdog, [0.02])
+
+        assert watchdog.error is None
+
+    async def test_first_token_timeout(self):
+        watchdog = StallWatchdog(0.02, None)
+
+        with pytest.raises(FirstTokenTimeoutError):
+            async with watchdog:
+                await _stream(watchdog, [1.0])
+
+    async def test_inter_chunk_timeout(self):
+        watchdog = StallWatchdog(1.0, 0.05)
+
+        start = time.perf_counter()
+        with pytest.raises(InterChunkTimeoutError):
+            async with watchdog:
+                await _stream(watchdog, [0.01, 0.01, 1.0])
+        # The stall is detected by the inter-chunk timeout, not the first token timeout
+        assert time.perf_counter() - start < 0.5
+
+    async def test_inter_chunk_timeout_starts_at_first_chunk(self):
+        watchdog = StallWatchdog(None, 0.05)
+
+        with pytest.raises(InterChunkTimeoutError):
+            async with watchdog:
+                await _stream(watchdog, [0.1, 1.0])
+
+    async def test_progressing_stream(self):
+        watchdog = StallWatchdog(0.1, 0.05)
+
+        async with watchdog:
+            await _stream(watchdog, [0.03] * 5)
+
+        assert watchdog.error is None
+
+    async def test_outside_cancellation_is_not_replaced(self):
+        watchdog = StallWatchdog(0.01, None)
+
+        async def request():
+            async with watchdog:
+                await real_sleep(1.0)
+
+        task = asyncio.create_task(request())
+        await real_sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async def test_start_with_callback(self):
+        errors = []
+        watchdog = StallWatchdog(0.01, None)
+        watchdog.start(errors.append)
+        await real_sleep(0.05)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], FirstTokenTimeoutError)
+        assert watchdog.error is errors[0]
+
+    async def test_stop(self):
+        errors = []
+        watchdog = StallWatchdog(0.01, None)
+        watchdog.start(errors.append)
+        watchdog.stop()
+        await real_sleep(0.05)
+
+        assert errors == []
+
+    @pytest.mark.parametrize(
+        "timeouts, gaps, error",
+        [
+            ((None, None), [0.02], None),
+            ((0.02, None), [1.0], FirstTokenTimeoutError),
+            ((1.0, 0.05), [0.01, 1.0], InterChunkTimeoutError),
+        ],
+    )
+    async def test_without_task_uncancel(self, monkeypatch, timeouts, gaps, error):
+        """Test the timeouts on Python 3.10, where the tasks have no cancelling() or uncancel()."""
+        monkeypatch.setattr(
+            "aiperf.clients.http.stall_watchdog._TASK_HAS_UNCANCEL", False
+        )
+        watchdog = StallWatchdog(*timeouts)
+
+        async def request() -> None:
+            async with watchdog:
+                await _stream(watchdog, gaps)
+
+        task = _Python310Task(request(), loop=asyncio.get_running_loop())
+        if error is None:
+            await task
+        else:
+            with pytest.raises(error):
+                await task
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the helpers that discard the content of the responses in timing-only mode."""
+
+import orjson
+import pytest
+
+from aiperf.clients.http.aiohttp_client import parse_sse_message
+from aiperf.clients.http.timing_only import (
+    append_timing_only_message,
+    extract_usage,
+    has_content,
+    timing_only_text_response,
+)
+
+USAGE = {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12}
+
+
+class TestExtractUsage:
+    def test_chat_completion(self):
+        body = orjson.dumps(
+            {
+                "choices": [{"message": {"content": "Hello"}}],
+                "usage": USAGE,
+            }
+        ).decode()
+
+        assert orjson.loads(extract_usage(body)) == {"usage": USAGE}
+
+    def test_whitespace_and_trailing_fields(self):
+        body = '{"data": [[0.1, 0.2]], "usage" : {"prompt_tokens": 5}, "model": "m"}'
+
+        assert orjson.loads(extract_usage(body)) == {"usage": {"prompt_tokens": 5}}
+
+    def test_usage_within_content_is_ignored(self):
+        body = orjson.dumps(
+            {"choices": [{"message": {"content": 'say "usage": {"x": 1}'}}]}
+        ).decode()
+
+        assert extract_usage(body) == ""
+
+    @pytest.mark.parametrize(
+        "body",
+        ["", "not json", '{"usage": null}', '{"usage": {"prompt_tokens": 5'],
+    )
+    def test_no_usage(self, body):
+        assert extract_usage(body) == ""
+
+    def test_timing_only_text_response(self):
+        response = timing_only_text_response(
+            123, "application/json", orjson.dumps({"usage": USAGE}).decode()
+        )
+
+        assert response.perf_ns == 123
+        assert response.content_type == "application/json"
+        assert orjson.loads(response.text) == {"usage": USAGE}
+
+
+def _chunk(delta: dict, **fields) -> str:
+    chunk = {"object": "chat.completion.chunk", "choices": [{"delta": delta}]}
+    return "data: " + orjson.dumps(chunk | fields).decode()
+
+
+USAGE_CHUNK = (
+    "data: "
+    + orjson.dumps(
+        {"object": "chat.completion.chunk", "choices": [], "usage": USAGE}
+    ).decode()
+)
+
+
+class TestAppendTimingOnlyMessage:
+    def test_only_latest_message_keeps_packets(self):
+        messages = []
+        for perf_ns, raw in enumerate(
+            [
+                _chunk({"content": "first"}),
+                _chunk({"content": "second"}),
+                "data: [DONE]",
+            ],
+            start=1,
+        ):
+            append_timing_only_message(messages, parse_sse_message(raw, perf_ns))
+
+        assert [message.perf_ns for message in messages] == [1, 2]
+        assert messages[0].packets == []
+        assert orjson.loads(messages[1].extract_data_content())["choices"][0][
+            "delta"
+        ] == {"content": "second"}
+
+    def test_messages_without_content_are_dropped(self):
+        messages = []
+        for perf_ns, raw in enumerate(
+            [
+                _chunk({"role": "assistant"}),
+                _chunk({"content": "first"}),
+                _chunk({"reasoning_content": "thinking"}),
+                _chunk({}),
+                USAGE_CHUNK,
+                "data: [DONE]",
+            ],
+            start=1,
+        ):
+            append_timing_only_message(messages, parse_sse_message(raw, perf_ns))
+
+        # The final usage-only message is kept for its usage, and left out by the parser
+        assert [message.perf_ns for message in messages] == [2, 3, 5]
+        assert not has_content(messages[2])
+        assert orjson.loads(messages[2].extract_data_content())["usage"] == USAGE
@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import uuid
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from aiperf.clients.http import AioHttpClient, Http2Client, RawHttpClient
 from aiperf.clients.model_endpoint_info import (
     EndpointInfo,
     ModelEndpointInfo,
@@ -12,7 +14,14 @@ from aiperf.clients.model_endpoint_info import (
     ModelListInfo,
 )
 from aiperf.clients.openai.openai_aiohttp import OpenAIClientAioHttp
-from aiperf.common.enums import EndpointType, ModelSelectionStrategy
+from aiperf.common.enums import (
+    EndpointType,
+    HttpClientType,
+    LoadBalancingStrategy,
+    ModelSelectionStrategy,
+)
+from aiperf.common.factories import HttpClientFactory
+from aiperf.common.models import RequestRecord
 
 
 class TestOpenAIClientAioHttpHeaders:
@@ -185,3 +194,209 @@ class TestOpenAIClientAioHttpHeaders:
 
         assert headers["X-Request-ID"] == "custom-request-id"
         assert headers["X-Correlation-ID"] == "custom-correlation-id"
+
+
+class TestOpenAIClientAioHttpHttpClient:
+    """Test that the OpenAI client sends its requests with the selected HTTP client."""
+
+    @pytest.mark.parametrize(
+        "http_client, expected_class",
+        [
+            (HttpClientType.AIOHTTP, AioHttpClient),
+            (HttpClientType.HTTP2, Http2Client),
+            (HttpClientType.RAW, RawHttpClient),
+        ],
+    )
+    def test_creates_selected_http_client(self, http_client, expected_class):
+        model_endpoint = ModelEndpointInfo(
+            models=ModelListInfo(
+                models=[ModelInfo(name="test-model")],
+                model_selection_strategy=ModelSelectionStrategy.RANDOM,
+            ),
+            endpoint=EndpointInfo(type=EndpointType.CHAT, http_client=http_client),
+        )
+        with patch(
+            "aiperf.common.factories.HttpClientFactory.create_instance"
+        ) as mock_create:
+            client = OpenAIClientAioHttp(model_endpoint)
+
+        mock_create.assert_called_once_with(http_client, model_endpoint=model_endpoint)
+        assert client.http_client is mock_create.return_value
+        assert HttpClientFactory.get_class_from_type(http_client) is expected_class
+
+    @pytest.mark.asyncio
+    async def test_send_request_uses_http_client(self):
+        model_endpoint = ModelEndpointInfo(
+            models=ModelListInfo(
+                models=[ModelInfo(name="test-model")],
+                model_selection_strategy=ModelSelectionStrategy.RANDOM,
+            ),
+            endpoint=EndpointInfo(type=EndpointType.CHAT, base_url="localhost:8000"),
+        )
+        http_client = Mock()
+        http_client.post_request = AsyncMock(
+            return_value=RequestRecord(start_perf_ns=1)
+        )
+        with patch(
+            "aiperf.common.factories.HttpClientFactory.create_instance",
+            return_value=http_client,
+        ):
+            client = OpenAIClientAioHttp(model_endpoint)
+
+        record = await client.send_request(model_endpoint, {"a": 1})
+
+        assert record.start_perf_ns == 1
+        url, payload, _ = http_client.post_request.call_args.args
+        assert url == "http://localhost:8000/v1/chat/completions"
+        assert payload == b'{"a":1}'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path, expected_url, send_request",
+        [
+            ("/v1/models", "http://localhost:8000/v1/models", True),
+            (None, "http://localhost:8000", False),
+        ],
+    )
+    async def test_prewarm_connections_uses_http_client(
+        self, path, expected_url, send_request
+    ):
+        model_endpoint = ModelEndpointInfo(
+            models=ModelListInfo(
+                models=[ModelInfo(name="test-model")],
+                model_selection_strategy=ModelSelectionStrategy.RANDOM,
+            ),
+            endpoint=EndpointInfo(type=EndpointType.CHAT, base_url="localhost:8000"),
+        )
+        http_client = Mock()
+        http_client.open_connections = AsyncMock(return_value=[])
+        with patch(
+            "aiperf.common.factories.HttpClientFactory.create_instance",
+            return_value=http_client,
+        ):
+            client = OpenAIClientAioHttp(model_endpoint)
+
+        await client.prewarm_connections(model_endpoint, 4, path)
+
+        url, headers, num_connections = http_client.open_connections.call_args.args
+        assert url == expected_url
+        assert headers["Accept"] == "application/json"
+        assert num_connections == 4
+        assert (
+            http_client.open_connections.call_args.kwargs["send_request"]
+            is send_request
+        )
+
+
+class TestOpenAIClientAioHttpLoadBalancing:
+    """Test that the OpenAI client load balances the requests across multiple URLs."""
+
+    URLS = ["http://replica-0:8000", "http://replica-1:8000"]
+
+    @pytest.fixture
+    def model_endpoint(self):
+        return ModelEndpointInfo(
+            models=ModelListInfo(
+                models=[ModelInfo(name="test-model")],
+                model_selection_strategy=ModelSelectionStrategy.RANDOM,
+            ),
+            endpoint=EndpointInfo(
+                type=EndpointType.CHAT,
+                base_url=self.URLS[0],
+                base_urls=self.URLS,
+                load_balancing=LoadBalancingStrategy.ROUND_ROBIN,
+            ),
+        )
+
+    @pytest.fixture
+    def http_clients(self):
+        http_clients = [Mock(), Mock()]
+        for http_client in http_clients:
+            http_client.post_request = AsyncMock(
+                side_effect=lambda *args, **kwargs: RequestRecord(start_perf_ns=1)
+            )
+            http_client.open_connections = AsyncMock(
+                side_effect=lambda url, headers, num_connections, **kwargs: [
+                    RequestRecord(start_perf_ns=1) for _ in range(num_connections)
+                ]
+            )
+            http_client.close = AsyncMock()
+        return http_clients
+
+    @pytest.fixture
+    def client(self, model_endpoint, http_clients):
+        with patch(
+            "aiperf.common.factories.HttpClientFactory.create_instance",
+            side_effect=http_clients,
+        ) as mock_create:
+            client = OpenAIClientAioHttp(model_endpoint)
+        created_urls = [
+            call.kwargs["model_endpoint"].endpoint.base_url
+            for call in mock_create.call_args_list
+        ]
+        assert created_urls == self.URLS
+        return client
+
+    def test_single_url_has_no_load_balancer(self):
+        model_endpoint = ModelEndpointInfo(
+            models=ModelListInfo(
+                models=[ModelInfo(name="test-model")],
+                model_selection_strategy=ModelSelectionStrategy.RANDOM,
+            ),
+            endpoint=EndpointInfo(
+                type=EndpointType.CHAT,
+                base_url=self.URLS[0],
+                base_urls=self.URLS[:1],
+            ),
+        )
+        with patch("aiperf.common.factories.HttpClientFactory.create_instance"):
+            client = OpenAIClientAioHttp(model_endpoint)
+
+        assert client.load_balancer is None
+        assert client.http_clients == [client.http_client]
+
+    @pytest.mark.asyncio
+    async def test_send_request_round_robin(self, client, model_endpoint, http_clients):
+        records = [
+            await client.send_request(model_endpoint, {"a": 1}) for _ in range(4)
+        ]
+
+        assert [record.endpoint_url for record in records] == self.URLS * 2
+        for http_client, url in zip(http_clients, self.URLS, strict=True):
+            assert http_client.post_request.await_count == 2
+            assert (
+                http_client.post_request.call_args.args[0]
+                == f"{url}/v1/chat/completions"
+            )
+        assert client.load_balancer.in_flight == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_send_request_error_releases_endpoint(
+        self, client, model_endpoint, http_clients
+    ):
+        http_clients[0].post_request.side_effect = RuntimeError("boom")
+
+        record = await client.send_request(model_endpoint, {"a": 1})
+
+        assert record.error.type == "RuntimeError"
+        assert record.endpoint_url == self.URLS[0]
+        assert client.load_balancer.in_flight == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connections_split_across_urls(
+        self, client, model_endpoint, http_clients
+    ):
+        records = await client.prewarm_connections(model_endpoint, 3, "/v1/models")
+
+        assert len(records) == 4
+        for http_client, url in zip(http_clients, self.URLS, strict=True):
+            url_arg, _, num_connections = http_client.open_connections.call_args.args
+            assert url_arg == f"{url}/v1/models"
+            assert num_connections == 2
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_http_clients(self, client, http_clients):
+        await client.close()
+
+        for http_client in http_clients:
+            http_client.close.assert_awaited_once()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from aiperf.clients.openai.openai_chat import OpenAIChatCompletionRequestConverter
+from aiperf.common.models import ConversationHistory, Text, Turn
+
+
+def _turn(text: str, role: str | None = None) -> Turn:
+    return Turn(role=role, texts=[Text(contents=[text])])
+
+
+class TestOpenAIChatCompletionRequestConverter:
+    """Test cases for the multi-turn history of OpenAIChatCompletionRequestConverter."""
+
+    @pytest.fixture
+    def converter(self):
+        return OpenAIChatCompletionRequestConverter()
+
+    @pytest.fixture
+    def model_endpoint(self):
+        mock_endpoint = MagicMock()
+        mock_endpoint.endpoint.extra = None
+        mock_endpoint.endpoint.streaming = False
+        mock_endpoint.primary_model_name = "test-model"
+        return mock_endpoint
+
+    @pytest.mark.asyncio
+    async def test_format_payload_without_history(self, converter, model_endpoint):
+        payload = await converter.format_payload(model_endpoint, _turn("hi"))
+
+        assert payload["messages"] == [{"role": "user", "name": "", "content": "hi"}]
+
+    @pytest.mark.asyncio
+    async def test_format_payload_with_empty_history(self, converter, model_endpoint):
+        payload = await converter.format_payload(
+            model_endpoint, _turn("hi"), history=ConversationHistory()
+        )
+
+        assert isinstance(payload["messages"], list)
+
+    @pytest.mark.asyncio
+    async def test_format_payload_sends_history(self, converter, model_endpoint):
+        history = ConversationHistory()
+        history.append(_turn("first"))
+        history.append(_turn("answer", role="assistant"))
+
+        payload = await converter.format_payload(
+            model_endpoint, _turn("second"), history=history
+        )
+
+        messages = orjson.loads(orjson.dumps(payload))["messages"]
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("user", "first"),
+            ("assistant", "answer"),
+            ("user", "second"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_format_payload_serializes_history_incrementally(
+        self, converter, model_endpoint
+    ):
+        history = ConversationHistory()
+        history.append(_turn("first"))
+        await converter.format_payload(model_endpoint, _turn("second"), history=history)
+        assert history.num_cached_turns == 1
+        cached_prefix = bytes(history.payload_cache)
+
+        history.append(_turn("second"))
+        history.append(_turn("answer", role="assistant"))
+        payload = await converter.format_payload(
+            model_endpoint, _turn("third"), history=history
+        )
+
+        # Previously serialized messages are reused as-is, and only the new ones are appended
+        assert history.num_cached_turns == 3
+        assert bytes(history.payload_cache).startswith(cached_prefix + b",")
+        messages = orjson.loads(orjson.dumps(payload))["messages"]
+        assert [m["content"] for m in messages] == [
+            "first",
+            "second",
+            "answer",
+            "third",
+        ]
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+
+import pytest
+
+from aiperf.clients.load_balancer import EndpointLoadBalancer
+from aiperf.common.enums import LoadBalancingStrategy
+
+
+class TestEndpointLoadBalancer:
+    def test_requires_an_endpoint(self):
+        with pytest.raises(ValueError):
+            EndpointLoadBalancer(0, LoadBalancingStrategy.ROUND_ROBIN)
+
+    def test_round_robin(self):
+        balancer = EndpointLoadBalancer(3, LoadBalancingStrategy.ROUND_ROBIN)
+
+        assert [balancer.acquire() for _ in range(7)] == [0, 1, 2, 0, 1, 2, 0]
+        assert balancer.in_flight == [3, 2, 2]
+
+    def test_release(self):
+        balancer = EndpointLoadBalancer(2, LoadBalancingStrategy.ROUND_ROBIN)
+        index = balancer.acquire()
+        balancer.release(index)
+
+        assert balancer.in_flight == [0, 0]
+
+    def test_least_outstanding(self):
+        balancer = EndpointLoadBalancer(3, LoadBalancingStrategy.LEAST_OUTSTANDING)
+        balancer.in_flight = [4, 1, 3]
+
+        assert balancer.acquire() == 1
+        assert balancer.acquire() == 1
+        assert balancer.in_flight == [4, 3, 3]
+
+        balancer.in_flight = [0, 5, 5]
+        assert balancer.acquire() == 0
+
+    def test_least_outstanding_spreads_ties(self):
+        balancer = EndpointLoadBalancer(3, LoadBalancingStrategy.LEAST_OUTSTANDING)
+
+        selected = []
+        for _ in range(6):
+            index = balancer.acquire()
+            selected.append(index)
+            balancer.release(index)
+
+        assert sorted(selected) == [0, 0, 1, 1, 2, 2]
+
+    def test_power_of_two_prefers_less_loaded(self):
+        random.seed(0)
+        balancer = EndpointLoadBalancer(2, LoadBalancingStrategy.POWER_OF_TWO)
+        balancer.in_flight = [5, 0]
+
+        assert balancer.acquire() == 1
+
+    def test_power_of_two_never_picks_most_loaded(self):
+        random.seed(0)
+        balancer = EndpointLoadBalancer(4, LoadBalancingStrategy.POWER_OF_TWO)
+        balancer.in_flight = [0, 0, 0, 100]
+
+        for _ in range(100):
+            index = balancer.acquire()
+            balancer.release(index)
+            assert index != 3
+
+    def test_power_of_two_single_endpoint(self):
+        balancer = EndpointLoadBalancer(1, LoadBalancingStrategy.POWER_OF_TWO)
+
+        assert balancer.acquire() == 0
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.clients.model_endpoint_info import ModelEndpointInfo
+from aiperf.common.config import EndpointConfig, UserConfig
+from aiperf.common.enums import EndpointType, LoadBalancingStrategy
+
+
+def _model_endpoint(url: str) -> ModelEndpointInfo:
+    return ModelEndpointInfo.from_user_config(
+        UserConfig(
+            endpoint=EndpointConfig(
+                model_names=["test-model"], type=EndpointType.CHAT, urls=[url]
+            )
+        )
+    )
+
+
+class TestEndpointInfoUnixSocket:
+    @pytest.mark.parametrize(
+        "url, expected_path",
+        [
+            ("unix:///tmp/server.sock", "/tmp/server.sock"),
+            ("unix://relative/server.sock", "relative/server.sock"),
+        ],
+    )
+    def test_unix_socket_url(self, url, expected_path):
+        model_endpoint = _model_endpoint(url)
+
+        assert model_endpoint.endpoint.unix_socket_path == expected_path
+        assert model_endpoint.endpoint.base_url == "http://localhost"
+        assert model_endpoint.url == "http://localhost/v1/chat/completions"
+
+    def test_tcp_url(self):
+        model_endpoint = _model_endpoint("localhost:8000")
+
+        assert model_endpoint.endpoint.unix_socket_path is None
+        assert model_endpoint.endpoint.base_url == "localhost:8000"
+
+
+class TestEndpointInfoMultipleUrls:
+    def test_single_url_is_not_split(self):
+        model_endpoint = _model_endpoint("localhost:8000")
+
+        assert model_endpoint.endpoint.base_urls == ["localhost:8000"]
+        assert model_endpoint.split_by_base_url() == [model_endpoint]
+
+    def test_split_by_base_url(self):
+        model_endpoint = ModelEndpointInfo.from_user_config(
+            UserConfig(
+                endpoint=EndpointConfig(
+                    model_names=["test-model"],
+                    type=EndpointType.CHAT,
+                    urls=["http://replica-0:8000", "unix:///tmp/replica-1.sock"],
+                    load_balancing=LoadBalancingStrategy.POWER_OF_TWO,
+                )
+            )
+        )
+
+        assert model_endpoint.endpoint.base_url == "http://replica-0:8000"
+        assert (
+            model_endpoint.endpoint.load_balancing == LoadBalancingStrategy.POWER_OF_TWO
+        )
+
+        first, second = model_endpoint.split_by_base_url()
+        assert first.url == "http://replica-0:8000/v1/chat/completions"
+        assert first.endpoint.unix_socket_path is None
+        assert first.endpoint.base_urls == ["http://replica-0:8000"]
+        assert second.url == "http://localhost/v1/chat/completions"
+        assert second.endpoint.unix_socket_path == "/tmp/replica-1.sock"
+        assert second.endpoint.base_urls == ["unix:///tmp/replica-1.sock"]
+        assert second.models == model_endpoint.models
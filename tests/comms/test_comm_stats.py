@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the message counters of the push and pull clients, and the channel stats aggregated from them.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    ServiceConfig,
+    UserConfig,
+    ZMQTCPConfig,
+)
+from aiperf.common.enums import CommAddress, CreditPhase, MessageType
+from aiperf.common.messages import (
+    CommChannelStatsMessage,
+    CommStatsMessage,
+    CreditReturnMessage,
+)
+from aiperf.common.models import CommChannelStats, CommClientStats
+from aiperf.timing.timing_manager import TimingManager
+from aiperf.zmq import ZMQPullClient, ZMQPushClient, ZMQTCPCommunication
+from aiperf.zmq.zmq_comms import get_channel_name
+
+
+def _credit_return(i: int) -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id=f"worker_{i}",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=f"credit_{i}",
+    )
+
+
+class TestCommChannelStats:
+    def test_from_client_stats(self):
+        stats = CommChannelStats.from_client_stats(
+            "records",
+            [
+                CommClientStats(channel="records", sent=10, send_blocked_ns=5),
+                CommClientStats(channel="records", sent=5, send_blocked_ns=7),
+                CommClientStats(channel="records", received=12, in_flight=2),
+            ],
+        )
+        assert stats.sent == 15
+        assert stats.received == 12
+        assert stats.in_flight == 2
+        assert stats.send_blocked_ns == 12
+        assert stats.queued == 3
+        assert stats.backlog == 5
+
+    def test_group_by_channel(self):
+        stats = CommChannelStats.group_by_channel(
+            [
+                CommClientStats(channel="records", sent=10),
+                CommClientStats(channel="credit_return", sent=3),
+                CommClientStats(channel="records", received=8, in_flight=1),
+            ]
+        )
+        assert stats == {
+            "records": CommChannelStats(
+                channel="records", sent=10, received=8, in_flight=1
+            ),
+            "credit_return": CommChannelStats(channel="credit_return", sent=3),
+        }
+
+    def test_request_stats(self):
+        stats = CommChannelStats.from_client_stats(
+            "dataset_manager",
+            [
+                CommClientStats(
+                    channel="dataset_manager",
+                    request_timeouts=1,
+                    request_latency_histograms={"conversation_request": {1: 3, 4: 1}},
+                ),
+                CommClientStats(
+                    channel="dataset_manager",
+                    request_late_replies=2,
+                    request_latency_histograms={
+                        "conversation_request": {1: 2},
+                        "dataset_timing_request": {64: 1},
+                    },
+                ),
+            ],
+        )
+        assert stats.request_timeouts == 1
+        assert stats.request_late_replies == 2
+        assert stats.request_latency_histograms == {
+            "conversation_request": {1: 5, 4: 1},
+            "dataset_timing_request": {64: 1},
+        }
+        # Request clients do not count towards the backlog
+        assert stats.backlog == 0
+
+    def test_queued_is_never_negative(self):
+        # The pull client can be sampled after the push clients, and count more messages
+        stats = CommChannelStats(channel="records", sent=10, received=11, in_flight=1)
+        assert stats.queued == 0
+        assert stats.backlog == 1
+
+
+@pytest.mark.parametrize(
+    "address, expected_channel",
+    [
+        (CommAddress.RECORDS, "records"),
+        (CommAddress.RAW_INFERENCE_PROXY_FRONTEND, "raw_inference"),
+        (CommAddress.RAW_INFERENCE_PROXY_BACKEND, "raw_inference"),
+        ("tcp://127.0.0.1:5000", "tcp://127.0.0.1:5000"),
+    ],
+)
+def test_get_channel_name(address, expected_channel):
+    assert get_channel_name(address) == expected_channel
+
+
+def test_comms_client_stats():
+    comms = ZMQTCPCommunication(ZMQTCPConfig())
+    comms.create_push_client(CommAddress.RAW_INFERENCE_PROXY_FRONTEND)
+    comms.create_pull_client(CommAddress.RAW_INFERENCE_PROXY_BACKEND)
+    comms.create_pub_client(CommAddress.EVENT_BUS_PROXY_FRONTEND)
+    comms.create_request_client(CommAddress.DATASET_MANAGER_PROXY_FRONTEND)
+    stats = comms.get_client_stats()
+    assert [s.channel for s in stats] == [
+        "raw_inference",
+        "raw_inference",
+        "dataset_manager",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_push_pull_counters():
+    address = f"inproc://stats_{uuid.uuid4().hex}"
+    pull_client = ZMQPullClient(address=address, bind=True, channel="test")
+    push_client = ZMQPushClient(address=address, bind=False, channel="test")
+    release = asyncio.Event()
+    processing: asyncio.Queue = asyncio.Queue()
+
+    async def _on_credit_return(message: CreditReturnMessage) -> None:
+        await processing.put(message)
+        await release.wait()
+
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, _on_credit_return)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        for i in range(3):
+            await push_client.push(_credit_return(i))
+        for _ in range(3):
+            await asyncio.wait_for(processing.get(), timeout=5)
+
+        assert push_client.get_stats() == CommClientStats(channel="test", sent=3)
+        assert pull_client.get_stats() == CommClientStats(
+            channel="test", received=3, in_flight=3, batch_size_histogram={1: 3}
+        )
+
+        release.set()
+        for _ in range(1000):
+            if not pull_client.messages_in_flight:
+                break
+            await asyncio.sleep(0)
+        assert pull_client.get_stats().in_flight == 0
+    finally:
+        await push_client.stop()
+        await pull_client.stop()
+
+
+@pytest.fixture
+def timing_manager() -> TimingManager:
+    timing_manager = TimingManager(
+        service_config=ServiceConfig(max_pipeline_backlog=10),
+        user_config=UserConfig(endpoint=EndpointConfig(model_names=["test-model"])),
+        service_id="timing_manager",
+    )
+    timing_manager.publish = AsyncMock()
+    return timing_manager
+
+
+def _comm_stats(service_id: str, *client_stats: CommClientStats) -> CommStatsMessage:
+    return CommStatsMessage(service_id=service_id, client_stats=list(client_stats))
+
+
+@pytest.mark.asyncio
+async def test_timing_manager_publishes_channel_stats(timing_manager):
+    """Test that the timing manager sums the counters that the services push to it, and only
+    publishes them when any service pushed its counters since the last time."""
+    await timing_manager._publish_comm_channel_stats()
+    timing_manager.publish.assert_not_awaited()
+
+    await timing_manager._on_comm_stats(
+        _comm_stats("worker_1", CommClientStats(channel="records", sent=4))
+    )
+    await timing_manager._on_comm_stats(
+        _comm_stats("worker_2", CommClientStats(channel="records", sent=6))
+    )
+    await timing_manager._on_comm_stats(
+        _comm_stats("worker_1", CommClientStats(channel="records", sent=5))
+    )
+    await timing_manager._on_comm_stats(
+        _comm_stats(
+            "records_manager",
+            CommClientStats(channel="records", received=9, in_flight=1),
+        )
+    )
+    await timing_manager._publish_comm_channel_stats()
+    await timing_manager._publish_comm_channel_stats()
+
+    timing_manager.publish.assert_awaited_once()
+    message = timing_manager.publish.call_args[0][0]
+    assert isinstance(message, CommChannelStatsMessage)
+    assert message.channel_stats == {
+        "records": CommChannelStats(channel="records", sent=11, received=9, in_flight=1)
+    }
+
+
+@pytest.mark.asyncio
+async def test_timing_manager_pauses_credits_on_pipeline_backlog(timing_manager):
+    """Test that the credits are paused while the backlog exceeds the max, not counting the credit return
+    and comm stats channels."""
+    await timing_manager._on_comm_stats(
+        _comm_stats(
+            "worker_1",
+            CommClientStats(channel="records", sent=20),
+            CommClientStats(channel="credit_return", sent=100),
+            CommClientStats(channel="comm_stats", sent=100),
+        )
+    )
+    await timing_manager._publish_comm_channel_stats()
+    assert not timing_manager.pipeline_backlog_clear.is_set()
+
+    await timing_manager._on_comm_stats(
+        _comm_stats("records_manager", CommClientStats(channel="records", received=15))
+    )
+    await timing_manager._publish_comm_channel_stats()
+    assert timing_manager.pipeline_backlog_clear.is_set()
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the ZMQ ROUTER/DEALER dispatch clients, using in-process sockets.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from aiperf.common.enums import CreditPhase, MessageType
+from aiperf.common.exceptions import CommunicationError
+from aiperf.common.messages import CreditCapacityMessage, CreditDropMessage
+from aiperf.zmq import ZMQDealerDispatchTargetClient, ZMQRouterDispatchClient
+
+
+@pytest.mark.asyncio
+async def test_dispatch_to_specific_target():
+    address = f"inproc://dispatch_{uuid.uuid4().hex}"
+    dispatcher = ZMQRouterDispatchClient(address=address, bind=True)
+    targets = [
+        ZMQDealerDispatchTargetClient(address=address, bind=False, target_id=f"w{i}")
+        for i in range(2)
+    ]
+    capacities: asyncio.Queue = asyncio.Queue()
+    received: dict[str, asyncio.Queue] = {}
+
+    async def _on_capacity(message: CreditCapacityMessage) -> None:
+        await capacities.put(message)
+
+    dispatcher.register_receive_callback(MessageType.CREDIT_CAPACITY, _on_capacity)
+    for target in targets:
+        received[target.target_id] = queue = asyncio.Queue()
+        target.register_receive_callback(MessageType.CREDIT_DROP, queue.put)
+
+    await dispatcher.initialize_and_start()
+    for target in targets:
+        await target.initialize_and_start()
+    try:
+        for target in targets:
+            await target.send(
+                CreditCapacityMessage(service_id=target.target_id, capacity=5)
+            )
+        advertised = {
+            (await asyncio.wait_for(capacities.get(), timeout=5)).service_id
+            for _ in targets
+        }
+        assert advertised == {"w0", "w1"}
+
+        credit = CreditDropMessage(
+            service_id="timing_manager", phase=CreditPhase.PROFILING, credit_num=0
+        )
+        await dispatcher.send_to("w1", credit)
+
+        message = await asyncio.wait_for(received["w1"].get(), timeout=5)
+        assert message.request_id == credit.request_id
+        assert received["w0"].empty()
+
+        with pytest.raises(CommunicationError, match="not connected"):
+            await dispatcher.send_to("unknown", credit)
+    finally:
+        for target in targets:
+            await target.stop()
+        await dispatcher.stop()
@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the pending request table of the request clients, and the deadlines of the requests.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aiperf.common.enums import CreditPhase, MessageType
+from aiperf.common.messages import CreditReturnMessage, Message
+from aiperf.zmq import (
+    RequestMultiplexer,
+    ZMQDealerRequestClient,
+    ZMQRouterReplyClient,
+    latency_bucket_ms,
+)
+
+
+@pytest.mark.parametrize(
+    "latency_ms, expected_bucket",
+    [(0, 1), (0.5, 1), (1, 2), (3, 4), (4, 8), (1000, 1024)],
+)
+def test_latency_bucket_ms(latency_ms, expected_bucket):
+    assert latency_bucket_ms(int(latency_ms * 1_000_000)) == expected_bucket
+
+
+class TestRequestMultiplexer:
+    def test_complete(self):
+        requests = RequestMultiplexer()
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=60)
+        assert len(requests) == 1
+
+        request = requests.complete("a")
+        assert request is not None
+        assert request.request_id == "a"
+        assert len(requests) == 0
+        assert sum(requests.latency_histograms[MessageType.CREDIT_RETURN].values()) == 1
+
+    def test_late_reply(self):
+        requests = RequestMultiplexer()
+        assert requests.complete("unknown") is None
+        assert requests.complete(None) is None
+        assert requests.late_replies == 2
+
+    def test_evict_expired(self):
+        requests = RequestMultiplexer()
+        requests.add("expired_1", MessageType.CREDIT_RETURN, timeout=0)
+        requests.add("expired_2", MessageType.CREDIT_RETURN, timeout=-1)
+        requests.add("pending", MessageType.CREDIT_RETURN, timeout=60)
+        requests.add("no_deadline", MessageType.CREDIT_RETURN, timeout=None)
+
+        expired = requests.evict_expired()
+        assert sorted(r.request_id for r in expired) == ["expired_1", "expired_2"]
+        assert sorted(requests.pending) == ["no_deadline", "pending"]
+        assert requests.timeouts == 2
+
+        # A reply after the deadline is a late reply
+        assert requests.complete("expired_1") is None
+        assert requests.late_replies == 1
+
+    def test_completed_requests_are_not_evicted(self):
+        requests = RequestMultiplexer()
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=-1)
+        requests.complete("a")
+        assert requests.evict_expired() == []
+        assert requests.timeouts == 0
+
+    def test_reused_request_id_keeps_new_deadline(self):
+        requests = RequestMultiplexer()
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=-1)
+        requests.complete("a")
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=60)
+        assert requests.evict_expired() == []
+        assert "a" in requests.pending
+
+    def test_expire(self):
+        requests = RequestMultiplexer()
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=60)
+        assert requests.expire("a") is not None
+        assert requests.expire("a") is None
+        assert requests.timeouts == 1
+
+    def test_cancel(self):
+        requests = RequestMultiplexer()
+        requests.add("a", MessageType.CREDIT_RETURN, timeout=60)
+        assert requests.cancel("a") is not None
+        assert requests.cancel("a") is None
+        assert len(requests) == 0
+        assert requests.timeouts == 0
+
+    def test_stale_heap_entries_are_compacted(self):
+        requests = RequestMultiplexer()
+        for i in range(10_000):
+            requests.add(str(i), MessageType.CREDIT_RETURN, timeout=60)
+            requests.complete(str(i))
+        assert len(requests) == 0
+        assert len(requests._deadline_heap) <= 1025
+
+
+@pytest.fixture
+async def request_reply_clients():
+    address = f"inproc://requests_{uuid.uuid4().hex}"
+    reply_client = ZMQRouterReplyClient(address=address, bind=True)
+    request_client = ZMQDealerRequestClient(address=address, bind=False)
+    release = asyncio.Event()
+
+    async def _echo(message: CreditReturnMessage) -> Message:
+        if message.service_id == "slow":
+            await release.wait()
+        return message.model_copy(update={"service_id": "echo"})
+
+    reply_client.register_request_handler("echo", MessageType.CREDIT_RETURN, _echo)
+    await reply_client.initialize_and_start()
+    await request_client.initialize_and_start()
+    yield request_client, release
+    release.set()
+    await request_client.stop()
+    await reply_client.stop()
+
+
+def _request(i: int, service_id: str = "worker") -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id=service_id,
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=f"credit_{i}",
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_many(request_reply_clients):
+    request_client, _ = request_reply_clients
+    requests = [_request(i) for i in range(5)]
+    responses = await request_client.request_many(requests, timeout=5)
+    assert [r.credit_drop_id for r in responses] == [r.credit_drop_id for r in requests]
+    assert len(request_client.requests) == 0
+    assert (
+        sum(
+            request_client.requests.latency_histograms[
+                MessageType.CREDIT_RETURN
+            ].values()
+        )
+        == 5
+    )
+    stats = request_client.get_stats()
+    assert (
+        sum(stats.request_latency_histograms[MessageType.CREDIT_RETURN].values()) == 5
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_is_removed(request_reply_clients):
+    request_client, release = request_reply_clients
+    with pytest.raises(asyncio.TimeoutError):
+        await request_client.request(_request(0, service_id="slow"), timeout=0.05)
+    assert len(request_client.requests) == 0
+    assert request_client.requests.timeouts == 1
+
+    # The reply that arrives after the timeout is counted, and not dispatched
+    release.set()
+    for _ in range(1000):
+        if request_client.requests.late_replies:
+            break
+        await asyncio.sleep(0)
+    assert request_client.requests.late_replies == 1
+    stats = request_client.get_stats()
+    assert stats.request_timeouts == 1
+    assert stats.request_late_replies == 1
+
+
+@pytest.mark.asyncio
+async def test_request_async_callback(request_reply_clients):
+    request_client, release = request_reply_clients
+    responses: asyncio.Queue = asyncio.Queue()
+
+    # Without a timeout, the request waits for its response however long it takes
+    await request_client.request_async(_request(0, service_id="slow"), responses.put)
+    await request_client._evict_expired_requests()
+    assert len(request_client.requests) == 1
+
+    release.set()
+    response = await asyncio.wait_for(responses.get(), timeout=5)
+    assert response.service_id == "echo"
+    assert len(request_client.requests) == 0
+
+
+@pytest.mark.asyncio
+async def test_request_async_timeout_is_logged(request_reply_clients):
+    request_client, _ = request_reply_clients
+    request_client.warning = MagicMock()
+
+    await request_client.request_async(
+        _request(0, service_id="slow"), AsyncMock(), timeout=0
+    )
+    await request_client._evict_expired_requests()
+
+    assert len(request_client.requests) == 0
+    request_client.warning.assert_called_once()
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the shared memory ring and the shared memory PUSH/PULL clients, using in-process sockets.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from aiperf.common.config import ZMQIPCConfig, ZMQTCPConfig
+from aiperf.common.enums import CommAddress, CreditPhase, MessageType
+from aiperf.common.messages import CreditReturnMessage
+from aiperf.zmq import (
+    SharedMemoryRing,
+    ZMQIPCCommunication,
+    ZMQPullClient,
+    ZMQPushClient,
+    ZMQSharedMemoryPullClient,
+    ZMQSharedMemoryPushClient,
+    ZMQTCPCommunication,
+)
+from tests.conftest import real_sleep
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryRing.create(64)
+    yield ring
+    ring.close()
+
+
+class TestSharedMemoryRing:
+    def test_write_and_read(self, ring):
+        assert ring.write(b"first")
+        assert ring.write(b"second")
+
+        assert ring.read() == [b"first", b"second"]
+        assert ring.read() == []
+
+    def test_full(self, ring):
+        # Each frame takes 4 bytes for the length, plus its payload
+        assert ring.write(b"x" * 28)
+        assert ring.write(b"y" * 28)
+        assert not ring.write(b"z")
+
+        assert ring.read() == [b"x" * 28, b"y" * 28]
+        assert ring.write(b"z")
+
+    def test_frame_larger_than_ring(self, ring):
+        assert not ring.write(b"x" * 64)
+        assert ring.read() == []
+
+    @pytest.mark.parametrize("payload_size", [10, 26, 30])
+    def test_wraps_around(self, ring, payload_size):
+        for i in range(20):
+            frame = bytes([i]) * payload_size
+            assert ring.write(frame)
+            assert ring.read() == [frame]
+
+    def test_attach_from_reader(self, ring):
+        reader = SharedMemoryRing.attach(ring.name)
+        try:
+            ring.write(b"hello")
+            assert reader.read() == [b"hello"]
+            assert not reader.writer_closed
+
+            ring.write(b"last")
+            ring.close()
+            # The reader can still read the remaining frames of a closed ring
+            assert reader.writer_closed
+            assert reader.read() == [b"last"]
+        finally:
+            reader.close()
+
+    def test_accept_reader(self, ring):
+        reader = SharedMemoryRing.attach(ring.name)
+        try:
+            assert reader.reader_accepted is None
+            assert not ring.accept_reader()
+
+            reader.mark_attached()
+            assert ring.accept_reader()
+            assert reader.reader_accepted
+            with pytest.raises(RuntimeError):
+                ring.reclaim()
+        finally:
+            reader.close()
+
+    def test_reclaim_before_reader_attached(self, ring):
+        ring.write(b"first")
+        ring.write(b"second")
+
+        assert ring.reclaim() == [b"first", b"second"]
+        reader = SharedMemoryRing.attach(ring.name)
+        try:
+            reader.mark_attached()
+            # The writer already refused the reader
+            assert not ring.accept_reader()
+            assert reader.reader_accepted is False
+        finally:
+            reader.close()
+
+
+def _credit_return(i: int) -> CreditReturnMessage:
+    return CreditReturnMessage(
+        service_id=f"worker_{i}", phase=CreditPhase.PROFILING, credit_drop_id=str(i)
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_pull_over_shared_memory():
+    address = f"inproc://shm_{uuid.uuid4().hex}"
+    pull_client = ZMQSharedMemoryPullClient(address=address, bind=True)
+    push_client = ZMQSharedMemoryPushClient(
+        address=address, bind=False, ring_capacity=4096
+    )
+    received: asyncio.Queue = asyncio.Queue()
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, received.put)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        for i in range(100):
+            await push_client.push(_credit_return(i))
+            await real_sleep(0)
+        # Too large for the ring, so it is sent over the socket
+        large = _credit_return(100)
+        large.credit_drop_id = "x" * 8192
+        await push_client.push(large)
+
+        messages = [
+            await asyncio.wait_for(received.get(), timeout=5) for _ in range(101)
+        ]
+        assert push_client.ring is not None
+        assert sorted(m.service_id for m in messages) == sorted(
+            f"worker_{i}" for i in range(101)
+        )
+    finally:
+        await push_client.stop()
+        await pull_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_push_client_resends_unread_messages_on_stop():
+    """Test that the messages of a ring which the pull client never attached to are sent over the socket."""
+    address = f"inproc://shm_{uuid.uuid4().hex}"
+    # A plain pull client never attaches to the ring
+    pull_client = ZMQPullClient(address=address, bind=True)
+    push_client = ZMQSharedMemoryPushClient(
+        address=address, bind=False, ring_capacity=4096
+    )
+    received: asyncio.Queue = asyncio.Queue()
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, received.put)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        for i in range(10):
+            await push_client.push(_credit_return(i))
+        assert received.empty()
+        await push_client.stop()
+
+        messages = [
+            await asyncio.wait_for(received.get(), timeout=5) for _ in range(10)
+        ]
+        assert sorted(m.service_id for m in messages) == sorted(
+            f"worker_{i}" for i in range(10)
+        )
+    finally:
+        await pull_client.stop()
+
+
+@pytest.mark.parametrize(
+    "machine, expected", [("x86_64", True), ("AMD64", True), ("aarch64", False)]
+)
+def test_shared_memory_only_enabled_on_x86_64(tmp_path, monkeypatch, machine, expected):
+    monkeypatch.setattr("platform.machine", lambda: machine)
+
+    config = ZMQIPCConfig(path=tmp_path, shared_memory=True)
+
+    assert config.shared_memory_enabled is expected
+
+
+@pytest.mark.parametrize(
+    "communication, shared_memory, expected_type",
+    [
+        (ZMQIPCCommunication, True, ZMQSharedMemoryPushClient),
+        (ZMQIPCCommunication, False, ZMQPushClient),
+        (ZMQTCPCommunication, None, ZMQPushClient),
+    ],
+)
+def test_comms_use_shared_memory_clients(
+    tmp_path, monkeypatch, communication, shared_memory, expected_type
+):
+    monkeypatch.setattr("platform.machine", lambda: "x86_64")
+    if communication is ZMQIPCCommunication:
+        comms = communication(ZMQIPCConfig(path=tmp_path, shared_memory=shared_memory))
+    else:
+        comms = communication(ZMQTCPConfig())
+
+    assert type(comms.create_push_client(CommAddress.RECORDS)) is expected_type
+    # Channels that go through a proxy always use the sockets
+    assert (
+        type(comms.create_push_client(CommAddress.RAW_INFERENCE_PROXY_FRONTEND))
+        is ZMQPushClient
+    )
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the multipart ZMQ frames of messages, and the clients that send and coalesce them,
+using in-process sockets.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from aiperf.common.config import ZMQTCPConfig
+from aiperf.common.enums import CommAddress, CreditPhase, MessageType
+from aiperf.common.messages import CreditReturnMessage, Message
+from aiperf.common.models import CommChannelStats
+from aiperf.zmq import (
+    ZMQDealerRequestClient,
+    ZMQPullClient,
+    ZMQPushClient,
+    ZMQRouterReplyClient,
+    ZMQTCPCommunication,
+    decode_message_frames,
+    decode_message_header,
+    encode_message_frames,
+)
+
+LARGE_PAYLOAD_SIZE = 1024 * 1024
+
+
+def _credit_return(i: int, payload_size: int = 0) -> CreditReturnMessage:
+    message = CreditReturnMessage(
+        service_id=f"worker_{i}",
+        phase=CreditPhase.PROFILING,
+        credit_drop_id=f"credit_{i}",
+    )
+    if payload_size:
+        message.credit_drop_id = "x" * payload_size
+    return message
+
+
+class TestMessageFrames:
+    def test_encode_header(self):
+        message = _credit_return(0)
+        message.request_id = "abc"
+        header, body = encode_message_frames(message)
+        assert decode_message_header(header) == (MessageType.CREDIT_RETURN, "abc")
+        assert body == message.model_dump_json().encode()
+
+    def test_encode_header_without_request_id(self):
+        header, _ = encode_message_frames(_credit_return(0))
+        assert decode_message_header(header) == (MessageType.CREDIT_RETURN, None)
+
+    def test_decode_ignores_routing_envelope(self):
+        message = _credit_return(0)
+        frames = [b"routing_id", *encode_message_frames(message)]
+        assert decode_message_frames(frames) == message
+
+    def test_from_json_with_type_memoryview(self):
+        message = _credit_return(0)
+        decoded = Message.from_json_with_type(
+            MessageType.CREDIT_RETURN, memoryview(message.to_json_bytes())
+        )
+        assert isinstance(decoded, CreditReturnMessage)
+        assert decoded == message
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload_size", [0, LARGE_PAYLOAD_SIZE])
+async def test_push_pull_frames(payload_size):
+    address = f"inproc://frames_{uuid.uuid4().hex}"
+    pull_client = ZMQPullClient(address=address, bind=True)
+    push_client = ZMQPushClient(address=address, bind=False)
+    received: asyncio.Queue = asyncio.Queue()
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, received.put)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        sent = [_credit_return(i, payload_size) for i in range(3)]
+        for message in sent:
+            await push_client.push(message)
+        messages = [await asyncio.wait_for(received.get(), timeout=5) for _ in range(3)]
+        assert sorted(messages, key=lambda m: m.service_id) == sent
+    finally:
+        await push_client.stop()
+        await pull_client.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload_size", [0, LARGE_PAYLOAD_SIZE])
+async def test_request_reply_frames(payload_size):
+    address = f"inproc://frames_{uuid.uuid4().hex}"
+    reply_client = ZMQRouterReplyClient(address=address, bind=True)
+    request_client = ZMQDealerRequestClient(address=address, bind=False)
+
+    async def _echo(message: CreditReturnMessage) -> Message:
+        return message.model_copy(update={"service_id": "echo"})
+
+    reply_client.register_request_handler("echo", MessageType.CREDIT_RETURN, _echo)
+
+    await reply_client.initialize_and_start()
+    await request_client.initialize_and_start()
+    try:
+        request = _credit_return(0, payload_size)
+        response = await request_client.request(request, timeout=5)
+        assert isinstance(response, CreditReturnMessage)
+        assert response.request_id == request.request_id
+        assert response.service_id == "echo"
+        assert response.credit_drop_id == request.credit_drop_id
+    finally:
+        await request_client.stop()
+        await reply_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_push_pull_batches():
+    address = f"inproc://frames_{uuid.uuid4().hex}"
+    pull_client = ZMQPullClient(address=address, bind=True)
+    push_client = ZMQPushClient(
+        address=address, bind=False, batch_size=4, batch_timeout=0.01
+    )
+    received: asyncio.Queue = asyncio.Queue()
+
+    async def _on_credit_return(message: CreditReturnMessage) -> None:
+        if message.service_id == "worker_5":
+            raise ValueError("An error should not drop the rest of the batch")
+        await received.put(message)
+
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, _on_credit_return)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        sent = [_credit_return(i) for i in range(10)]
+        for message in sent:
+            await push_client.push(message)
+        # The last partial batch is sent once the batch timeout expires
+        messages = [await asyncio.wait_for(received.get(), timeout=5) for _ in range(9)]
+        assert [m.service_id for m in messages] == [
+            m.service_id for m in sent if m.service_id != "worker_5"
+        ]
+        assert push_client.batch_size_histogram == {4: 2, 2: 1}
+        assert pull_client.batch_size_histogram == {4: 2, 2: 1}
+
+        # The batch sizes travel with the comm stats, and each batch is counted once per channel
+        assert push_client.get_stats().batch_size_histogram == {4: 2, 2: 1}
+        channel_stats = CommChannelStats.from_client_stats(
+            "credit_return", [push_client.get_stats(), pull_client.get_stats()]
+        )
+        assert channel_stats.batch_size_histogram == {4: 2, 2: 1}
+    finally:
+        await push_client.stop()
+        await pull_client.stop()
+
+
+@pytest.mark.asyncio
+async def test_push_flushes_batch_on_stop():
+    address = f"inproc://frames_{uuid.uuid4().hex}"
+    pull_client = ZMQPullClient(address=address, bind=True)
+    push_client = ZMQPushClient(
+        address=address, bind=False, batch_size=100, batch_timeout=60
+    )
+    received: asyncio.Queue = asyncio.Queue()
+    pull_client.register_pull_callback(MessageType.CREDIT_RETURN, received.put)
+
+    await pull_client.initialize_and_start()
+    await push_client.initialize_and_start()
+    try:
+        for i in range(3):
+            await push_client.push(_credit_return(i))
+        assert received.empty()
+        await push_client.stop()
+        messages = [await asyncio.wait_for(received.get(), timeout=5) for _ in range(3)]
+        assert len(messages) == 3
+        assert push_client.batch_size_histogram == {3: 1}
+    finally:
+        await pull_client.stop()
+
+
+@pytest.mark.parametrize(
+    "address, expected_batch_size",
+    [
+        (CommAddress.RECORDS, 16),
+        (CommAddress.RAW_INFERENCE_PROXY_FRONTEND, 16),
+        (CommAddress.CREDIT_RETURN, None),
+    ],
+)
+def test_comms_batch_push_clients(address, expected_batch_size):
+    comms = ZMQTCPCommunication(
+        ZMQTCPConfig(push_batch_size=16, push_batch_timeout_us=500)
+    )
+    push_client = comms.create_push_client(address)
+    assert push_client.batch_size == expected_batch_size
+    if expected_batch_size:
+        assert push_client.batch_timeout == 0.0005
@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 from enum import Enum
 
+import pytest
+from pydantic import ValidationError
+
 from aiperf.common.config import EndpointConfig, EndpointDefaults
 from aiperf.common.enums import EndpointType, ModelSelectionStrategy
 
@@ -22,7 +25,8 @@ def test_endpoint_config_defaults():
     assert config.type == EndpointDefaults.TYPE
     assert config.custom_endpoint == EndpointDefaults.CUSTOM_ENDPOINT
     assert config.streaming == EndpointDefaults.STREAMING
-    assert config.url == EndpointDefaults.URL
+    assert config.urls == [EndpointDefaults.URL]
+    assert config.load_balancing == EndpointDefaults.LOAD_BALANCING
 
 
 def test_endpoint_config_custom_values():
@@ -43,7 +47,7 @@ def test_endpoint_config_custom_values():
         "type": EndpointType.CHAT,
         "custom_endpoint": "custom_endpoint",
         "streaming": True,
-        "url": "http://custom-url",
+        "urls": ["http://custom-url"],
         "timeout_seconds": 10,
         "api_key": "custom_api_key",
     }
@@ -87,3 +91,48 @@ def test_streaming_validation():
         model_names=["gpt2"],
     )
     assert not config.streaming  # Streaming is not supported for embeddings
+
+
+def test_multiple_urls():
+    """
+    Test that multiple URLs can be given as a comma-separated list or repeated.
+    """
+
+    config = EndpointConfig(
+        model_names=["gpt2"], urls="http://replica-0:8000, http://replica-1:8000"
+    )
+    assert config.urls == ["http://replica-0:8000", "http://replica-1:8000"]
+
+    config = EndpointConfig(
+        model_names=["gpt2"],
+        urls=["http://replica-0:8000", "http://replica-1:8000,http://replica-2:8000"],
+    )
+    assert config.urls == [
+        "http://replica-0:8000",
+        "http://replica-1:8000",
+        "http://replica-2:8000",
+    ]
+
+
+def test_stall_timeouts():
+    """
+    Test that the connect, first token and inter-chunk timeouts are optional and positive.
+    """
+
+    config = EndpointConfig(model_names=["gpt2"])
+    assert config.connect_timeout_seconds is None
+    assert config.first_token_timeout_seconds is None
+    assert config.inter_chunk_timeout_seconds is None
+
+    config = EndpointConfig(
+        model_names=["gpt2"],
+        connect_timeout_seconds=2.5,
+        first_token_timeout_seconds=30,
+        inter_chunk_timeout_seconds=1,
+    )
+    assert config.connect_timeout_seconds == 2.5
+    assert config.first_token_timeout_seconds == 30.0
+    assert config.inter_chunk_timeout_seconds == 1.0
+
+    with pytest.raises(ValidationError):
+        EndpointConfig(model_names=["gpt2"], inter_chunk_timeout_seconds=0)
@@ -24,7 +24,7 @@ class TestGracePeriodValidation:
 
         # Create a minimal UserConfig to test validation
         endpoint_config = EndpointConfig(
-            url="http://localhost:8000/test", model_names=["test-model"]
+            urls=["http://localhost:8000/test"], model_names=["test-model"]
         )
 
         user_config = UserConfig(endpoint=endpoint_config, loadgen=loadgen_config)
@@ -45,7 +45,7 @@ class TestGracePeriodValidation:
             )
 
             endpoint_config = EndpointConfig(
-                url="http://localhost:8000/test", model_names=["test-model"]
+                urls=["http://localhost:8000/test"], model_names=["test-model"]
             )
 
             UserConfig(endpoint=endpoint_config, loadgen=loadgen_config)
@@ -57,7 +57,7 @@ class TestGracePeriodValidation:
         loadgen_config = LoadGeneratorConfig(request_count=10)
 
         endpoint_config = EndpointConfig(
-            url="http://localhost:8000/test", model_names=["test-model"]
+            urls=["http://localhost:8000/test"], model_names=["test-model"]
         )
 
         user_config = UserConfig(endpoint=endpoint_config, loadgen=loadgen_config)
@@ -73,7 +73,7 @@ class TestGracePeriodValidation:
         )
 
         endpoint_config = EndpointConfig(
-            url="http://localhost:8000/test", model_names=["test-model"]
+            urls=["http://localhost:8000/test"], model_names=["test-model"]
         )
 
         user_config = UserConfig(endpoint=endpoint_config, loadgen=loadgen_config)
@@ -94,7 +94,7 @@ class TestGracePeriodValidation:
         )
 
         endpoint_config = EndpointConfig(
-            url="http://localhost:8000/test", model_names=["test-model"]
+            urls=["http://localhost:8000/test"], model_names=["test-model"]
         )
 
         user_config = UserConfig(endpoint=endpoint_config, loadgen=loadgen_config)
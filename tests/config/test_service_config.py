@@ -150,6 +150,8 @@ class TestTCPConfiguration:
         assert comm_config.records_push_pull_port == 5557
         assert comm_config.credit_drop_port == 5562
         assert comm_config.credit_return_port == 5563
+        assert comm_config.worker_health_port == 5564
+        assert comm_config.comm_stats_port == 5565
 
 
 class TestIPCConfiguration:
@@ -164,6 +166,8 @@ class TestIPCConfiguration:
                     "records_push_pull_address": "ipc:///tmp/aiperf/records_push_pull.ipc",
                     "credit_drop_address": "ipc:///tmp/aiperf/credit_drop.ipc",
                     "credit_return_address": "ipc:///tmp/aiperf/credit_return.ipc",
+                    "worker_health_address": "ipc:///tmp/aiperf/worker_health.ipc",
+                    "comm_stats_address": "ipc:///tmp/aiperf/comm_stats.ipc",
                 },
             ),
         ],
@@ -190,6 +194,26 @@ class TestIPCConfiguration:
         assert comm_config.raw_inference_proxy_config.path == comm_config.path
 
 
+class TestPushBatchConfiguration:
+    """Test that the push batch settings are applied to the communication config."""
+
+    def test_disabled_by_default(self):
+        comm_config = ServiceConfig().comm_config
+        assert comm_config.push_batch_size is None
+        assert comm_config.push_batch_timeout_us == 1000
+
+    @pytest.mark.parametrize("comm_config_arg", ["zmq_tcp", "zmq_ipc"])
+    def test_applied_to_comm_config(self, comm_config_arg):
+        config_class = ZMQTCPConfig if comm_config_arg == "zmq_tcp" else ZMQIPCConfig
+        config = ServiceConfig(
+            **{comm_config_arg: config_class()},
+            zmq_push_batch_size=32,
+            zmq_push_batch_timeout_us=250,
+        )
+        assert config.comm_config.push_batch_size == 32
+        assert config.comm_config.push_batch_timeout_us == 250
+
+
 class TestServiceConfigSerialization:
     """Test ServiceConfig serialization."""
 
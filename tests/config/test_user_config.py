@@ -14,7 +14,7 @@ from aiperf.common.config import (
     TokenizerConfig,
     UserConfig,
 )
-from aiperf.common.enums import EndpointType
+from aiperf.common.enums import CreditRoutingMode, EndpointType
 from aiperf.common.enums.timing_enums import TimingMode
 
 
@@ -41,7 +41,7 @@ def test_user_config_serialization_to_file():
             type=EndpointType.CHAT,
             custom_endpoint="custom_endpoint",
             streaming=True,
-            url="http://custom-url",
+            urls=["http://custom-url"],
         ),
     )
 
@@ -87,7 +87,7 @@ def test_user_config_defaults():
     )
     assert config.endpoint.model_names == ["model1", "model2"]
     assert config.endpoint.streaming == EndpointDefaults.STREAMING
-    assert config.endpoint.url == EndpointDefaults.URL
+    assert config.endpoint.urls == [EndpointDefaults.URL]
     assert isinstance(config.endpoint, EndpointConfig)
     assert isinstance(config.input, InputConfig)
     assert isinstance(config.output, OutputConfig)
@@ -112,13 +112,13 @@ def test_user_config_custom_values():
             custom_endpoint="custom_endpoint",
             model_names=["model1", "model2"],
             streaming=True,
-            url="http://custom-url",
+            urls=["http://custom-url"],
         ),
     }
     config = UserConfig(**custom_values)
     assert config.endpoint.model_names == ["model1", "model2"]
     assert config.endpoint.streaming is True
-    assert config.endpoint.url == "http://custom-url"
+    assert config.endpoint.urls == ["http://custom-url"]
     assert isinstance(config.endpoint, EndpointConfig)
     assert isinstance(config.input, InputConfig)
     assert isinstance(config.output, OutputConfig)
@@ -136,7 +136,7 @@ def test_user_config_exclude_unset_fields():
             type=EndpointType.CHAT,
             custom_endpoint="custom_endpoint",
             streaming=True,
-            url="http://custom-url",
+            urls=["http://custom-url"],
         ),
     )
     assert config.model_dump_json(exclude_unset=True) != config.model_dump_json()  # fmt: skip
@@ -179,7 +179,7 @@ def test_compute_artifact_directory(
         type=endpoint_type,
         custom_endpoint="custom_endpoint",
         streaming=streaming,
-        url="http://custom-url",
+        urls=["http://custom-url"],
     )
     output = OutputConfig(artifact_directory=Path("/tmp/artifacts"))
     loadgen = LoadGeneratorConfig(concurrency=5, request_rate=10)
@@ -201,3 +201,24 @@ def test_compute_artifact_directory(
 
     artifact_dir = config._compute_artifact_directory()
     assert artifact_dir == Path(expected_dir)
+
+
+@pytest.mark.parametrize(
+    "fixed_schedule, expected_mode",
+    [
+        (True, CreditRoutingMode.SESSION_AFFINITY),
+        (False, CreditRoutingMode.LEAST_LOADED),
+    ],
+)
+def test_session_affinity_only_applies_to_fixed_schedule(
+    monkeypatch, fixed_schedule, expected_mode
+):
+    monkeypatch.setattr("pathlib.Path.is_file", lambda self: True)
+    config = UserConfig(
+        endpoint=EndpointConfig(model_names=["test-model"]),
+        loadgen=LoadGeneratorConfig(
+            credit_routing_mode=CreditRoutingMode.SESSION_AFFINITY
+        ),
+        input=InputConfig(fixed_schedule=fixed_schedule, file="/tmp/dummy_input.txt"),
+    )
+    assert config.loadgen.credit_routing_mode == expected_mode
@@ -9,8 +9,8 @@ import pytest
 from aiperf.common.config import EndpointConfig, ServiceConfig, UserConfig
 from aiperf.common.config.config_defaults import OutputDefaults
 from aiperf.common.constants import NANOS_PER_MILLIS
-from aiperf.common.enums import EndpointType
-from aiperf.common.models import MetricResult
+from aiperf.common.enums import CreditRoutingMode, EndpointType
+from aiperf.common.models import CreditRoutingSummary, MetricResult
 from aiperf.common.models.export_models import JsonExportData
 from aiperf.exporters.exporter_config import ExporterConfig
 from aiperf.exporters.json_exporter import JsonExporter
@@ -73,6 +73,22 @@ class TestJsonExporter:
             def error_summary(self):
                 return []
 
+            @property
+            def client_event_loop_lag(self):
+                return None
+
+            @property
+            def client_saturated(self):
+                return False
+
+            @property
+            def credit_routing(self):
+                return CreditRoutingSummary(
+                    mode=CreditRoutingMode.LEAST_LOADED,
+                    routed_counts={"worker_1": 3, "worker_2": 1},
+                    max_queue_depths={"worker_1": 2, "worker_2": 1},
+                )
+
         return MockResults(sample_records)
 
     @pytest.mark.asyncio
@@ -104,6 +120,10 @@ class TestJsonExporter:
             assert data.time_to_first_token.avg == 123.0
             assert data.time_to_first_token.p1 == 101.0
 
+            assert data.credit_routing is not None
+            assert data.credit_routing.routed_counts == {"worker_1": 3, "worker_2": 1}
+            assert data.credit_routing.imbalance == 1.5
+
             assert data.input_config is not None
             assert isinstance(data.input_config, UserConfig)
             # TODO: Uncomment this once we have expanded the output config to include all important fields
@@ -38,7 +38,7 @@ def empty_dataset_manager(
         user_config=user_config,
         service_id="test_dataset_manager",
     )
-    manager.dataset = {}
+    manager._set_dataset([])
     return manager
 
 
@@ -53,7 +53,7 @@ def populated_dataset_manager(
         user_config=user_config,
         service_id="test_dataset_manager",
     )
-    manager.dataset = sample_conversations
+    manager._set_dataset(sample_conversations.values())
     return manager
 
 
@@ -111,7 +111,8 @@ class TestDatasetManagerInputsJsonGeneration:
 
         written_json = json.loads(capture_file_writes.written_content)
         session_ids = [session["session_id"] for session in written_json["data"]]
-        expected_order = list(populated_dataset_manager.dataset.keys())
+        store = populated_dataset_manager.dataset_store
+        expected_order = [store.session_id(i) for i in range(len(store))]
         assert session_ids == expected_order
 
     @pytest.mark.asyncio
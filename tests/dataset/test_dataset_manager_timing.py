@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the chunked DatasetManager fixed schedule timing responses.
+"""
+
+import pytest
+
+from aiperf.common.exceptions import ServiceError
+from aiperf.common.messages import DatasetTimingRequest
+from aiperf.common.models import Conversation, Text, Turn
+from aiperf.dataset.dataset_manager import DatasetManager
+
+
+def _conversation(session_id: str, *timestamps: int | None) -> Conversation:
+    return Conversation(
+        session_id=session_id,
+        turns=[
+            Turn(timestamp=timestamp, texts=[Text(contents=["hello"])])
+            for timestamp in timestamps
+        ],
+    )
+
+
+@pytest.fixture
+def timing_dataset_manager(empty_dataset_manager: DatasetManager) -> DatasetManager:
+    conversations = [
+        _conversation("session_a", 300, 100),
+        _conversation("session_b", 200),
+        _conversation("session_c", 100),
+    ]
+    empty_dataset_manager._set_dataset(conversations)
+    empty_dataset_manager.dataset_configured.set()
+    return empty_dataset_manager
+
+
+class TestDatasetManagerTiming:
+    """Test suite for the fixed schedule timing requests."""
+
+    @pytest.mark.asyncio
+    async def test_timing_response_is_sorted(
+        self, timing_dataset_manager: DatasetManager
+    ):
+        response = await timing_dataset_manager._handle_dataset_timing_request(
+            DatasetTimingRequest(service_id="test")
+        )
+
+        assert response.total_entries == 4
+        assert response.total_conversations == 3
+        assert response.timestamps == [100, 100, 200, 300]
+        # Stable sort keeps the dataset order for equal timestamps
+        assert [
+            response.conversation_ids[i] for i in response.conversation_indices
+        ] == ["session_a", "session_c", "session_b", "session_a"]
+
+    @pytest.mark.asyncio
+    async def test_timing_response_is_chunked(
+        self, timing_dataset_manager: DatasetManager
+    ):
+        timestamps, indices, conversation_ids = [], [], []
+        offset = 0
+        while True:
+            response = await timing_dataset_manager._handle_dataset_timing_request(
+                DatasetTimingRequest(service_id="test", offset=offset, limit=1)
+            )
+            assert len(response.timestamps) <= 1
+            timestamps.extend(response.timestamps)
+            indices.extend(response.conversation_indices)
+            conversation_ids.extend(response.conversation_ids)
+            offset += 1
+            if offset >= response.total_entries:
+                break
+
+        assert timestamps == [100, 100, 200, 300]
+        assert conversation_ids == ["session_a", "session_b", "session_c"]
+        assert [conversation_ids[i] for i in indices] == [
+            "session_a",
+            "session_c",
+            "session_b",
+            "session_a",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_timestamp_raises_error(
+        self, timing_dataset_manager: DatasetManager
+    ):
+        store = timing_dataset_manager.dataset_store
+        timing_dataset_manager._set_dataset(
+            [
+                *map(store.get_conversation, range(len(store))),
+                _conversation("session_d", None),
+            ]
+        )
+
+        with pytest.raises(ServiceError, match="without a timestamp"):
+            await timing_dataset_manager._handle_dataset_timing_request(
+                DatasetTimingRequest(service_id="test")
+            )
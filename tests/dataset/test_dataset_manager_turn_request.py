@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the DatasetManager turn and conversation requests.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from aiperf.common.messages import (
+    ConversationTurnRequestMessage,
+    Message,
+)
+from aiperf.common.models import Audio, Conversation, Image, Text, Turn
+from aiperf.dataset.dataset_manager import DatasetManager
+
+
+@pytest.fixture
+def multimodal_dataset_manager(
+    empty_dataset_manager: DatasetManager,
+) -> DatasetManager:
+    conversation = Conversation(
+        session_id="session_a",
+        turns=[
+            Turn(
+                texts=[Text(contents=["describe this"])],
+                images=[Image(contents=["data:image/png;base64,AAAA"])],
+                audios=[Audio(contents=["wav,AAAA"])],
+            )
+        ],
+    )
+    empty_dataset_manager._set_dataset([conversation])
+    return empty_dataset_manager
+
+
+class TestDatasetManagerTurnRequest:
+    @pytest.mark.asyncio
+    async def test_turn_request(self, multimodal_dataset_manager: DatasetManager):
+        response = await multimodal_dataset_manager._handle_conversation_turn_request(
+            ConversationTurnRequestMessage(
+                service_id="test", conversation_id="session_a", turn_index=0
+            )
+        )
+
+        assert response.turn.images[0].contents == ["data:image/png;base64,AAAA"]
+        assert response.turn.audios[0].contents == ["wav,AAAA"]
+
+    @pytest.mark.asyncio
+    async def test_turn_request_texts_only(
+        self, multimodal_dataset_manager: DatasetManager
+    ):
+        response = await multimodal_dataset_manager._handle_conversation_turn_request(
+            ConversationTurnRequestMessage(
+                service_id="test",
+                conversation_id="session_a",
+                turn_index=0,
+                texts_only=True,
+            )
+        )
+
+        assert response.turn.texts[0].contents == ["describe this"]
+        assert response.turn.images == []
+        assert response.turn.audios == []
+        # The turn in the dataset is left intact
+        assert multimodal_dataset_manager.dataset_store.get_turn(0, 0).images
+
+    def test_conversation_request_sends_raw_payloads(
+        self, multimodal_dataset_manager: DatasetManager
+    ):
+        """Test that a conversation is sent from the payloads of the dataset store, without being parsed."""
+        with patch.object(
+            multimodal_dataset_manager.dataset_store,
+            "get_conversation",
+            side_effect=AssertionError("The conversation should not be parsed"),
+        ):
+            response = multimodal_dataset_manager._return_conversation_by_id(
+                request_id="r1", conversation_id="session_a"
+            )
+            received = Message.from_json(response.to_json_bytes())
+
+        assert received.request_id == "r1"
+        assert received.conversation.session_id == "session_a"
+        assert received.conversation.turns[0].images[0].contents == [
+            "data:image/png;base64,AAAA"
+        ]
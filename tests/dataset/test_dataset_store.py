@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the memory-mapped dataset store.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from aiperf.common.exceptions import DatasetError
+from aiperf.common.models import Conversation, Image, Text, Turn
+from aiperf.dataset import MISSING_VALUE, DatasetStore, write_dataset_store
+
+
+@pytest.fixture
+def conversations() -> list[Conversation]:
+    return [
+        Conversation(
+            session_id="session_a",
+            turns=[
+                Turn(texts=[Text(contents=["hello"])], timestamp=100),
+                Turn(
+                    texts=[Text(contents=["world"])],
+                    images=[Image(contents=["data:image/png;base64,AAAA"])],
+                    delay=50,
+                ),
+            ],
+        ),
+        Conversation(session_id="session_é", turns=[]),
+        Conversation(
+            session_id="session_c",
+            turns=[Turn(texts=[Text(contents=["again"])], timestamp=200)],
+        ),
+    ]
+
+
+@pytest.fixture
+def dataset_store(tmp_path: Path, conversations: list[Conversation]):
+    path = tmp_path / "dataset_store.bin"
+    write_dataset_store(path, conversations)
+    store = DatasetStore(path)
+    yield store
+    store.close()
+
+
+class TestDatasetStore:
+    def test_round_trip(
+        self, dataset_store: DatasetStore, conversations: list[Conversation]
+    ):
+        assert len(dataset_store) == 3
+        assert dataset_store.num_turns == 3
+        assert [dataset_store.session_id(i) for i in range(3)] == [
+            "session_a",
+            "session_é",
+            "session_c",
+        ]
+        for i, conversation in enumerate(conversations):
+            assert dataset_store.get_conversation(i) == conversation
+
+    def test_index_of(self, dataset_store: DatasetStore):
+        assert dataset_store.index_of("session_a") == 0
+        assert dataset_store.index_of("session_é") == 1
+        assert dataset_store.index_of("session_c") == 2
+        assert dataset_store.index_of("unknown") is None
+
+    def test_index_of_hash_collision(self, tmp_path: Path):
+        path = tmp_path / "dataset_store.bin"
+        with patch("aiperf.dataset.dataset_store._hash_session_id", return_value=0):
+            write_dataset_store(
+                path, [Conversation(session_id=f"session_{i}") for i in range(3)]
+            )
+            store = DatasetStore(path)
+            assert [store.index_of(f"session_{i}") for i in range(3)] == [0, 1, 2]
+            assert store.index_of("unknown") is None
+        store.close()
+
+    def test_conversation_json(
+        self, dataset_store: DatasetStore, conversations: list[Conversation]
+    ):
+        for i, conversation in enumerate(conversations):
+            assert (
+                Conversation.model_validate_json(dataset_store.conversation_json(i))
+                == conversation
+            )
+
+    def test_columns(self, dataset_store: DatasetStore):
+        assert dataset_store.conversation_turn_offsets.tolist() == [0, 2, 2, 3]
+        assert dataset_store.timestamps.tolist() == [100, MISSING_VALUE, 200]
+        assert dataset_store.delays.tolist() == [MISSING_VALUE, 50, MISSING_VALUE]
+
+    def test_turn_payload(self, dataset_store: DatasetStore):
+        payload = dataset_store.turn_payload(0, 1)
+        assert isinstance(payload, memoryview)
+        assert orjson.loads(payload)["images"][0]["contents"] == [
+            "data:image/png;base64,AAAA"
+        ]
+        payload.release()
+
+    @pytest.mark.parametrize(
+        "conversation_index, turn_index", [(0, 2), (1, 0), (0, -1)]
+    )
+    def test_turn_index_out_of_range(
+        self, dataset_store: DatasetStore, conversation_index: int, turn_index: int
+    ):
+        with pytest.raises(IndexError):
+            dataset_store.turn_payload(conversation_index, turn_index)
+
+    def test_empty(self, tmp_path: Path):
+        path = tmp_path / "empty.bin"
+        write_dataset_store(path, [])
+        store = DatasetStore(path)
+        assert len(store) == 0
+        assert not store
+        assert store.timestamps.size == 0
+        store.close()
+
+    def test_close_with_payload_referenced(self, dataset_store: DatasetStore):
+        payload = dataset_store.turn_payload(0, 0)
+        dataset_store.close()
+        assert orjson.loads(payload)["texts"][0]["contents"] == ["hello"]
+
+    def test_overwrite_does_not_leave_temp_file(
+        self, tmp_path: Path, conversations: list[Conversation]
+    ):
+        path = tmp_path / "dataset_store.bin"
+        write_dataset_store(path, conversations)
+        write_dataset_store(path, conversations[:1])
+        store = DatasetStore(path)
+        assert store.session_id(0) == "session_a"
+        assert store.index_of("session_c") is None
+        store.close()
+        assert [p.name for p in tmp_path.iterdir()] == ["dataset_store.bin"]
+
+    @pytest.mark.parametrize(
+        "content", [b"", b"not a dataset store" * 10], ids=["empty", "bad_magic"]
+    )
+    def test_invalid_file(self, tmp_path: Path, content: bytes):
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(content)
+        with pytest.raises(DatasetError):
+            DatasetStore(path)
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.metrics.metric_dicts import MetricRecordDict
+from aiperf.metrics.types.coalesced_response_metric import (
+    CoalescedResponseCountMetric,
+)
+from tests.metrics.conftest import create_record, run_simple_metrics_pipeline
+
+
+class TestCoalescedResponseCountMetric:
+    def test_coalesced_response_count(self):
+        """Test that the coalesced response count of each record is extracted"""
+        records = []
+        for count in [0, 3]:
+            record = create_record(responses=[110, 120, 130, 140])
+            record.request.coalesced_response_count = count
+            records.append(record)
+
+        metric_results = run_simple_metrics_pipeline(
+            records, CoalescedResponseCountMetric.tag
+        )
+        assert metric_results[CoalescedResponseCountMetric.tag] == [0, 3]
+
+    def test_not_captured(self):
+        """Test that records whose client did not timestamp the socket reads have no metric value"""
+        with pytest.raises(NoMetricValue):
+            CoalescedResponseCountMetric().parse_record(
+                create_record(), MetricRecordDict()
+            )
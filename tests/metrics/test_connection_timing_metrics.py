@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from pytest import approx
+
+from aiperf.common.exceptions import NoMetricValue
+from aiperf.common.models import ConnectionTiming
+from aiperf.metrics.metric_dicts import MetricRecordDict
+from aiperf.metrics.types.connection_timing_metrics import (
+    ConnectionReuseRatioMetric,
+    ConnectLatencyMetric,
+    RequestSendDurationMetric,
+    ReusedConnectionCountMetric,
+    ServerWaitTimeMetric,
+)
+from aiperf.metrics.types.request_count_metric import RequestCountMetric
+from tests.metrics.conftest import create_record, run_simple_metrics_pipeline
+
+
+def create_timed_record(start_ns: int = 100, reused: bool = False, **timing):
+    """Create a record with the given connection timing."""
+    record = create_record(start_ns=start_ns, responses=[start_ns + 100])
+    record.request.connection_timing = ConnectionTiming(reused=reused, **timing)
+    return record
+
+
+class TestConnectionTimingMetrics:
+    def test_connection_timing_breakdown(self):
+        """Test the connect latency, send duration and server wait time of a single request"""
+        # Request start at 100ns, connection ready at 130ns, request sent at 135ns, headers at 175ns
+        record = create_timed_record(
+            start_ns=100,
+            connection_ready_perf_ns=130,
+            request_sent_perf_ns=135,
+            headers_received_perf_ns=175,
+        )
+
+        metric_results = run_simple_metrics_pipeline(
+            [record],
+            ConnectLatencyMetric.tag,
+            RequestSendDurationMetric.tag,
+            ServerWaitTimeMetric.tag,
+        )
+        assert metric_results[ConnectLatencyMetric.tag] == [30]
+        assert metric_results[RequestSendDurationMetric.tag] == [5]
+        assert metric_results[ServerWaitTimeMetric.tag] == [40]
+
+    @pytest.mark.parametrize(
+        "metric_class",
+        [ConnectLatencyMetric, RequestSendDurationMetric, ServerWaitTimeMetric],
+    )
+    def test_no_connection_timing(self, metric_class):
+        """Test that records without connection timing have no metric value"""
+        with pytest.raises(NoMetricValue):
+            metric_class().parse_record(create_record(), MetricRecordDict())
+
+    @pytest.mark.parametrize(
+        "metric_class",
+        [ConnectLatencyMetric, RequestSendDurationMetric, ServerWaitTimeMetric],
+    )
+    def test_missing_timing_points(self, metric_class):
+        """Test that timing points the client did not capture result in no metric value"""
+        with pytest.raises(NoMetricValue):
+            metric_class().parse_record(create_timed_record(), MetricRecordDict())
+
+    def test_timestamps_out_of_order(self):
+        """Test that an error is raised if the headers were received before the request was sent"""
+        record = create_timed_record(
+            request_sent_perf_ns=150, headers_received_perf_ns=140
+        )
+        with pytest.raises(ValueError):
+            ServerWaitTimeMetric().parse_record(record, MetricRecordDict())
+
+    @pytest.mark.parametrize(
+        "reused, expected_ratio",
+        [
+            ([True, True, True, False], 0.75),
+            ([False, False], 0.0),
+            ([True], 1.0),
+        ],
+    )
+    def test_connection_reuse_ratio(self, reused, expected_ratio):
+        """Test the fraction of requests sent over reused connections, including no reuse at all"""
+        records = [create_timed_record(reused=value) for value in reused]
+
+        metric_results = run_simple_metrics_pipeline(
+            records,
+            RequestCountMetric.tag,
+            ReusedConnectionCountMetric.tag,
+            ConnectionReuseRatioMetric.tag,
+        )
+        assert metric_results[ReusedConnectionCountMetric.tag] == sum(reused)
+        assert metric_results[ConnectionReuseRatioMetric.tag] == approx(expected_ratio)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+
+import pytest
+
+from aiperf.common.constants import DEFAULT_EVENT_LOOP_LAG_WINDOW, NANOS_PER_MILLIS
+from aiperf.common.mixins import ProcessHealthMixin
+from tests.conftest import real_sleep
+
+
+class TestProcessHealthMixinEventLoopLag:
+    """Test suite for the event loop lag probe of the ProcessHealthMixin."""
+
+    @pytest.fixture
+    def component(self):
+        return ProcessHealthMixin()
+
+    def test_no_event_loop_lag_before_probing(self, component):
+        assert component.get_event_loop_lag() is None
+        assert component.get_process_health().event_loop_lag is None
+
+    def test_event_loop_lag_percentiles(self, component):
+        component._event_loop_lag_samples.extend(range(1, 101))
+
+        lag = component.get_event_loop_lag()
+
+        assert lag.samples == 100
+        assert lag.p50_ns == 50
+        assert lag.p90_ns == 90
+        assert lag.p99_ns == 99
+        assert lag.max_ns == 100
+
+    def test_event_loop_lag_uses_recent_samples(self, component):
+        component._event_loop_lag_samples.extend(
+            [10**9] * DEFAULT_EVENT_LOOP_LAG_WINDOW
+        )
+        component._event_loop_lag_samples.extend([0] * DEFAULT_EVENT_LOOP_LAG_WINDOW)
+
+        assert component.get_event_loop_lag().max_ns == 0
+
+    @pytest.mark.asyncio
+    async def test_probe_measures_blocked_event_loop(self, component, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", real_sleep)
+        await component.initialize()
+        await component.start()
+        try:
+            await asyncio.sleep(0.1)
+            # Block the event loop while the probe is sleeping
+            time.sleep(0.2)
+            await asyncio.sleep(0.1)
+        finally:
+            await component.stop()
+
+        lag = component.get_process_health().event_loop_lag
+        assert lag is not None
+        assert lag.max_ns >= 100 * NANOS_PER_MILLIS
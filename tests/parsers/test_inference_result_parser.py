@@ -3,13 +3,34 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
+from aiperf.clients.http.aiohttp_client import parse_sse_message
+from aiperf.clients.http.timing_only import append_timing_only_message
 from aiperf.common.config import EndpointConfig, InputConfig, ServiceConfig, UserConfig
 from aiperf.common.messages import ConversationTurnResponseMessage
-from aiperf.common.models import ErrorDetails, RequestRecord, Text, Turn
+from aiperf.common.models import (
+    ErrorDetails,
+    ParsedResponse,
+    RequestRecord,
+    SSEField,
+    SSEMessage,
+    Text,
+    TextResponse,
+    TextResponseData,
+    Turn,
+)
 from aiperf.common.tokenizer import Tokenizer
-from aiperf.parsers.inference_result_parser import InferenceResultParser
+from aiperf.metrics.types.inter_chunk_latency_metric import InterChunkLatencyMetric
+from aiperf.metrics.types.request_latency_metric import RequestLatencyMetric
+from aiperf.metrics.types.ttft_metric import TTFTMetric
+from aiperf.parsers.inference_result_parser import (
+    InferenceResultParser,
+    parse_record_from_usage,
+)
+from aiperf.parsers.openai_parsers import OpenAIResponseExtractor
+from tests.metrics.conftest import run_simple_metrics_pipeline
 
 
 @pytest.fixture
@@ -129,3 +150,194 @@ async def test_error_records_compute_input_tokens(
     assert result.input_token_count == 8
     assert result.responses == []
     assert record.error is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "final_response, expected_perf_ns",
+    [
+        (
+            SSEMessage(
+                perf_ns=3000,
+                packets=[
+                    SSEField(
+                        name="data",
+                        value='{"choices":[],"usage":{"prompt_tokens":12,"completion_tokens":30,'
+                        '"completion_tokens_details":{"reasoning_tokens":10}}}',
+                    )
+                ],
+            ),
+            # The usage-only final message of a stream is not a response
+            [2000],
+        ),
+        (
+            TextResponse(
+                perf_ns=3000,
+                text='{"usage":{"prompt_tokens":12,"completion_tokens":30,'
+                '"completion_tokens_details":{"reasoning_tokens":10}}}',
+            ),
+            [2000, 3000],
+        ),
+    ],
+)
+async def test_timing_only_record_uses_server_usage(
+    parser, mock_tokenizer, sample_turn, final_response, expected_perf_ns
+):
+    """Test that timing-only records keep the response timestamps and take the token counts from the usage."""
+    setup_parser_for_error_tests(parser, mock_tokenizer, sample_turn)
+    parser.model_endpoint.endpoint.timing_only = True
+    record = create_request_record()
+    record.start_perf_ns = 1000
+    record.responses = [SSEMessage(perf_ns=2000), final_response]
+
+    result = await parser.parse_request_record(record)
+
+    assert [response.perf_ns for response in result.responses] == expected_perf_ns
+    assert result.input_token_count == 12
+    assert result.output_token_count == 20
+    assert result.reasoning_token_count == 10
+    parser.extractor.extract_response_data.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_timing_only_record_without_usage(parser, mock_tokenizer, sample_turn):
+    """Test that timing-only records without usage fall back to tokenizing the input only."""
+    setup_parser_for_error_tests(parser, mock_tokenizer, sample_turn)
+    parser.model_endpoint.endpoint.timing_only = True
+    record = create_request_record()
+    record.responses = [
+        SSEMessage(
+            perf_ns=record.start_perf_ns + 1,
+            packets=[
+                SSEField(
+                    name="data",
+                    value='{"object":"chat.completion.chunk","choices":[{"delta":{"content":"Hi"}}]}',
+                )
+            ],
+        )
+    ]
+
+    result = await parser.parse_request_record(record)
+
+    assert len(result.responses) == 1
+    assert result.input_token_count == 8
+    assert result.output_token_count is None
+    assert result.reasoning_token_count is None
+
+
+def _sse_data(perf_ns: int, data: str) -> SSEMessage:
+    return SSEMessage(perf_ns=perf_ns, packets=[SSEField(name="data", value=data)])
+
+
+def test_parse_record_from_usage():
+    """Test that a record is parsed from the usage chunk that precedes the [DONE] message of a stream."""
+    record = create_request_record()
+    record.responses = [
+        _sse_data(2000, '{"choices":[{"delta":{"content":"Hi"}}]}'),
+        _sse_data(
+            3000,
+            '{"choices":[],"usage":{"prompt_tokens":12,"completion_tokens":30,'
+            '"completion_tokens_details":{"reasoning_tokens":10}}}',
+        ),
+        _sse_data(3001, "[DONE]"),
+    ]
+    responses = [ParsedResponse(perf_ns=2000, data=TextResponseData(text="Hi"))]
+
+    result = parse_record_from_usage(record, responses)
+
+    assert result.responses == responses
+    assert result.input_token_count == 12
+    assert result.output_token_count == 20
+    assert result.reasoning_token_count == 10
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"choices":[{"delta":{"content":"Hi"}}]}',
+        '{"choices":[],"usage":{"completion_tokens":30}}',
+        '{"choices":[],"usage":null}',
+    ],
+)
+def test_parse_record_from_usage_without_usage(data):
+    """Test that a record needs to be tokenized when the server did not report both token counts."""
+    record = create_request_record()
+    record.responses = [_sse_data(2000, data), _sse_data(2001, "[DONE]")]
+
+    assert parse_record_from_usage(record, []) is None
+
+
+@pytest.mark.asyncio
+async def test_input_token_count_is_cached_by_turn(parser, mock_tokenizer):
+    """Test that each turn is only tokenized once, from the texts sent with the record."""
+    parser.get_tokenizer = AsyncMock(return_value=mock_tokenizer)
+
+    def record_with_texts(turn_index: int = 0) -> RequestRecord:
+        record = create_request_record()
+        record.turn_index = turn_index
+        record.input_texts = ["Hello world Test case", "Another input"]
+        return record
+
+    first = await parser.compute_input_token_count(record_with_texts())
+    second = await parser.compute_input_token_count(record_with_texts())
+    await parser.compute_input_token_count(record_with_texts(turn_index=1))
+
+    assert first == second == 6
+    assert mock_tokenizer.encode.call_count == 4
+    parser.conversation_request_client.request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_timing_only_metrics_match_normal_mode(
+    parser, mock_tokenizer, sample_turn
+):
+    """Test that the timing metrics of a stream are the same in timing-only mode as in normal mode,
+    with the role-only first message and the usage-only final message left out of both."""
+    stream = [
+        (100, {"choices": [{"delta": {"role": "assistant"}}]}),
+        (500, {"choices": [{"delta": {"content": "Hello world"}}]}),
+        (600, {"choices": [{"delta": {"content": " again"}}]}),
+        (
+            900,
+            {
+                "choices": [],
+                "usage": {"prompt_tokens": 8, "completion_tokens": 3},
+            },
+        ),
+    ]
+    raw_messages = [
+        (
+            perf_ns,
+            "data: "
+            + orjson.dumps({"object": "chat.completion.chunk"} | chunk).decode(),
+        )
+        for perf_ns, chunk in stream
+    ] + [(950, "data: [DONE]")]
+
+    setup_parser_for_error_tests(parser, mock_tokenizer, sample_turn)
+    parser.extractor = OpenAIResponseExtractor(parser.model_endpoint)
+    metrics = [
+        TTFTMetric.tag,
+        RequestLatencyMetric.tag,
+        InterChunkLatencyMetric.tag,
+    ]
+
+    results = {}
+    for timing_only in (False, True):
+        parser.model_endpoint.endpoint.timing_only = timing_only
+        record = create_request_record()
+        record.start_perf_ns = 0
+        for perf_ns, raw in raw_messages:
+            message = parse_sse_message(raw, perf_ns)
+            if timing_only:
+                append_timing_only_message(record.responses, message)
+            else:
+                record.responses.append(message)
+        parsed = await parser.parse_request_record(record)
+        assert [response.perf_ns for response in parsed.responses] == [500, 600]
+        results[timing_only] = (
+            run_simple_metrics_pipeline([parsed], *metrics),
+            parsed.output_token_count,
+        )
+
+    assert results[True] == results[False]
@@ -165,6 +165,7 @@ def create_metric_metadata(
     benchmark_phase: CreditPhase = CreditPhase.PROFILING,
     x_request_id: str | None = None,
     x_correlation_id: str | None = None,
+    endpoint_url: str | None = None,
 ) -> MetricRecordMetadata:
     """
     Create a MetricRecordMetadata object with sensible defaults.
@@ -181,6 +182,7 @@ def create_metric_metadata(
         benchmark_phase: Benchmark phase (warmup or profiling)
         x_request_id: X-Request-ID header value (optional)
         x_correlation_id: X-Correlation-ID header value (optional)
+        endpoint_url: URL the request was load balanced to (optional)
 
     Returns:
         MetricRecordMetadata object
@@ -197,6 +199,7 @@ def create_metric_metadata(
         benchmark_phase=benchmark_phase,
         x_request_id=x_request_id,
         x_correlation_id=x_correlation_id,
+        endpoint_url=endpoint_url,
     )
 
 
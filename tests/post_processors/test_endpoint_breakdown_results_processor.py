@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from aiperf.common.config import (
+    EndpointConfig,
+    OutputConfig,
+    ServiceConfig,
+    UserConfig,
+)
+from aiperf.common.config.config_defaults import OutputDefaults
+from aiperf.common.enums import EndpointType, LoadBalancingStrategy
+from aiperf.common.exceptions import PostProcessorDisabled
+from aiperf.common.models import ErrorDetails
+from aiperf.metrics.types.request_latency_metric import RequestLatencyMetric
+from aiperf.metrics.types.ttft_metric import TTFTMetric
+from aiperf.post_processors.endpoint_breakdown_results_processor import (
+    EndpointBreakdownResultsProcessor,
+)
+from tests.post_processors.conftest import create_metric_records_message
+
+URLS = ["http://replica-0:8000", "http://replica-1:8000"]
+
+
+def _user_config(tmp_path: Path, urls: list[str]) -> UserConfig:
+    return UserConfig(
+        endpoint=EndpointConfig(
+            model_names=["test-model"],
+            type=EndpointType.CHAT,
+            streaming=True,
+            urls=urls,
+            load_balancing=LoadBalancingStrategy.LEAST_OUTSTANDING,
+        ),
+        output=OutputConfig(artifact_directory=tmp_path),
+    )
+
+
+def _record_data(
+    endpoint_url: str | None,
+    latency_ns: int,
+    start_ns: int,
+    error: ErrorDetails | None = None,
+):
+    return create_metric_records_message(
+        results=[
+            {RequestLatencyMetric.tag: latency_ns, TTFTMetric.tag: latency_ns // 2}
+        ],
+        error=error,
+        endpoint_url=endpoint_url,
+        request_start_ns=start_ns,
+        request_end_ns=start_ns + latency_ns,
+    ).to_data()
+
+
+class TestEndpointBreakdownResultsProcessor:
+    def test_disabled_for_single_url(self, tmp_path: Path):
+        with pytest.raises(PostProcessorDisabled):
+            EndpointBreakdownResultsProcessor(
+                service_id="records-manager",
+                service_config=ServiceConfig(),
+                user_config=_user_config(tmp_path, URLS[:1]),
+            )
+
+    @pytest.mark.asyncio
+    async def test_breakdown_by_endpoint(self, tmp_path: Path):
+        processor = EndpointBreakdownResultsProcessor(
+            service_id="records-manager",
+            service_config=ServiceConfig(),
+            user_config=_user_config(tmp_path, URLS),
+        )
+
+        await processor.process_result(_record_data(URLS[0], 10_000_000, 0))
+        await processor.process_result(_record_data(URLS[0], 30_000_000, 1_000_000_000))
+        await processor.process_result(_record_data(URLS[1], 50_000_000, 0))
+        await processor.process_result(
+            _record_data(
+                URLS[1],
+                1_000_000,
+                500_000_000,
+                error=ErrorDetails(code=500, message="Internal Server Error"),
+            )
+        )
+        # Records without an endpoint URL are not part of the breakdown
+        await processor.process_result(_record_data(None, 1_000_000, 0))
+
+        assert await processor.summarize() == []
+
+        breakdown = processor.get_breakdown()
+        assert breakdown.load_balancing == LoadBalancingStrategy.LEAST_OUTSTANDING
+        first, second = breakdown.endpoints
+        assert first.url == URLS[0]
+        assert first.request_count == 2
+        assert first.error_request_count == 0
+        assert first.request_throughput == pytest.approx(2 / 1.03)
+        assert first.metrics[RequestLatencyMetric.tag].avg == pytest.approx(20.0)
+        assert first.metrics[RequestLatencyMetric.tag].unit == "ms"
+        assert first.metrics[TTFTMetric.tag].avg == pytest.approx(10.0)
+
+        assert second.url == URLS[1]
+        assert second.request_count == 1
+        assert second.error_request_count == 1
+        assert second.request_throughput == pytest.approx(1 / 0.501)
+        assert second.metrics[RequestLatencyMetric.tag].avg == pytest.approx(50.0)
+
+    @pytest.mark.asyncio
+    async def test_exports_breakdown_on_stop(self, tmp_path: Path):
+        processor = EndpointBreakdownResultsProcessor(
+            service_id="records-manager",
+            service_config=ServiceConfig(),
+            user_config=_user_config(tmp_path, URLS),
+        )
+        await processor.initialize()
+        await processor.start()
+        await processor.process_result(_record_data(URLS[1], 10_000_000, 0))
+        await processor.stop()
+
+        export_file = (
+            tmp_path / OutputDefaults.PROFILE_EXPORT_AIPERF_ENDPOINTS_JSON_FILE
+        )
+        data = orjson.loads(export_file.read_bytes())
+        assert data["load_balancing"] == "least_outstanding"
+        assert [endpoint["url"] for endpoint in data["endpoints"]] == URLS
+        assert [endpoint["request_count"] for endpoint in data["endpoints"]] == [0, 1]
+        assert data["endpoints"][0]["metrics"] == {}
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from aiperf.common.constants import NANOS_PER_MILLIS
+from aiperf.common.enums.worker_enums import WorkerStatus
+from aiperf.common.messages import WorkerStatusSummaryMessage
+from aiperf.common.models import EventLoopLag, ProcessHealth, WorkerStats
+from aiperf.records.records_manager import RecordsManager
+
+THRESHOLD_MS = 50.0
+
+
+def create_mock_records_manager(
+    start_time_ns: int | None = 1, end_time_ns: int | None = None
+) -> MagicMock:
+    """Create a mock RecordsManager instance for testing the client saturation detection."""
+    instance = MagicMock()
+    instance.start_time_ns = start_time_ns
+    instance.end_time_ns = end_time_ns
+    instance.user_config.loadgen.client_lag_threshold = THRESHOLD_MS
+    instance.client_lag_threshold_ns = int(THRESHOLD_MS * NANOS_PER_MILLIS)
+    instance.client_event_loop_lag = None
+    instance.client_saturated = False
+    return instance
+
+
+def create_summary_message(
+    p99_ms: float, worker_id: str = "worker_1"
+) -> WorkerStatusSummaryMessage:
+    p99_ns = int(p99_ms * NANOS_PER_MILLIS)
+    return WorkerStatusSummaryMessage(
+        service_id="worker_manager",
+        worker_statuses={worker_id: WorkerStatus.HEALTHY},
+        worker_stats={
+            worker_id: WorkerStats(
+                worker_id=worker_id,
+                health=ProcessHealth(
+                    create_time=0,
+                    uptime=1,
+                    cpu_usage=10.0,
+                    memory_usage=0,
+                    event_loop_lag=EventLoopLag(
+                        samples=100, p50_ns=0, p90_ns=0, p99_ns=p99_ns, max_ns=p99_ns
+                    ),
+                ),
+            )
+        },
+    )
+
+
+@pytest.mark.asyncio
+class TestRecordsManagerClientSaturation:
+    """Test the records manager's client saturation detection."""
+
+    async def test_lag_below_threshold(self):
+        instance = create_mock_records_manager()
+
+        await RecordsManager._on_worker_status_summary(
+            instance, create_summary_message(5)
+        )
+
+        assert not instance.client_saturated
+        assert instance.client_event_loop_lag.p99_ns == 5 * NANOS_PER_MILLIS
+        instance.warning.assert_not_called()
+
+    async def test_lag_above_threshold_warns_once(self):
+        instance = create_mock_records_manager()
+
+        await RecordsManager._on_worker_status_summary(
+            instance, create_summary_message(80)
+        )
+        await RecordsManager._on_worker_status_summary(
+            instance, create_summary_message(100, worker_id="worker_2")
+        )
+        await RecordsManager._on_worker_status_summary(
+            instance, create_summary_message(5)
+        )
+
+        assert instance.client_saturated
+        # The most lagged worker is reported
+        assert instance.client_event_loop_lag.p99_ns == 100 * NANOS_PER_MILLIS
+        instance.warning.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "start_time_ns,end_time_ns",
+        [
+            (None, None),  # Before the profiling phase
+            (1, 2),  # After the profiling phase
+        ],
+    )
+    async def test_lag_outside_profiling_is_ignored(self, start_time_ns, end_time_ns):
+        instance = create_mock_records_manager(start_time_ns, end_time_ns)
+
+        await RecordsManager._on_worker_status_summary(
+            instance, create_summary_message(80)
+        )
+
+        assert not instance.client_saturated
+        assert instance.client_event_loop_lag is None
+
+    async def test_summary_without_health_is_ignored(self):
+        instance = create_mock_records_manager()
+        message = create_summary_message(80)
+        message.worker_stats = {}
+
+        await RecordsManager._on_worker_status_summary(instance, message)
+
+        assert not instance.client_saturated
+        assert instance.client_event_loop_lag is None
@@ -8,10 +8,16 @@ import pytest
 
 from aiperf.common.config import EndpointConfig, InputConfig, ServiceConfig, UserConfig
 from aiperf.common.enums import CustomDatasetType
+from aiperf.common.messages import ConversationResponseMessage, Message
 from aiperf.common.messages.command_messages import ProfileConfigureCommand
 from aiperf.dataset.dataset_manager import DatasetManager
 
 
+def _session_id(response: ConversationResponseMessage) -> str:
+    """Get the session ID of the conversation of a response, as received by a worker."""
+    return Message.from_json(response.to_json_bytes()).conversation.session_id
+
+
 class TestDatasetManagerSequentialIteration:
     """Test sequential iteration behavior for custom datasets."""
 
@@ -91,9 +97,8 @@ class TestDatasetManagerSequentialIteration:
 
             # Verify that the order is identical (sequential), not different (random)
             for i in range(5):
-                assert (
-                    conversations[i].conversation.session_id
-                    == conversations_repeat[i].conversation.session_id
+                assert _session_id(conversations[i]) == _session_id(
+                    conversations_repeat[i]
                 )
 
         finally:
@@ -145,7 +150,7 @@ class TestDatasetManagerSequentialIteration:
             custom_sessions = []
             for _ in range(6):  # More than dataset size to test wraparound
                 conv = custom_manager._return_any_conversation("test_session")
-                custom_sessions.append(conv.conversation.session_id)
+                custom_sessions.append(_session_id(conv))
 
             # Should repeat pattern: session1, session2, session3, session1, session2, session3
             assert (
@@ -202,7 +207,7 @@ class TestDatasetManagerSequentialIteration:
             session_ids = []
             for _ in range(5):  # 5 requests for 2-entry dataset
                 conv = dataset_manager._return_any_conversation("test_session")
-                session_ids.append(conv.conversation.session_id)
+                session_ids.append(_session_id(conv))
 
             # Should follow pattern: entry1, entry2, entry1, entry2, entry1
             assert (
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the least loaded credit routing of the TimingManager.
+"""
+
+import pytest
+
+from aiperf.common.enums import CreditRoutingMode
+from aiperf.timing.credit_router import CreditRouter
+
+
+def _affinity_router(*worker_ids: str, capacity: int = 100) -> CreditRouter:
+    router = CreditRouter(mode=CreditRoutingMode.SESSION_AFFINITY, load_factor=1.25)
+    for worker_id in worker_ids:
+        router.update_capacity(worker_id, capacity)
+    return router
+
+
+class TestCreditRouter:
+    def test_select_worker_without_workers_raises(self):
+        router = CreditRouter()
+        with pytest.raises(ValueError, match="No workers"):
+            router.select_worker()
+
+    def test_credits_are_spread_across_workers(self):
+        router = CreditRouter()
+        router.update_capacity("worker_1", 10)
+        router.update_capacity("worker_2", 10)
+
+        selected = [router.select_worker() for _ in range(6)]
+
+        assert selected.count("worker_1") == 3
+        assert selected.count("worker_2") == 3
+        assert router.queue_depths() == {"worker_1": 3, "worker_2": 3}
+
+    def test_slow_worker_receives_fewer_credits(self):
+        router = CreditRouter()
+        router.update_capacity("fast", 4)
+        router.update_capacity("slow", 4)
+        for _ in range(4):
+            router.select_worker()
+
+        # Only the fast worker returns its credits
+        router.credit_returned("fast")
+        router.credit_returned("fast")
+
+        assert [router.select_worker() for _ in range(2)] == ["fast", "fast"]
+        assert router.queue_depths() == {"fast": 2, "slow": 2}
+
+    def test_load_is_relative_to_capacity(self):
+        router = CreditRouter()
+        router.update_capacity("small", 1)
+        router.update_capacity("large", 3)
+
+        selected = [router.select_worker() for _ in range(4)]
+
+        assert selected.count("small") == 1
+        assert selected.count("large") == 3
+
+    def test_workers_at_capacity_receive_no_credits(self):
+        router = CreditRouter()
+        router.update_capacity("worker_1", 1)
+        router.update_capacity("worker_2", 2)
+        assert router.capacity_available.is_set()
+
+        assert sorted(router.select_worker() for _ in range(3)) == [
+            "worker_1",
+            "worker_2",
+            "worker_2",
+        ]
+        assert not router.capacity_available.is_set()
+        assert router.select_worker() is None
+        assert router.queue_depths() == {"worker_1": 1, "worker_2": 2}
+
+        router.credit_returned("worker_2")
+        assert router.capacity_available.is_set()
+        assert router.select_worker() == "worker_2"
+
+    def test_routing_summary(self):
+        router = CreditRouter()
+        router.update_capacity("worker_1", 10)
+        router.update_capacity("worker_2", 10)
+        for _ in range(3):
+            router.select_worker()
+        router.credit_returned("worker_1")
+        router.credit_returned("worker_2")
+        router.select_worker()
+
+        summary = router.routing_summary()
+        assert summary.routed_counts == {"worker_1": 2, "worker_2": 2}
+        assert summary.max_queue_depths == {"worker_1": 2, "worker_2": 1}
+        assert summary.total == 4
+        assert summary.imbalance == 1.0
+        assert "max queue depth 2" in router.load_balance_summary()
+
+    def test_zero_capacity_removes_worker(self):
+        router = CreditRouter()
+        router.update_capacity("worker_1", 10)
+        router.update_capacity("worker_1", 0)
+
+        assert len(router) == 0
+        assert not router.capacity_available.is_set()
+        # Credits returned by removed workers are ignored
+        router.credit_returned("worker_1")
+
+
+class TestCreditRouterSessionAffinity:
+    def test_conversation_is_routed_to_same_worker(self):
+        router = _affinity_router("worker_1", "worker_2", "worker_3")
+
+        for i in range(30):
+            selected = router.select_worker(f"session_{i}")
+            router.credit_returned(selected)
+            # Every later turn of the conversation goes to the same worker
+            for _ in range(3):
+                assert router.select_worker(f"session_{i}") == selected
+                router.credit_returned(selected)
+
+        assert router.affinity_overflows == 0
+
+    def test_conversations_are_spread_across_workers(self):
+        router = _affinity_router("worker_1", "worker_2", "worker_3")
+
+        owners = set()
+        for i in range(100):
+            selected = router.select_worker(f"session_{i}")
+            router.credit_returned(selected)
+            owners.add(selected)
+
+        assert owners == {"worker_1", "worker_2", "worker_3"}
+
+    def test_adding_worker_moves_few_conversations(self):
+        router = _affinity_router("worker_1", "worker_2", "worker_3")
+        conversation_ids = [f"session_{i}" for i in range(1000)]
+
+        def _owners() -> list[str]:
+            owners = []
+            for conversation_id in conversation_ids:
+                owners.append(router.select_worker(conversation_id))
+                router.credit_returned(owners[-1])
+            return owners
+
+        before = _owners()
+        router.update_capacity("worker_4", 100)
+        after = _owners()
+
+        moved = sum(a != b for a, b in zip(before, after, strict=True))
+        # Ideally 1/4 of the conversations move to the new worker, and none move between the old ones
+        assert moved < len(conversation_ids) / 2
+        assert all(
+            b == "worker_4" for a, b in zip(before, after, strict=True) if a != b
+        )
+
+    def test_hot_session_overflows_to_other_workers(self):
+        router = _affinity_router("worker_1", "worker_2", "worker_3")
+
+        # Many concurrent credits for the same conversation, none of them returned
+        selected = [router.select_worker("hot_session") for _ in range(30)]
+
+        depths = router.queue_depths()
+        assert max(depths.values()) <= 13  # ceil(1.25 * 30 / 3)
+        assert len(set(selected)) == 3
+        assert router.affinity_overflows > 0
+        assert "overflowed" in router.load_balance_summary()
+
+    def test_affinity_skips_workers_at_capacity(self):
+        router = _affinity_router("worker_1", "worker_2", capacity=1)
+        owner = router.select_worker("session_1")
+
+        # The owner is at capacity, so the next credit overflows to the other worker
+        other = router.select_worker("session_1")
+        assert {owner, other} == {"worker_1", "worker_2"}
+        assert router.select_worker("session_1") is None
+
+    def test_credit_without_conversation_uses_least_loaded(self):
+        router = _affinity_router("worker_1", "worker_2")
+
+        selected = [router.select_worker() for _ in range(4)]
+
+        assert selected.count("worker_1") == 2
+        assert selected.count("worker_2") == 2
@@ -6,12 +6,13 @@ Tests for the timing manager fixed schedule strategy.
 
 import time
 
+import numpy as np
 import pytest
 
 from aiperf.common.constants import MILLIS_PER_SECOND
 from aiperf.common.enums import CreditPhase, TimingMode
 from aiperf.common.models import CreditPhaseStats
-from aiperf.timing import FixedScheduleStrategy, TimingManagerConfig
+from aiperf.timing import FixedSchedule, FixedScheduleStrategy, TimingManagerConfig
 from tests.timing_manager.conftest import MockCreditManager
 from tests.utils.time_traveler import TimeTraveler
 
@@ -66,7 +67,10 @@ class TestFixedScheduleStrategy:
 
         assert len(strategy.ordered_phase_configs) == 1
         assert strategy._num_requests == len(simple_schedule)
-        assert strategy._schedule == simple_schedule
+        assert [
+            (int(timestamp), strategy._schedule.conversation_id(i))
+            for i, timestamp in enumerate(strategy._schedule.timestamps)
+        ] == simple_schedule
 
         # Check phase types - only profiling phase supported
         assert strategy.ordered_phase_configs[0].type == CreditPhase.PROFILING
@@ -77,17 +81,19 @@ class TestFixedScheduleStrategy:
             self._create_strategy(mock_credit_manager, [])
 
     @pytest.mark.parametrize(
-        "schedule,expected_groups,expected_keys",
+        "schedule,expected_groups",
         [
             (
                 [(0, "conv1"), (100, "conv2"), (200, "conv3")],
-                {0: ["conv1"], 100: ["conv2"], 200: ["conv3"]},
-                [0, 100, 200],
+                [(0, ["conv1"]), (100, ["conv2"]), (200, ["conv3"])],
             ),
             (
                 [(0, "conv1"), (0, "conv2"), (100, "conv3"), (100, "conv4")],
-                {0: ["conv1", "conv2"], 100: ["conv3", "conv4"]},
-                [0, 100],
+                [(0, ["conv1", "conv2"]), (100, ["conv3", "conv4"])],
+            ),
+            (
+                [(100, "conv1"), (0, "conv2"), (100, "conv3"), (0, "conv1")],
+                [(0, ["conv2", "conv1"]), (100, ["conv1", "conv3"])],
             ),
         ],
     )
@@ -95,14 +101,36 @@ class TestFixedScheduleStrategy:
         self,
         mock_credit_manager: MockCreditManager,
         schedule: list[tuple[int, str]],
-        expected_groups: dict[int, list[str]],
-        expected_keys: list[int],
+        expected_groups: list[tuple[int, list[str]]],
     ):
-        """Test that timestamps are properly grouped."""
+        """Test that timestamps are sorted and grouped, keeping the original order within a group."""
         strategy, _ = self._create_strategy(mock_credit_manager, schedule)
 
-        assert strategy._timestamp_groups == expected_groups
-        assert strategy._sorted_timestamp_keys == expected_keys
+        groups = [
+            (
+                timestamp,
+                [strategy._schedule.conversation_id(i) for i in range(start, end)],
+            )
+            for timestamp, start, end in strategy._schedule.iter_timestamp_groups()
+        ]
+        assert groups == expected_groups
+
+    def test_fixed_schedule_is_compact(self):
+        """Test that the schedule is stored as numpy arrays with a deduplicated conversation ID table."""
+        schedule = FixedSchedule.from_entries(
+            [(200, "conv1"), (100, "conv2"), (300, "conv1")]
+        )
+
+        assert schedule.timestamps.dtype == np.int64
+        assert schedule.conversation_indices.dtype == np.int32
+        assert schedule.timestamps.tolist() == [100, 200, 300]
+        assert schedule.conversation_ids == ["conv1", "conv2"]
+        assert schedule.first_timestamp == 100
+
+    def test_fixed_schedule_length_mismatch_raises_error(self):
+        """Test that mismatched array lengths are rejected."""
+        with pytest.raises(ValueError, match="must be the same length"):
+            FixedSchedule(np.array([0, 1]), np.array([0]), ["conv1"])
 
     @pytest.mark.parametrize(
         "auto_offset,manual_offset,expected_zero_ms",
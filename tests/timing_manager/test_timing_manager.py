@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the credit dispatching of the timing manager.
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiperf.common.config import EndpointConfig, ServiceConfig, UserConfig
+from aiperf.common.enums import CreditPhase
+from aiperf.common.messages import (
+    CreditReturnMessage,
+    DatasetTimingRequest,
+    DatasetTimingResponse,
+)
+from aiperf.timing.timing_manager import TimingManager
+
+
+@pytest.fixture
+def timing_manager() -> TimingManager:
+    timing_manager = TimingManager(
+        service_config=ServiceConfig(),
+        user_config=UserConfig(endpoint=EndpointConfig(model_names=["test-model"])),
+        service_id="timing_manager",
+    )
+    timing_manager.credit_dispatch_client.send_to = AsyncMock()
+    return timing_manager
+
+
+def _sent_credit_nums(timing_manager: TimingManager) -> list[int]:
+    return [
+        call.args[1].credit_num
+        for call in timing_manager.credit_dispatch_client.send_to.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_credit_waits_for_worker_capacity(timing_manager):
+    """Test that dropping a credit blocks the caller while every worker is at capacity, and that
+    the credits are sent in the order they were dropped once capacity frees up."""
+    timing_manager.credit_router.update_capacity("worker_1", 1)
+
+    async def drop_credits() -> None:
+        for credit_num in range(3):
+            await timing_manager.drop_credit(CreditPhase.PROFILING, credit_num)
+
+    task = asyncio.create_task(drop_credits())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert not task.done()
+    assert _sent_credit_nums(timing_manager) == [0]
+
+    for expected in ([0, 1], [0, 1, 2]):
+        await timing_manager._on_credit_return(
+            CreditReturnMessage(
+                service_id="worker_1",
+                phase=CreditPhase.PROFILING,
+                credit_drop_id=str(uuid.uuid4()),
+            )
+        )
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert _sent_credit_nums(timing_manager) == expected
+
+    await task
+
+
+@pytest.mark.asyncio
+async def test_no_credits_issued_while_pipeline_backlog_exceeds_max(timing_manager):
+    """Test that while the pipeline backlog exceeds the max, the credits are neither sent to the
+    workers nor counted by the caller, and that issuing resumes once the backlog drains."""
+    timing_manager.credit_router.update_capacity("worker_1", 10)
+    timing_manager.pipeline_backlog_clear.clear()
+    sent = 0
+
+    async def issue_credits() -> None:
+        nonlocal sent
+        for credit_num in range(3):
+            await timing_manager.drop_credit(CreditPhase.PROFILING, credit_num)
+            sent += 1
+
+    task = asyncio.create_task(issue_credits())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert sent == 0
+    timing_manager.credit_dispatch_client.send_to.assert_not_awaited()
+
+    timing_manager.pipeline_backlog_clear.set()
+    await task
+    assert sent == 3
+    assert _sent_credit_nums(timing_manager) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_phase_complete_includes_credit_routing(timing_manager):
+    """Test that the phase complete message reports how the credits were spread across the workers."""
+    timing_manager.publish = AsyncMock()
+    timing_manager.credit_router.update_capacity("worker_1", 10)
+    await timing_manager.drop_credit(CreditPhase.PROFILING, 0)
+
+    await timing_manager.publish_phase_complete(
+        CreditPhase.PROFILING, completed=1, end_ns=1
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    message = timing_manager.publish.call_args[0][0]
+    assert message.credit_routing.routed_counts == {"worker_1": 1}
+    assert message.credit_routing.max_queue_depths == {"worker_1": 1}
+
+
+class _FakeDatasetManager:
+    """Answers the fixed schedule chunk requests, recording how many requests were sent at once."""
+
+    def __init__(self, num_entries: int, num_conversations: int) -> None:
+        self.timestamps = [i * 10 for i in range(num_entries)]
+        self.conversation_indices = [i % num_conversations for i in range(num_entries)]
+        self.conversation_ids = [f"session_{i}" for i in range(num_conversations)]
+        self.batch_sizes: list[int] = []
+
+    def _respond(self, message: DatasetTimingRequest) -> DatasetTimingResponse:
+        start, end = message.offset, message.offset + message.limit
+        return DatasetTimingResponse(
+            service_id="dataset_manager",
+            offset=start,
+            total_entries=len(self.timestamps),
+            total_conversations=len(self.conversation_ids),
+            timestamps=self.timestamps[start:end],
+            conversation_indices=self.conversation_indices[start:end],
+            conversation_ids=self.conversation_ids[start:end],
+        )
+
+    async def request(self, message: DatasetTimingRequest) -> DatasetTimingResponse:
+        self.batch_sizes.append(1)
+        return self._respond(message)
+
+    async def request_many(
+        self, messages: list[DatasetTimingRequest]
+    ) -> list[DatasetTimingResponse]:
+        self.batch_sizes.append(len(messages))
+        return [self._respond(message) for message in messages]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_entries, num_conversations", [(20, 7), (5, 11), (3, 3)])
+async def test_request_fixed_schedule_in_chunks(
+    timing_manager, monkeypatch, num_entries, num_conversations
+):
+    """Test that the fixed schedule is reassembled in order from chunks that are requested
+    several at a time, when either the entries or the conversation IDs span more chunks."""
+    monkeypatch.setattr(
+        "aiperf.timing.timing_manager.DEFAULT_DATASET_TIMING_CHUNK_SIZE", 3
+    )
+    monkeypatch.setattr(
+        "aiperf.timing.timing_manager.DEFAULT_DATASET_TIMING_CHUNKS_IN_FLIGHT", 2
+    )
+    dataset_manager = _FakeDatasetManager(num_entries, num_conversations)
+    timing_manager.dataset_request_client = dataset_manager
+
+    schedule = await timing_manager._request_fixed_schedule()
+
+    assert schedule.timestamps.tolist() == dataset_manager.timestamps
+    assert (
+        schedule.conversation_indices.tolist() == dataset_manager.conversation_indices
+    )
+    assert schedule.conversation_ids == dataset_manager.conversation_ids
+    num_chunks = -(-max(num_entries, num_conversations) // 3)
+    assert sum(dataset_manager.batch_sizes) == num_chunks
+    assert max(dataset_manager.batch_sizes) <= 2
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the virtual user sessions and the think time scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from aiperf.common.constants import NANOS_PER_MILLIS
+from aiperf.common.enums import CreditPhase
+from aiperf.common.messages import CreditDropMessage
+from aiperf.common.models import Conversation, Text, Turn
+from aiperf.workers.session import SessionScheduler, VirtualUserSession
+
+
+def _session(*delays: int | None) -> VirtualUserSession:
+    conversation = Conversation(
+        session_id="session_1",
+        turns=[Turn(delay=delay, texts=[Text(contents=["hi"])]) for delay in delays],
+    )
+    message = CreditDropMessage(
+        service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+    )
+    return VirtualUserSession(message, conversation, drop_perf_ns=0)
+
+
+class TestVirtualUserSession:
+    def test_advance_records_history(self):
+        session = _session(None, 1000)
+        response = Turn(role="assistant", texts=[Text(contents=["hello"])])
+
+        session.advance(session.current_turn, response)
+        assert session.turn_index == 1
+        assert not session.is_finished
+        assert session.think_time_ns == 1000 * NANOS_PER_MILLIS
+
+        session.advance(session.current_turn, None)
+        assert session.is_finished
+        assert [turn.role for turn in session.history.turns] == [
+            None,
+            "assistant",
+            None,
+        ]
+
+    @pytest.mark.parametrize("delay", [None, 0, -5])
+    def test_no_think_time(self, delay):
+        assert _session(delay).think_time_ns == 0
+
+    def test_session_has_no_instance_dict(self):
+        assert not hasattr(_session(None), "__dict__")
+
+
+@pytest.mark.asyncio
+class TestSessionScheduler:
+    async def test_pop_due_in_wake_order(self):
+        scheduler = SessionScheduler()
+        sessions = [_session(None) for _ in range(3)]
+        scheduler.schedule(sessions[0], 300)
+        scheduler.schedule(sessions[1], 100)
+        scheduler.schedule(sessions[2], 200)
+
+        assert scheduler.pop_due(50) == []
+        assert scheduler.pop_due(200) == [sessions[1], sessions[2]]
+        assert len(scheduler) == 1
+        assert scheduler.pop_due(1000) == [sessions[0]]
+
+    async def test_equal_wake_times_keep_schedule_order(self):
+        scheduler = SessionScheduler()
+        sessions = [_session(None) for _ in range(5)]
+        for session in sessions:
+            scheduler.schedule(session, 100)
+
+        assert scheduler.pop_due(100) == sessions
+
+    async def test_wait_until_due_sleeps_until_earliest(self):
+        scheduler = SessionScheduler()
+        session = _session(None)
+        wake_perf_ns = time.perf_counter_ns() + 20 * NANOS_PER_MILLIS
+        scheduler.schedule(session, wake_perf_ns)
+
+        await asyncio.wait_for(scheduler.wait_until_due(), timeout=1.0)
+
+        assert time.perf_counter_ns() >= wake_perf_ns
+        assert scheduler.pop_due(time.perf_counter_ns()) == [session]
+
+    async def test_wait_until_due_wakes_on_earlier_session(self):
+        scheduler = SessionScheduler()
+        scheduler.schedule(_session(None), time.perf_counter_ns() + 60 * 1_000_000_000)
+        waiter = asyncio.create_task(scheduler.wait_until_due())
+        await asyncio.sleep(0)
+
+        earlier = _session(None)
+        scheduler.schedule(earlier, time.perf_counter_ns())
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert scheduler.pop_due(time.perf_counter_ns()) == [earlier]
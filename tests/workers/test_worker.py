@@ -10,18 +10,36 @@ import pytest
 from aiperf.common.config.endpoint_config import EndpointConfig
 from aiperf.common.config.service_config import ServiceConfig
 from aiperf.common.config.user_config import UserConfig
+from aiperf.common.config.worker_config import WorkersConfig
 from aiperf.common.constants import NANOS_PER_SECOND
 from aiperf.common.enums import CreditPhase
-from aiperf.common.messages import CreditDropMessage
-from aiperf.common.models import ParsedResponse, TextResponseData
+from aiperf.common.messages import (
+    ConversationResponseMessage,
+    CreditDropMessage,
+    DatasetConfiguredNotification,
+    MetricRecordsMessage,
+    ProfileConfigureCommand,
+)
+from aiperf.common.models import (
+    Conversation,
+    ErrorDetails,
+    ParsedResponse,
+    SSEField,
+    SSEMessage,
+    Text,
+    TextResponseData,
+    Turn,
+)
 from aiperf.common.models.record_models import RequestRecord
+from aiperf.dataset import write_dataset_store
+from aiperf.post_processors.metric_record_processor import MetricRecordProcessor
 from aiperf.workers.worker import Worker
 
 
 class MockWorker(Worker):
     """Mock implementation of Worker for testing."""
 
-    def __init__(self):
+    def __init__(self, service_config: ServiceConfig | None = None):
         with (
             patch(
                 "aiperf.clients.http.aiohttp_client.create_tcp_connector"
@@ -44,7 +62,7 @@ class MockWorker(Worker):
             mock_client_factory.return_value = mock_client
 
             super().__init__(
-                service_config=ServiceConfig(),
+                service_config=service_config or ServiceConfig(),
                 user_config=UserConfig(
                     endpoint=EndpointConfig(model_names=["test-model"]),
                 ),
@@ -184,34 +202,38 @@ class TestWorker:
                 f"Expected timeout {expected_timeout}, got {actual_timeout}"
             )
 
-    async def test_process_response(self, monkeypatch, worker):
-        """Ensure process_response extracts text correctly from RequestRecord."""
-        mock_parsed_response = ParsedResponse(
-            perf_ns=0,
-            data=TextResponseData(text="Hello, world!"),
+    @pytest.mark.parametrize(
+        "text, expected_history",
+        [("Hello, world!", ["first", "Hello, world!"]), ("", ["first"])],
+    )
+    async def test_execute_session_turn_records_response(
+        self, worker, text, expected_history
+    ):
+        """Test that the text of the response is added to the session history as an assistant turn."""
+        from aiperf.common.models import Conversation, Text, Turn
+        from aiperf.workers.session import VirtualUserSession
+
+        conversation = Conversation(
+            session_id="session_1", turns=[Turn(texts=[Text(contents=["first"])])]
         )
-        mock_extractor = Mock()
-        mock_extractor.extract_response_data = AsyncMock(
-            return_value=[mock_parsed_response]
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
         )
-        monkeypatch.setattr(worker, "extractor", mock_extractor)
-        turn = await worker._process_response(RequestRecord())
-        assert turn.texts[0].contents == ["Hello, world!"]
-
-    async def test_process_response_empty(self, monkeypatch, worker):
-        """Ensure process_response handles empty responses correctly."""
-        # mock_parsed_response = RequestRecord(responses=[])
-        mock_parsed_response = ParsedResponse(
-            perf_ns=0,
-            data=TextResponseData(text=""),
+        session = VirtualUserSession(message, conversation, drop_perf_ns=0)
+        worker._build_response_record = AsyncMock(return_value=RequestRecord())
+        worker.extractor.extract_response_data = AsyncMock(
+            return_value=[ParsedResponse(perf_ns=0, data=TextResponseData(text=text))]
         )
-        mock_extractor = Mock()
-        mock_extractor.extract_response_data = AsyncMock(
-            return_value=[mock_parsed_response]
+        worker._send_inference_result_message = AsyncMock()
+
+        await worker._execute_session_turn(session)
+
+        assert [turn.texts[0].contents[0] for turn in session.history.turns] == (
+            expected_history
         )
-        monkeypatch.setattr(worker, "extractor", mock_extractor)
-        turn = await worker._process_response(RequestRecord())
-        assert turn is None
+        if text:
+            assert session.history.turns[-1].role == "assistant"
+        worker._send_inference_result_message.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_build_response_record(
@@ -349,3 +371,476 @@ class TestWorker:
         assert captured_args["x_request_id"] == x_request_id
         assert "x_correlation_id" in captured_args
         assert captured_args["x_correlation_id"] == message.request_id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("attach_turn", [False, True])
+    async def test_record_references_turn(self, worker, attach_turn):
+        """Test that the record only carries its turn when attaching turns (raw export level)."""
+        from aiperf.common.models import Image, Text, Turn
+
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        turn = Turn(
+            texts=[Text(contents=["test"])], images=[Image(contents=["base64"])]
+        )
+        # The default export level only references the turn
+        assert not worker.attach_turn
+        worker.attach_turn = attach_turn
+        worker.inference_client.send_request = AsyncMock(
+            return_value=RequestRecord(start_perf_ns=1000)
+        )
+        worker.request_converter = Mock()
+        worker.request_converter.format_payload = AsyncMock(return_value={})
+
+        record = await worker._call_inference_api_internal(message, turn, "id")
+
+        assert record.turn is (turn if attach_turn else None)
+        assert worker.request_converter.format_payload.call_args[1]["turn"] is turn
+
+        record = await worker._build_response_record(
+            conversation_id="cid",
+            message=message,
+            turn=turn,
+            turn_index=0,
+            drop_perf_ns=0,
+        )
+        assert record.input_texts == (None if attach_turn else ["test"])
+
+    @pytest.mark.asyncio
+    async def test_run_session_parks_session_during_think_time(self, worker):
+        """Test that a session releases its request slot and is parked while thinking."""
+        from aiperf.common.models import Conversation, Text, Turn
+        from aiperf.workers.session import VirtualUserSession
+
+        conversation = Conversation(
+            session_id="session_1",
+            turns=[
+                Turn(texts=[Text(contents=["first"])]),
+                Turn(texts=[Text(contents=["second"])], delay=60_000),
+            ],
+        )
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        session = VirtualUserSession(message, conversation, drop_perf_ns=0)
+
+        worker._build_response_record = AsyncMock(return_value=RequestRecord())
+        worker._send_inference_result_message = AsyncMock()
+        worker._return_credit = AsyncMock()
+
+        await worker._run_session(session)
+
+        assert session.turn_index == 1
+        assert len(worker.session_scheduler) == 1
+        assert not worker.request_slots.locked()
+        worker._return_credit.assert_not_called()
+
+        # Resuming the session sends the last turn and returns the credit
+        await worker._run_session(worker.session_scheduler.pop_due(2**63)[0])
+
+        assert session.is_finished
+        assert worker._build_response_record.await_count == 2
+        worker._return_credit.assert_awaited_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_parked_sessions_exceed_request_slots(self):
+        """Test that the advertised session capacity is independent of the request slots, so that
+        more sessions can be parked during think time than there are connections."""
+        from aiperf.workers.session import VirtualUserSession
+
+        worker = MockWorker(ServiceConfig(workers=WorkersConfig(max_sessions=10)))
+        worker.request_slots = asyncio.Semaphore(2)
+        worker._build_response_record = AsyncMock(return_value=RequestRecord())
+        worker._send_inference_result_message = AsyncMock()
+        worker._return_credit = AsyncMock()
+
+        for i in range(5):
+            conversation = Conversation(
+                session_id=f"session_{i}",
+                turns=[
+                    Turn(texts=[Text(contents=["first"])]),
+                    Turn(texts=[Text(contents=["second"])], delay=60_000),
+                ],
+            )
+            message = CreditDropMessage(
+                service_id="test-service", phase=CreditPhase.PROFILING, credit_num=i
+            )
+            await worker._run_session(
+                VirtualUserSession(message, conversation, drop_perf_ns=0)
+            )
+
+        assert worker.credit_capacity == 10
+        assert len(worker.session_scheduler) == 5
+        assert not worker.request_slots.locked()
+        worker._return_credit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_session_returns_credit_on_error(self, worker):
+        """Test that the credit is returned when a turn fails mid session."""
+        from aiperf.common.models import Conversation, Text, Turn
+        from aiperf.workers.session import VirtualUserSession
+
+        conversation = Conversation(
+            session_id="session_1", turns=[Turn(texts=[Text(contents=["first"])])]
+        )
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        session = VirtualUserSession(message, conversation, drop_perf_ns=0)
+
+        worker._build_response_record = AsyncMock(side_effect=RuntimeError("boom"))
+        worker._return_credit = AsyncMock()
+
+        await worker._run_session(session)
+
+        worker._return_credit.assert_awaited_once_with(message)
+        assert len(worker.session_scheduler) == 0
+
+    @pytest.mark.asyncio
+    async def test_run_session_returns_credit_on_cancel(self, worker):
+        """Test that the credit is returned and the session drained when a turn is cancelled."""
+        from aiperf.common.models import Conversation, Text, Turn
+        from aiperf.workers.session import VirtualUserSession
+
+        conversation = Conversation(
+            session_id="session_1", turns=[Turn(texts=[Text(contents=["first"])])]
+        )
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        session = VirtualUserSession(message, conversation, drop_perf_ns=0)
+
+        worker._build_response_record = AsyncMock(side_effect=asyncio.CancelledError())
+        worker._return_credit = AsyncMock()
+        worker.active_sessions = 1
+
+        with pytest.raises(asyncio.CancelledError):
+            await worker._run_session(session)
+
+        worker._return_credit.assert_awaited_once_with(message)
+        assert worker.active_sessions == 0
+        assert worker._sessions_drained.is_set()
+
+    @pytest.mark.asyncio
+    async def test_credit_drop_tracks_active_sessions(self, worker):
+        """Test that a session is active until its credit is returned, so the worker can drain it."""
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        release_session = asyncio.Event()
+
+        async def run_session(session):
+            await release_session.wait()
+            await worker._end_session(session.message)
+
+        worker._start_session = AsyncMock(return_value=Mock(message=message))
+        worker._run_session = run_session
+        worker._return_credit = AsyncMock()
+
+        task = asyncio.create_task(worker._credit_drop_callback(message))
+        await asyncio.sleep(0)
+        assert worker.active_sessions == 1
+        assert not worker._sessions_drained.is_set()
+
+        release_session.set()
+        await task
+        assert worker.active_sessions == 0
+        assert worker._sessions_drained.is_set()
+        worker._return_credit.assert_awaited_once_with(message)
+
+    @pytest.mark.asyncio
+    async def test_credit_drop_returned_immediately_when_stopping(self, worker):
+        """Test that credits routed to a stopping worker are returned without being processed."""
+        message = CreditDropMessage(
+            service_id="test-service", phase=CreditPhase.PROFILING, credit_num=1
+        )
+        worker.stop_requested = True
+        worker._start_session = AsyncMock()
+        worker._return_credit = AsyncMock()
+
+        await worker._credit_drop_callback(message)
+
+        worker._start_session.assert_not_called()
+        worker._return_credit.assert_awaited_once_with(message)
+        assert worker.active_sessions == 0
+
+    async def test_health_message_reports_average_credit_drop_latency(self, worker):
+        """Test that the health message reports the average credit drop latency since the previous one."""
+        worker.get_process_health = Mock(return_value=None)
+        worker._credit_drop_latency_sum_ns = 3_000
+        worker._credit_drop_latency_count = 3
+        worker.active_sessions = 2
+
+        with patch("aiperf.workers.worker.WorkerHealthMessage") as mock_message:
+            worker.create_health_message()
+            assert mock_message.call_args.kwargs["credit_drop_latency_ns"] == 1_000
+            assert mock_message.call_args.kwargs["active_sessions"] == 2
+
+            worker.create_health_message()
+            assert mock_message.call_args.kwargs["credit_drop_latency_ns"] is None
+
+    @pytest.mark.parametrize(
+        "concurrency, num_workers, expected",
+        [
+            (10, 4, 3),
+            (10, None, 10),
+            (3, 8, 1),
+            (None, 4, 0),
+        ],
+    )
+    async def test_num_connections_to_prewarm(
+        self, worker, concurrency, num_workers, expected
+    ):
+        """Test that each worker pre-warms its share of the concurrency."""
+        worker.user_config.endpoint.connection_prewarm = True
+        worker.user_config.loadgen.concurrency = concurrency
+        assert worker._num_connections_to_prewarm(num_workers) == expected
+
+    async def test_num_connections_to_prewarm_disabled_by_default(self, worker):
+        worker.user_config.loadgen.concurrency = 10
+        assert worker._num_connections_to_prewarm(2) == 0
+
+    async def test_prewarm_connections(self, worker):
+        """Test that the connections are pre-warmed on profile configure, and the stats returned."""
+        worker.user_config.endpoint.connection_prewarm = True
+        worker.user_config.loadgen.concurrency = 4
+        records = [
+            RequestRecord(start_perf_ns=100, end_perf_ns=600, status=200),
+            RequestRecord(start_perf_ns=100, end_perf_ns=300, status=404),
+            RequestRecord(
+                start_perf_ns=100,
+                end_perf_ns=200,
+                error=ErrorDetails(type="ConnectionRefusedError", message="refused"),
+            ),
+        ]
+        worker.inference_client.prewarm_connections = AsyncMock(return_value=records)
+
+        stats = await worker._prewarm_connections(
+            ProfileConfigureCommand(
+                service_id="controller", config=worker.user_config, num_workers=2
+            )
+        )
+
+        worker.inference_client.prewarm_connections.assert_awaited_once_with(
+            worker.model_endpoint, 2, "/v1/models"
+        )
+        assert stats.num_connections == 3
+        assert stats.failed == 1
+        assert stats.connect_times_ns == [500, 200]
+
+    async def test_prewarm_connections_timeout(self, worker):
+        """Test that a pre-warm which takes too long counts all connections as failed."""
+        worker.user_config.endpoint.connection_prewarm = True
+        worker.user_config.loadgen.concurrency = 2
+        worker.inference_client.prewarm_connections = AsyncMock()
+
+        async def mock_wait_for(coro, timeout):
+            coro.close()
+            raise asyncio.TimeoutError()
+
+        with patch("asyncio.wait_for", side_effect=mock_wait_for):
+            stats = await worker._prewarm_connections(
+                ProfileConfigureCommand(
+                    service_id="controller", config=worker.user_config, num_workers=1
+                )
+            )
+
+        assert stats.num_connections == 2
+        assert stats.failed == 2
+        assert stats.connect_times_ns == []
+
+    async def test_retrieve_conversation_from_dataset_store(self, worker, tmp_path):
+        """Test that known conversations, and the credits without a conversation, are read from the
+        mapped dataset store, and any others requested."""
+        conversation = Conversation(
+            session_id="session_1", turns=[Turn(texts=[Text(contents=["hello"])])]
+        )
+        path = tmp_path / "dataset_store.bin"
+        write_dataset_store(path, [conversation])
+        await worker._on_dataset_configured(
+            DatasetConfiguredNotification(
+                service_id="dataset_manager", dataset_store_path=str(path)
+            )
+        )
+        requested = Conversation(session_id="session_2")
+        worker.conversation_request_client.request = AsyncMock(
+            return_value=ConversationResponseMessage(
+                service_id="dataset_manager", conversation=requested
+            )
+        )
+
+        for conversation_id, expected in [
+            ("session_1", conversation),
+            ("session_2", requested),
+            (None, conversation),
+        ]:
+            assert (
+                await worker._retrieve_conversation_response(
+                    service_id="worker",
+                    conversation_id=conversation_id,
+                    phase=CreditPhase.PROFILING,
+                )
+                == expected
+            )
+        worker.conversation_request_client.request.assert_awaited_once()
+        worker.dataset_store.close()
+
+    @pytest.mark.parametrize("random_seed", [None, 42])
+    async def test_select_conversation_from_dataset_store(
+        self, worker, tmp_path, random_seed
+    ):
+        """Test that the credits without a conversation are read from the mapped dataset store in
+        order of the dataset in sequential mode, continuing from the warmup credits, and otherwise
+        sampled at random, reproducibly per credit when seeded."""
+        path = tmp_path / "dataset_store.bin"
+        write_dataset_store(
+            path,
+            [
+                Conversation(
+                    session_id=f"session_{i}",
+                    turns=[Turn(texts=[Text(contents=[str(i)])])],
+                )
+                for i in range(4)
+            ],
+        )
+        worker.user_config.loadgen.warmup_request_count = 3
+        worker.user_config.input.random_seed = random_seed
+        worker.conversation_request_client.request = AsyncMock()
+
+        async def session_ids(phase: CreditPhase, credit_nums: range) -> list[str]:
+            return [
+                (
+                    await worker._retrieve_conversation_response(
+                        service_id="worker",
+                        conversation_id=None,
+                        phase=phase,
+                        credit_num=credit_num,
+                    )
+                ).session_id
+                for credit_num in credit_nums
+            ]
+
+        await worker._on_dataset_configured(
+            DatasetConfiguredNotification(
+                service_id="dataset_manager",
+                dataset_store_path=str(path),
+                sequential_iteration=True,
+            )
+        )
+        assert await session_ids(CreditPhase.WARMUP, range(3)) == [
+            "session_0",
+            "session_1",
+            "session_2",
+        ]
+        assert await session_ids(CreditPhase.PROFILING, range(3)) == [
+            "session_3",
+            "session_0",
+            "session_1",
+        ]
+
+        await worker._on_dataset_configured(
+            DatasetConfiguredNotification(
+                service_id="dataset_manager", dataset_store_path=str(path)
+            )
+        )
+        sampled = await session_ids(CreditPhase.PROFILING, range(100))
+        assert set(sampled) == {f"session_{i}" for i in range(4)}
+        if random_seed is not None:
+            assert await session_ids(CreditPhase.PROFILING, range(100)) == sampled
+
+        worker.conversation_request_client.request.assert_not_called()
+        worker.dataset_store.close()
+
+    async def test_dataset_store_not_reachable(self, worker, tmp_path):
+        """Test that the conversations are requested when the dataset store cannot be mapped."""
+        await worker._on_dataset_configured(
+            DatasetConfiguredNotification(
+                service_id="dataset_manager",
+                dataset_store_path=str(tmp_path / "missing.bin"),
+            )
+        )
+        assert worker.dataset_store is None
+
+
+def _usage_record(usage: str | None) -> RequestRecord:
+    """Create a valid streaming record, whose final chunk reports the given usage."""
+    final_chunk = '{"choices":[]' + (f',"usage":{usage}' if usage else "") + "}"
+    return RequestRecord(
+        model_name="test-model",
+        conversation_id="conversation_1",
+        turn_index=0,
+        credit_phase=CreditPhase.PROFILING,
+        credit_num=3,
+        timestamp_ns=1_000_000,
+        start_perf_ns=1000,
+        end_perf_ns=5000,
+        responses=[
+            SSEMessage(
+                perf_ns=2000,
+                packets=[SSEField(name="data", value='{"choices":[{"delta":{}}]}')],
+            ),
+            SSEMessage(
+                perf_ns=3000, packets=[SSEField(name="data", value=final_chunk)]
+            ),
+            SSEMessage(perf_ns=3001, packets=[SSEField(name="data", value="[DONE]")]),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+class TestWorkerComputeMetrics:
+    @pytest.fixture
+    def worker(self):
+        worker = MockWorker(ServiceConfig(workers=WorkersConfig(compute_metrics=True)))
+        worker.records_push_client = Mock(push=AsyncMock())
+        worker.inference_results_push_client = Mock(push=AsyncMock())
+        worker.execute_async = Mock(side_effect=lambda coroutine: coroutine.close())
+        return worker
+
+    async def test_disabled_by_default(self):
+        worker = MockWorker()
+
+        assert worker.records_processors == []
+        assert not await worker._send_metric_records_message(
+            _usage_record('{"prompt_tokens":5,"completion_tokens":7}'), []
+        )
+
+    async def test_creates_record_processors(self, worker):
+        assert any(
+            isinstance(processor, MetricRecordProcessor)
+            for processor in worker.records_processors
+        )
+
+    async def test_sends_metric_records_from_usage(self, worker):
+        record = _usage_record('{"prompt_tokens":5,"completion_tokens":7}')
+        responses = [ParsedResponse(perf_ns=2000, data=TextResponseData(text="Hi"))]
+
+        assert await worker._send_metric_records_message(record, responses)
+
+        message: MetricRecordsMessage = worker.records_push_client.push.call_args[0][0]
+        metrics = message.to_data().metrics
+        assert metrics["input_sequence_length"] == 5
+        assert metrics["output_sequence_length"] == 7
+        assert message.metadata.worker_id == worker.service_id
+        assert message.metadata.session_num == 3
+        assert message.metadata.request_end_ns == 1_000_000 + 3001 - 1000
+        assert worker.task_stats.completed == 1
+
+    @pytest.mark.parametrize(
+        "usage, error",
+        [
+            (None, None),
+            (
+                '{"prompt_tokens":5,"completion_tokens":7}',
+                ErrorDetails(code=500, message="Server error", type="ServerError"),
+            ),
+        ],
+    )
+    async def test_falls_back_to_record_processors(self, worker, usage, error):
+        """Records without usage, or that failed, are left for the record processors to tokenize."""
+        record = _usage_record(usage)
+        record.error = error
+
+        assert not await worker._send_metric_records_message(record, [])
+        worker.records_push_client.push.assert_not_called()
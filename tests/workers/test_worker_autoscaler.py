@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Unit tests for the worker auto-scaling policy of the WorkerManager.
+"""
+
+import pytest
+
+from aiperf.common.constants import (
+    DEFAULT_AUTOSCALE_COOLDOWN,
+    DEFAULT_AUTOSCALE_IDLE_TIME,
+    NANOS_PER_MILLIS,
+    NANOS_PER_SECOND,
+)
+from aiperf.common.models import EventLoopLag, ProcessHealth
+from aiperf.workers.worker_manager import WorkerAutoScaler, WorkerStatusInfo
+
+NOW_NS = 1_000 * NANOS_PER_SECOND
+
+
+def _info(
+    worker_id: str,
+    cpu_usage: float = 10.0,
+    active_sessions: int = 1,
+    credit_drop_latency_ms: int | None = None,
+    idle_for_sec: float | None = None,
+    event_loop_lag_ms: int = 0,
+) -> WorkerStatusInfo:
+    lag_ns = event_loop_lag_ms * NANOS_PER_MILLIS
+    return WorkerStatusInfo(
+        worker_id=worker_id,
+        health=ProcessHealth(
+            create_time=0,
+            uptime=1,
+            cpu_usage=cpu_usage,
+            memory_usage=0,
+            event_loop_lag=EventLoopLag(
+                samples=100, p50_ns=0, p90_ns=0, p99_ns=lag_ns, max_ns=lag_ns
+            ),
+        ),
+        active_sessions=active_sessions,
+        credit_drop_latency_ns=None
+        if credit_drop_latency_ms is None
+        else credit_drop_latency_ms * NANOS_PER_MILLIS,
+        idle_since_ns=None
+        if idle_for_sec is None
+        else NOW_NS - int(idle_for_sec * NANOS_PER_SECOND),
+    )
+
+
+class TestWorkerAutoScaler:
+    @pytest.fixture
+    def autoscaler(self):
+        return WorkerAutoScaler(min_workers=1, max_workers=10)
+
+    def test_no_scaling_when_healthy(self, autoscaler):
+        infos = [_info("w1"), _info("w2", credit_drop_latency_ms=1)]
+
+        assert autoscaler.workers_to_spawn(infos, 2, NOW_NS) == 0
+        assert autoscaler.workers_to_shutdown(infos, 2, NOW_NS) == []
+
+    @pytest.mark.parametrize(
+        "infos",
+        [
+            [_info("w1", cpu_usage=90.0), _info("w2", cpu_usage=80.0)],
+            [_info("w1", credit_drop_latency_ms=50), _info("w2", credit_drop_latency_ms=20)],
+            [_info("w1", event_loop_lag_ms=30), _info("w2", event_loop_lag_ms=10)],
+        ],
+    )  # fmt: skip
+    def test_scale_up_when_saturated(self, autoscaler, infos):
+        assert autoscaler.workers_to_spawn(infos, 8, NOW_NS) == 2
+
+    def test_scale_up_is_bounded_by_max_workers(self, autoscaler):
+        infos = [_info("w1", cpu_usage=100.0)]
+
+        assert autoscaler.workers_to_spawn(infos, 9, NOW_NS) == 1
+        autoscaler.last_scale_ns = None
+        assert autoscaler.workers_to_spawn(infos, 10, NOW_NS) == 0
+
+    def test_cooldown_after_scaling(self, autoscaler):
+        infos = [_info("w1", cpu_usage=100.0)]
+
+        assert autoscaler.workers_to_spawn(infos, 1, NOW_NS) == 1
+        assert autoscaler.workers_to_spawn(infos, 2, NOW_NS + 1) == 0
+
+        after_cooldown_ns = NOW_NS + int(DEFAULT_AUTOSCALE_COOLDOWN * NANOS_PER_SECOND)
+        assert autoscaler.workers_to_spawn(infos, 2, after_cooldown_ns) == 1
+
+    def test_scale_down_longest_idle_workers(self, autoscaler):
+        infos = [
+            _info("busy"),
+            _info("idle_1", active_sessions=0, idle_for_sec=DEFAULT_AUTOSCALE_IDLE_TIME),
+            _info("idle_2", active_sessions=0, idle_for_sec=DEFAULT_AUTOSCALE_IDLE_TIME * 2),
+            _info("recently_idle", active_sessions=0, idle_for_sec=1),
+        ]  # fmt: skip
+
+        assert autoscaler.workers_to_shutdown(infos, 4, NOW_NS) == ["idle_2"]
+
+    def test_no_scale_down_when_all_workers_idle(self, autoscaler):
+        # e.g. between phases, or before profiling starts
+        infos = [
+            _info("idle_1", active_sessions=0, idle_for_sec=DEFAULT_AUTOSCALE_IDLE_TIME),
+            _info("idle_2", active_sessions=0, idle_for_sec=DEFAULT_AUTOSCALE_IDLE_TIME),
+        ]  # fmt: skip
+
+        assert autoscaler.workers_to_shutdown(infos, 2, NOW_NS) == []
+
+    def test_no_scale_down_below_min_workers(self):
+        autoscaler = WorkerAutoScaler(min_workers=2, max_workers=10)
+        infos = [
+            _info("busy"),
+            _info("idle", active_sessions=0, idle_for_sec=DEFAULT_AUTOSCALE_IDLE_TIME),
+        ]  # fmt: skip
+
+        assert autoscaler.workers_to_shutdown(infos, 2, NOW_NS) == []
@@ -4,13 +4,15 @@
 Simple test for WorkerManager max workers functionality.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from aiperf.common.config import EndpointConfig, ServiceConfig, UserConfig
 from aiperf.common.config.loadgen_config import LoadGeneratorConfig
 from aiperf.common.config.worker_config import WorkersConfig
+from aiperf.common.messages import WorkerHealthMessage
+from aiperf.common.models import ProcessHealth, WorkerTaskStats
 from aiperf.workers.worker_manager import WorkerManager
 
 
@@ -90,3 +92,91 @@ class TestMaxWorkers:
             )
 
             assert worker_manager.max_workers == expected
+
+    @pytest.mark.parametrize(
+        "cpus,concurrency,min_workers,max_workers,expected_initial,expected_max",
+        [
+            (10, 100, None, None, 6, 9),  # Starts at the default, and can grow to num CPUs - 1
+            (224, 1000, None, None, 32, 223),  # The max cap only applies to the initial workers
+            (10, 4, None, None, 4, 4),  # Concurrency still limits the workers
+            (10, 100, 2, 4, 4, 4),  # max_workers is the upper bound
+            (10, 100, 8, None, 8, 9),  # min_workers raises the initial workers
+        ],
+    )  # fmt: skip
+    def test_autoscale_worker_bounds(
+        self,
+        cpus,
+        concurrency,
+        min_workers,
+        max_workers,
+        expected_initial,
+        expected_max,
+    ):
+        """Test the initial and max workers when auto-scaling is enabled."""
+        with patch(
+            "aiperf.workers.worker_manager.multiprocessing.cpu_count", return_value=cpus
+        ):
+            service_config = ServiceConfig(
+                workers=WorkersConfig(min=min_workers, max=max_workers, autoscale=True)
+            )
+            user_config = UserConfig(
+                endpoint=EndpointConfig(model_names=["test-model"]),
+                loadgen=LoadGeneratorConfig(concurrency=concurrency),
+            )
+
+            worker_manager = WorkerManager(
+                service_config=service_config,
+                user_config=user_config,
+                service_id="test-worker-manager",
+            )
+
+            assert worker_manager.initial_workers == expected_initial
+            assert worker_manager.max_workers == expected_max
+            assert worker_manager.autoscaler.max_workers == expected_max
+
+
+def _health_message(worker_id: str) -> WorkerHealthMessage:
+    return WorkerHealthMessage(
+        service_id=worker_id,
+        health=ProcessHealth(create_time=0, uptime=1, cpu_usage=10.0, memory_usage=0),
+        task_stats=WorkerTaskStats(total=1, in_progress=1),
+    )
+
+
+@pytest.mark.asyncio
+class TestWorkerStatusSummary:
+    """Test the worker status summaries that aggregate the health of the workers."""
+
+    @pytest.fixture
+    def worker_manager(self) -> WorkerManager:
+        worker_manager = WorkerManager(
+            service_config=ServiceConfig(),
+            user_config=UserConfig(endpoint=EndpointConfig(model_names=["test-model"])),
+            service_id="test-worker-manager",
+        )
+        worker_manager.publish = AsyncMock()
+        return worker_manager
+
+    async def test_summary_only_includes_updated_workers(self, worker_manager):
+        await worker_manager._on_worker_health(_health_message("worker_1"))
+        await worker_manager._on_worker_health(_health_message("worker_2"))
+        await worker_manager._worker_summary_loop()
+
+        summary = worker_manager.publish.call_args.args[0]
+        assert sorted(summary.worker_statuses) == ["worker_1", "worker_2"]
+        assert sorted(summary.worker_stats) == ["worker_1", "worker_2"]
+        assert summary.worker_stats["worker_1"].task_stats.total == 1
+
+        await worker_manager._on_worker_health(_health_message("worker_2"))
+        await worker_manager._worker_summary_loop()
+
+        summary = worker_manager.publish.call_args.args[0]
+        assert sorted(summary.worker_statuses) == ["worker_1", "worker_2"]
+        assert list(summary.worker_stats) == ["worker_2"]
+
+    async def test_unchanged_summary_is_not_published(self, worker_manager):
+        await worker_manager._on_worker_health(_health_message("worker_1"))
+        await worker_manager._worker_summary_loop()
+        await worker_manager._worker_summary_loop()
+
+        assert worker_manager.publish.await_count == 1
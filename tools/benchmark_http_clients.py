@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Compare the client-side CPU cost and timestamp accuracy of the HTTP/1.1 clients.
+
+A local streaming server runs in a separate process and sends chunked SSE responses, where each
+message contains the server's `perf_counter_ns` taken right before the message was written. As
+`perf_counter_ns` uses the system-wide monotonic clock on Linux, the difference between the
+timestamp the client recorded for a message and the server's timestamp is the delay added by the
+network stack and the client. The client CPU time is measured for the client process only.
+
+Usage:
+    python tools/benchmark_http_clients.py --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+import numpy as np
+import orjson
+
+from aiperf.clients.model_endpoint_info import (
+    EndpointInfo,
+    ModelEndpointInfo,
+    ModelInfo,
+    ModelListInfo,
+)
+from aiperf.common.enums import EndpointType, HttpClientType, ModelSelectionStrategy
+from aiperf.common.factories import HttpClientFactory
+
+HOST = "127.0.0.1"
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    num_chunks: int,
+    interval: float,
+) -> None:
+    try:
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            content_length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    content_length = int(line.split(":", 1)[1])
+            await reader.readexactly(content_length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n"
+            )
+            for _ in range(num_chunks):
+                await asyncio.sleep(interval)
+                message = f"data: {time.perf_counter_ns()}\n\n".encode()
+                writer.write(f"{len(message):x}\r\n".encode() + message + b"\r\n")
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _run_server(port_queue: multiprocessing.Queue, num_chunks: int, interval: float):
+    async def main() -> None:
+        server = await asyncio.start_server(
+            lambda r, w: _serve_connection(r, w, num_chunks, interval), HOST, 0
+        )
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _benchmark_client(
+    http_client: HttpClientType, url: str, num_requests: int, concurrency: int
+) -> dict[str, float]:
+    model_endpoint = ModelEndpointInfo(
+        models=ModelListInfo(
+            models=[ModelInfo(name="benchmark")],
+            model_selection_strategy=ModelSelectionStrategy.ROUND_ROBIN,
+        ),
+        endpoint=EndpointInfo(type=EndpointType.CHAT, http_client=http_client),
+    )
+    client = HttpClientFactory.create_instance(
+        http_client, model_endpoint=model_endpoint
+    )
+    headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+    payload = orjson.dumps({"stream": True})
+    semaphore = asyncio.Semaphore(concurrency)
+    timestamp_errors: list[int] = []
+    errors = 0
+
+    async def send() -> None:
+        nonlocal errors
+        async with semaphore:
+            record = await client.post_request(url, payload, headers)
+        if record.error:
+            errors += 1
+            return
+        for message in record.responses:
+            timestamp_errors.append(message.perf_ns - int(message.packets[0].value))
+
+    # Warm up the connections, so that only steady state requests are measured
+    await asyncio.gather(*[send() for _ in range(concurrency)])
+    timestamp_errors.clear()
+
+    cpu_start_ns = time.process_time_ns()
+    wall_start_ns = time.perf_counter_ns()
+    await asyncio.gather(*[send() for _ in range(num_requests)])
+    cpu_ns = time.process_time_ns() - cpu_start_ns
+    wall_ns = time.perf_counter_ns() - wall_start_ns
+    await client.close()
+
+    errors_us = np.array(timestamp_errors) / 1000
+    return {
+        "cpu_us_per_request": cpu_ns / num_requests / 1000,
+        "requests_per_sec": num_requests / (wall_ns / 1e9),
+        "timestamp_error_p50_us": float(np.percentile(errors_us, 50)),
+        "timestamp_error_p99_us": float(np.percentile(errors_us, 99)),
+        "timestamp_error_max_us": float(errors_us.max()),
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--chunks", type=int, default=50, help="SSE messages per response"
+    )
+    parser.add_argument("--interval-ms", type=float, default=1.0)
+    parser.add_argument(
+        "--clients",
+        nargs="+",
+        type=HttpClientType,
+        default=[HttpClientType.AIOHTTP, HttpClientType.RAW],
+    )
+    args = parser.parse_args()
+
+    # Import the clients so that they are registered with the factory
+    import aiperf.clients  # noqa: F401
+
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_run_server,
+        args=(port_queue, args.chunks, args.interval_ms / 1000),
+        daemon=True,
+    )
+    server.start()
+    url = f"http://{HOST}:{port_queue.get(timeout=10)}/v1/chat/completions"
+
+    try:
+        results = {
+            http_client: asyncio.run(
+                _benchmark_client(http_client, url, args.requests, args.concurrency)
+            )
+            for http_client in args.clients
+        }
+    finally:
+        server.terminate()
+
+    columns = list(next(iter(results.values())).keys())
+    print(f"{'client':<10}" + "".join(f"{column:>26}" for column in columns))
+    for http_client, result in results.items():
+        print(
+            f"{http_client:<10}"
+            + "".join(f"{result[column]:>26,.1f}" for column in columns)
+        )
+
+
+if __name__ == "__main__":
+    main()